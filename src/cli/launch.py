@@ -29,7 +29,7 @@ import os
 import shutil
 import sys
 from pathlib import Path
-from typing import Any, TypeVar, cast
+from typing import Any, Callable, Iterable, Sized, TypeVar, cast
 import yaml
 
 from src.core.repeaters import repeater_factory
@@ -72,7 +72,7 @@ def _resolve_entry_point_for_backend(benchmark_name: str, benchmark_data: dict[s
     # Determine backend type for entry point selection
     # Docker backend needs container entry point, others use AppImage or default
     uses_docker = "docker" in backends
-    uses_container = any(b in backends for b in ["knative", "fission"])
+    uses_container = any(b in backends for b in ["knative", "fission", "http"])
 
     if uses_docker:
         # Check for explicit docker entry point
@@ -96,9 +96,13 @@ def _resolve_entry_point_for_backend(benchmark_name: str, benchmark_data: dict[s
         # Check for explicit container entry point
         if backend_entry_points.get("container"):
             return backend_entry_points["container"]
-        # For knative/fission, use benchmark name as function/service name
+        # For knative/fission/http, use benchmark name as function/service name
         return benchmark_name
 
+    elif any(b in backends for b in ["warm", "faaslocal"]):
+        # Warm workers and local FaaS instances import the Python source, not a packaged executable
+        pass
+
     else:
         # Local/SSH/MPI backends - prefer AppImage if available
         if backend_entry_points.get("appimage"):
@@ -395,6 +399,17 @@ def build_orchestrator_options(args: argparse.Namespace, config: dict[str, Any])
     options["mode"] = _coalesce_option("a" if args.append else None, config.get("mode"), "w",
                                          cli_is_set=args.append)
 
+    # Resume: skip complete configurations, continue interrupted ones (always appends)
+    options["resume"] = _coalesce_option(True if args.resume else None, config.get("resume"), False,
+                                         cli_is_set=args.resume)
+    if options["resume"]:
+        options["mode"] = "a"
+
+    # Reuse results of identical configurations found in other runlogs
+    options["reuse_results"] = _coalesce_option(True if args.reuse_results else None,
+                                                config.get("reuse_results"), False,
+                                                cli_is_set=args.reuse_results)
+
     # System spec commands
     options["sys_spec_commands"] = config.get("sys_spec_commands", {})
     options["skip_sys_specs"] = _coalesce_option(True if args.skip_sys_specs else None,
@@ -438,6 +453,24 @@ def build_orchestrator_options(args: argparse.Namespace, config: dict[str, Any])
     config_copies = config.get("copies") or config.get("mpl")
     options["mpl"] = _coalesce_option(args.copies, config_copies, 1)
 
+    # Pipelined mode: analyze iteration i while iteration i+1 runs
+    options["pipeline"] = _coalesce_option(True if args.pipeline else None, config.get("pipeline"), False,
+                                            cli_is_set=args.pipeline)
+
+    # Open-loop load: issue requests on an arrival process instead of running mpl copies
+    options["arrival_rate"] = _coalesce_option(args.arrival_rate, config.get("arrival_rate"), None)
+    if options["arrival_rate"]:
+        options["arrivals"] = _coalesce_option(args.arrivals, config.get("arrivals"), "poisson")
+        options["duration"] = _coalesce_option(args.duration, config.get("duration"), 10.0)
+        for key in ("arrival_seed", "max_in_flight"):
+            if config.get(key) is not None:
+                options[key] = config[key]
+
+    # Launch commands directly when they need no shell (only recorded if set)
+    exec_mode = _coalesce_option(args.exec_mode, config.get("exec_mode"), None)
+    if exec_mode:
+        options["exec_mode"] = exec_mode
+
     # Environment variables (from config)
     options["environment"] = config.get("environment", {})
 
@@ -656,10 +689,18 @@ def print_experiment_result(result: ExperimentResult, verbose: bool) -> int:
         Exit code (0 for success, 1 for failure)
     """
     if result.success:
-        if verbose:
+        if verbose and result.convergence_info.get("skipped"):
+            print(f"\n✓ Skipped: results complete in launch {result.convergence_info['completed_launch_id']}")
+        elif verbose:
             print("\n✓ Experiment completed successfully")
             print(f"  Iterations: {result.iteration_count}")
             print(f"  Metrics collected: {len(result.metrics)}")
+            last = result.metrics[-1] if result.metrics else {}
+            if "throughput" in last and "latency_p50" in last:
+                # Open-loop load: summary of the last load phase
+                p50, p99, p999 = (last[f"latency_{p}"][0] for p in ("p50", "p99", "p999"))
+                print(f"  Open-loop (last iteration): {last['throughput'][0]} req/s, "
+                      f"error rate {last['error_rate'][0]}, latency p50 {p50}s p99 {p99}s p99.9 {p999}s")
         return 0
     else:
         print("\n✗ Experiment failed")
@@ -673,6 +714,9 @@ def run_parameter_sweep(args: argparse.Namespace, config: dict[str, Any]) -> int
 
     Sweep is an inline dict with args/env/options keys.
     For external files, use include directive with a file containing sweep: key.
+    Its strategy key selects which configurations run: all of them
+    (cartesian), a budget of them (random, lhs, bayesian), or mpl levels
+    chosen to locate the scalability knee (knee).
 
     Args:
         args: Parsed command-line arguments
@@ -682,7 +726,7 @@ def run_parameter_sweep(args: argparse.Namespace, config: dict[str, Any]) -> int
         Exit code (0 for success, non-zero for errors)
     """
     from src.core.config.schema import ExperimentConfig, SweepConfig
-    from src.core.execution.parameter_space import CartesianSweepStrategy
+    from src.core.execution.parameter_space import create_parameter_space_strategy
 
     if args.verbose:
         print("\n=== Parameter Sweep ===")
@@ -699,10 +743,16 @@ def run_parameter_sweep(args: argparse.Namespace, config: dict[str, Any]) -> int
         print(f"\n✗ Error parsing configuration: {e}", file=sys.stderr)
         return 1
 
-    # Create strategy and generate all configurations
-    strategy = CartesianSweepStrategy(base_config, sweep_config)
+    if sweep_config.strategy == "knee" and args.copies is not None:
+        print("\n✗ Error: --copies/--mpl cannot be combined with the knee strategy, which chooses mpl",
+              file=sys.stderr)
+        return 1
+
+    # Create strategy; configurations are expanded lazily as the sweep reaches them
     try:
+        strategy = create_parameter_space_strategy(base_config, sweep_config, sweep_config.strategy)
         configurations = strategy.generate_configurations()
+        on_result = _sweep_result_reporter(args, strategy)
     except Exception as e:
         print(f"\n✗ Error generating sweep configurations: {e}", file=sys.stderr)
         if args.verbose:
@@ -710,12 +760,27 @@ def run_parameter_sweep(args: argparse.Namespace, config: dict[str, Any]) -> int
             traceback.print_exc()
         return 1
 
+    total = len(configurations) if isinstance(configurations, Sized) else None
     if args.verbose:
-        print(f"Total configurations: {len(configurations)}")
+        if sweep_config.strategy == "knee":
+            print(f"Strategy: knee, up to {total} mpl levels (max mpl {sweep_config.max_mpl})")
+        elif total is not None:
+            print(f"Total configurations: {total}")
+        if sweep_config.strategy not in ("cartesian", "knee"):
+            print(f"Strategy: {sweep_config.strategy}, {sweep_config.goal} {sweep_config.metric}")
+
+    parallel_configs = _coalesce_option(args.parallel_configs, config.get("parallel_configs"), 1)
+    if parallel_configs > 1 and (total is None or total > 1):
+        exit_code = run_parallel_sweep(args, config, configurations, parallel_configs,
+                                       base_config.model_dump(), on_result)
+        _finish_adaptive_sweep(args, strategy)
+        return exit_code
 
     # Run each configuration
     all_success = True
+    count = 0
     for i, (launch_id, exp_config, parameters) in enumerate(configurations):
+        count += 1
         if args.verbose:
             print(f"\n--- Running {launch_id} ---")
 
@@ -730,8 +795,10 @@ def run_parameter_sweep(args: argparse.Namespace, config: dict[str, Any]) -> int
         sweep_params = parameters
 
         # Run the experiment with this specific config
+        results: list[ExperimentResult] = []
         try:
-            exit_code = run_experiment_with_config(args, config_dict, launch_id, sweep_params)
+            exit_code = run_experiment_with_config(args, config_dict, launch_id, sweep_params,
+                                                   on_result=results.append)
             if exit_code != 0:
                 all_success = False
                 if not args.verbose:
@@ -740,9 +807,194 @@ def run_parameter_sweep(args: argparse.Namespace, config: dict[str, Any]) -> int
             print(f"\n✗ Error in {launch_id}: {e}", file=sys.stderr)
             all_success = False
 
+        # Adaptive strategies choose the next configuration knowing this result
+        if on_result:
+            on_result(launch_id, results[0] if results else None)
+
+    if args.verbose:
+        print("\n=== Sweep Complete ===")
+        print(f"Configurations run: {count}")
+        print(f"Status: {'✓ All succeeded' if all_success else '✗ Some failed'}")
+    _finish_adaptive_sweep(args, strategy)
+
+    return 0 if all_success else 1
+
+
+def _sweep_output_base(args: argparse.Namespace, config: dict[str, Any]) -> Path:
+    """Output path (without extension) shared by all configurations of a sweep."""
+    from src.core.runlogs import RunLogger
+
+    benchmark_spec = resolve_benchmark_spec(args, config)
+    options, _ = build_orchestrator_options(args, config)
+    task = benchmark_spec.get("task") or args.experiment
+    return Path(RunLogger.output_base(options["directory"], args.experiment, task))
+
+
+def _sweep_result_reporter(args: argparse.Namespace,
+                           strategy: Any) -> Callable[[str, ExperimentResult | None], None] | None:
+    """
+    Build the callback that reports finished configurations to an adaptive strategy.
+
+    The strategy receives the configuration's CSV rows grouped by
+    iteration, including those of an earlier launch when resuming skipped
+    it; failed runs are reported as None.
+
+    Args:
+        args: Parsed command-line arguments
+        strategy: Parameter space strategy of the sweep
+
+    Returns:
+        Callback taking (launch_id, experiment result or None if it did not
+        run), or None for strategies that do not use results (cartesian)
+    """
+    from src.core.execution.parameter_space import AdaptiveSweepStrategy
+    from src.core.runlogs.journal import read_launch_rows
+
+    if not isinstance(strategy, AdaptiveSweepStrategy):
+        return None
+    base = _sweep_output_base(args, strategy.base_config.model_dump())
+    csv_path = base.with_name(base.name + ".csv")
+
+    def report(launch_id: str, result: ExperimentResult | None) -> None:
+        iterations, source = None, launch_id
+        if result is not None and result.success:
+            source = result.convergence_info.get("completed_launch_id", launch_id)
+            iterations = read_launch_rows(csv_path, source)
+        strategy.report(launch_id, iterations, source)
+
+    return report
+
+
+def _finish_adaptive_sweep(args: argparse.Namespace, strategy: Any) -> None:
+    """
+    Print an adaptive strategy's outcome and add its section to the task's Markdown file.
+
+    No-op for strategies that do not use results (cartesian).
+    """
+    from src.core.execution.parameter_space import AdaptiveSweepStrategy
+    from src.core.runlogs import RunLogger
+
+    if not isinstance(strategy, AdaptiveSweepStrategy):
+        return
+    for line in strategy.summary():
+        print(line, file=sys.stderr if line.startswith("✗") else sys.stdout)
+    section = strategy.markdown_section()
+    if section is None:
+        return
+    base = _sweep_output_base(args, strategy.base_config.model_dump())
+    try:
+        RunLogger.save_md_section(str(base), *section)
+    except OSError as e:
+        print(f"⚠ Could not write {section[0].lower()} to {base}.md: {e}", file=sys.stderr)
+
+
+def _sweep_config_cores(args: argparse.Namespace, config: dict[str, Any]) -> int:
+    """Local cores a sweep configuration needs: cores_per_config (0 for remote runs), else its MPL."""
+    if config.get("cores_per_config") is not None:
+        return int(config["cores_per_config"])
+    return int(_coalesce_option(args.copies, config.get("copies") or config.get("mpl"), 1))
+
+
+def _truncate_sweep_outputs(args: argparse.Namespace, config: dict[str, Any]) -> None:
+    """Remove the CSV/Markdown files (and launch journal) a sweep would overwrite (parallel sweeps only append)."""
+    from src.core.runlogs import RunJournal
+
+    base = _sweep_output_base(args, config)
+    for suffix in (".csv", ".md"):
+        base.with_name(base.name + suffix).unlink(missing_ok=True)
+    RunJournal(base).clear()
+
+
+def run_parallel_sweep(args: argparse.Namespace, config: dict[str, Any],
+                       configurations: Iterable[tuple[str, Any, dict[str, Any]]],
+                       parallel_configs: int, base_config: dict[str, Any],
+                       on_result: Callable[[str, ExperimentResult | None], None] | None = None) -> int:
+    """
+    Run sweep configurations concurrently under a core/memory budget.
+
+    Each configuration demands cores_per_config local cores (default: its
+    MPL; 0 for configurations that run on other hosts) and
+    memory_per_config MB (default: 0, not accounted). All configurations
+    append to the shared output files; unless appending, the files are
+    truncated once before the sweep starts. Per-iteration output is
+    suppressed; one progress line is printed per finished configuration
+    (failures only, unless verbose).
+
+    Args:
+        args: Parsed command-line arguments
+        config: Merged sweep config (for parallel_configs, pin_cpus, ...)
+        configurations: (launch_id, ExperimentConfig, parameters) per configuration
+            (consumed lazily, as configurations start)
+        parallel_configs: Maximum configurations running at once
+        base_config: Sweep's base config dict (for output mode and files)
+        on_result: Called with (launch_id, experiment result or None) as each
+            configuration finishes
+
+    Returns:
+        Exit code (0 if all configurations succeeded)
+    """
+    from src.core.config.settings import Settings
+    from src.core.execution.sweep_scheduler import (
+        SweepJob, SweepProgress, SweepScheduler, available_memory_mb
+    )
+
+    pin_cpus = _coalesce_option(True if args.pin_cpus else None, config.get("pin_cpus"), False,
+                                cli_is_set=args.pin_cpus)
+    settings = Settings()
+    core_budget = int(settings.get("sweep.core_budget", 0) or 0)
+    memory_budget = int(settings.get("sweep.memory_budget_mb", 0) or 0) or available_memory_mb()
+
+    resume = args.resume or base_config.get("resume", False)
+    if not args.append and not resume and base_config.get("mode", "w") != "a":
+        try:
+            _truncate_sweep_outputs(args, base_config)
+        except Exception as e:
+            print(f"\n✗ Error preparing sweep output files: {e}", file=sys.stderr)
+            return 1
+
+    # Configurations share stdout: keep per-iteration output out of it
+    quiet_args = argparse.Namespace(**{**vars(args), "verbose": False})
+
+    def make_job(launch_id: str, exp_config: Any, parameters: dict[str, Any]) -> SweepJob:
+        config_dict = exp_config.model_dump()
+        config_dict["mode"] = "a"
+
+        def run(cpus: list[int] | None) -> int:
+            results: list[ExperimentResult] = []
+            try:
+                return run_experiment_with_config(quiet_args, config_dict, launch_id, parameters,
+                                                  cpu_set=cpus, on_result=results.append)
+            finally:
+                if on_result:
+                    on_result(launch_id, results[0] if results else None)
+
+        return SweepJob(
+            launch_id=launch_id,
+            run=run,
+            cores=_sweep_config_cores(args, config_dict),
+            memory_mb=int(config_dict.get("memory_per_config", 0) or 0),
+        )
+
+    # Jobs are created as the scheduler reaches them, so the sweep is never materialized
+    jobs = (make_job(*configuration) for configuration in configurations)
+
+    def on_progress(progress: SweepProgress) -> None:
+        if args.verbose or progress.exit_code != 0:
+            status = "✓" if progress.exit_code == 0 else "✗"
+            print(f"[{progress.completed}/{progress.total}] {status} {progress.launch_id} "
+                  f"({progress.running} running, {progress.failed} failed, {progress.elapsed:.0f}s elapsed)")
+
+    scheduler = SweepScheduler(parallel_configs, core_budget=core_budget, memory_budget_mb=memory_budget,
+                               pin_cpus=pin_cpus, on_progress=on_progress)
+    if args.verbose:
+        print(f"Running up to {parallel_configs} configurations at once "
+              f"({scheduler.core_budget} cores{', pinned' if scheduler.pin_cpus else ''})")
+    results = scheduler.run(jobs, total=len(configurations) if isinstance(configurations, Sized) else None)
+    all_success = all(code == 0 for code in results.values())
+
     if args.verbose:
         print("\n=== Sweep Complete ===")
-        print(f"Configurations run: {len(configurations)}")
+        print(f"Configurations run: {len(results)}")
         print(f"Status: {'✓ All succeeded' if all_success else '✗ Some failed'}")
 
     return 0 if all_success else 1
@@ -750,7 +1002,9 @@ def run_parameter_sweep(args: argparse.Namespace, config: dict[str, Any]) -> int
 
 def run_experiment_with_config(args: argparse.Namespace, config: dict[str, Any],
                                 launch_id: str | None = None,
-                                sweep_params: dict[str, Any] | None = None) -> int:
+                                sweep_params: dict[str, Any] | None = None,
+                                cpu_set: list[int] | None = None,
+                                on_result: Callable[[ExperimentResult], None] | None = None) -> int:
     """
     Run a single experiment with a specific configuration.
 
@@ -759,6 +1013,8 @@ def run_experiment_with_config(args: argparse.Namespace, config: dict[str, Any],
         config: Experiment configuration dict
         launch_id: Optional launch identifier for sweep runs
         sweep_params: Optional sweep parameters for this specific run (added as invariants)
+        cpu_set: Optional CPUs to pin the benchmark to (parallel sweeps)
+        on_result: Optional callback receiving the experiment result (if it ran)
 
     Returns:
         Exit code (0 for success, non-zero for errors)
@@ -784,6 +1040,9 @@ def run_experiment_with_config(args: argparse.Namespace, config: dict[str, Any],
         if sweep_params:
             options["sweep_params"] = sweep_params
 
+        if cpu_set:
+            options["cpu_set"] = cpu_set
+
         # Create orchestrator
         orchestrator = ExecutionOrchestrator(
             options=options,
@@ -797,6 +1056,8 @@ def run_experiment_with_config(args: argparse.Namespace, config: dict[str, Any],
         # Create progress callbacks and run experiment
         callbacks = create_progress_callbacks(args.verbose)
         result = orchestrator.run(callbacks)
+        if on_result:
+            on_result(result)
 
         # Print results and return exit code
         if args.verbose or not launch_id:
@@ -1099,6 +1360,44 @@ Examples:
         dest="copies",
         help="Alias for --copies (multiprogramming level)"
     )
+    execution.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Analyze each iteration while the next one runs (may run one extra, flagged iteration)"
+    )
+    execution.add_argument(
+        "--arrival-rate",
+        type=float,
+        metavar="RATE",
+        help="Open-loop load: issue RATE requests per second instead of running copies"
+    )
+    execution.add_argument(
+        "--arrivals",
+        choices=["constant", "poisson"],
+        help="Open-loop arrival process (default: poisson)"
+    )
+    execution.add_argument(
+        "--duration",
+        type=float,
+        metavar="SECONDS",
+        help="Seconds of open-loop load per iteration (default: 10)"
+    )
+    execution.add_argument(
+        "--exec-mode",
+        choices=["shell", "direct", "spawn"],
+        help="Launch commands via /bin/sh, or directly when they need no shell (default: direct)"
+    )
+    execution.add_argument(
+        "--parallel-configs",
+        type=int,
+        metavar="N",
+        help="Run up to N sweep configurations concurrently (default: 1)"
+    )
+    execution.add_argument(
+        "--pin-cpus",
+        action="store_true",
+        help="Pin each concurrent sweep configuration to its own CPUs"
+    )
 
     # Output options
     output = parser.add_argument_group("output options")
@@ -1112,6 +1411,16 @@ Examples:
         action="store_true",
         help="Append to existing run data instead of overwrite"
     )
+    output.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip configurations with complete results and continue interrupted ones (implies --append)"
+    )
+    output.add_argument(
+        "--reuse-results",
+        action="store_true",
+        help="Reuse results of identical configurations found in other runlogs"
+    )
 
     # General options
     options = parser.add_argument_group("general options")
@@ -1261,7 +1570,7 @@ def main(argv: list[str] | None = None) -> int:
             base_dir = Path(args.config[0]).parent
 
         # Pass config dict directly - no temp file needed!
-        return workflow.run_workflow(config, args.verbose, base_dir=base_dir)
+        return workflow.run_workflow(config, args.verbose, base_dir=base_dir, resume=args.resume)
 
     # Validate experiment arguments for regular task execution
     error_code = validate_experiment_args(args)
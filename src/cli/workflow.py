@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 """
-SHARP workflow execution - run multiple experiments in sequence.
+SHARP workflow execution - run multiple experiments as a dependency graph.
 
-Current implementation: simple sequential workflow execution.
-Future: DAG workflows with dependencies and parallelism.
+Tasks run after the tasks they depend on (by default, the previous task),
+with up to max_workers independent tasks at once.
 
 © Copyright 2025--2025 Hewlett Packard Enterprise Development LP
 """
@@ -14,7 +14,8 @@ from typing import Union, Any
 
 import yaml
 
-from src.core.config.schema import WorkflowConfig
+from src.core.config.schema import WorkflowConfig, WorkflowTask
+from src.core.execution.workflow_scheduler import WorkflowJob, WorkflowScheduler, check_dependencies
 
 
 def load_workflow_from_dict(workflow_data: dict[str, Any]) -> WorkflowConfig:
@@ -39,8 +40,9 @@ def load_workflow_from_dict(workflow_data: dict[str, Any]) -> WorkflowConfig:
         # Warn about unsupported Phase 6+ features
         if hasattr(config, '__pydantic_extra__') and config.__pydantic_extra__:
             for key in config.__pydantic_extra__.keys():
-                if key in ['steps', 'parallel_groups', 'depends_on']:
+                if key in ['steps', 'parallel_groups']:
                     print(f"⚠ Warning: '{key}' is not yet supported (Phase 6+ feature)", file=sys.stderr)
+        check_dependencies(config.task_ids(), config.task_dependencies())
         return config
     except Exception as e:
         raise ValueError(f"Invalid workflow configuration: {e}")
@@ -73,13 +75,18 @@ def load_workflow(workflow_path: str) -> WorkflowConfig:
 def run_workflow(
     workflow: Union[str, dict[str, Any], WorkflowConfig],
     verbose: bool = False,
-    base_dir: Path | None = None
+    base_dir: Path | None = None,
+    resume: bool = False,
+    max_workers: int | None = None
 ) -> int:
     """
-    Execute workflow experiments sequentially.
+    Execute workflow experiments as a dependency graph.
 
-    Current implementation: runs each experiment in order, stopping on first failure.
-    No dependencies, no parallelism, no state passing between experiments.
+    Each task starts once the tasks it depends on succeeded (by default, the
+    previous task, so plain lists run in order), with up to max_workers tasks
+    at once; tasks sharing a resource never overlap. When a task fails, the
+    tasks depending on it are skipped and independent branches continue.
+    No state passing between experiments.
 
     Args:
         workflow: Workflow specification as:
@@ -90,6 +97,10 @@ def run_workflow(
         base_dir: Base directory for resolving relative task paths.
                   If None and workflow is a file path, uses the file's directory.
                   If None and workflow is dict/WorkflowConfig, uses current directory.
+        resume: Rerun an interrupted workflow: tasks (and sweep configurations)
+                with complete results are skipped, interrupted ones continue
+        max_workers: Maximum tasks running at once (default: the workflow's
+                     max_workers)
 
     Returns:
         Exit code (0 for success, non-zero for failure)
@@ -108,6 +119,7 @@ def run_workflow(
                 base_dir = Path.cwd()
         elif isinstance(workflow, WorkflowConfig):
             workflow_config = workflow
+            check_dependencies(workflow_config.task_ids(), workflow_config.task_dependencies())
             # Default base_dir to current directory for WorkflowConfig input
             if base_dir is None:
                 base_dir = Path.cwd()
@@ -117,6 +129,8 @@ def run_workflow(
         print(f"\n✗ Error loading workflow: {e}", file=sys.stderr)
         return 1
 
+    workers = max_workers or workflow_config.max_workers
+    total = len(workflow_config.workflow)
     if verbose:
         # Use workflow description or "workflow" as default name
         workflow_name = workflow_config.description
@@ -125,151 +139,190 @@ def run_workflow(
         print(f"\nExecuting workflow: {workflow_name or 'workflow'}")
         if workflow_config.experiment:
             print(f"Experiment name: {workflow_config.experiment}")
-        print(f"Tasks: {len(workflow_config.workflow)}\n")
-
-    # Import launch module for running individual experiments
-    from src.cli import launch
+        print(f"Tasks: {total}" + (f" (up to {workers} at once)" if workers > 1 else "") + "\n")
 
     # Resolve task paths relative to base directory
     workflow_dir = base_dir
-
-    failed_tasks = []
-    for i, workflow_task in enumerate(workflow_config.workflow, start=1):
-        task_data: dict[str, Any] = {}
-        task_identifier = None
-        resolved_path = None
-
-        # Step 1: Load base configuration from file if specified
-        if workflow_task.include:
-            task_path = workflow_task.include
-            task_identifier = task_path
-
-            # Resolve task path
-            if not Path(task_path).is_absolute():
-                resolved_path = workflow_dir / task_path
-            else:
-                resolved_path = Path(task_path)
-
-            if not resolved_path.exists():
-                print(f"\n✗ Error: Task file not found: {task_path}", file=sys.stderr)
-                failed_tasks.append((task_identifier, "file not found"))
-                # Stop on first failure (sequential workflow behavior)
-                break
-
-            # Load task config from file (base configuration)
+    task_ids = workflow_config.task_ids()
+    dependencies = workflow_config.task_dependencies()
+    identifiers = {
+        task_id: _task_identifier(i, workflow_task)
+        for i, (task_id, workflow_task) in enumerate(zip(task_ids, workflow_config.workflow), start=1)
+    }
+
+    failed_tasks: list[tuple[str, str]] = []
+
+    def make_job(i: int, task_id: str, workflow_task: WorkflowTask) -> WorkflowJob:
+        def run() -> int:
+            task_identifier = identifiers[task_id]
+            task_argv, error = _build_task_argv(workflow_task, i, workflow_config, workflow_dir, verbose, resume)
+            if task_argv is None:
+                failed_tasks.append((task_identifier, error))
+                return 1
+
+            # Display what we're running
+            if verbose:
+                if workflow_task.include and workflow_task.task:
+                    print(f"[{i}/{total}] Running: {workflow_task.include} (task: {workflow_task.task})")
+                elif workflow_task.include:
+                    print(f"[{i}/{total}] Running: {workflow_task.include}")
+                else:
+                    print(f"[{i}/{total}] Running: {workflow_task.task}")
+
+            # Run task
+            from src.cli import launch
             try:
-                with open(resolved_path, 'r') as f:
-                    task_data = yaml.safe_load(f) or {}
-            except Exception as e:
-                print(f"\n✗ Error loading task {task_path}: {e}", file=sys.stderr)
-                failed_tasks.append((task_identifier, f"load error: {e}"))
-                # Stop on first failure (sequential workflow behavior)
-                break
-
-        # Step 2: Override/merge with inline fields (composition)
-        # This allows hybrid: include a file + override specific fields
-
-        # Override task name if specified inline
-        if workflow_task.task is not None:
-            if 'options' not in task_data:
-                task_data['options'] = {}
-            task_data['options']['task'] = workflow_task.task
-            task_identifier = f"task {i} ({workflow_task.task})"
-
-        # Override backends if specified inline
-        if workflow_task.backends is not None:
-            task_data['backends'] = workflow_task.backends
-
-        # Merge options (inline values take precedence)
-        if workflow_task.options is not None:
-            if 'options' not in task_data:
-                task_data['options'] = {}
-            task_data['options'].update(workflow_task.options)
-
-        # Set identifier if not already set (pure inline case)
-        if task_identifier is None:
-            task_identifier = f"task {i} ({workflow_task.task})"
-
-        # Display what we're running
-        if verbose:
-            if workflow_task.include and workflow_task.task:
-                print(f"[{i}/{len(workflow_config.workflow)}] Running: {workflow_task.include} (task: {workflow_task.task})")
-            elif workflow_task.include:
-                print(f"[{i}/{len(workflow_config.workflow)}] Running: {workflow_task.include}")
-            else:
-                print(f"[{i}/{len(workflow_config.workflow)}] Running: {workflow_task.task}")
-
-        # Build argv for launch.main()
-        task_argv = []
-
-        # For file includes: add -f flag and optional task name
-        if workflow_task.include:
-            # If task file specifies a task name in options, pass it as positional argument
-            task_name = None
-            if task_data and 'options' in task_data and 'task' in task_data['options']:
-                task_name = task_data['options']['task']
-
-            # Add task name if found
-            if task_name:
-                task_argv.append(task_name)
-
-            # Add experiment name from workflow config if provided
-            # (task config file's experiment field takes precedence in launch.py)
-            if workflow_config.experiment:
-                task_argv.extend(['-e', workflow_config.experiment])
-
-            # Add the file path
-            task_argv.extend(['-f', str(resolved_path)])
-
-        # For inline tasks: build full argv from task definition
-        else:
-            # Add task name (required for inline tasks)
-            task_argv.append(workflow_task.task)
-
-            # Add backends
-            if workflow_task.backends:
-                for backend in workflow_task.backends:
-                    task_argv.extend(['-b', backend])
-
-            # Add options as JSON
-            if workflow_task.options:
-                import json
-                task_argv.extend(['-j', json.dumps(workflow_task.options)])
+                exit_code = launch.main(task_argv)
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else 1
 
-            # Add experiment name from workflow config if provided
-            # (task options.experiment takes precedence in launch.py)
-            if workflow_config.experiment:
-                task_argv.extend(['-e', workflow_config.experiment])
+            if exit_code != 0:
+                print(f"\n✗ Task failed: {task_identifier} (exit code: {exit_code})", file=sys.stderr)
+                failed_tasks.append((task_identifier, f"exit code {exit_code}"))
+            elif verbose:
+                print(f"✓ Completed: {task_identifier}\n")
+            return exit_code
 
-        # Add verbose flag if needed
-        if verbose:
-            task_argv.append('--verbose')
+        return WorkflowJob(name=task_id, run=run, depends_on=dependencies[task_id],
+                           resources=workflow_task.resources)
 
-        # Run task
-        exit_code = launch.main(task_argv)
-
-        if exit_code != 0:
-            print(f"\n✗ Task failed: {task_identifier} (exit code: {exit_code})", file=sys.stderr)
-            failed_tasks.append((task_identifier, f"exit code {exit_code}"))
-            # Stop on first failure (sequential workflow behavior)
-            break
-
-        if verbose:
-            print(f"✓ Completed: {task_identifier}\n")
+    jobs = [make_job(i, task_id, workflow_task)
+            for i, (task_id, workflow_task) in enumerate(zip(task_ids, workflow_config.workflow), start=1)]
+    results = WorkflowScheduler(workers).run(jobs)
+    skipped_tasks = [identifiers[task_id] for task_id, exit_code in results.items() if exit_code is None]
 
     # Print summary
-    if failed_tasks:
+    if failed_tasks or skipped_tasks:
         print(f"\n✗ Workflow failed: {len(failed_tasks)} task(s) failed", file=sys.stderr)
         for task_identifier, reason in failed_tasks:
             print(f"  - {task_identifier}: {reason}", file=sys.stderr)
+        for task_identifier in skipped_tasks:
+            print(f"  - {task_identifier}: skipped (dependency failed)", file=sys.stderr)
         return 1
 
     if verbose:
-        print(f"\n✓ Workflow completed successfully: {len(workflow_config.workflow)} tasks")
+        print(f"\n✓ Workflow completed successfully: {total} tasks")
 
     return 0
 
 
+def _task_identifier(i: int, workflow_task: WorkflowTask) -> str:
+    """Name of a task in progress and error messages (its include path or task name)."""
+    if workflow_task.task is not None or not workflow_task.include:
+        return f"task {i} ({workflow_task.task})"
+    return workflow_task.include
+
+
+def _build_task_argv(workflow_task: WorkflowTask, i: int, workflow_config: WorkflowConfig,
+                     workflow_dir: Path, verbose: bool, resume: bool) -> tuple[list[str] | None, str]:
+    """
+    Build the launch command line of one workflow task.
+
+    Args:
+        workflow_task: Task definition
+        i: Task position (from 1)
+        workflow_config: Workflow configuration (for the experiment name)
+        workflow_dir: Base directory for relative include paths
+        verbose: Whether to pass --verbose
+        resume: Whether to pass --resume
+
+    Returns:
+        (argv, "") or (None, failure reason) if the included file cannot be loaded
+    """
+    task_data: dict[str, Any] = {}
+    resolved_path = None
+
+    # Step 1: Load base configuration from file if specified
+    if workflow_task.include:
+        task_path = workflow_task.include
+
+        # Resolve task path
+        if not Path(task_path).is_absolute():
+            resolved_path = workflow_dir / task_path
+        else:
+            resolved_path = Path(task_path)
+
+        if not resolved_path.exists():
+            print(f"\n✗ Error: Task file not found: {task_path}", file=sys.stderr)
+            return None, "file not found"
+
+        # Load task config from file (base configuration)
+        try:
+            with open(resolved_path, 'r') as f:
+                task_data = yaml.safe_load(f) or {}
+        except Exception as e:
+            print(f"\n✗ Error loading task {task_path}: {e}", file=sys.stderr)
+            return None, f"load error: {e}"
+
+    # Step 2: Override/merge with inline fields (composition)
+    # This allows hybrid: include a file + override specific fields
+
+    # Override task name if specified inline
+    if workflow_task.task is not None:
+        if 'options' not in task_data:
+            task_data['options'] = {}
+        task_data['options']['task'] = workflow_task.task
+
+    # Override backends if specified inline
+    if workflow_task.backends is not None:
+        task_data['backends'] = workflow_task.backends
+
+    # Merge options (inline values take precedence)
+    if workflow_task.options is not None:
+        if 'options' not in task_data:
+            task_data['options'] = {}
+        task_data['options'].update(workflow_task.options)
+
+    # Build argv for launch.main()
+    task_argv = []
+
+    # For file includes: add -f flag and optional task name
+    if workflow_task.include:
+        # If task file specifies a task name in options, pass it as positional argument
+        task_name = None
+        if task_data and 'options' in task_data and 'task' in task_data['options']:
+            task_name = task_data['options']['task']
+
+        # Add task name if found
+        if task_name:
+            task_argv.append(task_name)
+
+        # Add experiment name from workflow config if provided
+        # (task config file's experiment field takes precedence in launch.py)
+        if workflow_config.experiment:
+            task_argv.extend(['-e', workflow_config.experiment])
+
+        # Add the file path
+        task_argv.extend(['-f', str(resolved_path)])
+
+    # For inline tasks: build full argv from task definition
+    else:
+        # Add task name (required for inline tasks)
+        task_argv.append(workflow_task.task)
+
+        # Add backends
+        if workflow_task.backends:
+            for backend in workflow_task.backends:
+                task_argv.extend(['-b', backend])
+
+        # Add options as JSON
+        if workflow_task.options:
+            import json
+            task_argv.extend(['-j', json.dumps(workflow_task.options)])
+
+        # Add experiment name from workflow config if provided
+        # (task options.experiment takes precedence in launch.py)
+        if workflow_config.experiment:
+            task_argv.extend(['-e', workflow_config.experiment])
+
+    # Add verbose flag if needed
+    if verbose:
+        task_argv.append('--verbose')
+    if resume:
+        task_argv.append('--resume')
+    return task_argv, ""
+
+
 def main(argv: list[str] | None = None) -> int:
     """
     Main entry point for workflow command.
@@ -283,12 +336,14 @@ def main(argv: list[str] | None = None) -> int:
     import argparse
 
     parser = argparse.ArgumentParser(
-        description="Execute SHARP workflow (sequential tasks)",
+        description="Execute SHARP workflow (tasks as a dependency graph)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
   workflow experiments/scaling_study.yaml
   workflow --verbose experiments/matrix_suite.yaml
+  workflow --resume experiments/scaling_study.yaml  # after an interruption
+  workflow --max-workers 4 experiments/nightly.yaml
 
 Workflow YAML Format (file includes):
   version: 1.0.0
@@ -313,6 +368,24 @@ Workflow YAML Format (inline tasks):
         repeater: RSE
         threshold: 0.05
 
+Dependencies and resources (tasks without depends_on follow the previous task):
+  version: 1.0.0
+  max_workers: 4
+  workflow:
+    - id: build
+      include: build.yaml
+    - id: cpu
+      include: cpu.yaml
+      depends_on: [build]
+      resources: [host:node7]
+    - id: gpu
+      include: gpu.yaml
+      depends_on: [build]
+      resources: [host:node7]
+    - id: net
+      include: net.yaml
+      depends_on: []
+
 Mixed format (file includes + inline):
   version: 1.0.0
   workflow:
@@ -334,10 +407,25 @@ Mixed format (file includes + inline):
         help='Print progress information'
     )
 
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Skip tasks with complete results and continue interrupted ones'
+    )
+
+    parser.add_argument(
+        '--max-workers', '-w',
+        type=int,
+        metavar='N',
+        help="Run up to N independent tasks at once (overrides the workflow's max_workers)"
+    )
+
     args = parser.parse_args(argv)
+    if args.max_workers is not None and args.max_workers < 1:
+        parser.error("--max-workers must be at least 1")
 
     # When called from CLI, always pass file path (string)
-    return run_workflow(args.workflow, args.verbose)
+    return run_workflow(args.workflow, args.verbose, resume=args.resume, max_workers=args.max_workers)
 
 
 if __name__ == "__main__":
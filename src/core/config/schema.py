@@ -23,15 +23,36 @@ class SweepConfig(BaseModel):
     - args: List of complete argument lists
     - env: Dict of environment variables with scalar or list values
     - options: Dict of runtime options with scalar or list values
+
+    By default all combinations run. The random, lhs (Latin hypercube) and
+    bayesian strategies instead run a budget of combinations; bayesian picks
+    each next one to optimize a metric of the configurations already run.
+    The knee strategy runs one configuration at adaptively chosen mpl levels
+    to locate its scalability knee and SLO limit.
     """
     args: list[list[str]] | None = Field(None, description="List of argument lists to sweep over")
     env: dict[str, str | list[str]] | None = Field(None, description="Environment variables to sweep")
     options: dict[str, Any] | None = Field(None, description="Runtime options to sweep")
+    strategy: Literal["cartesian", "random", "lhs", "bayesian", "knee"] = Field(
+        "cartesian", description="How combinations are chosen")
+    budget: int | None = Field(None, ge=1, description="Maximum configurations to run (sampling strategies)")
+    metric: str = Field("outer_time", description="Metric optimized by the bayesian strategy")
+    goal: Literal["minimize", "maximize"] = Field("minimize", description="Optimization direction of metric")
+    initial_points: int | None = Field(
+        None, ge=1, description="Space-filling configurations run before the bayesian model is used")
+    seed: int | None = Field(None, description="Random seed (makes sampled configurations reproducible)")
+    max_mpl: int = Field(64, ge=1, description="Highest mpl level the knee strategy tries")
+    knee_efficiency: float = Field(
+        0.5, gt=0, le=1, description="Marginal scaling efficiency below which the knee strategy stops scaling")
+    slo: float | None = Field(None, gt=0, description="Latency SLO in seconds (knee strategy)")
+    slo_factor: float | None = Field(
+        None, gt=1, description="Latency SLO as a multiple of the mpl 1 latency (knee strategy)")
+    slo_percentile: float = Field(95, gt=0, le=100, description="Latency percentile checked against the SLO")
 
     @model_validator(mode='after')
     def validate_has_content(self) -> 'SweepConfig':
-        """Ensure at least one sweep dimension is specified."""
-        if not any([self.args, self.env, self.options]):
+        """Ensure at least one sweep dimension is specified (the knee strategy varies mpl itself)."""
+        if self.strategy != "knee" and not any([self.args, self.env, self.options]):
             raise ValueError("Sweep must specify at least one of: args, env, options")
         return self
 
@@ -207,6 +228,11 @@ class WorkflowTask(BaseModel):
     - Inline 'task' overrides task from file
     - Inline 'backends' overrides backends from file
     - Inline 'options' are merged with file options (inline takes precedence)
+
+    Scheduling: a task runs after the tasks listed in depends_on (by id)
+    succeed; without depends_on it runs after the previous task, as in a
+    sequential workflow (depends_on: [] makes it independent). Tasks sharing
+    a resource name never run at the same time.
     """
     include: str | None = None  # Path to task config file (base configuration)
 
@@ -215,6 +241,11 @@ class WorkflowTask(BaseModel):
     backends: list[str] | None = None
     options: dict[str, Any] | None = None
 
+    # Scheduling
+    id: str | None = None  # Name for depends_on references (default: task<position>, from 1)
+    depends_on: list[str] | None = None  # Task ids that must succeed first (None: the previous task)
+    resources: list[str] = Field(default_factory=list)  # Held exclusively while running, e.g. "host:node7"
+
     @model_validator(mode='after')
     def validate_task_definition(self) -> 'WorkflowTask':
         """Ensure at least include or task is specified."""
@@ -225,14 +256,16 @@ class WorkflowTask(BaseModel):
 
 
 class WorkflowConfig(BaseModel):
-    """Minimal sequential workflow configuration.
+    """Workflow configuration: a list of tasks, run as a dependency graph.
 
     Supports inline task definitions, file includes, or hybrid composition:
     - Inline: {"task": "benchmark_name", "backends": [...], "options": {...}}
     - Include: {"include": "path/to/task.yaml"}
     - Hybrid: {"include": "base.yaml", "options": {"repeats": 1000}}
 
-    No dependencies, no parallelism, no state passing between tasks.
+    Tasks form a dependency graph (see WorkflowTask): up to max_workers
+    tasks whose dependencies succeeded run at once. No state passing between
+    tasks.
 
     Note: 'experiment' field is separate - used for runlogs directory (same as -e flag).
     Top-level 'workflow' and 'task' are mutually exclusive.
@@ -241,6 +274,19 @@ class WorkflowConfig(BaseModel):
     description: str | None = None
     experiment: str | None = None  # Runlogs subdirectory (same as -e flag, CLI overrides this)
     workflow: list[WorkflowTask]  # List of tasks (inline or file includes)
+    max_workers: int = Field(1, ge=1, description="Maximum tasks running at once")
+
+    def task_ids(self) -> list[str]:
+        """Id of each task, in workflow order (explicit id or task<position>)."""
+        return [task.id or f"task{i}" for i, task in enumerate(self.workflow, start=1)]
+
+    def task_dependencies(self) -> dict[str, list[str]]:
+        """Ids each task depends on (the previous task where depends_on is not given)."""
+        ids = self.task_ids()
+        return {
+            task_id: task.depends_on if task.depends_on is not None else ids[i - 1:i]
+            for i, (task_id, task) in enumerate(zip(ids, self.workflow))
+        }
 
 
 # Reserved for future DAG workflow support (Phase 6+)
@@ -0,0 +1,417 @@
+"""
+Persistent channels to remote execution agents, shared by short-lived clients.
+
+A relay process per host starts the remote agent once through a transport
+command (by default `ssh -T -o BatchMode=yes HOST`, which then runs
+remote_agent.bootstrap_command() on the host) and keeps the channel open.
+It listens on a local Unix socket and forwards each client's command to the
+agent over the channel, so commands after the first skip connection setup
+and authentication. The sshagent backend runs this module as its command:
+
+    python3 -m src.core.execution.agent_relay run HOST 'COMMAND'
+
+The first invocation for a host starts the relay (and the agent); every
+invocation sends the command, prints its output and exits with its status,
+like `ssh HOST 'COMMAND'` would. After the output, the client prints one line
+for the backend's metrics:
+
+    remote-agent output STARTED REMOTE_TIME USER_TIME SYS_TIME
+
+where STARTED is 1 if this invocation started the agent, and REMOTE_TIME,
+USER_TIME and SYS_TIME are measured on the host (wall time and the command's
+CPU times), without the channel's latency; --quiet omits the line (for sys
+spec probes). `run --all` runs a command on every host with a running relay
+(e.g. a reset), and `stop` stops all relays.
+
+Any command that runs a program with its stdin and stdout connected to the
+host can serve as --transport ({host} is replaced by the host); tests use
+`sh -c` as a local stand-in. Relays are keyed by host, transport and remote
+interpreter, and exit after being idle for --idle-timeout seconds or when
+the channel breaks (the next client starts a new one). Neither the client's
+environment nor its working directory is forwarded, as with ssh.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import fcntl
+import hashlib
+import itertools
+import json
+import os
+import queue
+import select
+import shlex
+import socket
+import socketserver
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+from src.core.execution import warm_worker
+from src.core.execution.remote_agent import bootstrap_command
+
+DEFAULT_TRANSPORT = "ssh -T -o BatchMode=yes {host}"
+DEFAULT_IDLE_TIMEOUT = 600.0  # Seconds a relay waits for the next command before closing the channel
+CONNECT_TIMEOUT = 60.0  # Seconds a client waits for a new relay to reach its agent
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+@dataclass
+class RemoteResult:
+    """Outcome of one command run by a remote agent."""
+    status: int  # Exit code (128 + signal number if the command was killed)
+    output: str  # Combined stdout and stderr
+    elapsed: float  # Wall time on the host (seconds)
+    user_time: float  # CPU times of the command on the host (seconds)
+    sys_time: float
+    started: bool  # Whether this call started the relay and agent
+
+
+class AgentRelay(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Forwards clients' requests to one agent over a persistent channel.
+
+    Each client connection carries one JSON request line, {"command": ...,
+    "timeout": ...}, and receives the agent's reply line. A client that
+    disconnects before its reply has its command killed on the host.
+
+    Args:
+        path: Unix socket path
+        agent_command: Shell command that starts the agent (transport included)
+        idle_timeout: Seconds without requests after which serve() returns
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: str, agent_command: str, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+        """Start the agent and wait for its first reply, then bind the socket."""
+        self.idle_timeout = idle_timeout
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, queue.Queue[Dict[str, Any] | None]] = {}
+        self._lock = threading.Lock()
+        self._active = 0
+        self._last_request = time.monotonic()
+        self._channel_closed = threading.Event()
+        self.agent = subprocess.Popen(agent_command, shell=True, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                      start_new_session=True)
+        threading.Thread(target=self._read_replies, daemon=True).start()
+        self.host_info = self.request({"op": "ping"}, timeout=CONNECT_TIMEOUT)
+        if self.host_info is None:
+            self.agent.kill()
+            raise RuntimeError(f"Agent did not answer: {agent_command}")
+        super().__init__(path, _RelayRequestHandler)
+
+    def request(self, request: Dict[str, Any], timeout: float | None = None,
+                client: socket.socket | None = None) -> Dict[str, Any] | None:
+        """
+        Send a request to the agent and wait for its reply.
+
+        Args:
+            request: Request fields (the relay assigns the id)
+            timeout: Seconds to wait for the reply (default: no limit)
+            client: Client socket; if it closes first, the command is killed
+
+        Returns:
+            The agent's reply, or None if the channel broke, the wait timed out or the client left
+        """
+        request_id = next(self._ids)
+        replies: queue.Queue[Dict[str, Any] | None] = queue.Queue()
+        with self._lock:
+            self._pending[request_id] = replies
+            self._active += 1
+        deadline = time.monotonic() + timeout if timeout else None
+        try:
+            self._send(request | {"id": request_id})
+            while True:
+                try:
+                    return replies.get(timeout=0.2)
+                except queue.Empty:
+                    pass
+                if (deadline and time.monotonic() > deadline) or (client and _closed(client)):
+                    self._send({"id": request_id, "op": "kill"})
+                    return None
+        except OSError:
+            return None
+        finally:
+            with self._lock:
+                self._pending.pop(request_id, None)
+                self._active -= 1
+                self._last_request = time.monotonic()
+
+    def _send(self, request: Dict[str, Any]) -> None:
+        assert self.agent.stdin is not None
+        with self._lock:
+            self.agent.stdin.write(json.dumps(request).encode() + b"\n")
+            self.agent.stdin.flush()
+
+    def _read_replies(self) -> None:
+        """Dispatch agent replies to waiting requests; stop serving when the channel breaks."""
+        assert self.agent.stdout is not None
+        for line in self.agent.stdout:
+            try:
+                reply = json.loads(line)
+            except ValueError:
+                continue  # E.g. a login banner printed by the transport
+            with self._lock:
+                replies = self._pending.get(reply.get("id"))
+            if replies is not None:
+                replies.put(reply)
+        with self._lock:
+            for replies in self._pending.values():
+                replies.put(None)
+        self._channel_closed.set()
+
+    def serve(self) -> None:
+        """Serve clients until stopped, idle or disconnected, then close the channel and socket."""
+        watchdog = threading.Thread(target=self._exit_when_idle, daemon=True)
+        watchdog.start()
+        try:
+            self.serve_forever(poll_interval=0.2)
+        finally:
+            self.server_close()
+            with contextlib.suppress(OSError):
+                os.unlink(self.server_address)  # type: ignore[arg-type]
+            with contextlib.suppress(OSError):
+                assert self.agent.stdin is not None
+                self.agent.stdin.close()  # The agent exits at end of input
+            try:
+                self.agent.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.agent.kill()
+
+    def _exit_when_idle(self) -> None:
+        """Stop serving once the channel broke or no request ran for idle_timeout seconds."""
+        while not self._channel_closed.wait(min(1.0, self.idle_timeout)):
+            with self._lock:
+                if self._active == 0 and time.monotonic() - self._last_request >= self.idle_timeout:
+                    break
+        self.shutdown()
+
+
+class _RelayRequestHandler(socketserver.StreamRequestHandler):
+    """Handles one client request line (see AgentRelay)."""
+
+    server: AgentRelay
+
+    def handle(self) -> None:
+        """Read the request, forward it to the agent, write the reply."""
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        if request.get("op") == "stop":
+            reply: Dict[str, Any] | None = {"status": 0}
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        else:
+            reply = self.server.request({"command": request.get("command", ""), "timeout": request.get("timeout")},
+                                        client=self.connection)
+        if reply is not None:
+            self.wfile.write(json.dumps(reply).encode() + b"\n")
+            self.wfile.flush()
+
+
+def _closed(sock: socket.socket) -> bool:
+    """Whether the peer of a connection that sends nothing more has closed it."""
+    readable, _, _ = select.select([sock], [], [], 0)
+    return bool(readable) and sock.recv(1, socket.MSG_PEEK) == b""
+
+
+# =============================================================================
+# Client side
+# =============================================================================
+
+def agent_command(host: str, transport: str = DEFAULT_TRANSPORT, python: str = "python3") -> str:
+    """Shell command that starts an agent on host through the transport."""
+    return f"{transport.replace('{host}', host)} {shlex.quote(bootstrap_command(python))}"
+
+
+def socket_path(host: str, transport: str = DEFAULT_TRANSPORT, python: str = "python3") -> Path:
+    """Socket of the relay to a host."""
+    key = hashlib.sha256(json.dumps([host, transport, python]).encode()).hexdigest()[:16]
+    return warm_worker.socket_dir() / f"sharp-agent-{os.getuid()}-{key}.sock"
+
+
+def start_relay(path: Path, command: str, idle_timeout: float) -> None:
+    """
+    Start a relay on a socket and wait until it serves (callers hold a start lock).
+
+    Raises:
+        RuntimeError: If the relay exits (e.g. the transport failed) or does not start in time
+    """
+    with contextlib.suppress(FileNotFoundError):
+        path.unlink()  # Stale socket of a relay that died
+    log = tempfile.TemporaryFile()
+    env = os.environ | {"PYTHONPATH": os.pathsep.join(filter(None, [str(PROJECT_ROOT),
+                                                                     os.environ.get("PYTHONPATH")]))}
+    relay = subprocess.Popen(
+        [sys.executable, "-m", "src.core.execution.agent_relay", "serve", "--socket", str(path),
+         "--idle-timeout", str(idle_timeout), command],
+        stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT, env=env, start_new_session=True)
+    deadline = time.monotonic() + CONNECT_TIMEOUT
+    while not warm_worker.connectable(path):
+        if relay.poll() is not None or time.monotonic() > deadline:
+            if relay.poll() is None:
+                relay.kill()
+            log.seek(0)
+            raise RuntimeError(log.read().decode(errors="replace").strip() or "agent relay did not start")
+        time.sleep(0.01)
+
+
+def run(host: str, command: str, transport: str = DEFAULT_TRANSPORT, python: str = "python3",
+        timeout: float | None = None, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> RemoteResult:
+    """
+    Run a shell command on a host through its agent, starting the relay and agent if needed.
+
+    Args:
+        host: Host name (substituted for {host} in the transport)
+        command: Shell command to run on the host
+        transport: Command that connects to the host and runs its arguments there
+        python: Python 3 interpreter on the host
+        timeout: Seconds after which the command is killed on the host (default: no limit)
+        idle_timeout: Seconds a new relay waits for commands before closing the channel
+
+    Returns:
+        RemoteResult of the command
+
+    Raises:
+        RuntimeError: If the agent cannot be started
+        ConnectionError: If the channel breaks before the command completes
+    """
+    path = socket_path(host, transport, python)
+    started = False
+    if not warm_worker.connectable(path):
+        # One client starts the relay; concurrent copies wait for it
+        with open(path.with_suffix(".lock"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            if not warm_worker.connectable(path):
+                start_relay(path, agent_command(host, transport, python), idle_timeout)
+                started = True
+    try:
+        reply = warm_worker.send_request(path, {"command": command, "timeout": timeout})
+    except ConnectionError:
+        raise ConnectionError(f"Channel to {host} closed before the command completed") from None
+    status = int(reply["status"])
+    return RemoteResult(status=status if status >= 0 else 128 - status, output=reply["output"],
+                        elapsed=float(reply["elapsed"]), user_time=float(reply["user"]),
+                        sys_time=float(reply["sys"]), started=started)
+
+
+def relay_sockets() -> List[Path]:
+    """Sockets of this user's relays."""
+    return sorted(warm_worker.socket_dir().glob(f"sharp-agent-{os.getuid()}-*.sock"))
+
+
+def run_all(command: str, timeout: float | None = None) -> int:
+    """
+    Run a command on every host with a running relay (e.g. a reset).
+
+    Returns:
+        Highest exit status (0 if there are no relays)
+    """
+    worst = 0
+    for path in relay_sockets():
+        try:
+            reply = warm_worker.send_request(path, {"command": command, "timeout": timeout})
+        except (OSError, ValueError):
+            continue  # Relay is gone
+        sys.stdout.write(reply["output"])
+        status = int(reply["status"])
+        worst = max(worst, status if status >= 0 else 128 - status)
+    return worst
+
+
+def stop_all() -> int:
+    """
+    Stop all relays of this user, closing their channels.
+
+    Returns:
+        Number of relays stopped
+    """
+    stopped = 0
+    for path in relay_sockets():
+        try:
+            warm_worker.send_request(path, {"op": "stop"}, timeout=10)
+            stopped += 1
+        except (OSError, ValueError):
+            with contextlib.suppress(OSError):
+                path.unlink()  # Relay is gone
+        with contextlib.suppress(OSError):
+            path.with_suffix(".lock").unlink()
+    deadline = time.monotonic() + 10
+    while relay_sockets() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return stopped
+
+
+def main(argv: List[str] | None = None) -> int:
+    """
+    Command-line entry point (the sshagent backend's run, sys spec and reset commands).
+
+    Returns:
+        Exit status of the remote command (or of the relay, for serve)
+    """
+    parser = argparse.ArgumentParser(description="Run commands on hosts through persistent agents")
+    commands = parser.add_subparsers(dest="subcommand", required=True)
+
+    runner = commands.add_parser("run", help="Run a shell command on a host (or on all connected hosts)")
+    runner.add_argument("--transport", default=DEFAULT_TRANSPORT,
+                        help="Command that runs its argument on the host ({host} is replaced)")
+    runner.add_argument("--python", default="python3", help="Python 3 interpreter on the host")
+    runner.add_argument("--timeout", type=float, help="Seconds after which the command is killed")
+    runner.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help="Seconds an idle relay keeps its channel open")
+    runner.add_argument("--all", action="store_true", help="Run on every host with a running relay")
+    runner.add_argument("--quiet", action="store_true",
+                        help="Print only the command's output (no metrics line), e.g. for sys specs")
+    runner.add_argument("host", nargs="?", help="Host to run on")
+    runner.add_argument("command", nargs=argparse.REMAINDER, help="Shell command")
+
+    commands.add_parser("stop", help="Stop all relays and their agents")
+
+    server = commands.add_parser("serve", help=argparse.SUPPRESS)
+    server.add_argument("--socket", required=True)
+    server.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT)
+    server.add_argument("agent_command")
+
+    args = parser.parse_args(argv)
+    if args.subcommand == "stop":
+        stop_all()
+        return 0
+    if args.subcommand == "serve":
+        try:
+            relay = AgentRelay(args.socket, args.agent_command, args.idle_timeout)
+        except (RuntimeError, OSError) as e:
+            print(f"agent-relay: {e}", file=sys.stderr)
+            return 1
+        relay.serve()
+        return 0
+
+    if args.all:
+        # With --all, the first positional is part of the command
+        return run_all(" ".join(filter(None, [args.host] + args.command)), args.timeout)
+    if not args.host or not args.command:
+        parser.error("host and command are required")
+    try:
+        result = run(args.host, " ".join(args.command), args.transport, args.python, args.timeout,
+                     args.idle_timeout)
+    except (RuntimeError, OSError, ValueError) as e:
+        print(f"agent-relay: {e}", file=sys.stderr)
+        return 255  # As ssh does when it cannot connect
+    sys.stdout.write(result.output)
+    if not args.quiet:
+        print(f"remote-agent output {int(result.started)} {result.elapsed:.6f} "
+              f"{result.user_time:.6f} {result.sys_time:.6f}")
+    return result.status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,9 +10,23 @@ and host round-robin for SSH-like backends.
 
 import os
 import platform
+import re
+import shlex
 import tempfile
 from typing import Any, Dict, List
 
+# Characters with a meaning to the shell (beyond quoting and word splitting): a
+# command containing any of them, even quoted, is left to the shell
+_SHELL_CHARS = frozenset("|&;<>()$`\\*?[]{}~#!\n")
+# Words the shell treats specially (reserved words and builtins) at the start of a command
+_SHELL_WORDS = frozenset({
+    "!", ".", ":", "alias", "break", "case", "cd", "command", "continue", "do", "done", "elif", "else",
+    "esac", "eval", "exec", "exit", "export", "fi", "for", "function", "if", "read", "readonly", "return",
+    "select", "set", "shift", "source", "then", "time", "times", "trap", "type", "ulimit", "umask",
+    "unset", "until", "wait", "while",
+})
+_ASSIGNMENT = re.compile(r"[A-Za-z_][A-Za-z0-9_]*=")
+
 
 class CommandComposer:
     """
@@ -27,6 +41,7 @@ class CommandComposer:
     - Backend chaining (outer/left backends wrap inner/right backends, forming composition)
     - MPI vs non-MPI backend detection and command generation
     - Host round-robin for SSH-like backends
+    - Argv form of composed commands that need no shell (see argv())
     """
 
     def __init__(self, backend_options: Dict[str, Dict[str, Any]], benchmark_spec: Dict[str, Any] | None = None,
@@ -60,6 +75,34 @@ class CommandComposer:
         # Lazily created temporary directory for MPI outputs
         self.unique_tmp_dir: str | None = None
 
+    @staticmethod
+    def argv(command: str) -> List[str] | None:
+        """
+        Split a composed command into an argv, if running it needs no shell.
+
+        A command qualifies when it is a single simple command: no pipes,
+        redirections, command separators, substitutions, globs, comments or
+        variable assignments, and it does not start with a shell builtin or
+        reserved word. Quotes are allowed and removed, as the shell would.
+        Executing the argv directly then behaves like `sh -c command`.
+
+        Args:
+            command: Composed shell command
+
+        Returns:
+            List of arguments, or None if the command needs the shell
+        """
+        command = command.strip()  # Templates written as YAML block scalars end with a newline
+        if _SHELL_CHARS.intersection(command):
+            return None
+        try:
+            argv = shlex.split(command)
+        except ValueError:
+            return None  # Unbalanced quotes: let the shell report it
+        if not argv or argv[0] in _SHELL_WORDS or _ASSIGNMENT.match(argv[0]):
+            return None
+        return argv
+
     def _extract_hosts_from_backend_options(self, backend_options: Dict[str, Dict[str, Any]]) -> List[str]:
         """
         Extract hosts from any backend that has a 'hosts' option.
@@ -0,0 +1,594 @@
+"""
+Local FaaS emulator: benchmark functions served over HTTP by pools of warm instances.
+
+The micro benchmarks are Flask apps written for Fission and Knative, but
+measuring cold versus warm function behavior on those platforms needs a
+Kubernetes cluster. The faaslocal backend emulates the platform on the local
+host instead. A gateway process serves every deployed function at
+
+    POST http://127.0.0.1:PORT/<function>
+
+with the request body, split on whitespace, as the arguments of the
+benchmark's entry function (see warm_worker.resolve_entry). Each function has
+a pool of instances: warm worker processes that import the benchmark once and
+handle one call at a time. A request takes an idle instance (a warm start) or,
+if none is idle and the pool is below max_replicas, starts a new one (a cold
+start, which includes interpreter startup and the benchmark's imports).
+Instances idle for idle_timeout seconds are stopped, down to min_replicas;
+scaling a function up to at least min_replicas ahead of the requests pre-warms
+its pool (keeping instances already warm), and scaling it to zero forces the next requests to start cold.
+
+Every response carries X-Faas-Cold (1 for a cold start), X-Faas-Startup-Time
+(seconds the serving instance took to start) and X-Faas-Call-Time (seconds
+in the entry function). The backend's command runs this module:
+
+    python3 -m src.core.execution.faas_local invoke --concurrency $MPL BENCHMARK.py ARGS...
+
+which starts the gateway if needed (it exits after being idle for
+--gateway-idle-timeout seconds), deploys the benchmark as a function named
+after its file, sends the requests over pooled HTTP connections (see
+http_invoker) and prints each response body followed by one line per request:
+
+    faaslocal output INDEX STATUS LATENCY COLD WARM_LATENCY COLD_LATENCY STARTUP_TIME CALL_TIME
+
+where LATENCY is the request's HTTP latency, repeated as WARM_LATENCY or
+COLD_LATENCY by the kind of start (the other is NA). The scale subcommand
+(the backend's reset command) scales functions, e.g. to zero.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import fcntl
+import itertools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from src.core.execution import warm_worker
+from src.core.execution.http_invoker import invoke_concurrently
+
+DEFAULT_MAX_REPLICAS = 16
+DEFAULT_IDLE_TIMEOUT = 60.0  # Seconds an idle instance is kept (above min_replicas)
+DEFAULT_GATEWAY_IDLE_TIMEOUT = 600.0  # Seconds without requests after which the gateway exits
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+@dataclass
+class FunctionSpec:
+    """A deployed function and its scaling limits."""
+    name: str
+    path: str  # Benchmark .py file
+    function: str | None = None  # Entry function (default: the Flask route '/' function)
+    min_replicas: int = 0
+    max_replicas: int = DEFAULT_MAX_REPLICAS
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT
+    mtime_ns: int = 0  # Of path when deployed: redeploying a changed file replaces its instances
+    cwd: str = ""  # Working directory of the instances (default: the gateway's)
+
+
+@dataclass
+class _Instance:
+    """One warm worker process serving a function."""
+    socket: Path
+    startup_time: float = 0.0  # Seconds from spawn to serving
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class FunctionPool:
+    """
+    Instances of one function, scaled between min_replicas and max_replicas.
+
+    Args:
+        spec: Function to serve
+        socket_prefix: Path prefix of the instances' Unix sockets
+    """
+
+    def __init__(self, spec: FunctionSpec, socket_prefix: str) -> None:
+        """Initialize an empty pool (see class docstring)."""
+        if not 0 <= spec.min_replicas <= spec.max_replicas or spec.max_replicas < 1:
+            raise ValueError(f"Invalid replicas for {spec.name}: min {spec.min_replicas}, max {spec.max_replicas}")
+        self.spec = spec
+        self._socket_prefix = socket_prefix
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._idle: List[_Instance] = []
+        self._total = 0  # Idle, busy and starting instances
+        self.cold_starts = 0  # Requests that started an instance
+        self.requests = 0
+
+    def call(self, args: List[str]) -> Tuple[Dict[str, Any], bool, float]:
+        """
+        Call the function on an idle instance, starting one if needed.
+
+        Returns:
+            Tuple of (reply of the warm worker, cold start, instance startup time)
+
+        Raises:
+            RuntimeError: If a new instance fails to start
+            OSError: If the instance fails during the call
+        """
+        instance, cold = self._acquire()
+        healthy = False
+        try:
+            reply = warm_worker.send_request(instance.socket, {"args": args})
+            healthy = True
+            return reply, cold, instance.startup_time
+        finally:
+            self._release(instance, healthy)
+
+    def _acquire(self) -> Tuple[_Instance, bool]:
+        with self._cond:
+            self.requests += 1
+            self._cond.wait_for(lambda: bool(self._idle) or self._total < self.spec.max_replicas)
+            if self._idle:
+                return self._idle.pop(), False
+            self._total += 1
+            self.cold_starts += 1
+        try:
+            return self._start_instance(), True
+        except BaseException:
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, instance: _Instance, healthy: bool) -> None:
+        with self._cond:
+            if healthy:
+                instance.last_used = time.monotonic()
+                self._idle.append(instance)
+            else:
+                self._total -= 1
+            self._cond.notify()
+        if not healthy:
+            self._stop_instance(instance)
+
+    def _start_instance(self) -> _Instance:
+        socket = Path(f"{self._socket_prefix}-{next(self._counter)}.sock")
+        start = time.perf_counter()
+        # Instances start in the deploying client's directory, and outlive an
+        # idle gateway only briefly: it stops them, this is a safety net
+        warm_worker.start_worker(socket, self.spec.path, "inproc", self.spec.function,
+                                 idle_timeout=max(self.spec.idle_timeout, DEFAULT_GATEWAY_IDLE_TIMEOUT) * 2,
+                                 cwd=self.spec.cwd or None)
+        return _Instance(socket, time.perf_counter() - start)
+
+    @staticmethod
+    def _stop_instance(instance: _Instance) -> None:
+        with contextlib.suppress(OSError, ValueError):
+            warm_worker.send_request(instance.socket, {"op": "stop"}, timeout=10)
+
+    def scale(self, replicas: int, at_least: bool = False) -> int:
+        """
+        Start or stop idle instances to reach `replicas` (busy instances are kept).
+
+        Args:
+            replicas: Number of instances to reach
+            at_least: Only start instances, keeping any above `replicas`
+
+        Returns:
+            Number of instances afterwards
+        """
+        with self._cond:
+            excess = [] if at_least else self._idle[:max(0, self._total - replicas)]
+            self._idle = self._idle[len(excess):]
+            self._total -= len(excess)
+            missing = max(0, min(replicas, self.spec.max_replicas) - self._total)
+            self._total += missing
+        for instance in excess:
+            self._stop_instance(instance)
+        started: List[_Instance] = []
+        errors: List[BaseException] = []
+
+        def start() -> None:
+            try:
+                started.append(self._start_instance())
+            except BaseException as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=start) for _ in range(missing)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with self._cond:
+            self._total -= len(errors)
+            self._idle.extend(started)
+            self._cond.notify_all()
+            total = self._total
+        if errors:
+            raise RuntimeError(f"Cannot start {self.spec.name}: {errors[0]}")
+        return total
+
+    def reap_idle(self) -> None:
+        """Stop instances idle for longer than idle_timeout, down to min_replicas."""
+        now = time.monotonic()
+        with self._cond:
+            expired = [i for i in self._idle if now - i.last_used >= self.spec.idle_timeout]
+            expired = expired[:max(0, self._total - self.spec.min_replicas)]
+            for instance in expired:
+                self._idle.remove(instance)
+            self._total -= len(expired)
+        for instance in expired:
+            self._stop_instance(instance)
+
+    def state(self) -> Dict[str, Any]:
+        """Deployment and instance counts, for listing."""
+        with self._cond:
+            return asdict(self.spec) | {"instances": self._total, "idle": len(self._idle),
+                                        "requests": self.requests, "cold_starts": self.cold_starts}
+
+
+class FaasGateway(ThreadingHTTPServer):
+    """
+    HTTP gateway of the local FaaS emulator.
+
+    Routes:
+        POST /<name>                 Invoke a function (body: whitespace-separated arguments)
+        PUT /_functions/<name>       Deploy or update a function (body: FunctionSpec fields as JSON)
+        GET /_functions              List functions and their instances
+        POST /_scale                 Scale functions (body: {"replicas": N, "name": optional,
+                                     "at_least": optional, only scale up})
+        POST /_stop                  Stop the gateway and all instances
+
+    Args:
+        address: Address to listen on (default: an ephemeral localhost port)
+        idle_timeout: Seconds without requests after which serve() returns
+        socket_dir: Directory for instance sockets (default: warm_worker.socket_dir())
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int] = ("127.0.0.1", 0),
+                 idle_timeout: float = DEFAULT_GATEWAY_IDLE_TIMEOUT, socket_dir: Path | None = None) -> None:
+        """Bind the gateway (see class docstring)."""
+        super().__init__(address, _GatewayHandler)
+        self.idle_timeout = idle_timeout
+        self.pools: Dict[str, FunctionPool] = {}
+        self._lock = threading.Lock()
+        self._deployments = itertools.count()
+        self._socket_dir = socket_dir or warm_worker.socket_dir()
+        self._last_request = time.monotonic()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the gateway."""
+        host, port = self.server_address[:2]
+        return f"http://{host.decode() if isinstance(host, bytes) else host}:{port}"
+
+    def deploy(self, spec: FunctionSpec) -> None:
+        """Deploy a function, replacing its instances if its code or entry changed."""
+        with self._lock:
+            old = self.pools.get(spec.name)
+            if old is not None and (old.spec.path, old.spec.mtime_ns, old.spec.function, old.spec.cwd) == \
+                    (spec.path, spec.mtime_ns, spec.function, spec.cwd):
+                old.spec.min_replicas, old.spec.max_replicas = spec.min_replicas, spec.max_replicas
+                old.spec.idle_timeout = spec.idle_timeout
+                return
+            # Short names (Unix socket paths are limited to ~100 bytes); not sharp-warm-*, so stop_all skips them
+            prefix = self._socket_dir / f"sharp-faas-{os.getuid()}-{os.getpid()}-{next(self._deployments)}"
+            self.pools[spec.name] = FunctionPool(spec, str(prefix))
+        if old is not None:
+            old.scale(0)
+
+    def touch(self) -> None:
+        """Record activity (postpones the idle shutdown)."""
+        self._last_request = time.monotonic()
+
+    def serve(self) -> None:
+        """Serve until stopped or idle for idle_timeout seconds, then stop all instances."""
+        reaper = threading.Thread(target=self._reap, daemon=True)
+        reaper.start()
+        try:
+            self.serve_forever(poll_interval=0.2)
+        finally:
+            self.server_close()
+            for pool in list(self.pools.values()):
+                pool.scale(0)
+
+    def _reap(self) -> None:
+        """Scale down idle instances; shut the gateway down when idle."""
+        while True:
+            time.sleep(0.5)
+            for pool in list(self.pools.values()):
+                pool.reap_idle()
+            if time.monotonic() - self._last_request >= self.idle_timeout:
+                break
+        self.shutdown()
+
+
+class _GatewayHandler(BaseHTTPRequestHandler):
+    """Handles gateway requests (see FaasGateway)."""
+
+    server: FaasGateway
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        """List functions."""
+        self.server.touch()
+        if self.path.rstrip("/") != "/_functions":
+            self._reply(404, b"Not found\n")
+            return
+        states = {name: pool.state() for name, pool in list(self.server.pools.items())}
+        self._reply(200, json.dumps(states).encode(), content_type="application/json")
+
+    def do_PUT(self) -> None:
+        """Deploy a function."""
+        self.server.touch()
+        body = self._body()
+        name = self.path.strip("/").removeprefix("_functions/")
+        if not self.path.startswith("/_functions/") or not name:
+            self._reply(404, b"Not found\n")
+            return
+        try:
+            self.server.deploy(FunctionSpec(**(json.loads(body or b"{}") | {"name": name})))
+        except (TypeError, ValueError) as e:
+            self._reply(400, f"{e}\n".encode())
+            return
+        self._reply(200, b"Deployed\n")
+
+    def do_POST(self) -> None:
+        """Invoke a function, or run an administrative operation."""
+        self.server.touch()
+        body = self._body()
+        name = self.path.split("?")[0].strip("/")
+        if name == "_stop":
+            self._reply(200, b"Stopping\n")
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        elif name == "_scale":
+            self._scale(body)
+        elif name in self.server.pools:
+            self._invoke(self.server.pools[name], body)
+        else:
+            self._reply(404, f"No function named '{name}'\n".encode())
+
+    def _scale(self, body: bytes) -> None:
+        try:
+            request = json.loads(body or b"{}")
+            replicas = int(request["replicas"])
+            names = [request["name"]] if request.get("name") else list(self.server.pools)
+            at_least = bool(request.get("at_least"))
+            counts = {name: self.server.pools[name].scale(replicas, at_least) for name in names}
+        except (KeyError, TypeError, ValueError) as e:
+            self._reply(400, f"Invalid scale request: {e}\n".encode())
+            return
+        except RuntimeError as e:
+            self._reply(500, f"{e}\n".encode())
+            return
+        self._reply(200, json.dumps(counts).encode(), content_type="application/json")
+
+    def _invoke(self, pool: FunctionPool, body: bytes) -> None:
+        try:
+            reply, cold, startup_time = pool.call(body.decode(errors="replace").split())
+        except (RuntimeError, OSError, ValueError) as e:
+            self._reply(502, f"Function {pool.spec.name} failed: {e}\n".encode())
+            return
+        self._reply(200 if reply["status"] == 0 else 500, reply["output"].encode(), headers={
+            "X-Faas-Cold": str(int(cold)),
+            "X-Faas-Startup-Time": f"{reply.get('worker_start_time', startup_time):.6f}",
+            "X-Faas-Call-Time": f"{reply['call_time']:.6f}",
+        })
+
+    def _body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def _reply(self, status: int, body: bytes, content_type: str = "text/plain",
+               headers: Dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass  # No access log
+
+
+# =============================================================================
+# Client side
+# =============================================================================
+
+def state_path() -> Path:
+    """File where the running gateway records its URL."""
+    return warm_worker.socket_dir() / f"sharp-faaslocal-{os.getuid()}.json"
+
+
+def _admin(url: str, method: str, path: str, payload: Dict[str, Any] | None = None,
+           timeout: float = 10) -> bytes:
+    """Send an administrative request to the gateway and return the response body."""
+    data = json.dumps(payload).encode() if payload is not None else None
+    request = urllib.request.Request(f"{url}{path}", data=data, method=method,
+                                     headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        body: bytes = response.read()
+    return body
+
+
+def running_gateway() -> str | None:
+    """URL of the running gateway, or None."""
+    try:
+        url = json.loads(state_path().read_text())["url"]
+        _admin(url, "GET", "/_functions", timeout=2)
+        return str(url)
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def ensure_gateway(idle_timeout: float = DEFAULT_GATEWAY_IDLE_TIMEOUT) -> str:
+    """
+    URL of the running gateway, starting one if needed.
+
+    Raises:
+        RuntimeError: If the gateway does not start
+    """
+    url = running_gateway()
+    if url:
+        return url
+    with open(state_path().with_suffix(".lock"), "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        url = running_gateway()
+        if url:
+            return url
+        log = tempfile.TemporaryFile()
+        env = os.environ | {"PYTHONPATH": os.pathsep.join(filter(None, [str(PROJECT_ROOT),
+                                                                         os.environ.get("PYTHONPATH")]))}
+        gateway = subprocess.Popen(
+            [sys.executable, "-m", "src.core.execution.faas_local", "serve", "--idle-timeout", str(idle_timeout)],
+            stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT, env=env, start_new_session=True)
+        deadline = time.monotonic() + warm_worker.STARTUP_TIMEOUT
+        while not (url := running_gateway()):
+            if gateway.poll() is not None or time.monotonic() > deadline:
+                if gateway.poll() is None:
+                    gateway.kill()
+                log.seek(0)
+                raise RuntimeError(log.read().decode(errors="replace").strip() or "faaslocal gateway did not start")
+            time.sleep(0.01)
+        return url
+
+
+def deploy(url: str, spec: FunctionSpec) -> None:
+    """Deploy (or update) a function on the gateway."""
+    payload = {k: v for k, v in asdict(spec).items() if k != "name"}
+    _admin(url, "PUT", f"/_functions/{spec.name}", payload)
+
+
+def scale(url: str, replicas: int, name: str | None = None, at_least: bool = False) -> Dict[str, int]:
+    """
+    Scale one function (or all) to a number of idle instances (with at_least, only up to it).
+
+    Returns:
+        Instances of each scaled function afterwards
+    """
+    payload = {"replicas": replicas, "name": name, "at_least": at_least}
+    counts: Dict[str, int] = json.loads(_admin(url, "POST", "/_scale", payload, timeout=warm_worker.STARTUP_TIMEOUT))
+    return counts
+
+
+def _serve(idle_timeout: float) -> int:
+    """Gateway process main: serve until idle, recording the URL in the state file."""
+    gateway = FaasGateway(idle_timeout=idle_timeout)
+    path = state_path()
+    with tempfile.NamedTemporaryFile("w", dir=path.parent, delete=False) as f:
+        json.dump({"url": gateway.url, "pid": os.getpid()}, f)
+    os.replace(f.name, path)
+    try:
+        gateway.serve()
+    finally:
+        with contextlib.suppress(OSError, ValueError, KeyError):
+            if json.loads(path.read_text())["pid"] == os.getpid():
+                path.unlink()
+    return 0
+
+
+def _invoke(args: argparse.Namespace) -> int:
+    """Deploy the benchmark, send the requests and print their outputs and timings."""
+    benchmark = os.path.abspath(args.benchmark)
+    if not benchmark.endswith(".py"):
+        print(f"faaslocal: {args.benchmark} is not a Python benchmark (.py)", file=sys.stderr)
+        return 1
+    spec = FunctionSpec(name=args.name or Path(benchmark).stem, path=benchmark, function=args.function,
+                        min_replicas=args.min_replicas, max_replicas=args.max_replicas,
+                        idle_timeout=args.idle_timeout, mtime_ns=os.stat(benchmark).st_mtime_ns, cwd=os.getcwd())
+    try:
+        url = ensure_gateway(args.gateway_idle_timeout)
+        deploy(url, spec)
+        if spec.min_replicas:
+            scale(url, spec.min_replicas, spec.name, at_least=True)  # Pre-warm before the timed requests
+        results = asyncio.run(invoke_concurrently(f"{url}/{spec.name}", " ".join(args.args).encode(),
+                                                  args.concurrency, args.requests, args.timeout))
+    except (RuntimeError, OSError, ValueError) as e:
+        print(f"faaslocal: {e}", file=sys.stderr)
+        return 1
+
+    for result in results:
+        if result.error:
+            print(f"faaslocal: request {result.index} failed: {result.error}", file=sys.stderr)
+        elif result.body:
+            text = result.body.decode(errors="replace")
+            print(text, end="" if text.endswith("\n") else "\n")
+    for result in results:
+        cold = result.headers.get("x-faas-cold", "NA")
+        latency = f"{result.latency:.9f}" if result.status else "NA"
+        warm_latency = latency if cold == "0" else "NA"
+        cold_latency = latency if cold == "1" else "NA"
+        print(f"faaslocal output {result.index} {result.status} {latency} {cold} {warm_latency} {cold_latency} "
+              f"{result.headers.get('x-faas-startup-time', 'NA')} {result.headers.get('x-faas-call-time', 'NA')}")
+    return 0 if all(200 <= r.status < 300 for r in results) else 1
+
+
+def main(argv: List[str] | None = None) -> int:
+    """
+    Command-line entry point (the faaslocal backend's run and reset commands).
+
+    Returns:
+        Exit code (invoke: 0 if every request succeeded)
+    """
+    parser = argparse.ArgumentParser(description="Local FaaS emulator for Python benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    invoke = commands.add_parser("invoke", help="Invoke a benchmark as a function (deploying it if needed)")
+    invoke.add_argument("--concurrency", type=int, default=1, help="Requests in flight at once")
+    invoke.add_argument("--requests", type=int, default=1, help="Requests per connection")
+    invoke.add_argument("--timeout", type=float, default=warm_worker.STARTUP_TIMEOUT, help="Seconds per request")
+    invoke.add_argument("--name", help="Function name (default: benchmark file name)")
+    invoke.add_argument("--function", help="Entry function (default: the Flask route '/' function)")
+    invoke.add_argument("--min-replicas", type=int, default=0,
+                        help="Instances kept warm (started before the requests)")
+    invoke.add_argument("--max-replicas", type=int, default=DEFAULT_MAX_REPLICAS,
+                        help="Most instances of the function")
+    invoke.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help="Seconds an idle instance is kept above --min-replicas")
+    invoke.add_argument("--gateway-idle-timeout", type=float, default=DEFAULT_GATEWAY_IDLE_TIMEOUT,
+                        help="Seconds without requests before a new gateway exits")
+    invoke.add_argument("benchmark", help="Benchmark .py file")
+    invoke.add_argument("args", nargs=argparse.REMAINDER, help="Arguments for the entry function")
+
+    scaler = commands.add_parser("scale", help="Scale deployed functions (e.g. to zero)")
+    scaler.add_argument("--replicas", type=int, default=0, help="Instances to keep (default: 0)")
+    scaler.add_argument("name", nargs="?", help="Function name (default: all)")
+
+    commands.add_parser("url", help="Print the gateway URL (starting the gateway if needed)")
+    commands.add_parser("stop", help="Stop the gateway and all instances")
+
+    server = commands.add_parser("serve", help=argparse.SUPPRESS)
+    server.add_argument("--idle-timeout", type=float, default=DEFAULT_GATEWAY_IDLE_TIMEOUT)
+
+    args = parser.parse_args(argv)
+    if args.command == "serve":
+        return _serve(args.idle_timeout)
+    if args.command == "invoke":
+        return _invoke(args)
+
+    url = ensure_gateway() if args.command == "url" else running_gateway()
+    try:
+        if args.command == "url":
+            print(url)
+        elif args.command == "scale" and url:
+            scale(url, args.replicas, args.name)
+        elif args.command == "stop" and url:
+            _admin(url, "POST", "/_stop")
+    except (OSError, ValueError) as e:
+        print(f"faaslocal: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,431 @@
+"""
+HTTP invocation of FaaS functions over pooled keep-alive connections.
+
+The knative and fission backends start a kubectl (or fission) pipeline and a
+curl process for every invocation, so each measurement includes the CLI
+startup, an API-server lookup and a new TCP (or TLS) handshake. The http
+backend runs this module instead, once per iteration:
+
+    python3 -m src.core.execution.http_invoker --concurrency $MPL --url URL ARGS...
+    python3 -m src.core.execution.http_invoker --concurrency $MPL --resolve "kubectl get ksvc $FN ..." ARGS...
+
+It resolves the function URL (with --resolve, by running the command once
+and caching its output for --resolve-ttl seconds), opens --concurrency
+keep-alive connections, then sends --concurrency requests at once (asyncio)
+and waits for all responses. With --requests N, each connection then sends
+N requests back to back. Every request POSTs the arguments, joined by
+spaces, as the body, as the curl pipeline does.
+
+Connection setup is timed separately from the requests, and latencies are
+measured in-process with a monotonic nanosecond clock, so they exclude
+process startup, URL resolution and handshakes. After printing each response
+body, the invoker prints one line per request for the backend's metrics:
+
+    http-invoke output INDEX STATUS LATENCY CONNECT_TIME BYTES
+
+where STATUS is the HTTP status (0 if the request failed), LATENCY the
+seconds from sending the request to reading the whole response, and
+CONNECT_TIME the seconds it took to open the connection the request used.
+
+This module only uses the standard library, so the invoker starts quickly.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+DEFAULT_TIMEOUT = 60.0  # Seconds per request
+DEFAULT_RESOLVE_TTL = 300.0  # Seconds a resolved URL is reused
+
+
+@dataclass
+class HttpResponse:
+    """A complete HTTP response."""
+    status: int
+    headers: Dict[str, str]  # Lower-case names
+    body: bytes
+    latency: float  # Seconds from sending the request to reading the whole response
+
+
+@dataclass
+class InvocationResult:
+    """Outcome of one invocation (see invoke_concurrently)."""
+    index: int
+    status: int  # HTTP status (0 if the request failed)
+    latency: float  # Seconds (0 if the request failed)
+    connect_time: float  # Seconds to open the connection used
+    body: bytes = b""
+    error: str = ""
+    headers: Dict[str, str] = field(default_factory=dict)  # Response headers (lower-case names)
+
+
+@dataclass
+class _Target:
+    """Where to connect and what to request, parsed from a URL."""
+    host: str
+    port: int
+    tls: bool
+    path: str  # Path and query
+    authority: str  # Host header value
+
+    @classmethod
+    def parse(cls, url: str) -> _Target:
+        parts = urlsplit(url if "://" in url else f"http://{url}")
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Invalid function URL: {url!r}")
+        tls = parts.scheme == "https"
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        return cls(parts.hostname, parts.port or (443 if tls else 80), tls, path, parts.netloc)
+
+
+class HttpConnection:
+    """
+    One HTTP/1.1 keep-alive connection (requests on it run one at a time).
+
+    Use HttpConnection.open() to connect; connect_time is how long that took.
+    """
+
+    def __init__(self, target: _Target, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 connect_time: float) -> None:
+        """Wrap an open stream (see open())."""
+        self.target = target
+        self.connect_time = connect_time
+        self.reusable = True  # False once the server closes or the stream breaks
+        self.requests_sent = 0
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def open(cls, url: str, timeout: float = DEFAULT_TIMEOUT) -> HttpConnection:
+        """Connect (with TLS for https URLs) and time the connection setup."""
+        target = _Target.parse(url)
+        start = time.perf_counter_ns()
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(target.host, target.port,
+                                    ssl=ssl.create_default_context() if target.tls else None),
+            timeout)
+        return cls(target, reader, writer, (time.perf_counter_ns() - start) / 1e9)
+
+    async def request(self, method: str = "POST", body: bytes = b"",
+                      headers: Dict[str, str] | None = None, path: str | None = None) -> HttpResponse:
+        """
+        Send a request and read the whole response.
+
+        Raises:
+            ConnectionError: If the connection closes before a complete response
+            ValueError: If the response is not valid HTTP/1.x
+        """
+        lines = [f"{method} {path or self.target.path} HTTP/1.1", f"Host: {self.target.authority}",
+                 f"Content-Length: {len(body)}", "Connection: keep-alive"]
+        lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        self.requests_sent += 1
+        start = time.perf_counter_ns()
+        try:
+            self._writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+            await self._writer.drain()
+            status, response_headers = await self._read_head()
+            content = await self._read_body(method, status, response_headers)
+        except (OSError, asyncio.IncompleteReadError) as e:
+            self.reusable = False
+            raise ConnectionError(f"Connection to {self.target.authority} failed: {e}") from e
+        except BaseException:
+            self.reusable = False  # E.g. cancelled by a timeout: the stream is mid-response
+            raise
+        latency = (time.perf_counter_ns() - start) / 1e9
+        if response_headers.get("connection", "").lower() == "close":
+            self.reusable = False
+        return HttpResponse(status, response_headers, content, latency)
+
+    async def _read_head(self) -> Tuple[int, Dict[str, str]]:
+        status_line = await self._reader.readline()
+        if not status_line:
+            raise asyncio.IncompleteReadError(b"", None)
+        parts = status_line.decode("latin-1").split(None, 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/1."):
+            raise ValueError(f"Invalid HTTP status line: {status_line!r}")
+        headers: Dict[str, str] = {}
+        while True:
+            line = await self._reader.readline()
+            if line in (b"\r\n", b"\n"):
+                break
+            if not line:
+                raise asyncio.IncompleteReadError(b"", None)
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        return int(parts[1]), headers
+
+    async def _read_body(self, method: str, status: int, headers: Dict[str, str]) -> bytes:
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            return b""
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks: List[bytes] = []
+            while True:
+                size = int((await self._reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    while (await self._reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass  # Trailers
+                    return b"".join(chunks)
+                chunks.append(await self._reader.readexactly(size))
+                await self._reader.readexactly(2)
+        if "content-length" in headers:
+            return await self._reader.readexactly(int(headers["content-length"]))
+        self.reusable = False  # Body ends when the server closes
+        return await self._reader.read()
+
+    async def close(self) -> None:
+        """Close the connection."""
+        self.reusable = False
+        self._writer.close()
+        with contextlib.suppress(OSError, ssl.SSLError):
+            await self._writer.wait_closed()
+
+
+class HttpPool:
+    """
+    Pool of keep-alive connections to one function URL.
+
+    Connections are opened on demand, up to size, and returned to the pool
+    after each request unless the server closed them.
+    """
+
+    def __init__(self, url: str, size: int = 1, timeout: float = DEFAULT_TIMEOUT) -> None:
+        """
+        Args:
+            url: Function URL (http:// or https://)
+            size: Maximum connections open at once
+            timeout: Seconds to wait for a connection or a response
+        """
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+        _Target.parse(url)  # Fail early on bad URLs
+        self.url = url
+        self.size = size
+        self.timeout = timeout
+        self._idle: List[HttpConnection] = []
+        self._open = 0
+        self._available: asyncio.Condition | None = None  # Created inside the event loop
+
+    async def prewarm(self, count: int | None = None) -> List[float]:
+        """
+        Open connections ahead of the requests (all at once).
+
+        Args:
+            count: Connections to open (default: pool size)
+
+        Returns:
+            Connect time of each opened connection
+        """
+        count = min(self.size - self._open, self.size if count is None else count)
+        self._open += count
+        try:
+            connections = await asyncio.gather(*(HttpConnection.open(self.url, self.timeout) for _ in range(count)))
+        except BaseException:
+            self._open -= count
+            raise
+        self._idle.extend(connections)
+        return [c.connect_time for c in connections]
+
+    @contextlib.asynccontextmanager
+    async def connection(self) -> AsyncIterator[HttpConnection]:
+        """Borrow a connection (opening one if none is idle and the pool is not full)."""
+        if self._available is None:
+            self._available = asyncio.Condition()
+        async with self._available:
+            await self._available.wait_for(lambda: bool(self._idle) or self._open < self.size)
+            connection = self._idle.pop(0) if self._idle else None
+            if connection is None:
+                self._open += 1
+        if connection is None:
+            try:
+                connection = await HttpConnection.open(self.url, self.timeout)
+            except BaseException:
+                await self._release(None)
+                raise
+        try:
+            yield connection
+        finally:
+            await self._release(connection)
+
+    async def _release(self, connection: HttpConnection | None) -> None:
+        assert self._available is not None
+        async with self._available:
+            if connection is not None and connection.reusable:
+                self._idle.append(connection)
+            else:
+                self._open -= 1
+                if connection is not None:
+                    await connection.close()
+            self._available.notify()
+
+    async def request(self, body: bytes = b"", method: str = "POST",
+                      headers: Dict[str, str] | None = None) -> Tuple[HttpResponse, float]:
+        """
+        Send one request on a pooled connection.
+
+        A request that fails on a reused connection (closed by the server
+        while idle) is retried once on a new connection.
+
+        Returns:
+            Response and the connect time of the connection that served it
+        """
+        for attempt in range(2):
+            async with self.connection() as connection:
+                reused = connection.requests_sent > 0
+                try:
+                    response = await asyncio.wait_for(connection.request(method, body, headers), self.timeout)
+                except ConnectionError:
+                    if attempt or not reused:
+                        raise
+                    continue
+                return response, connection.connect_time
+        raise AssertionError("unreachable")
+
+    async def close(self) -> None:
+        """Close all idle connections."""
+        idle, self._idle = self._idle, []
+        self._open -= len(idle)
+        await asyncio.gather(*(c.close() for c in idle))
+
+
+async def invoke_concurrently(url: str, body: bytes = b"", concurrency: int = 1, requests: int = 1,
+                              timeout: float = DEFAULT_TIMEOUT,
+                              headers: Dict[str, str] | None = None) -> List[InvocationResult]:
+    """
+    Invoke a function with a fixed number of requests in flight.
+
+    Opens `concurrency` connections first, then runs `concurrency` request
+    streams at once, each sending `requests` requests back to back.
+
+    Returns:
+        One result per request, in stream order (stream 0's requests first)
+    """
+    pool = HttpPool(url, concurrency, timeout)
+    results: List[InvocationResult] = [InvocationResult(i, 0, 0.0, 0.0) for i in range(concurrency * requests)]
+    try:
+        with contextlib.suppress(OSError, asyncio.TimeoutError):
+            await pool.prewarm()  # Connections that fail here are retried (and reported) per request
+
+        async def stream(first: int) -> None:
+            for index in range(first, first + requests):
+                try:
+                    response, connect_time = await pool.request(body, headers=headers)
+                    results[index] = InvocationResult(index, response.status, response.latency, connect_time,
+                                                      response.body, headers=response.headers)
+                except (OSError, ValueError, asyncio.TimeoutError) as e:
+                    results[index].error = str(e) or type(e).__name__
+
+        await asyncio.gather(*(stream(s * requests) for s in range(concurrency)))
+    finally:
+        await pool.close()
+    return results
+
+
+def resolve_url(command: str, ttl: float = DEFAULT_RESOLVE_TTL, refresh: bool = False) -> str:
+    """
+    Resolve a function URL by running a command, reusing its output for ttl seconds.
+
+    Args:
+        command: Shell command printing the URL (e.g. kubectl get ksvc NAME -o jsonpath='{.status.url}')
+        ttl: Seconds a cached URL stays valid (0: always run the command)
+        refresh: Ignore the cached URL
+
+    Returns:
+        URL
+
+    Raises:
+        RuntimeError: If the command fails or prints nothing
+    """
+    key = hashlib.sha256(json.dumps([command, os.getcwd()]).encode()).hexdigest()[:16]
+    cache = os.path.join(tempfile.gettempdir(), f"sharp-url-{os.getuid()}-{key}")
+    if not refresh and ttl > 0:
+        with contextlib.suppress(OSError):
+            if time.time() - os.path.getmtime(cache) < ttl:
+                with open(cache) as f:
+                    url = f.read().strip()
+                if url:
+                    return url
+    result = subprocess.run(command, shell=True, capture_output=True, text=True)
+    url = result.stdout.strip()
+    if result.returncode != 0 or not url:
+        raise RuntimeError(f"Cannot resolve function URL with {command!r}: {result.stderr.strip() or 'no output'}")
+    with contextlib.suppress(OSError):
+        with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(cache), delete=False) as tmp:
+            tmp.write(url)
+        os.replace(tmp.name, cache)
+    return url
+
+
+def forget_url(command: str) -> None:
+    """Drop the cached URL of a resolve command (e.g. after the function moved)."""
+    key = hashlib.sha256(json.dumps([command, os.getcwd()]).encode()).hexdigest()[:16]
+    with contextlib.suppress(OSError):
+        os.unlink(os.path.join(tempfile.gettempdir(), f"sharp-url-{os.getuid()}-{key}"))
+
+
+def main(argv: List[str] | None = None) -> int:
+    """
+    Command-line entry point (the http backend's run command).
+
+    Returns:
+        0 if every request got a 2xx response, else 1
+    """
+    parser = argparse.ArgumentParser(description="Invoke a FaaS function over pooled HTTP connections")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="Function URL")
+    target.add_argument("--resolve", metavar="COMMAND", help="Shell command printing the function URL")
+    parser.add_argument("--resolve-ttl", type=float, default=DEFAULT_RESOLVE_TTL,
+                        help="Seconds to reuse a resolved URL")
+    parser.add_argument("--concurrency", type=int, default=1, help="Requests in flight at once")
+    parser.add_argument("--requests", type=int, default=1, help="Requests per connection")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Seconds per request")
+    parser.add_argument("--header", action="append", default=[], metavar="NAME:VALUE",
+                        help="Extra request header (repeatable)")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Request body (joined by spaces)")
+    args = parser.parse_args(argv)
+    if args.concurrency < 1 or args.requests < 1:
+        parser.error("--concurrency and --requests must be at least 1")
+
+    headers = {"Content-Type": "application/json"}
+    for header in args.header:
+        name, _, value = header.partition(":")
+        headers[name.strip()] = value.strip()
+    body = " ".join(args.args).encode()
+
+    try:
+        url = args.url or resolve_url(args.resolve, args.resolve_ttl)
+        results = asyncio.run(invoke_concurrently(url, body, args.concurrency, args.requests, args.timeout, headers))
+    except (RuntimeError, ValueError) as e:
+        print(f"http-invoke: {e}", file=sys.stderr)
+        return 1
+    if args.resolve and all(r.status == 0 for r in results):
+        forget_url(args.resolve)  # Possibly stale: resolve again next time
+
+    for result in results:
+        if result.error:
+            print(f"http-invoke: request {result.index} failed: {result.error}", file=sys.stderr)
+        elif result.body:
+            text = result.body.decode(errors="replace")
+            print(text, end="" if text.endswith("\n") else "\n")
+    for result in results:
+        print(f"http-invoke output {result.index} {result.status} {result.latency:.9f} "
+              f"{result.connect_time:.9f} {len(result.body)}")
+    return 0 if all(200 <= r.status < 300 for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
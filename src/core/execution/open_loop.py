@@ -0,0 +1,295 @@
+"""
+Open-loop execution: invocations issued on an arrival process.
+
+Runner executes `mpl` copies and waits for all of them before the next
+iteration starts, a closed loop: when the system under test slows down, the
+load slows down with it, hiding queueing delay (coordinated omission).
+OpenLoopRunner instead launches the benchmark command at the arrival times
+of a constant-rate or Poisson process for a fixed duration, regardless of
+how many earlier invocations are still running, then waits for the
+outstanding ones. Each iteration is one such load phase, logged with one
+row per invocation (request).
+
+Per request, the runner records when it was scheduled, sent (launched) and
+received (completed), relative to the start of the iteration. outer_time is
+the request's own time (received - sent), and request_latency the time from
+its scheduled arrival to completion, which also counts any delay in sending
+it. Summary metrics of the load phase (offered rate, throughput, error rate
+and latency percentiles) are repeated in every row of the iteration.
+
+Each request is a new process running the composed backend command, so the
+attainable rate is bounded by process startup on the load-generating host;
+requests beyond max_in_flight concurrent ones, or that cannot be launched for
+lack of file descriptors or processes, are dropped and count as errors.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+from __future__ import annotations
+
+import errno
+import math
+import os
+import random
+import selectors
+import subprocess
+import tempfile
+import time
+import warnings
+from typing import Dict, List, Tuple
+
+from src.core.execution.runner import DEFAULT_EXEC_MODE, Runner
+
+ARRIVAL_PROCESSES = ("constant", "poisson")
+
+# Launch errors that mean the load generator ran out of descriptors or processes:
+# the request is dropped (and counted as an error) rather than ending the run
+LAUNCH_LIMIT_ERRORS = (errno.EMFILE, errno.ENFILE, errno.EAGAIN)
+
+# Per-request metrics reported by OpenLoopRunner.copy_metrics: name -> (type, description)
+REQUEST_METRICS: Dict[str, Tuple[str, str]] = {
+    "request_scheduled": ("float", "Scheduled arrival of this request relative to the iteration start (seconds)"),
+    "request_sent": ("float", "Launch time of this request relative to the iteration start (seconds)"),
+    "request_received": ("float", "Completion time of this request relative to the iteration start (seconds)"),
+    "request_latency": ("float", "Time from the scheduled arrival to completion of this request (seconds)"),
+    "request_status": ("int", "Exit code of this request (NA if it timed out)"),
+    "offered_rate": ("float", "Requests per second offered in this iteration (arrivals / duration)"),
+    "throughput": ("float", "Successful requests per second in this iteration"),
+    "error_rate": ("float", "Fraction of this iteration's requests that failed, timed out or were dropped"),
+    "latency_p50": ("float", "Median request_latency of this iteration's successful requests (seconds)"),
+    "latency_p99": ("float", "99th percentile request_latency of this iteration (seconds)"),
+    "latency_p999": ("float", "99.9th percentile request_latency of this iteration (seconds)"),
+}
+
+
+def arrival_times(process: str, rate: float, duration: float, rng: random.Random | None = None) -> List[float]:
+    """
+    Arrival times of an arrival process within [0, duration).
+
+    Args:
+        process: "constant" (evenly spaced) or "poisson" (exponential inter-arrival times)
+        rate: Mean arrivals per second
+        duration: Length of the arrival window (seconds)
+        rng: Random generator for Poisson arrivals (default: unseeded)
+
+    Returns:
+        Arrival offsets in seconds, ascending
+
+    Raises:
+        ValueError: If the process is unknown, or rate or duration is not positive
+    """
+    if process not in ARRIVAL_PROCESSES:
+        raise ValueError(f"Unknown arrival process '{process}' (expected one of: {', '.join(ARRIVAL_PROCESSES)})")
+    if rate <= 0 or duration <= 0:
+        raise ValueError(f"Arrival rate and duration must be positive, got {rate} and {duration}")
+    if process == "constant":
+        return [i / rate for i in range(math.ceil(duration * rate - 1e-9))]
+    rng = rng or random.Random()
+    times: List[float] = []
+    t = rng.expovariate(rate)
+    while t < duration:
+        times.append(t)
+        t += rng.expovariate(rate)
+    return times
+
+
+def percentile(values: List[float], q: float) -> float | None:
+    """Nearest-rank percentile (q in [0, 100]) of values, or None if there are none."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+def _close_selector(selector: selectors.BaseSelector) -> None:
+    """Close a selector and the pidfds registered with it."""
+    for key in list(selector.get_map().values()):
+        os.close(key.fd)
+    selector.close()
+
+
+class OpenLoopRunner(Runner):
+    """
+    Runs a command repeatedly on an arrival process (see module docstring).
+
+    run_commands() takes the single composed command (mpl 1) and returns one
+    output file per launched request, like Runner does per copy.
+    """
+
+    def __init__(self, rate: float, duration: float, arrivals: str = "poisson", seed: int | None = None,
+                 max_in_flight: int = 1024, timeout: int | None = None, verbose: bool = False,
+                 stdin_fd: int = -1, cpu_set: List[int] | None = None,
+                 exec_mode: str = DEFAULT_EXEC_MODE) -> None:
+        """
+        Initialize runner.
+
+        Args:
+            rate: Mean requests per second
+            duration: Seconds over which requests are issued per iteration
+            arrivals: Arrival process, "constant" or "poisson"
+            seed: Seed for Poisson arrivals (default: unseeded)
+            max_in_flight: Most requests running at once; later arrivals are dropped
+            timeout: Seconds to wait for outstanding requests after the arrival
+                window (default: 24 hours); requests still running are terminated
+            verbose: Print command lines before execution
+            stdin_fd: File descriptor for stdin (default: closed)
+            cpu_set: CPUs to pin launched commands to
+            exec_mode: How to launch requests (see runner.EXEC_MODES)
+        """
+        super().__init__(timeout=timeout, verbose=verbose, stdin_fd=stdin_fd, cpu_set=cpu_set,
+                         exec_mode=exec_mode)
+        arrival_times(arrivals, rate, duration)  # Validate early
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+        self.rate = rate
+        self.duration = duration
+        self.arrivals = arrivals
+        self.max_in_flight = max_in_flight
+        self._rng = random.Random(seed)
+        # Per request of the last run, relative to its start (in launch order)
+        self.scheduled: List[float] = []
+        self.returncodes: List[int | None] = []
+        self.dropped = 0
+        self._t0 = 0.0
+
+    def run_commands(self, commands: List[str], env: dict[str, str] | None = None
+                     ) -> Tuple[bool, List[tempfile._TemporaryFileWrapper[bytes]], float]:
+        """
+        Issue the command at every arrival of one load phase and wait for all requests.
+
+        Args:
+            commands: The composed command, as a one-element list
+            env: Environment variables to set for subprocess (default: inherit parent)
+
+        Returns:
+            Tuple of (success, output_files, elapsed_time): success is True
+            unless no request was launched; output_files holds one (closed)
+            file per launched request; elapsed_time runs from the start of
+            the load phase to the last completion
+
+        Raises:
+            ValueError: If more than one command is given (mpl above 1)
+            RuntimeError: If the command is not found or not executable
+        """
+        if len(commands) != 1:
+            raise ValueError(f"Open-loop runs issue a single command per request, got {len(commands)} (use mpl 1)")
+        command = commands[0]
+        schedule = arrival_times(self.arrivals, self.rate, self.duration, self._rng)
+        self.start_times, self.exit_times, self.rusages, self.exec_modes = [], [], [], []
+        self.scheduled, self.returncodes, self.dropped = [], [], 0
+        output_files: List[tempfile._TemporaryFileWrapper[bytes]] = []
+        pending: Dict[int, subprocess.Popen[str]] = {}
+        selector = selectors.DefaultSelector() if hasattr(os, "pidfd_open") else None
+
+        self._t0 = t0 = time.perf_counter()
+        deadline = t0 + self.duration + self.timeout
+        next_arrival = 0
+        try:
+            while next_arrival < len(schedule) or pending:
+                now = time.perf_counter()
+                if now >= deadline:
+                    break
+                if next_arrival < len(schedule) and now >= t0 + schedule[next_arrival]:
+                    if len(pending) >= self.max_in_flight:
+                        self.dropped += 1
+                    else:
+                        index = len(output_files)
+                        sent = time.perf_counter()
+                        try:
+                            popen, output_file = self._launch(command, index, env)
+                        except OSError as e:
+                            if e.errno not in LAUNCH_LIMIT_ERRORS:
+                                raise
+                            self.dropped += 1
+                            next_arrival += 1
+                            continue
+                        self.start_times.append(sent)
+                        self.scheduled.append(schedule[next_arrival])
+                        self.exit_times.append(None)
+                        self.rusages.append(None)
+                        self.returncodes.append(None)
+                        output_files.append(output_file)
+                        pending[index] = popen
+                        if selector is not None:
+                            try:
+                                selector.register(os.pidfd_open(popen.pid), selectors.EVENT_READ, index)
+                            except OSError:
+                                # Out of descriptors: poll the outstanding requests instead
+                                _close_selector(selector)
+                                selector = None
+                    next_arrival += 1
+                    continue
+                wake = t0 + schedule[next_arrival] if next_arrival < len(schedule) else deadline
+                exited = self._wait_for_exits(pending, selector, max(0.0, wake - now))
+                now = time.perf_counter()
+                for index in exited:
+                    self.exit_times[index] = now
+                    returncode, self.rusages[index] = self._reap(pending.pop(index))
+                    self.returncodes[index] = returncode
+                    output_files[index].close()  # Only its path is needed for metric extraction
+                    if returncode in (126, 127):
+                        self._check_returncode(index, returncode, [command] * len(output_files), output_files)
+        finally:
+            if selector is not None:
+                _close_selector(selector)
+            for index, popen in pending.items():
+                popen.terminate()
+                popen.wait()
+                output_files[index].close()
+
+        if pending:
+            warnings.warn(f"Timeout exceeded ({self.timeout}s after the arrival window): "
+                          f"{len(pending)} request(s) terminated")
+        failed = sum(code != 0 for code in self.returncodes) + self.dropped
+        if failed:
+            warnings.warn(f"{failed} of {len(schedule)} open-loop request(s) failed, timed out or were dropped")
+
+        exits = [t for t in self.exit_times if t is not None]
+        elapsed_time = (max(exits) if exits else time.perf_counter()) - t0
+        return bool(output_files), output_files, elapsed_time
+
+    def copy_metrics(self) -> Dict[str, List[str]]:
+        """
+        Per-request timing and resource usage of the last run_commands call.
+
+        Returns the metrics in REQUEST_METRICS, outer_time (the request's own
+        time) and the rusage metrics of Runner.copy_metrics, one value per
+        launched request; iteration-wide metrics are repeated for every request.
+
+        Returns:
+            Dict mapping metric name to list of string values, or empty dict
+            if no request was launched
+        """
+        metrics = super().copy_metrics()
+        if not metrics:
+            return {}
+        for name in ("copy_start", "copy_time", "launch_skew", "straggler_ratio"):
+            metrics.pop(name, None)  # Replaced by the request timestamps
+
+        def fmt(value: float | None) -> str:
+            return "NA" if value is None else str(value)
+
+        sent = [start - self._t0 for start in self.start_times]
+        received = [None if end is None else end - self._t0 for end in self.exit_times]
+        latency = [None if end is None else end - scheduled for end, scheduled in zip(received, self.scheduled)]
+        metrics["outer_time"] = [fmt(None if end is None else end - start) for start, end in zip(sent, received)]
+        metrics["request_scheduled"] = [str(t) for t in self.scheduled]
+        metrics["request_sent"] = [str(t) for t in sent]
+        metrics["request_received"] = [fmt(t) for t in received]
+        metrics["request_latency"] = [fmt(t) for t in latency]
+        metrics["request_status"] = [fmt(code) for code in self.returncodes]
+
+        requests = len(self.scheduled) + self.dropped
+        succeeded = [t for t, code in zip(latency, self.returncodes) if code == 0 and t is not None]
+        window = max([self.duration] + [t for t in received if t is not None])
+        summary = {
+            "offered_rate": requests / self.duration,
+            "throughput": len(succeeded) / window,
+            "error_rate": (requests - len(succeeded)) / requests,
+            "latency_p50": percentile(succeeded, 50),
+            "latency_p99": percentile(succeeded, 99),
+            "latency_p999": percentile(succeeded, 99.9),
+        }
+        for name, value in summary.items():
+            metrics[name] = [fmt(value)] * len(self.scheduled)
+        return metrics
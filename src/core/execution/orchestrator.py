@@ -8,15 +8,22 @@ Coordinates the full lifecycle of a benchmark run:
 4. Extract and aggregate metrics
 5. Write results to CSV/Markdown logs
 
+Launches are journaled by configuration hash, so with the resume option a
+configuration whose results are complete is skipped and an interrupted one
+continues where it stopped; with reuse_results, the results of an identical
+configuration in another runlog are replayed instead of re-measured.
+
 © Copyright 2025--2025 Hewlett Packard Enterprise Development LP
 """
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
 import os
+import sqlite3
 import subprocess
 import tempfile
 import time
@@ -31,11 +38,13 @@ from src.core.config.backend_loader import (
     BackendChainError
 )
 from src.core.execution.command_composer import CommandComposer
-from src.core.execution.runner import Runner
+from src.core.execution.open_loop import REQUEST_METRICS, OpenLoopRunner
+from src.core.execution.runner import COPY_METRICS, DEFAULT_EXEC_MODE, Runner
 from src.core.repeaters import repeater_factory
 from src.core.rundata import RunData
 from src.core.metrics.extractor import MetricExtractor
-from src.core.runlogs import RunLogger, collect_sysinfo
+from src.core.runlogs import RunJournal, RunLogger, RunlogIndex, collect_sysinfo, config_hash
+from src.core.runlogs.journal import iteration_metrics, read_launch_rows
 
 
 def _load_default_sys_spec_commands() -> Dict[str, Dict[str, str]]:
@@ -106,6 +115,20 @@ class ExecutionOrchestrator:
                 - mode: Optional[str] - file write mode (w or a)
                 - sys_spec_commands: Optional[Dict] - system spec commands
                 - skip_sys_specs: Optional[bool] - skip system specs
+                - pipeline: Optional[bool] - analyze iteration i while i+1 runs
+                - cpu_set: Optional[List[int]] - CPUs to pin the benchmark to
+                - arrival_rate: Optional[float] - open-loop load: requests per
+                  second issued on an arrival process instead of mpl copies
+                - arrivals: Optional[str] - arrival process (constant or poisson)
+                - duration: Optional[float] - seconds of open-loop load per iteration
+                - arrival_seed: Optional[int] - seed for Poisson arrivals
+                - max_in_flight: Optional[int] - most concurrent open-loop requests
+                - exec_mode: Optional[str] - launch commands through the shell, or
+                  directly when they need none ("direct", the default, or "spawn")
+                - resume: Optional[bool] - skip if complete results of this
+                  configuration exist, continue an interrupted launch of it
+                - reuse_results: Optional[bool] - replay results of an identical
+                  configuration from another runlog before running
             experiment_name: Name of experiment for logging (default: "misc")
 
         Raises:
@@ -171,6 +194,9 @@ class ExecutionOrchestrator:
         if not self.sys_spec_commands and not self.skip_sys_specs:
             self.sys_spec_commands = _load_default_sys_spec_commands()
         self.mpl = options.get("mpl", 1)  # Multiprogramming level (concurrency)
+        self.pipeline = options.get("pipeline", False)  # Overlap analysis with the next iteration
+        self.cpu_set = options.get("cpu_set")  # CPUs to pin to (parallel sweeps)
+        self.exec_mode = options.get("exec_mode", DEFAULT_EXEC_MODE)  # Skip /bin/sh for commands that need none
         self.experiment_name = experiment_name
 
         # Create repeater from options
@@ -180,8 +206,23 @@ class ExecutionOrchestrator:
         }
         self.repeater = repeater_factory(repeater_config)
 
+        # Open-loop load: requests issued on an arrival process (one row per request)
+        self.arrival_rate = options.get("arrival_rate")
+        self.arrivals = options.get("arrivals", "poisson")
+        self.duration = options.get("duration", 10.0)
+        if self.arrival_rate and self.mpl != 1:
+            raise ValueError("Open-loop runs (arrival_rate) issue one request at a time; mpl must be 1")
+
         # Initialize runtime components
-        self.runner = Runner(timeout=self.timeout, verbose=self.verbose)
+        self.runner: Runner
+        if self.arrival_rate:
+            self.runner = OpenLoopRunner(
+                self.arrival_rate, self.duration, self.arrivals, seed=options.get("arrival_seed"),
+                max_in_flight=options.get("max_in_flight", 1024),
+                timeout=self.timeout, verbose=self.verbose, cpu_set=self.cpu_set, exec_mode=self.exec_mode)
+        else:
+            self.runner = Runner(timeout=self.timeout, verbose=self.verbose, cpu_set=self.cpu_set,
+                                 exec_mode=self.exec_mode)
 
         metrics = options.get("metrics", {})
         self.metric_extractor = MetricExtractor(metrics)
@@ -189,6 +230,21 @@ class ExecutionOrchestrator:
         task_name = self.benchmark_spec.get("task", self.experiment_name)
         topdir = options.get("directory", "runlogs")
         launch_id = options.get("launch_id")  # Optional launch_id for sweep runs
+        self.topdir = topdir
+
+        # Identify this configuration and look up earlier launches of it
+        self.config_hash = config_hash(options)
+        self.journal = RunJournal(RunLogger.output_base(topdir, self.experiment_name, task_name))
+        self.reuse_results = options.get("reuse_results", False)
+        self.completed_launch_id: str | None = None  # Launch with complete results (resume: skip)
+        self.resumed_launch_id: str | None = None  # Interrupted launch to continue (resume)
+        if options.get("resume", False):
+            self.mode = "a"  # Never truncate the results being resumed
+            status, previous_launch_id = self.journal.lookup(self.config_hash)
+            if status == "complete":
+                self.completed_launch_id = previous_launch_id
+            elif status == "started":
+                launch_id = self.resumed_launch_id = previous_launch_id
 
         self.logger = RunLogger(
             topdir=topdir,
@@ -209,7 +265,20 @@ class ExecutionOrchestrator:
         self.logger.add_invariant("task", task_name, "string", "Task/benchmark name")
         self.logger.add_invariant("start", self.start, "string", "Warm, cold, or as-is start")
         self.logger.add_invariant("concurrency", self.mpl, "int", "Concurrent copies (MPL)")
+        self.logger.add_invariant("config_hash", self.config_hash, "string",
+                                  "Hash of the configuration that determines the results")
+        if self.arrival_rate:
+            self.logger.add_invariant("arrivals", self.arrivals, "string", "Open-loop arrival process")
+            self.logger.add_invariant("arrival_rate", self.arrival_rate, "float",
+                                      "Open-loop arrival rate (requests per second)")
+            self.logger.add_invariant("duration", self.duration, "float",
+                                      "Seconds of open-loop load per iteration")
+        if self.cpu_set:
+            self.logger.add_invariant("cpu_set", ",".join(str(cpu) for cpu in self.cpu_set), "string",
+                                      "CPUs the benchmark was pinned to")
         self.iteration_count = 0
+        self.speculative_iterations = 0
+        self.replayed_iterations = 0
         self.collected_metrics: List[Dict[str, Any]] = []
 
     def run(self, callbacks: ProgressCallbacks | None = None,
@@ -230,8 +299,22 @@ class ExecutionOrchestrator:
         callbacks = callbacks or ProgressCallbacks()
         max_iterations = max_iterations or 1000
         self.iteration_count = 0
+        self.speculative_iterations = 0
+        self.replayed_iterations = 0
         self.collected_metrics = []
 
+        if self.completed_launch_id is not None:
+            # Resuming: this configuration's results are already complete
+            return ExperimentResult(
+                success=True,
+                iteration_count=0,
+                convergence_info={"skipped": True, "completed_launch_id": self.completed_launch_id},
+                output_paths={
+                    "csv": self.logger.get_csv_path(),
+                    "markdown": self.logger.get_markdown_path(),
+                }
+            )
+
         try:
             # Create command composer (reuse for all iterations)
             composer = CommandComposer(
@@ -239,66 +322,46 @@ class ExecutionOrchestrator:
                 self.benchmark_spec
             )
 
-            # Warm start: run benchmark once before measurements
-            if self.start == "warm":
-                commands = composer.compose(self.backend_names, copies=self.mpl)
-                self.runner.run_commands(commands, env=self.environment)  # Run once, discard results
-
-            # Main iteration loop
-            should_continue = True
-            while should_continue and self.iteration_count < max_iterations:
-                # Cold start: execute reset commands before each iteration
-                if self.start == "cold":
-                    self._execute_reset()
-
-                # Iteration start callback
-                if callbacks.on_iteration_start:
-                    callbacks.on_iteration_start(self.iteration_count + 1)
-
-                # Build commands (possibly chained backends)
-                commands = composer.compose(
-                    self.backend_names,
-                    copies=self.mpl
-                )
+            # Journal the launch; truncating the output also forgets earlier launches
+            if self.mode != "a":
+                self.journal.clear()
+            self.journal.record(self.logger.launch_id, self.config_hash, "started")
 
-                # Run commands and measure wall-clock time
-                success, output_files, elapsed_time = self.runner.run_commands(commands, env=self.environment)
-                if not success:
-                    raise RuntimeError("Command execution timeout or failure")
+            # Stream rows to the CSV as iterations complete (crash-safe)
+            self.logger.start_streaming(mode=self.mode)
 
-                # Extract metrics from each output file (returns RunData)
-                rundata = self._extract_metrics(output_files, elapsed_time)
+            # Feed results of an interrupted or identical earlier launch to the repeater
+            should_continue = self._replay_results(callbacks, max_iterations)
 
-                # Increment count BEFORE calling repeater (it expects count to be updated)
-                self.iteration_count += 1
+            # Warm start: run benchmark once before measurements
+            if self.start == "warm" and should_continue:
+                commands = composer.compose(self.backend_names, copies=self.mpl)
+                self.runner.run_commands(commands, env=self.environment)  # Run once, discard results
 
-                # Update repeater: returns True to continue, False to stop
-                should_continue = self.repeater(rundata)
+            # Main iteration loop (nothing left to run if the replayed results converged)
+            if self.pipeline and should_continue:
+                should_continue = self._run_pipelined(composer, callbacks, max_iterations)
+            else:
+                while should_continue and self.iteration_count < max_iterations:
+                    output_files, elapsed_time, copy_metrics = self._launch_iteration(
+                        composer, callbacks, self.iteration_count + 1)
 
-                # Store iteration metrics (for callbacks/result only)
-                self.collected_metrics.append({
-                    k: [str(v) for v in vals] for k, vals in rundata.perf.items()
-                })
+                    # Extract metrics from each output file (returns RunData)
+                    rundata = self._extract_metrics(output_files, elapsed_time, copy_metrics)
 
-                # Add row data for each metric entry (preserves per-rank rows)
-                self._log_run_data(rundata)
+                    # Increment count BEFORE calling repeater (it expects count to be updated)
+                    self.iteration_count += 1
 
-                # Iteration complete callback
-                if callbacks.on_iteration_complete:
-                    callbacks.on_iteration_complete(self.iteration_count, {
-                        "metrics": rundata.perf,
-                        "should_continue": should_continue,
-                    })
+                    # Update repeater: returns True to continue, False to stop
+                    should_continue = self.repeater(rundata)
 
-                # Clean up temporary files
-                for f in output_files:
-                    try:
-                        f.close()
-                    except Exception:
-                        pass
+                    self._finish_iteration(rundata, should_continue, callbacks, output_files)
 
-            # Save results to CSV and Markdown
-            self.logger.save_csv(mode=self.mode)
+            # Save remaining results to CSV, then Markdown (a resumed launch may have no new rows)
+            if self.logger.row_count:
+                self.logger.save_csv(mode=self.mode)
+            else:
+                self.logger.close_stream()
 
             # Collect system specifications (run through backend chain)
             sys_specs = collect_sysinfo(
@@ -307,6 +370,7 @@ class ExecutionOrchestrator:
                 backend_names=self.backend_names
             ) if not self.skip_sys_specs else {}
             self.logger.save_md(mode=self.mode, sys_specs=sys_specs)
+            self.journal.record(self.logger.launch_id, self.config_hash, "complete")
 
             # Convergence callback (stopped due to repeater)
             if not should_continue and callbacks.on_convergence:
@@ -323,6 +387,8 @@ class ExecutionOrchestrator:
                     "stopped_early": not should_continue,
                     "max_iterations_reached": self.iteration_count >= max_iterations,
                     "final_count": self.iteration_count,
+                    "speculative_iterations": self.speculative_iterations,
+                    "replayed_iterations": self.replayed_iterations,
                 },
                 output_paths={
                     "csv": self.logger.get_csv_path(),
@@ -331,6 +397,11 @@ class ExecutionOrchestrator:
             )
 
         except Exception as e:
+            # Keep the rows streamed so far: the partial CSV remains analyzable
+            try:
+                self.logger.close_stream()
+            except Exception:
+                pass
             if callbacks.on_error:
                 callbacks.on_error(e)
             return ExperimentResult(
@@ -340,7 +411,214 @@ class ExecutionOrchestrator:
                 error_message=str(e)
             )
 
-    def _log_run_data(self, rundata: RunData) -> None:
+    def _replay_results(self, callbacks: ProgressCallbacks, max_iterations: int) -> bool:
+        """
+        Feed iterations of an earlier launch to the repeater before running new ones.
+
+        When resuming an interrupted launch, these are the rows it already
+        wrote to this CSV (they are not written again). When reusing results,
+        they are the rows of the newest launch with the same configuration
+        hash in another runlog of the same runlogs directory, logged again
+        under this launch.
+
+        Args:
+            callbacks: Progress callbacks (on_iteration_complete is invoked)
+            max_iterations: Hard limit on iterations
+
+        Returns:
+            Repeater decision after the last replayed iteration (True if none)
+        """
+        if self.resumed_launch_id is not None:
+            iterations = read_launch_rows(self.logger.get_csv_path(), self.resumed_launch_id)
+            log_rows = False
+        elif self.reuse_results:
+            iterations = self._reusable_iterations()
+            log_rows = True
+        else:
+            return True
+
+        should_continue = True
+        for rows in iterations:
+            if not should_continue or self.iteration_count >= max_iterations:
+                break
+            rundata = RunData(iteration_metrics(rows))
+            self.iteration_count += 1
+            self.replayed_iterations += 1
+            should_continue = self.repeater(rundata)
+            self.collected_metrics.append({
+                k: [str(v) for v in vals] for k, vals in rundata.perf.items()
+            })
+            if log_rows:
+                self._log_run_data(rundata, speculative=False if self.pipeline else None)
+                self.logger.flush_rows()
+            if callbacks.on_iteration_complete:
+                callbacks.on_iteration_complete(self.iteration_count, {
+                    "metrics": rundata.perf,
+                    "should_continue": should_continue,
+                    "speculative": False,
+                })
+        return should_continue
+
+    def _reusable_iterations(self) -> List[List[Dict[str, str]]]:
+        """Iterations of the newest identical launch in another runlog (empty if none)."""
+        own_csv = Path(self.logger.get_csv_path()).resolve()
+        try:
+            with RunlogIndex(self.topdir) as index:
+                index.refresh()
+                matches = index.find_launches(self.config_hash)
+        except (sqlite3.Error, OSError):
+            return []
+        for match in matches:
+            if Path(match["csv_path"]).resolve() == own_csv:
+                continue  # Same runlog: that's what resume is for
+            iterations = read_launch_rows(match["csv_path"], match["launch_id"])
+            if iterations:
+                source = Path(match["md_path"]).relative_to(self.topdir).with_suffix("").as_posix()
+                self.logger.add_invariant("reused_from", f"{source}:{match['launch_id']}", "string",
+                                          "Runlog and launch whose results were reused")
+                return iterations
+        return []
+
+    def _launch_iteration(self, composer: CommandComposer, callbacks: ProgressCallbacks, iteration: int
+                          ) -> Tuple[List[tempfile._TemporaryFileWrapper[bytes]], float, Dict[str, List[str]]]:
+        """
+        Run one benchmark iteration (all copies) and wait for it to finish.
+
+        Args:
+            composer: Command composer for the backend chain
+            callbacks: Progress callbacks (on_iteration_start is invoked)
+            iteration: Number of this iteration (from 1), for on_iteration_start
+
+        Returns:
+            Tuple of (output files, elapsed wall-clock time, per-copy metrics)
+
+        Raises:
+            RuntimeError: If command execution times out or fails
+        """
+        # Cold start: execute reset commands before each iteration
+        if self.start == "cold":
+            self._execute_reset()
+
+        # Iteration start callback
+        if callbacks.on_iteration_start:
+            callbacks.on_iteration_start(iteration)
+
+        # Build commands (possibly chained backends)
+        commands = composer.compose(
+            self.backend_names,
+            copies=self.mpl
+        )
+
+        # Run commands and measure wall-clock time
+        success, output_files, elapsed_time = self.runner.run_commands(commands, env=self.environment)
+        if not success:
+            raise RuntimeError("Command execution timeout or failure")
+        exec_modes = getattr(self.runner, "exec_modes", None)
+        if exec_modes:
+            self.logger.add_invariant("exec_mode", ",".join(sorted(set(exec_modes))), "string",
+                                      "How the benchmark command was launched (shell, direct or spawn)")
+
+        # Snapshot per-copy metrics now: the runner resets them on the next run
+        return output_files, elapsed_time, self._copy_metrics(len(output_files))
+
+    def _finish_iteration(self, rundata: RunData, should_continue: bool, callbacks: ProgressCallbacks,
+                          output_files: List[tempfile._TemporaryFileWrapper[bytes]],
+                          speculative: bool | None = None) -> None:
+        """
+        Record a completed iteration: store and log its metrics, then clean up.
+
+        Args:
+            rundata: Metrics of the iteration
+            should_continue: Repeater decision after this iteration
+            callbacks: Progress callbacks (on_iteration_complete is invoked)
+            output_files: Output files of the iteration, closed here
+            speculative: In pipelined mode, whether the iteration ran after the
+                stopping decision (adds a "speculative" CSV column); None otherwise
+        """
+        # Store iteration metrics (for callbacks/result only)
+        self.collected_metrics.append({
+            k: [str(v) for v in vals] for k, vals in rundata.perf.items()
+        })
+
+        # Add row data for each metric entry (preserves per-rank rows)
+        self._log_run_data(rundata, speculative=speculative)
+        self.logger.flush_rows()
+
+        # Iteration complete callback
+        if callbacks.on_iteration_complete:
+            callbacks.on_iteration_complete(self.iteration_count, {
+                "metrics": rundata.perf,
+                "should_continue": should_continue,
+                "speculative": bool(speculative),
+            })
+
+        # Clean up temporary files
+        for f in output_files:
+            try:
+                f.close()
+            except Exception:
+                pass
+
+    def _run_pipelined(self, composer: CommandComposer, callbacks: ProgressCallbacks,
+                       max_iterations: int) -> bool:
+        """
+        Run iterations with metric extraction and stopping decisions pipelined.
+
+        While iteration i is analyzed (metrics extracted, repeater consulted)
+        in a worker thread, iteration i+1 already runs. Iterations are still
+        logged and fed to the repeater strictly in order. When the decision
+        for iteration i is to stop, iteration i+1 has already run: it is the
+        only speculative iteration. It is logged with speculative=1 but not
+        fed to the repeater (and if it failed, the failure is ignored). Note that analysis competes for CPU with the
+        running iteration, which may perturb measurements on small systems.
+
+        Args:
+            composer: Command composer for the backend chain
+            callbacks: Progress callbacks
+            max_iterations: Hard limit on iterations, speculative one included
+
+        Returns:
+            Last repeater decision (False if the repeater asked to stop)
+        """
+        def analyze(files: List[tempfile._TemporaryFileWrapper[bytes]], elapsed: float,
+                    copy_metrics: Dict[str, List[str]]) -> Tuple[RunData, bool]:
+            rundata = self._extract_metrics(files, elapsed, copy_metrics)
+            return rundata, self.repeater(rundata)
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="sharp-analysis") as pool:
+            # Iteration i+1 starts before iteration i is counted, so number launches here
+            first = self.iteration_count + 1
+            current = self._launch_iteration(composer, callbacks, first)
+            launched = 1
+            while True:
+                analysis = pool.submit(analyze, *current)
+                upcoming = None
+                launch_error: Exception | None = None
+                if launched < max_iterations:
+                    try:
+                        upcoming = self._launch_iteration(composer, callbacks, first + launched)
+                        launched += 1
+                    except Exception as e:
+                        launch_error = e  # Record iteration i first, then fail
+
+                rundata, should_continue = analysis.result()
+                self.iteration_count += 1
+                self._finish_iteration(rundata, should_continue, callbacks, current[0], speculative=False)
+                if launch_error is not None and should_continue:
+                    raise launch_error
+                if upcoming is None:
+                    return should_continue
+
+                current = upcoming
+                if not should_continue:
+                    # Already ran past the stopping decision: record, but don't analyze
+                    self.iteration_count += 1
+                    self.speculative_iterations += 1
+                    rundata = self._extract_metrics(*current)
+                    self._finish_iteration(rundata, should_continue, callbacks, current[0], speculative=True)
+                    return should_continue
+
+    def _log_run_data(self, rundata: RunData, speculative: bool | None = None) -> None:
         """Log CSV rows for each metric entry (e.g., per MPI rank)."""
         perf = rundata.perf
         row_count = self._row_count_from_perf(perf)
@@ -354,12 +632,19 @@ class ExecutionOrchestrator:
             self.logger.add_row_data("repeat", str(self.iteration_count), "int", "Iteration/repeat number")
             rank_value = str(row_index)
             self.logger.add_row_data("rank", rank_value, "int", "MPI rank (0 for non-MPI)")
+            if speculative is not None:
+                self.logger.add_row_data("speculative", str(int(speculative)), "int",
+                                         "1 if run after the stopping decision (pipelined mode)")
 
             outer_time_value = self._value_for_row(outer_values, row_index, default=str(outer_values[-1]) if outer_values else "")
             self.logger.add_row_data("outer_time", outer_time_value, "float", "outer_time")
 
             for field_name, values in metric_items:
                 value = self._value_for_row(values, row_index)
+                if field_name in COPY_METRICS or field_name in REQUEST_METRICS:
+                    metric_type, description = (COPY_METRICS | REQUEST_METRICS)[field_name]
+                    self.logger.add_row_data(field_name, value, metric_type, description)
+                    continue
                 # Get type from metric specs, default to float for backwards compatibility
                 metric_type = self.metric_extractor.metric_specs.get(field_name, {}).get("type", "float")
                 if metric_type == "numeric":
@@ -428,13 +713,15 @@ class ExecutionOrchestrator:
                     else:
                         warnings.warn(f"Reset command error for backend {backend_name}: {e}")
 
-    def _extract_metrics(self, output_files: list[tempfile._TemporaryFileWrapper[bytes]], elapsed_time: float) -> RunData:
+    def _extract_metrics(self, output_files: list[tempfile._TemporaryFileWrapper[bytes]], elapsed_time: float,
+                         copy_metrics: Dict[str, List[str]] | None = None) -> RunData:
         """
         Extract metrics from output files and add wall-clock execution time.
 
         Args:
             output_files: List of TemporaryFile objects from runner (one per parallel process)
             elapsed_time: Wall-clock time in seconds for command execution
+            copy_metrics: Per-copy runner metrics of this iteration (default: read from the runner)
 
         Returns:
             RunData object containing extracted metrics plus outer_time
@@ -447,11 +734,16 @@ class ExecutionOrchestrator:
             raise RuntimeError("No output files available for metric extraction")
 
         # Extract metrics from all output files (one per parallel process)
-        # and merge them into a single RunData with lists of values
-        outer_metrics = {"outer_time": [str(elapsed_time)]}
+        # and merge them into a single RunData with lists of values.
+        # Per-copy timing/rusage from the runner is attached to its copy's file.
+        if copy_metrics is None:
+            copy_metrics = self._copy_metrics(len(output_files))
         merged_metrics: Dict[str, List[str]] = {}
 
-        for output_file in output_files:
+        for copy_index, output_file in enumerate(output_files):
+            outer_metrics = {"outer_time": [str(elapsed_time)]}
+            for name, values in copy_metrics.items():
+                outer_metrics[name] = [values[copy_index]]
             file_rundata = self.metric_extractor.extract(output_file.name, outer_metrics)
             for metric_name, values in file_rundata.perf.items():
                 if metric_name not in merged_metrics:
@@ -460,3 +752,22 @@ class ExecutionOrchestrator:
                 merged_metrics[metric_name].extend(str(v) for v in values)
 
         return RunData(merged_metrics)
+
+    def _copy_metrics(self, copies: int) -> Dict[str, List[str]]:
+        """
+        Get per-copy timing and resource usage metrics from the runner.
+
+        Args:
+            copies: Number of output files (copies) in the current iteration
+
+        Returns:
+            Dict mapping metric name to one value per copy, or empty dict if
+            the runner does not provide them for this iteration
+        """
+        copy_metrics = getattr(self.runner, "copy_metrics", None)
+        if not callable(copy_metrics):
+            return {}
+        metrics: Dict[str, List[str]] = copy_metrics()
+        if any(len(values) != copies for values in metrics.values()):
+            return {}
+        return metrics
@@ -3,20 +3,31 @@ SHARP 4.0 Parameter Space Exploration
 
 Provides strategies for exploring parameter spaces:
 - Cartesian product (full sweep)
-- Future: Random sampling, gradient descent, genetic algorithms, etc.
+- Random sampling and Latin hypercube sampling of a run budget
+- Bayesian optimization (Gaussian process surrogate, expected improvement)
+- Scalability knee search over multiprogramming levels
 
 © Copyright 2022--2025 Hewlett Packard Enterprise Development LP
 """
 
-import copy
 import itertools
+import math
+import random
+import threading
 import uuid
 import warnings
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, overload
+
+import numpy
+import scipy.stats
 
 from src.core.config.schema import ExperimentConfig, SweepConfig
 
+# One sweep configuration: (launch_id, config, varied parameters)
+SweepPoint = tuple[str, ExperimentConfig, dict[str, Any]]
+
 
 # =============================================================================
 # Utilities
@@ -103,12 +114,12 @@ class ParameterSpaceStrategy(ABC):
         self.base_config = base_config
 
     @abstractmethod
-    def generate_configurations(self) -> list[tuple[str, ExperimentConfig, dict[str, Any]]]:
+    def generate_configurations(self) -> Iterable[SweepPoint]:
         """
         Generate configurations to explore.
 
         Returns:
-            List of (launch_id, config, parameters) tuples where:
+            Iterable (possibly lazy) of (launch_id, config, parameters) tuples where:
             - launch_id: Unique identifier for this configuration
             - config: Complete ExperimentConfig for this run
             - parameters: Dict of parameters that varied (for logging)
@@ -126,6 +137,173 @@ class ParameterSpaceStrategy(ABC):
         pass
 
 
+# =============================================================================
+# Lazy Sweep Space
+# =============================================================================
+
+class SweepSpace(Sequence[SweepPoint]):
+    """
+    Lazily expanded Cartesian product of sweep parameters.
+
+    Behaves like the list of (launch_id, config, parameters) tuples of all
+    combinations, without materializing it: its length is computed from the
+    dimension sizes, point i is decoded from i directly (for sharding and
+    resuming sweeps), and iterating creates each point only when reached.
+
+    Each point's config is a shallow overlay on one shared base config: only
+    its environment and options dicts are new. Treat configs as read-only
+    (use model_dump() for a private copy).
+    """
+
+    def __init__(self, base_config: ExperimentConfig, dimensions: list[tuple[str, list[Any]]],
+                 session_id: str, prefix: str = "sweep"):
+        """
+        Initialize sweep space.
+
+        Args:
+            base_config: Base experiment configuration (copied once)
+            dimensions: (parameter key, values) per dimension, where keys are
+                '__args__', 'env.NAME' or 'opt.NAME'; the last dimension
+                varies fastest
+            session_id: Session ID shared by all launch IDs of this sweep
+            prefix: Launch ID prefix
+        """
+        self.base_config = base_config.model_copy(deep=True)
+        self._keys = [key for key, _ in dimensions]
+        self._values = [values for _, values in dimensions]
+        self._session_id = session_id
+        self._prefix = prefix
+        self._size = math.prod(len(values) for values in self._values)
+
+    def __len__(self) -> int:
+        """Number of combinations (product of dimension sizes)."""
+        return self._size
+
+    @overload
+    def __getitem__(self, index: int) -> SweepPoint: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[SweepPoint]: ...
+
+    def __getitem__(self, index: int | slice) -> SweepPoint | list[SweepPoint]:
+        """
+        Get point(s) by position, without expanding the others.
+
+        Args:
+            index: Point index (negative counts from the end) or slice
+
+        Returns:
+            (launch_id, config, parameters) tuple, or list of them for a slice
+
+        Raises:
+            IndexError: If index is out of range
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(f"Sweep point {index} out of range (size {self._size})")
+        return self.point(index + 1, index)
+
+    def __iter__(self) -> Iterator[SweepPoint]:
+        """Yield all points in order, creating each on demand."""
+        for sequence, combo in enumerate(itertools.product(*self._values), start=1):
+            yield self._point(sequence, combo)
+
+    @property
+    def dimensions(self) -> list[tuple[str, list[Any]]]:
+        """(parameter key, values) per dimension, last dimension fastest."""
+        return list(zip(self._keys, self._values))
+
+    def combination(self, index: int) -> tuple[Any, ...]:
+        """
+        Decode the parameter values of point index (mixed-radix, last dimension fastest).
+
+        Args:
+            index: Point index in [0, len)
+
+        Returns:
+            One value per dimension
+        """
+        return tuple(values[digit] for values, digit in zip(self._values, self.digits(index)))
+
+    def digits(self, index: int) -> tuple[int, ...]:
+        """
+        Decode the value positions of point index (one per dimension).
+
+        Args:
+            index: Point index in [0, len)
+
+        Returns:
+            Position of the point's value in each dimension's value list
+        """
+        digits = []
+        for values in reversed(self._values):
+            index, digit = divmod(index, len(values))
+            digits.append(digit)
+        return tuple(reversed(digits))
+
+    def index_of(self, digits: Sequence[int]) -> int:
+        """
+        Encode value positions (one per dimension) as a point index (inverse of digits()).
+
+        Args:
+            digits: Position of a value in each dimension's value list
+
+        Returns:
+            Point index in [0, len)
+        """
+        index = 0
+        for values, digit in zip(self._values, digits):
+            index = index * len(values) + digit
+        return index
+
+    def point(self, sequence: int, index: int) -> SweepPoint:
+        """
+        Build point index under an explicit sequence number (used in its launch ID).
+
+        Args:
+            sequence: Launch ID sequence number (1-based)
+            index: Point index in [0, len)
+
+        Returns:
+            (launch_id, config, parameters) tuple
+        """
+        return self._point(sequence, self.combination(index))
+
+    def _point(self, sequence: int, combo: tuple[Any, ...]) -> SweepPoint:
+        """Build the (launch_id, config, parameters) tuple of one combination."""
+        launch_id = generate_launch_id(prefix=self._prefix, sequence=sequence, session_id=self._session_id)
+        environment: dict[str, str] = {}
+        options: dict[str, Any] = {}
+        runtime: dict[str, Any] = {}
+        parameters: dict[str, Any] = {}
+
+        # Apply each parameter from the combination
+        for key, value in zip(self._keys, combo):
+            if key == '__args__':
+                options['args'] = value
+                parameters['args'] = value
+            elif key.startswith('env.'):
+                environment[key[4:]] = value  # Remove 'env.' prefix
+                parameters[key] = value
+            elif key.startswith('opt.'):
+                options[key[4:]] = value  # Remove 'opt.' prefix
+                runtime[key[4:]] = value
+                parameters[key[4:]] = value
+
+        # Swept options also apply at the top level, where launch reads runtime
+        # options (mpl, start, ...) as from -j
+        base = self.base_config
+        config = base.model_copy(update={
+            **runtime,
+            "environment": {**base.environment, **environment},
+            "options": {**base.options, **options},
+        })
+        return launch_id, config, parameters
+
+
 # =============================================================================
 # Cartesian Product Strategy (Full Sweep)
 # =============================================================================
@@ -150,67 +328,43 @@ class CartesianSweepStrategy(ParameterSpaceStrategy):
         self.sweep_config = sweep_config
         self._session_id = uuid.uuid4().hex[:6]
 
-    def generate_configurations(self) -> list[tuple[str, ExperimentConfig, dict[str, Any]]]:
+    def generate_configurations(self) -> SweepSpace:
         """
-        Generate all combinations via Cartesian product.
+        Generate all combinations via Cartesian product (lazily).
+
+        Warns once per base environment variable or option that the sweep
+        overrides with a different value.
 
         Returns:
-            List of (launch_id, config, parameters) tuples
+            SweepSpace of (launch_id, config, parameters) tuples
         """
-        configs = []
-
-        # Build a unified parameter space dictionary
+        # Build a unified parameter space: one dimension per parameter
         # Args are special: each entry is already a complete args list
-        param_space: dict[str, Any] = {}
+        dimensions: list[tuple[str, list[Any]]] = []
 
         if self.sweep_config.args:
-            param_space['__args__'] = self.sweep_config.args
+            dimensions.append(('__args__', self.sweep_config.args))
 
         if self.sweep_config.env:
             for key, value in self.sweep_config.env.items():
-                param_space[f'env.{key}'] = value
+                values = value if isinstance(value, list) else [value]
+                self._warn_override("environment variable", key, self.base_config.environment, values)
+                dimensions.append((f'env.{key}', values))
 
         if self.sweep_config.options:
             for key, value in self.sweep_config.options.items():
-                param_space[f'opt.{key}'] = value
-
-        # Generate all combinations using cartesian_product_dict
-        all_combinations = cartesian_product_dict(param_space)
-
-        # Create a config for each combination
-        for sequence, combo in enumerate(all_combinations, start=1):
-            launch_id = generate_launch_id(prefix="sweep", sequence=sequence, session_id=self._session_id)
-
-            config = copy.deepcopy(self.base_config)
-            parameters = {}
-
-            # Apply each parameter from the combination
-            for key, value in combo.items():
-                if key == '__args__':
-                    config.options['args'] = value
-                    parameters['args'] = value
-                elif key.startswith('env.'):
-                    env_key = key[4:]  # Remove 'env.' prefix
-                    if env_key in config.environment and config.environment[env_key] != value:
-                        warnings.warn(
-                            f"Sweep overriding environment variable '{env_key}': "
-                            f"{config.environment[env_key]} → {value}"
-                        )
-                    config.environment[env_key] = value
-                    parameters[key] = value
-                elif key.startswith('opt.'):
-                    opt_key = key[4:]  # Remove 'opt.' prefix
-                    if opt_key in config.options and config.options[opt_key] != value:
-                        warnings.warn(
-                            f"Sweep overriding option '{opt_key}': "
-                            f"{config.options[opt_key]} → {value}"
-                        )
-                    config.options[opt_key] = value
-                    parameters[opt_key] = value
-
-            configs.append((launch_id, config, parameters))
-
-        return configs
+                values = value if isinstance(value, list) else [value]
+                self._warn_override("option", key, self.base_config.options, values)
+                dimensions.append((f'opt.{key}', values))
+
+        return SweepSpace(self.base_config, dimensions, self._session_id)
+
+    @staticmethod
+    def _warn_override(kind: str, key: str, base: dict[str, Any], values: list[Any]) -> None:
+        """Warn if sweep values replace a different value from the base config."""
+        if key in base and any(base[key] != value for value in values):
+            shown = values[0] if len(values) == 1 else values
+            warnings.warn(f"Sweep overriding {kind} '{key}': {base[key]} → {shown}")
 
     def get_parameter_ranges(self) -> dict[str, Any]:
         """
@@ -235,6 +389,609 @@ class CartesianSweepStrategy(ParameterSpaceStrategy):
         return ranges
 
 
+# =============================================================================
+# Adaptive Strategies (choose configurations as the sweep runs)
+# =============================================================================
+
+class AdaptiveSweep:
+    """
+    The configurations an adaptive strategy proposes, in proposal order.
+
+    Iterating asks the strategy for one point at a time, so each choice can
+    use the results reported (via report()) for all configurations that
+    finished before it; when the strategy is not ready, iteration blocks
+    until a running configuration reports. Launch IDs are numbered in
+    proposal order.
+    """
+
+    def __init__(self, strategy: "AdaptiveSweepStrategy"):
+        """Wrap an adaptive strategy (see AdaptiveSweepStrategy.generate_configurations)."""
+        self.strategy = strategy
+        self.base_config = strategy.base_config
+
+    def __len__(self) -> int:
+        """Maximum number of configurations that will run."""
+        return self.strategy.max_points()
+
+    def __iter__(self) -> Iterator[SweepPoint]:
+        """Yield proposed points until the strategy is done."""
+        strategy = self.strategy
+        sequence = 0
+        while True:
+            with strategy.cond:
+                strategy.cond.wait_for(strategy.ready)
+                point = strategy.next_point(sequence + 1)
+                if point is None:
+                    return
+                strategy.pending += 1
+            sequence += 1
+            yield point
+
+
+class AdaptiveSweepStrategy(ParameterSpaceStrategy):
+    """
+    Strategy choosing each configuration only when the sweep requests it.
+
+    The sweep reports each finished configuration's CSV rows with report(),
+    so later choices can depend on earlier results. Subclasses implement
+    next_point(), observe() and max_points(); ready() makes the sweep wait
+    for running configurations before the next choice.
+    """
+
+    def __init__(self, base_config: ExperimentConfig):
+        """
+        Initialize adaptive strategy.
+
+        Args:
+            base_config: Base experiment configuration
+        """
+        super().__init__(base_config)
+        self.cond = threading.Condition()  # Guards all state; notified on each report
+        self.pending = 0  # Proposed configurations that have not reported yet
+
+    def generate_configurations(self) -> AdaptiveSweep:
+        """
+        Generate configurations one at a time, as the sweep requests them.
+
+        Returns:
+            AdaptiveSweep of (launch_id, config, parameters) tuples
+        """
+        return AdaptiveSweep(self)
+
+    def report(self, launch_id: str, iterations: list[list[dict[str, str]]] | None,
+               source: str | None = None) -> None:
+        """
+        Report a finished configuration.
+
+        Args:
+            launch_id: Launch ID of a proposed configuration
+            iterations: Its CSV rows grouped by iteration, or None if it failed
+            source: Launch ID holding the rows, if another one (a resumed
+                sweep skips configurations completed by an earlier launch)
+        """
+        with self.cond:
+            self.pending -= 1
+            self.observe(launch_id, iterations, source or launch_id)
+            self.cond.notify_all()
+
+    def ready(self) -> bool:
+        """Whether the next choice can be made now (caller holds cond; default: always)."""
+        return True
+
+    @abstractmethod
+    def max_points(self) -> int:
+        """Upper bound on the number of configurations proposed."""
+        pass
+
+    @abstractmethod
+    def next_point(self, sequence: int) -> SweepPoint | None:
+        """
+        Choose the next configuration (caller holds cond).
+
+        Args:
+            sequence: Launch ID sequence number for the point
+
+        Returns:
+            (launch_id, config, parameters) tuple, or None when done
+        """
+        pass
+
+    @abstractmethod
+    def observe(self, launch_id: str, iterations: list[list[dict[str, str]]] | None, source: str) -> None:
+        """Record a finished configuration's rows (caller holds cond; see report())."""
+        pass
+
+    def summary(self) -> list[str]:
+        """Lines describing the outcome, printed when the sweep ends."""
+        return []
+
+    def markdown_section(self) -> tuple[str, str] | None:
+        """(title, Markdown body) to add to the task's Markdown file, if any."""
+        return None
+
+
+def _metric_values(iterations: list[list[dict[str, str]]], metric: str) -> list[float]:
+    """Numeric values of a metric over all rows (iterations and ranks), skipping missing ones."""
+    values = []
+    for rows in iterations:
+        for row in rows:
+            try:
+                values.append(float(row[metric]))
+            except (KeyError, TypeError, ValueError):
+                continue
+    return values
+
+
+# =============================================================================
+# Sampling Strategies (run budget)
+# =============================================================================
+
+class SamplingSweepStrategy(AdaptiveSweepStrategy):
+    """
+    Runs a budget of points chosen from the Cartesian product of the sweep.
+
+    Subclasses choose each next point (propose); each finished
+    configuration's objective is the median of the sweep metric over its
+    rows, kept per point and oriented so that lower is better.
+    """
+
+    def __init__(self, base_config: ExperimentConfig, sweep_config: SweepConfig):
+        """
+        Initialize sampling strategy.
+
+        Args:
+            base_config: Base experiment configuration
+            sweep_config: Sweep configuration defining parameter space, budget,
+                metric, goal and seed
+        """
+        super().__init__(base_config)
+        self.sweep_config = sweep_config
+        self.cartesian = CartesianSweepStrategy(base_config, sweep_config)
+        self.space = self.cartesian.generate_configurations()
+        self.budget = min(sweep_config.budget or len(self.space), len(self.space))
+        self.rng = random.Random(sweep_config.seed)
+        self.launched: dict[str, int] = {}  # launch_id -> point index
+        self.sequences: dict[int, int] = {}  # point index -> launch ID sequence number
+        self.sources: dict[int, str] = {}  # point index -> launch ID holding its results
+        self.proposed: set[int] = set()
+        self.results: dict[int, float | None] = {}  # point index -> objective (None: failed)
+
+    def get_parameter_ranges(self) -> dict[str, Any]:
+        """
+        Get parameter ranges for documentation.
+
+        Returns:
+            Dictionary with parameter names and their ranges
+        """
+        return self.cartesian.get_parameter_ranges()
+
+    def max_points(self) -> int:
+        """Number of configurations that will run (the budget)."""
+        return self.budget
+
+    def next_point(self, sequence: int) -> SweepPoint | None:
+        """Choose and reserve the next point; None once the budget is spent."""
+        if len(self.proposed) >= self.budget:
+            return None
+        index = self.propose()
+        self.proposed.add(index)
+        point = self.space.point(sequence, index)
+        self.launched[point[0]] = index
+        self.sequences[index] = sequence
+        return point
+
+    def observe(self, launch_id: str, iterations: list[list[dict[str, str]]] | None, source: str) -> None:
+        """Record the median of the sweep metric over the configuration's rows."""
+        value = None
+        if iterations is not None:
+            values = _metric_values(iterations, self.sweep_config.metric)
+            if values:
+                value = float(numpy.median(values))
+            else:
+                warnings.warn(f"Metric '{self.sweep_config.metric}' not found for {source}")
+        self.tell(launch_id, value, source)
+
+    def tell(self, launch_id: str, value: float | None, source: str | None = None) -> None:
+        """
+        Record the objective of a finished configuration directly.
+
+        Args:
+            launch_id: Launch ID of a proposed configuration
+            value: Value of the sweep metric, or None if the run failed
+            source: Launch ID holding the results, if another one
+        """
+        with self.cond:
+            index = self.launched[launch_id]
+            if value is not None and self.sweep_config.goal == "maximize":
+                value = -value
+            self.results[index] = value
+            self.sources[index] = source or launch_id
+
+    def best(self) -> tuple[SweepPoint, float] | None:
+        """
+        Best configuration reported so far.
+
+        Returns:
+            ((launch_id, config, parameters), metric value), or None if no
+            configuration succeeded; launch_id is the launch holding the results
+        """
+        with self.cond:
+            scored = [(value, index) for index, value in self.results.items() if value is not None]
+            if not scored:
+                return None
+            value, index = min(scored)
+            sequence, source = self.sequences[index], self.sources[index]
+        _, config, parameters = self.space.point(sequence, index)
+        metric = -value if self.sweep_config.goal == "maximize" else value
+        return (source, config, parameters), metric
+
+    def summary(self) -> list[str]:
+        """The best configuration found."""
+        best = self.best()
+        if best is None:
+            return [f"✗ No sweep configuration produced the metric '{self.sweep_config.metric}'"]
+        (launch_id, _, parameters), value = best
+        shown = ", ".join(f"{key}={value}" for key, value in parameters.items())
+        return [f"Best configuration: {launch_id} ({shown}): {self.sweep_config.metric} = {value:g}"]
+
+    @abstractmethod
+    def propose(self) -> int:
+        """Choose a point index not proposed before."""
+        pass
+
+    def _random_unproposed(self) -> int:
+        """A uniformly random point index that was not proposed before."""
+        size = len(self.space)
+        if len(self.proposed) < size // 2:
+            while True:
+                index = self.rng.randrange(size)
+                if index not in self.proposed:
+                    return index
+        return self.rng.choice([i for i in range(size) if i not in self.proposed])
+
+    def _latin_hypercube(self, count: int) -> list[int]:
+        """
+        Distinct point indices of a Latin hypercube design.
+
+        Each dimension's value list is split into count strata, and every
+        stratum is used by exactly one point (so with count at least a
+        dimension's size, all its values are covered). Duplicate points of
+        small dimensions are replaced by random ones.
+        """
+        columns = []
+        for _, values in self.space.dimensions:
+            strata = list(range(count))
+            self.rng.shuffle(strata)
+            columns.append([int((stratum + self.rng.random()) / count * len(values)) for stratum in strata])
+        design = list(dict.fromkeys(self.space.index_of(digits) for digits in zip(*columns)))
+        chosen = set(design)
+        while len(design) < min(count, len(self.space)):
+            index = self.rng.randrange(len(self.space))
+            if index not in chosen:
+                design.append(index)
+                chosen.add(index)
+        return design
+
+
+class RandomSweepStrategy(SamplingSweepStrategy):
+    """Runs a budget of points drawn uniformly at random, without repetition."""
+
+    def propose(self) -> int:
+        """Choose a random point not proposed before."""
+        return self._random_unproposed()
+
+
+class LatinHypercubeSweepStrategy(SamplingSweepStrategy):
+    """Runs a budget of points from a Latin hypercube design, spreading them over every dimension."""
+
+    def __init__(self, base_config: ExperimentConfig, sweep_config: SweepConfig):
+        """Initialize strategy and lay out the design (see SamplingSweepStrategy)."""
+        super().__init__(base_config, sweep_config)
+        self._design = self._latin_hypercube(self.budget)
+
+    def propose(self) -> int:
+        """Choose the next point of the design."""
+        return self._design[len(self.proposed)]
+
+
+class BayesianSweepStrategy(SamplingSweepStrategy):
+    """
+    Runs a budget of points chosen to optimize the sweep metric.
+
+    The first initial_points (default: twice the number of dimensions, at
+    least 4) come from a Latin hypercube design. Each following point is
+    the one with the highest expected improvement under a Gaussian process
+    fitted to all results reported so far. Points still running are
+    excluded from the candidates, so parallel sweeps never propose them twice.
+
+    Each dimension is scaled to [0, 1] by value where all values are
+    numbers (logarithmically if positive and spanning more than a decade),
+    and by position in the value list otherwise.
+    """
+
+    # Candidates scored per proposal in larger spaces (a random subset)
+    MAX_CANDIDATES = 4096
+
+    def __init__(self, base_config: ExperimentConfig, sweep_config: SweepConfig):
+        """Initialize strategy and lay out the initial design (see SamplingSweepStrategy)."""
+        super().__init__(base_config, sweep_config)
+        dimensions = self.space.dimensions
+        initial = sweep_config.initial_points or max(4, 2 * len(dimensions))
+        self._initial = self._latin_hypercube(min(initial, self.budget))
+        self._scales = [self._scale(values) for _, values in dimensions]
+
+    def propose(self) -> int:
+        """Choose the next initial point, then the candidate with the highest expected improvement."""
+        if len(self.proposed) < len(self._initial):
+            return self._initial[len(self.proposed)]
+        known = {index: value for index, value in self.results.items() if value is not None}
+        if len(known) < 2:
+            return self._random_unproposed()
+
+        size = len(self.space)
+        if size - len(self.proposed) <= self.MAX_CANDIDATES:
+            candidates = [i for i in range(size) if i not in self.proposed]
+        else:
+            candidates = list({self._random_unproposed() for _ in range(self.MAX_CANDIDATES)})
+
+        mean, std = self._fit_surrogate(known, candidates)
+        best = min(known.values())
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            z = (best - mean) / std
+            improvement = numpy.where(std > 0, (best - mean) * scipy.stats.norm.cdf(z)
+                                      + std * scipy.stats.norm.pdf(z), 0.0)
+        return candidates[int(numpy.argmax(improvement))]
+
+    def _fit_surrogate(self, known: dict[int, float],
+                       candidates: list[int]) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Fit a Gaussian process to the known results and predict the candidates (mean, std)."""
+        from sklearn.gaussian_process import GaussianProcessRegressor
+        from sklearn.gaussian_process.kernels import ConstantKernel, Matern, WhiteKernel
+
+        dims = len(self._scales)
+        kernel = (ConstantKernel(1.0) * Matern(length_scale=[0.5] * dims, length_scale_bounds=(1e-2, 1e2), nu=2.5)
+                  + WhiteKernel(noise_level=1e-2, noise_level_bounds=(1e-6, 1.0)))
+        model = GaussianProcessRegressor(kernel=kernel, normalize_y=True, n_restarts_optimizer=2,
+                                         random_state=self.rng.randrange(2 ** 31))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")  # Convergence warnings on tiny samples
+            model.fit(self._encode(list(known)), numpy.array(list(known.values())))
+            mean, std = model.predict(self._encode(candidates), return_std=True)
+        return mean, std
+
+    def _encode(self, indices: list[int]) -> numpy.ndarray:
+        """Scale points to the unit hypercube (one row per point)."""
+        return numpy.array([[scale[digit] for scale, digit in zip(self._scales, self.space.digits(index))]
+                            for index in indices], dtype=float)
+
+    @staticmethod
+    def _scale(values: list[Any]) -> list[float]:
+        """Coordinates in [0, 1] of a dimension's values."""
+        try:
+            numbers = [float(v[0] if isinstance(v, list) and len(v) == 1 else v) for v in values]
+        except (TypeError, ValueError):
+            numbers = [float(i) for i in range(len(values))]
+        if min(numbers) > 0 and max(numbers) > 10 * min(numbers):
+            numbers = [math.log(n) for n in numbers]
+        low, high = min(numbers), max(numbers)
+        return [(n - low) / (high - low) if high > low else 0.0 for n in numbers]
+
+
+# =============================================================================
+# Scalability Knee Search (MPL levels)
+# =============================================================================
+
+class KneeSearchStrategy(AdaptiveSweepStrategy):
+    """
+    Searches multiprogramming levels (mpl) for the scalability knee and SLO limit.
+
+    Runs the experiment at mpl 1, 2, 4, ... (up to max_mpl) until both are
+    bracketed, then bisects each bracket. At each level, throughput is the
+    median over iterations of completed copies per second of outer_time, and
+    latency is the slo_percentile of the per-copy copy_time (outer_time when
+    the backend does not report it).
+
+    The knee is the last level before the marginal efficiency of adding
+    copies, (X(b) / X(a) - 1) * a / (b - a) for throughputs X at levels
+    a < b, drops below knee_efficiency (1: perfect scaling) or a level
+    fails. The SLO limit is the last level whose latency meets slo (seconds)
+    or slo_factor times the mpl 1 latency. Levels run one at a time, since
+    concurrent levels would disturb each other's measurements.
+    """
+
+    def __init__(self, base_config: ExperimentConfig, sweep_config: SweepConfig):
+        """
+        Initialize knee search.
+
+        Args:
+            base_config: Base experiment configuration
+            sweep_config: Sweep configuration; any args, env or options must
+                define a single configuration, and may not sweep mpl
+
+        Raises:
+            ValueError: If the sweep has several configurations or sets mpl
+        """
+        super().__init__(base_config)
+        self.sweep_config = sweep_config
+        if sweep_config.options and "mpl" in sweep_config.options:
+            raise ValueError("knee strategy chooses mpl itself; remove mpl from sweep options")
+        self.cartesian = CartesianSweepStrategy(base_config, sweep_config)
+        self.space = self.cartesian.generate_configurations()
+        if len(self.space) != 1:
+            raise ValueError(f"knee strategy needs a single configuration, sweep has {len(self.space)}")
+        self.max_mpl = sweep_config.max_mpl
+        self.launched: dict[str, int] = {}  # launch_id -> mpl
+        self.sources: dict[int, str] = {}  # mpl -> launch ID holding its results
+        self.proposed: set[int] = set()
+        # mpl -> (throughput, latency), or None if the level failed
+        self.levels: dict[int, tuple[float, float] | None] = {}
+
+    def get_parameter_ranges(self) -> dict[str, Any]:
+        """
+        Get parameter ranges for documentation.
+
+        Returns:
+            Dictionary with parameter names and their ranges
+        """
+        return {**self.cartesian.get_parameter_ranges(), "mpl": f"1-{self.max_mpl} (knee search)"}
+
+    def ready(self) -> bool:
+        """Choose the next level only when no level is running."""
+        return self.pending == 0
+
+    def max_points(self) -> int:
+        """Levels run at most: the doubling phase and a bisection per bracket."""
+        steps = math.ceil(math.log2(self.max_mpl)) if self.max_mpl > 1 else 0
+        return min(self.max_mpl, 3 * steps + 1)
+
+    def next_point(self, sequence: int) -> SweepPoint | None:
+        """Run the next level the search needs; None once the knee and SLO limit are located."""
+        mpl = self._next_level()
+        if mpl is None:
+            return None
+        self.proposed.add(mpl)
+        launch_id, config, _ = self.space.point(sequence, 0)
+        config = config.model_copy(update={"mpl": mpl, "options": {**config.options, "mpl": mpl}})
+        self.launched[launch_id] = mpl
+        return launch_id, config, {"mpl": mpl}
+
+    def observe(self, launch_id: str, iterations: list[list[dict[str, str]]] | None, source: str) -> None:
+        """Record the level's throughput and latency (None if it failed)."""
+        mpl = self.launched[launch_id]
+        self.sources[mpl] = source
+        self.levels[mpl] = self._measure(iterations) if iterations else None
+        if iterations and self.levels[mpl] is None:
+            warnings.warn(f"Metric 'outer_time' not found for {source}")
+
+    def _measure(self, iterations: list[list[dict[str, str]]]) -> tuple[float, float] | None:
+        """(throughput, latency) of one level's rows, or None without timings."""
+        throughputs = []
+        for rows in iterations:
+            times = _metric_values([rows], "outer_time")
+            if times and times[0] > 0:
+                throughputs.append(len(rows) / times[0])
+        latencies = _metric_values(iterations, "copy_time") or _metric_values(iterations, "outer_time")
+        if not throughputs or not latencies:
+            return None
+        return float(numpy.median(throughputs)), float(numpy.percentile(latencies, self.sweep_config.slo_percentile))
+
+    # -- Search --------------------------------------------------------------
+
+    @staticmethod
+    def efficiency(low: int, low_throughput: float, high: int, high_throughput: float) -> float:
+        """Marginal scaling efficiency from level low to level high (1: throughput grows with mpl)."""
+        return (high_throughput / low_throughput - 1) * low / (high - low)
+
+    def slo_latency(self) -> float | None:
+        """Latency bound of the SLO in seconds (None: no SLO or mpl 1 not measured)."""
+        if self.sweep_config.slo is not None:
+            return self.sweep_config.slo
+        baseline = self.levels.get(1)
+        if self.sweep_config.slo_factor is None or baseline is None:
+            return None
+        return self.sweep_config.slo_factor * baseline[1]
+
+    def _has_slo(self) -> bool:
+        """Whether an SLO search was requested."""
+        return self.sweep_config.slo is not None or self.sweep_config.slo_factor is not None
+
+    def knee_bracket(self) -> tuple[int, int] | None:
+        """First pair of adjacent measured levels where scaling stops (efficiency or failure)."""
+        measured = sorted(self.levels)
+        for low, high in zip(measured, measured[1:]):
+            below, above = self.levels[low], self.levels[high]
+            if below is None:
+                return None
+            if above is None or self.efficiency(low, below[0], high, above[0]) < self.sweep_config.knee_efficiency:
+                return low, high
+        return None
+
+    def slo_bracket(self) -> tuple[int | None, int] | None:
+        """(last level meeting the SLO or None, first level violating it), if one violates."""
+        bound = self.slo_latency()
+        below = None
+        for mpl in sorted(self.levels):
+            level = self.levels[mpl]
+            if level is None or (bound is not None and level[1] > bound):
+                return below, mpl
+            below = mpl
+        return None
+
+    def _next_level(self) -> int | None:
+        """The level to run next, recomputed from the measured levels (None: search done)."""
+        if 1 not in self.levels:
+            return None if 1 in self.proposed else 1
+        measured = sorted(self.levels)
+        top = measured[-1]
+        knee = self.knee_bracket()
+        slo = self.slo_bracket() if self._has_slo() else (top, top + 1)
+
+        # Doubling: until both are bracketed (a failed level brackets both)
+        if (knee is None or slo is None) and self.levels[top] is not None and top < self.max_mpl:
+            return min(2 * top, self.max_mpl)
+
+        # Bisection: narrow the lower unresolved bracket first
+        candidates = [(bracket[0] + bracket[1]) // 2 for bracket in (knee, slo)
+                      if bracket is not None and bracket[0] is not None and bracket[1] - bracket[0] > 1]
+        return min(candidates) if candidates else None
+
+    # -- Results -------------------------------------------------------------
+
+    def knee(self) -> int | None:
+        """The knee level, or None if the search did not find one (scaling up to max_mpl or failed at mpl 1)."""
+        bracket = self.knee_bracket()
+        return bracket[0] if bracket else None
+
+    def slo_limit(self) -> int | None:
+        """Highest level meeting the SLO (max measured level if none violates; None if mpl 1 does)."""
+        bracket = self.slo_bracket()
+        if bracket is None:
+            return max(self.levels) if self.levels else None
+        return bracket[0]
+
+    def curve(self) -> list[tuple[int, str, float | None, float | None, float | None]]:
+        """Measured levels as (mpl, launch_id, throughput, latency, efficiency from previous level)."""
+        rows: list[tuple[int, str, float | None, float | None, float | None]] = []
+        previous: tuple[int, tuple[float, float]] | None = None
+        for mpl in sorted(self.levels):
+            level = self.levels[mpl]
+            efficiency = None
+            if level is not None and previous is not None:
+                efficiency = self.efficiency(previous[0], previous[1][0], mpl, level[0])
+            rows.append((mpl, self.sources[mpl], level[0] if level else None, level[1] if level else None, efficiency))
+            if level is not None:
+                previous = (mpl, level)
+        return rows
+
+    def summary(self) -> list[str]:
+        """The knee and SLO limit found."""
+        with self.cond:
+            if not self.levels or self.levels.get(1) is None:
+                return ["✗ Knee search failed at mpl 1"]
+            knee = self.knee()
+            lines = [f"Scalability knee: mpl {knee}" if knee is not None
+                     else f"Scalability knee: not reached up to mpl {max(self.levels)}"]
+            if self._has_slo():
+                limit, bound = self.slo_limit(), self.slo_latency()
+                shown = f"p{self.sweep_config.slo_percentile:g} latency <= {bound:g}s" if bound is not None else "SLO"
+                lines.append(f"SLO limit ({shown}): mpl {limit}" if limit is not None
+                             else f"SLO limit ({shown}): not met at mpl 1")
+            return lines
+
+    def markdown_section(self) -> tuple[str, str] | None:
+        """The scalability curve as a Markdown table, with the knee and SLO limit."""
+        with self.cond:
+            if not self.levels:
+                return None
+            percentile = f"p{self.sweep_config.slo_percentile:g}"
+            lines = [f"| mpl | launch_id | throughput (copies/s) | {percentile} latency (s) | efficiency |",
+                     "|-----|-----------|-----------------------|-----------------|------------|"]
+            for mpl, launch_id, throughput, latency, efficiency in self.curve():
+                cells = [f"{value:.4g}" if value is not None else "NA" for value in (throughput, latency, efficiency)]
+                lines.append(f"| {mpl} | {launch_id} | " + " | ".join(cells) + " |")
+        return "Scalability curve", "\n".join(lines + [""] + [f"- {line}" for line in self.summary()])
+
+
 # =============================================================================
 # Factory Function
 # =============================================================================
@@ -249,8 +1006,8 @@ def create_parameter_space_strategy(
 
     Args:
         base_config: Base experiment configuration
-        sweep_config: Sweep configuration (required for cartesian)
-        strategy_type: Type of strategy ("cartesian", future: "random", "gradient", etc.)
+        sweep_config: Sweep configuration (required)
+        strategy_type: Type of strategy ("cartesian", "random", "lhs", "bayesian" or "knee")
 
     Returns:
         Configured ParameterSpaceStrategy instance
@@ -258,15 +1015,15 @@ def create_parameter_space_strategy(
     Raises:
         ValueError: If strategy_type is unknown or required config is missing
     """
-    if strategy_type == "cartesian":
-        if sweep_config is None:
-            raise ValueError("cartesian strategy requires sweep_config")
-        return CartesianSweepStrategy(base_config, sweep_config)
-
-    # Future strategies will be added here:
-    # elif strategy_type == "random":
-    #     return RandomSamplingStrategy(base_config, ...)
-    # elif strategy_type == "gradient":
-    #     return GradientDescentStrategy(base_config, ...)
-
-    raise ValueError(f"Unknown parameter space strategy: {strategy_type}")
+    strategies: dict[str, type[ParameterSpaceStrategy]] = {
+        "cartesian": CartesianSweepStrategy,
+        "random": RandomSweepStrategy,
+        "lhs": LatinHypercubeSweepStrategy,
+        "bayesian": BayesianSweepStrategy,
+        "knee": KneeSearchStrategy,
+    }
+    if strategy_type not in strategies:
+        raise ValueError(f"Unknown parameter space strategy: {strategy_type}")
+    if sweep_config is None:
+        raise ValueError(f"{strategy_type} strategy requires sweep_config")
+    return strategies[strategy_type](base_config, sweep_config)  # type: ignore[call-arg]
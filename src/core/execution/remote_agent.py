@@ -0,0 +1,156 @@
+"""
+Remote execution agent: runs shell commands sent over its stdin, timing them locally.
+
+The ssh backend opens a new SSH connection for every iteration, sys spec
+probe and reset, so each one pays connection setup and authentication, which
+also adds noise to outer_time. The sshagent backend instead starts this agent
+once per host (see agent_relay) and keeps the channel open. The agent reads
+one JSON request per line from stdin:
+
+    {"id": 7, "command": "./benchmark 100", "timeout": null}
+
+runs the command with the shell (stdout and stderr combined, stdin closed)
+in its own session, and writes one JSON reply line per request to stdout:
+
+    {"id": 7, "status": 0, "output": "...", "start": ..., "elapsed": ..., "user": ..., "sys": ..., "max_rss": ...}
+
+start is the host's wall clock at launch, and elapsed, user and sys are
+measured on the host (perf_counter and the child's rusage), so they exclude
+the channel's latency. Requests run concurrently; {"id": N, "op": "kill"}
+kills the process group of a running request, and {"id": N, "op": "ping"}
+replies with the host name, the clock and the interpreter version. The agent
+exits at end of input, killing commands still running.
+
+The agent only uses the standard library and no other SHARP module, so its
+source can be sent to a host that has nothing but a Python 3 interpreter
+(see bootstrap_command).
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import platform
+import shlex
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from typing import Any, Dict, IO
+
+
+class Agent:
+    """
+    Runs requests read from a stream, writing replies to another (see module docstring).
+
+    Args:
+        output: Binary stream for reply lines
+    """
+
+    def __init__(self, output: IO[bytes]) -> None:
+        """Initialize the agent (see class docstring)."""
+        self._output = output
+        self._write_lock = threading.Lock()
+        self._running: Dict[Any, subprocess.Popen[bytes]] = {}
+        self._running_lock = threading.Lock()
+
+    def serve(self, requests: IO[bytes]) -> None:
+        """Handle request lines until end of input, then kill running commands."""
+        for line in requests:
+            try:
+                request = json.loads(line)
+            except ValueError:
+                continue
+            op = request.get("op", "run")
+            if op == "ping":
+                self._reply({"id": request.get("id"), "host": platform.node(), "time": time.time(),
+                             "python": platform.python_version()})
+            elif op == "kill":
+                self._kill(request.get("id"))
+            else:
+                threading.Thread(target=self._run, args=(request,), daemon=True).start()
+        with self._running_lock:
+            for request_id in list(self._running):
+                self._kill(request_id)
+
+    def _run(self, request: Dict[str, Any]) -> None:
+        """Run one command and reply with its output and timings."""
+        reply: Dict[str, Any] = {"id": request.get("id")}
+        timeout = request.get("timeout")
+        with tempfile.TemporaryFile() as output:
+            start = time.time()
+            t0 = time.perf_counter()
+            try:
+                popen = subprocess.Popen(request["command"], shell=True, stdin=subprocess.DEVNULL,
+                                         stdout=output, stderr=subprocess.STDOUT, start_new_session=True)
+            except (OSError, KeyError, TypeError) as e:
+                self._reply(reply | {"status": 127, "output": f"remote-agent: {e}\n", "start": start,
+                                     "elapsed": 0.0, "user": 0.0, "sys": 0.0, "max_rss": 0})
+                return
+            with self._running_lock:
+                self._running[reply["id"]] = popen
+            timer = threading.Timer(timeout, self._kill, (reply["id"],)) if timeout else None
+            if timer:
+                timer.start()
+            _, wait_status, rusage = os.wait4(popen.pid, 0)
+            elapsed = time.perf_counter() - t0
+            if timer:
+                timer.cancel()
+            popen.returncode = os.waitstatus_to_exitcode(wait_status)
+            with self._running_lock:
+                self._running.pop(reply["id"], None)
+            output.seek(0)
+            reply |= {"status": popen.returncode, "output": output.read().decode(errors="replace"),
+                      "start": start, "elapsed": elapsed, "user": rusage.ru_utime, "sys": rusage.ru_stime,
+                      "max_rss": rusage.ru_maxrss}
+        self._reply(reply)
+
+    def _kill(self, request_id: Any) -> None:
+        """Kill the process group of a running request, if any."""
+        popen = self._running.get(request_id)
+        if popen is not None and popen.returncode is None:
+            try:
+                os.killpg(popen.pid, signal.SIGKILL)
+            except OSError:
+                pass
+
+    def _reply(self, reply: Dict[str, Any]) -> None:
+        with self._write_lock:
+            self._output.write(json.dumps(reply).encode() + b"\n")
+            self._output.flush()
+
+
+def bootstrap_command(python: str = "python3") -> str:
+    """
+    Shell command that starts this agent on a host without SHARP installed.
+
+    The agent's source travels compressed and base64-encoded inside the
+    command, which contains no characters a remote shell re-interprets
+    within double quotes.
+
+    Args:
+        python: Python 3 interpreter on the host
+
+    Returns:
+        Shell command running the agent on its stdin and stdout
+    """
+    with open(__file__, "rb") as f:
+        source = base64.b64encode(zlib.compress(f.read(), 9)).decode("ascii")
+    code = f"import base64,zlib;exec(zlib.decompress(base64.b64decode('{source}')))"
+    return f'{shlex.quote(python)} -u -c "{code}"'
+
+
+def main() -> int:
+    """Serve requests on stdin and stdout until end of input."""
+    Agent(sys.stdout.buffer).serve(sys.stdin.buffer)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,18 +2,51 @@
 Subprocess execution and management.
 
 Handles running shell commands with timeout, capturing output,
-and collecting metrics from subprocess results.
+and collecting metrics from subprocess results (per-copy timing and
+resource usage, reported via Runner.copy_metrics).
+
+Commands that need no shell (see CommandComposer.argv) can be executed
+directly, skipping the /bin/sh startup and parsing that otherwise adds to
+every copy's time (see EXEC_MODES).
 
 © Copyright 2025--2025 Hewlett Packard Enterprise Development LP
 """
 
 from __future__ import annotations
 
+import os
+import resource
+import selectors
+import shutil
+import statistics
 import subprocess
+import sys
 import tempfile
 import time
 import warnings
-from typing import List, Tuple
+from typing import Callable, Dict, List, Tuple
+
+from src.core.execution.command_composer import CommandComposer
+
+# How commands are launched: "shell" always runs them with /bin/sh; "direct"
+# executes commands that need no shell from their argv (fork and exec);
+# "spawn" does the same through posix_spawn where available (no fork of the
+# launcher's address space). Commands that need a shell always use it.
+EXEC_MODES = ("shell", "direct", "spawn")
+DEFAULT_EXEC_MODE = "direct"
+
+# Per-copy metrics reported by Runner.copy_metrics: name -> (type, description)
+COPY_METRICS: Dict[str, Tuple[str, str]] = {
+    "copy_start": ("float", "Launch time of this copy relative to the first copy (seconds)"),
+    "copy_time": ("float", "Wall-clock time from launch to exit of this copy (seconds)"),
+    "copy_user_time": ("float", "User CPU time of this copy, including reaped children (seconds)"),
+    "copy_sys_time": ("float", "System CPU time of this copy, including reaped children (seconds)"),
+    "copy_max_rss": ("float", "Maximum resident set size of this copy (KB), NA if below the launcher's own"),
+    "copy_vol_ctx_switches": ("float", "Voluntary context switches of this copy"),
+    "copy_invol_ctx_switches": ("float", "Involuntary context switches of this copy"),
+    "launch_skew": ("float", "Time between the first and last copy launch (seconds)"),
+    "straggler_ratio": ("float", "Slowest copy time divided by the median copy time"),
+}
 
 
 class Runner:
@@ -28,7 +61,8 @@ class Runner:
     """
 
     def __init__(self, timeout: int | None = None, verbose: bool = False,
-                 stdin_fd: int = -1) -> None:
+                 stdin_fd: int = -1, cpu_set: List[int] | None = None,
+                 exec_mode: str = DEFAULT_EXEC_MODE) -> None:
         """
         Initialize runner.
 
@@ -36,10 +70,27 @@ class Runner:
             timeout: Global timeout in seconds (default: 24 hours)
             verbose: Print command lines before execution
             stdin_fd: File descriptor for stdin (default: closed)
+            cpu_set: CPUs to pin launched commands to (default: inherit affinity;
+                ignored where CPU affinity is not supported)
+            exec_mode: How to launch commands, one of EXEC_MODES (default: DEFAULT_EXEC_MODE)
+
+        Raises:
+            ValueError: If exec_mode is unknown
         """
+        if exec_mode not in EXEC_MODES:
+            raise ValueError(f"Unknown exec mode '{exec_mode}' (expected one of: {', '.join(EXEC_MODES)})")
+        self.exec_mode = exec_mode
         self.timeout = timeout or (60 * 60 * 24)  # Default: 24 hours
         self.verbose = verbose
         self.stdin_fd = stdin_fd if stdin_fd >= 0 else None
+        self.cpu_set = list(cpu_set) if cpu_set and hasattr(os, "sched_setaffinity") else None
+        # perf_counter timestamps of each child's launch and exit in the last run
+        # (exit is None if it timed out), and its resource usage from wait4
+        self.start_times: List[float] = []
+        self.exit_times: List[float | None] = []
+        self.rusages: List[resource.struct_rusage | None] = []
+        # How each command of the last run was launched ("shell", "direct" or "spawn")
+        self.exec_modes: List[str] = []
 
     def run_commands(self, commands: List[str], env: dict[str, str] | None = None) -> Tuple[bool, List[tempfile._TemporaryFileWrapper[bytes]], float]:
         """
@@ -66,7 +117,9 @@ class Runner:
         t0 = time.perf_counter()
         popens, output_files = self._launch_commands(commands, env)
         success = self._wait_for_commands(popens, commands, t0, output_files)
-        elapsed_time = time.perf_counter() - t0
+        exits = [t for t in self.exit_times if t is not None]
+        # Measure to the last child's exit, excluding reaping overhead
+        elapsed_time = (max(exits) if success and exits else time.perf_counter()) - t0
         return success, output_files, elapsed_time
 
     def _launch_commands(self, commands: List[str], env: dict[str, str] | None = None) -> Tuple[List[subprocess.Popen[str]], List[tempfile._TemporaryFileWrapper[bytes]]]:
@@ -82,14 +135,57 @@ class Runner:
         """
         popens: List[subprocess.Popen[str]] = []
         output_files = []
+        self.start_times = []
+        self.exec_modes = []
 
         for i, cmd in enumerate(commands):
-            output_file = tempfile.NamedTemporaryFile(suffix=f"_{i}", delete=False)
+            start = time.perf_counter()  # Before the launch, so copy times include spawn cost like outer_time
+            popen, output_file = self._launch(cmd, i, env)
+            self.start_times.append(start)
             output_files.append(output_file)
+            popens.append(popen)
+
+        return popens, output_files
 
-            if self.verbose:
-                print(f"Running: {cmd}")
+    def _launch(self, cmd: str, index: int, env: dict[str, str] | None = None
+                ) -> Tuple[subprocess.Popen[str], tempfile._TemporaryFileWrapper[bytes]]:
+        """
+        Launch one command with its output (stdout and stderr) sent to a new temporary file.
+
+        Args:
+            cmd: Shell command to execute
+            index: Command index (suffix of the output file name)
+            env: Environment variables to set for subprocess (default: inherit parent)
 
+        Returns:
+            Tuple of (popen, output_file)
+        """
+        output_file = tempfile.NamedTemporaryFile(suffix=f"_{index}", delete=False)
+
+        if self.verbose:
+            print(f"Running: {cmd}")
+
+        mode, argv, executable = self._exec_plan(cmd, env)
+        if argv is not None:
+            try:
+                popen = subprocess.Popen(
+                    argv,
+                    executable=executable,
+                    stdout=output_file,
+                    stdin=self.stdin_fd,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    env=env,
+                    preexec_fn=self._pin_child if self.cpu_set else None,
+                    # Without close_fds, subprocess launches through posix_spawn (where supported)
+                    close_fds=mode != "spawn",
+                )
+                self.exec_modes.append(mode)
+                return popen, output_file
+            except OSError:
+                pass  # E.g. not executable: the shell reports it as usual (exit code 126/127)
+
+        try:
             popen = subprocess.Popen(
                 cmd,
                 stdout=output_file,
@@ -98,16 +194,48 @@ class Runner:
                 text=True,
                 shell=True,
                 env=env,
+                preexec_fn=self._pin_child if self.cpu_set else None,
             )
-            popens.append(popen)
+        except OSError:
+            output_file.close()
+            os.unlink(output_file.name)
+            raise
+        self.exec_modes.append("shell")
+        return popen, output_file
+
+    def _exec_plan(self, cmd: str, env: dict[str, str] | None = None) -> Tuple[str, List[str] | None, str | None]:
+        """
+        Decide how to launch a command under the runner's exec mode.
 
-        return popens, output_files
+        Returns:
+            Tuple of (mode, argv, executable): argv and the executable's path
+            are None when the command runs through the shell; "spawn" falls
+            back to "direct" when posix_spawn cannot be used (CPU pinning,
+            stdin redirected to a standard descriptor, unsupported platform)
+        """
+        argv = CommandComposer.argv(cmd) if self.exec_mode != "shell" else None
+        if argv is None:
+            return "shell", None, None
+        path = (env if env is not None else os.environ).get("PATH", os.defpath)
+        executable = shutil.which(argv[0], path=path)
+        if executable is None:
+            return "shell", None, None  # Let the shell report a missing command
+        mode = self.exec_mode
+        if mode == "spawn" and (self.cpu_set or (self.stdin_fd is not None and self.stdin_fd <= 2)
+                                or not getattr(subprocess, "_USE_POSIX_SPAWN", False)):
+            mode = "direct"
+        return mode, argv, os.path.abspath(executable)
 
     def _wait_for_commands(self, popens: List[subprocess.Popen[str]], commands: List[str], start_time: float,
                           output_files: List[tempfile._TemporaryFileWrapper[bytes]]) -> bool:
         """
         Wait for all commands to complete, checking for catastrophic failures.
 
+        Sleeps until a child exits (via pidfd on Linux) rather than polling,
+        so exit times are recorded with sub-millisecond resolution and the
+        launcher stays idle while the benchmark runs. Per-child exit times
+        (perf_counter timestamps) are stored in self.exit_times.
+
         Args:
             popens: List of Popen objects for running commands
             commands: Original command strings (for error messages)
@@ -120,71 +248,208 @@ class Runner:
         Raises:
             RuntimeError: If command fails catastrophically (not found, segfault, etc.)
         """
-        completed_commands: list[tuple[int, int]] = []
-
-        while popens and (time.perf_counter() - start_time) < self.timeout:
-            for i, popen in enumerate(popens):
-                returncode = popen.poll()
-                if returncode is not None:
-                    # Command completed - check for catastrophic failures
-                    cmd_index = len(completed_commands)
-                    completed_commands.append((cmd_index, returncode))
-
-                    match returncode:
-                        case 0:
-                            # Success - no action needed
-                            pass
-                        case 127:
-                            # Command not found
-                            raise RuntimeError(
-                                f"Command not found (exit code 127): {commands[cmd_index]}"
-                            )
-                        case 126:
-                            # Command not executable
-                            raise RuntimeError(
-                                f"Command not executable (exit code 126): {commands[cmd_index]}"
-                            )
-                        case n if n < 0:
-                            # Killed by signal (negative return code means signal)
-                            signal_num = -n
-                            raise RuntimeError(
-                                f"Command killed by signal {signal_num}: {commands[cmd_index]}"
-                            )
-                        case _:
-                            # Non-zero but not catastrophic - check for common issues
-                            warning_msg = f"Command {cmd_index} exited with code {returncode}: {commands[cmd_index]}"
-
-                            # Check for MPI slot availability error
-                            if cmd_index < len(output_files) and "mpirun" in commands[cmd_index]:
-                                try:
-                                    output_files[cmd_index].seek(0)
-                                    output = output_files[cmd_index].read().decode('utf-8', errors='ignore')
-                                    if "not enough slots available" in output:
-                                        warning_msg += (
-                                            "\n\nMPI Error: Not enough slots available. "
-                                            "To allow oversubscription, add to your backend YAML:\n"
-                                            "  backend_options:\n"
-                                            "    mpi:\n"
-                                            "      mpiflags: \"--oversubscribe\""
-                                        )
-                                except Exception:
-                                    pass  # If we can't read output, just use basic warning
-
-                            warnings.warn(warning_msg)
-
-                    popens.pop(i)
+        self.exit_times = [None] * len(popens)
+        self.rusages = [None] * len(popens)
+        pending = dict(enumerate(popens))
+        selector = self._open_exit_selector(pending)
+
+        try:
+            while pending:
+                remaining = self.timeout - (time.perf_counter() - start_time)
+                if remaining <= 0:
                     break
-            else:
-                # No command completed this iteration, sleep a bit
-                time.sleep(0.01)
-
-        if popens:
+                exited = self._wait_for_exits(pending, selector, remaining)
+                now = time.perf_counter()
+                for index in exited:
+                    popen = pending.pop(index)
+                    self.exit_times[index] = now
+                    # Child has exited, so this reaps it without blocking
+                    returncode, self.rusages[index] = self._reap(popen)
+                    self._check_returncode(index, returncode, commands, output_files)
+        finally:
+            if selector is not None:
+                for key in list(selector.get_map().values()):
+                    os.close(key.fd)
+                selector.close()
+
+        if pending:
             # Timeout exceeded
             warnings.warn(
-                f"Timeout exceeded ({self.timeout}s): {len(popens)} command(s) still running"
+                f"Timeout exceeded ({self.timeout}s): {len(pending)} command(s) still running"
             )
-            for popen in popens:
+            for popen in pending.values():
                 popen.terminate()
             return False
 
         return True
+
+    @staticmethod
+    def _open_exit_selector(pending: Dict[int, subprocess.Popen[str]]) -> selectors.BaseSelector | None:
+        """
+        Register a pidfd for every child, so exits can be awaited with select.
+
+        Returns:
+            Selector with one pidfd per child (data = command index), or None
+            if pidfds are unavailable (non-Linux or kernel < 5.3)
+        """
+        if not hasattr(os, "pidfd_open"):
+            return None
+        selector = selectors.DefaultSelector()
+        try:
+            for index, popen in pending.items():
+                fd = os.pidfd_open(popen.pid)
+                selector.register(fd, selectors.EVENT_READ, index)
+        except OSError:
+            for key in list(selector.get_map().values()):
+                os.close(key.fd)
+            selector.close()
+            return None
+        return selector
+
+    @staticmethod
+    def _wait_for_exits(pending: Dict[int, subprocess.Popen[str]],
+                        selector: selectors.BaseSelector | None, timeout: float) -> List[int]:
+        """
+        Block until at least one pending child exits or the timeout expires.
+
+        Returns:
+            Indices of children that have exited (possibly empty on timeout)
+        """
+        if selector is not None:
+            exited = []
+            for key, _ in selector.select(timeout):
+                selector.unregister(key.fd)
+                os.close(key.fd)
+                exited.append(key.data)
+            return exited
+
+        # Fallback without pidfd support: poll (without reaping) with a short sleep
+        exited = [
+            index for index, popen in pending.items()
+            if os.waitid(os.P_PID, popen.pid, os.WEXITED | os.WNOHANG | os.WNOWAIT) is not None
+        ]
+        if not exited:
+            time.sleep(min(0.01, timeout))
+        return exited
+
+    def _pin_child(self) -> None:
+        """Restrict the forked child (before exec) to the runner's CPU set."""
+        os.sched_setaffinity(0, self.cpu_set or [])
+
+    @staticmethod
+    def _reap(popen: subprocess.Popen[str]) -> Tuple[int, resource.struct_rusage | None]:
+        """
+        Reap an exited child, collecting its resource usage.
+
+        Returns:
+            Tuple of (returncode, rusage); rusage is None if it was unavailable
+        """
+        try:
+            _, status, rusage = os.wait4(popen.pid, 0)
+        except ChildProcessError:
+            return popen.wait(), None
+        popen.returncode = os.waitstatus_to_exitcode(status)
+        return popen.returncode, rusage
+
+    def copy_metrics(self) -> Dict[str, List[str]]:
+        """
+        Per-copy timing and resource usage of the last run_commands call.
+
+        Each metric in COPY_METRICS maps to one value per copy ("NA" where
+        unavailable). launch_skew and straggler_ratio describe the whole
+        iteration and are repeated for every copy.
+
+        Returns:
+            Dict mapping metric name to list of string values, or empty dict
+            if no commands have run
+        """
+        if not self.start_times:
+            return {}
+
+        first_start = min(self.start_times)
+        copy_times = [
+            end - start if end is not None else None
+            for start, end in zip(self.start_times, self.exit_times)
+        ]
+        # ru_maxrss is in kilobytes on Linux but bytes on macOS
+        rss_scale = 1024 if sys.platform == "darwin" else 1
+        # A child's ru_maxrss starts from the launcher's own high-water mark
+        # (exec keeps the peak of the address space it replaces), so only a
+        # larger value is the copy's own peak; smaller peaks are unknown
+        launcher_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        def fmt(value: float | None) -> str:
+            return "NA" if value is None else str(value)
+
+        metrics: Dict[str, List[str]] = {
+            "copy_start": [str(start - first_start) for start in self.start_times],
+            "copy_time": [fmt(t) for t in copy_times],
+        }
+        usage_fields: Dict[str, Callable[[resource.struct_rusage], float | None]] = {
+            "copy_user_time": lambda ru: ru.ru_utime,
+            "copy_sys_time": lambda ru: ru.ru_stime,
+            "copy_max_rss": lambda ru: ru.ru_maxrss // rss_scale if ru.ru_maxrss > launcher_rss else None,
+            "copy_vol_ctx_switches": lambda ru: ru.ru_nvcsw,
+            "copy_invol_ctx_switches": lambda ru: ru.ru_nivcsw,
+        }
+        for name, getter in usage_fields.items():
+            metrics[name] = [fmt(getter(ru)) if ru is not None else "NA" for ru in self.rusages]
+
+        finished = [t for t in copy_times if t is not None]
+        median = statistics.median(finished) if finished else 0
+        skew = str(max(self.start_times) - first_start)
+        straggler = fmt(max(finished) / median) if median > 0 else "NA"
+        metrics["launch_skew"] = [skew] * len(self.start_times)
+        metrics["straggler_ratio"] = [straggler] * len(self.start_times)
+        return metrics
+
+    @staticmethod
+    def _check_returncode(index: int, returncode: int, commands: List[str],
+                          output_files: List[tempfile._TemporaryFileWrapper[bytes]]) -> None:
+        """
+        Check a completed command's exit code for catastrophic failures.
+
+        Raises:
+            RuntimeError: If command was not found, not executable, or killed by a signal
+        """
+        match returncode:
+            case 0:
+                # Success - no action needed
+                pass
+            case 127:
+                # Command not found
+                raise RuntimeError(
+                    f"Command not found (exit code 127): {commands[index]}"
+                )
+            case 126:
+                # Command not executable
+                raise RuntimeError(
+                    f"Command not executable (exit code 126): {commands[index]}"
+                )
+            case n if n < 0:
+                # Killed by signal (negative return code means signal)
+                signal_num = -n
+                raise RuntimeError(
+                    f"Command killed by signal {signal_num}: {commands[index]}"
+                )
+            case _:
+                # Non-zero but not catastrophic - check for common issues
+                warning_msg = f"Command {index} exited with code {returncode}: {commands[index]}"
+
+                # Check for MPI slot availability error
+                if index < len(output_files) and "mpirun" in commands[index]:
+                    try:
+                        output_files[index].seek(0)
+                        output = output_files[index].read().decode('utf-8', errors='ignore')
+                        if "not enough slots available" in output:
+                            warning_msg += (
+                                "\n\nMPI Error: Not enough slots available. "
+                                "To allow oversubscription, add to your backend YAML:\n"
+                                "  backend_options:\n"
+                                "    mpi:\n"
+                                "      mpiflags: \"--oversubscribe\""
+                            )
+                    except Exception:
+                        pass  # If we can't read output, just use basic warning
+
+                warnings.warn(warning_msg)
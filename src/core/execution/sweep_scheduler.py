@@ -0,0 +1,207 @@
+"""
+Concurrent execution of independent sweep configurations.
+
+A parameter sweep normally runs its configurations one after another. When
+each configuration uses only a few cores of a large machine (or targets a
+different remote host), several can run at once. SweepScheduler starts
+configurations in sweep order as long as they fit in a core and memory
+budget, optionally pinning each one to a disjoint set of CPUs.
+
+Configurations running side by side compete for caches, memory bandwidth
+and I/O, so parallel sweeps trade measurement isolation for throughput.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import threading
+import time
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Sized
+
+
+@dataclass
+class SweepJob:
+    """One configuration to run, with its resource demand."""
+    launch_id: str
+    run: Callable[[List[int] | None], int]  # Receives the pinned CPU set (or None), returns exit code
+    cores: int = 1  # Local cores (0 for configurations running on other hosts)
+    memory_mb: int = 0
+
+
+@dataclass
+class SweepProgress:
+    """Aggregate progress of a sweep, passed to the progress callback."""
+    total: int
+    completed: int
+    failed: int
+    running: int
+    elapsed: float
+    launch_id: str = ""  # Configuration whose completion triggered this update
+    exit_code: int = 0
+
+
+def available_cpus() -> List[int]:
+    """
+    CPUs this process may run on.
+
+    Returns:
+        Sorted CPU ids from the affinity mask (or 0..cpu_count-1 where
+        affinity is not supported)
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def available_memory_mb() -> int:
+    """
+    Memory available for new work, from /proc/meminfo.
+
+    Returns:
+        MemAvailable in MB, or 0 if unknown
+    """
+    try:
+        with open("/proc/meminfo", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+
+class SweepScheduler:
+    """
+    Runs sweep configurations concurrently under a resource budget.
+
+    Jobs are started strictly in order: a job waits until enough cores and
+    memory are free (and fewer than max_parallel jobs run), and later jobs
+    wait behind it. A job demanding more than the whole budget runs alone.
+
+    Args:
+        max_parallel: Maximum configurations running at once
+        core_budget: Cores shared by running configurations (default: all
+            CPUs available to this process)
+        memory_budget_mb: Memory shared by running configurations in MB
+            (0 disables memory accounting)
+        pin_cpus: Give each configuration a disjoint set of CPUs
+        on_progress: Called after each configuration completes
+    """
+
+    def __init__(self, max_parallel: int, core_budget: int | None = None,
+                 memory_budget_mb: int = 0, pin_cpus: bool = False,
+                 on_progress: Callable[[SweepProgress], None] | None = None) -> None:
+        """Initialize the scheduler (see class docstring)."""
+        if max_parallel < 1:
+            raise ValueError(f"max_parallel must be at least 1, got {max_parallel}")
+        cpus = available_cpus()
+        self.pin_cpus = pin_cpus and hasattr(os, "sched_setaffinity")
+        self.core_budget = core_budget if core_budget and core_budget > 0 else len(cpus)
+        if self.pin_cpus:
+            # Pinned configurations can only share the CPUs that actually exist
+            cpus = cpus[:self.core_budget]
+            self.core_budget = len(cpus)
+        self.max_parallel = max_parallel
+        self.memory_budget_mb = max(0, memory_budget_mb)
+        self.on_progress = on_progress
+
+        self._cond = threading.Condition()
+        self._free_cpus: List[int] = cpus
+        self._free_cores = self.core_budget
+        self._free_memory = self.memory_budget_mb
+        self._running = 0
+
+    def run(self, jobs: Iterable[SweepJob], total: int | None = None) -> Dict[str, int]:
+        """
+        Run all jobs and wait for them to finish.
+
+        Jobs are consumed lazily, one at a time as resources free up, so a
+        generator over a large sweep never has to be materialized.
+
+        Args:
+            jobs: Configurations in sweep order
+            total: Number of jobs, for progress reports (default: len(jobs),
+                or 0 if jobs has no length)
+
+        Returns:
+            Exit code of each job by launch_id, in sweep order (a job that
+            raised is reported with exit code 1)
+        """
+        results: Dict[str, int] = {}
+        if total is None:
+            total = len(jobs) if isinstance(jobs, Sized) else 0
+        progress = SweepProgress(total=total, completed=0, failed=0, running=0, elapsed=0.0)
+        start = time.monotonic()
+
+        def finish(job: SweepJob, cores: int, memory: int, cpus: List[int] | None,
+                   future: Future[int]) -> None:
+            try:
+                exit_code = future.result()
+            except Exception as e:
+                warnings.warn(f"Sweep configuration {job.launch_id} raised: {e}")
+                exit_code = 1
+            with self._cond:
+                self._release(cores, memory, cpus)
+                results[job.launch_id] = exit_code
+                progress.completed += 1
+                progress.failed += exit_code != 0
+                progress.running = self._running
+                progress.elapsed = time.monotonic() - start
+                progress.launch_id = job.launch_id
+                progress.exit_code = exit_code
+                if self.on_progress:
+                    self.on_progress(SweepProgress(**vars(progress)))
+
+        with ThreadPoolExecutor(max_workers=self.max_parallel, thread_name_prefix="sharp-sweep") as pool:
+            for job in jobs:
+                results[job.launch_id] = 1  # Until it finishes
+                cores, memory = self._clamp(job)
+                with self._cond:
+                    self._cond.wait_for(lambda: self._fits(cores, memory))
+                    cpus = self._acquire(cores, memory)
+                future = pool.submit(job.run, cpus)
+                future.add_done_callback(functools.partial(finish, job, cores, memory, cpus))
+        return results
+
+    def _clamp(self, job: SweepJob) -> tuple[int, int]:
+        """Limit a job's demand to the whole budget, so it can run (alone)."""
+        cores = max(0, job.cores)
+        memory = max(0, job.memory_mb) if self.memory_budget_mb else 0
+        if cores > self.core_budget or memory > self.memory_budget_mb:
+            warnings.warn(
+                f"Sweep configuration {job.launch_id} needs {cores} cores and {memory} MB, "
+                f"more than the budget of {self.core_budget} cores and {self.memory_budget_mb} MB; "
+                "running it alone"
+            )
+        return min(cores, self.core_budget), min(memory, self.memory_budget_mb)
+
+    def _fits(self, cores: int, memory: int) -> bool:
+        """Whether a job can start now (caller holds the condition)."""
+        return (self._running < self.max_parallel
+                and cores <= self._free_cores
+                and memory <= self._free_memory)
+
+    def _acquire(self, cores: int, memory: int) -> List[int] | None:
+        """Reserve resources for a job, returning its CPU set if pinning."""
+        self._running += 1
+        self._free_cores -= cores
+        self._free_memory -= memory
+        if not self.pin_cpus:
+            return None
+        cpus, self._free_cpus = self._free_cpus[:cores], self._free_cpus[cores:]
+        return cpus
+
+    def _release(self, cores: int, memory: int, cpus: List[int] | None) -> None:
+        """Return a finished job's resources (caller holds the condition)."""
+        self._running -= 1
+        self._free_cores += cores
+        self._free_memory += memory
+        if cpus:
+            self._free_cpus = sorted(self._free_cpus + cpus)
+        self._cond.notify_all()
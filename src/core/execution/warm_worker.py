@@ -0,0 +1,493 @@
+"""
+Warm worker for Python benchmarks: import once, call per iteration.
+
+Each iteration of a Python benchmark normally starts a shell and a fresh
+interpreter that re-imports numpy, flask, etc. before a few milliseconds of
+work, so for short benchmarks outer_time is mostly interpreter startup. The
+warm backend runs this module as its command instead:
+
+    python3 -m src.core.execution.warm_worker [--mode fork|inproc] BENCHMARK.py ARGS...
+
+The first invocation starts a worker process that imports the benchmark
+module once and listens on a Unix socket; every invocation (including the
+first) sends its arguments to the worker, which calls the benchmark's entry
+function and returns its output. In fork mode (the default) each call runs
+in a child forked from the warm worker, so calls are isolated and copies run
+concurrently; in inproc mode calls run in the worker itself, one at a time.
+
+The entry function is the function served at "/" by the benchmark's Flask
+app (e.g. square_cpu in matmul.py), or the one named with --function. It is
+called with the arguments as strings, and its return value is printed, as
+the benchmarks' own __main__ blocks do.
+
+After the benchmark output, the client prints one line for the backend's
+metrics:
+
+    warm-worker output COLD WORKER_START_TIME CALL_TIME MODE
+
+where COLD is 1 if this invocation started the worker, WORKER_START_TIME is
+the seconds the worker took to start and import the benchmark, and
+CALL_TIME the seconds from the worker receiving the call to the entry
+function returning. Workers are keyed by benchmark file (and its
+modification time), interpreter, mode, entry function, working directory
+and environment, and exit after being idle for --idle-timeout seconds or
+when stopped with --stop-all (the backend's reset command, for cold starts).
+
+This module only uses the standard library, so the client starts quickly.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import fcntl
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Mapping, cast
+
+MODES = ("fork", "inproc")
+DEFAULT_IDLE_TIMEOUT = 600.0  # Seconds a worker waits for the next call before exiting
+STARTUP_TIMEOUT = 120.0  # Seconds a client waits for a new worker to import the benchmark
+
+# Variables the shell sets per invocation: not part of the worker key
+_VOLATILE_ENV = {"_", "PWD", "OLDPWD", "SHLVL"}
+
+
+@dataclass
+class WarmResult:
+    """Outcome of one call through a warm worker."""
+    status: int  # Exit status of the call (0: success)
+    output: str  # Benchmark output (stdout and stderr)
+    call_time: float  # Seconds from the worker receiving the call to the entry function returning
+    worker_start_time: float  # Seconds the worker took to start and import the benchmark
+    cold: bool  # Whether this call started the worker
+
+
+# =============================================================================
+# Worker side
+# =============================================================================
+
+def load_benchmark(path: str) -> ModuleType:
+    """
+    Import a benchmark file as a module (its __main__ block does not run).
+
+    Args:
+        path: Path to the benchmark's .py file
+
+    Returns:
+        Imported module
+    """
+    path = os.path.abspath(path)
+    sys.path.insert(0, os.path.dirname(path))  # For imports of sibling modules
+    spec = importlib.util.spec_from_file_location("sharp_warm_benchmark", path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot import {path} as a Python module")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def resolve_entry(module: ModuleType, function: str | None = None) -> Callable[..., Any]:
+    """
+    Find a benchmark's entry function.
+
+    Args:
+        module: Imported benchmark module
+        function: Name of the entry function (default: the function served
+            at "/" by a Flask app in the module)
+
+    Returns:
+        Entry function
+
+    Raises:
+        ValueError: If the function does not exist or cannot be found
+    """
+    if function:
+        entry = getattr(module, function, None)
+        if not callable(entry):
+            raise ValueError(f"Benchmark has no function '{function}'")
+        return cast(Callable[..., Any], entry)
+    for value in list(vars(module).values()):
+        try:
+            view_functions = getattr(value, "view_functions", None)
+            url_map = getattr(value, "url_map", None)
+        except Exception:  # Proxies such as flask.request raise outside a request
+            continue
+        if not isinstance(view_functions, dict) or url_map is None:
+            continue
+        for rule in url_map.iter_rules():
+            if rule.rule == "/" and rule.endpoint in view_functions:
+                return cast(Callable[..., Any], view_functions[rule.endpoint])
+    raise ValueError("Cannot find the benchmark's entry function (no Flask route '/'); use --function NAME")
+
+
+def _call(entry: Callable[..., Any], args: List[str]) -> int:
+    """Call the entry function and print its result, as a benchmark's __main__ block does."""
+    try:
+        result = entry(*args)
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+    except BaseException:
+        traceback.print_exc()
+        return 1
+    if result is not None:
+        print(result)
+    return 0
+
+
+class WarmWorkerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Serves calls of one benchmark's entry function over a Unix socket.
+
+    Each connection carries one JSON request line: {"args": [...]} to call
+    the entry function, or {"op": "stop"} to shut the worker down. The reply
+    is one JSON line with status, output, call_time and worker_start_time.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: str, entry: Callable[..., Any], mode: str,
+                 worker_start_time: float, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+        """
+        Bind the socket.
+
+        Args:
+            path: Unix socket path
+            entry: Benchmark entry function
+            mode: "fork" (call in a forked child) or "inproc" (call in the worker, serialized)
+            worker_start_time: Seconds the worker took to start and import the benchmark
+            idle_timeout: Seconds without calls after which serve() returns
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown warm worker mode: {mode}")
+        self.entry = entry
+        self.mode = mode
+        self.worker_start_time = worker_start_time
+        self.idle_timeout = idle_timeout
+        self._call_lock = threading.Lock()  # Serializes inproc calls
+        self._activity = threading.Condition()
+        self._active = 0
+        self._last_call = time.monotonic()
+        super().__init__(path, _WarmRequestHandler)
+
+    def serve(self) -> None:
+        """Serve calls until stopped or idle for idle_timeout seconds, then remove the socket."""
+        watchdog = threading.Thread(target=self._exit_when_idle, daemon=True)
+        watchdog.start()
+        try:
+            self.serve_forever(poll_interval=0.2)
+        finally:
+            self.server_close()
+            with contextlib.suppress(OSError):
+                os.unlink(self.server_address)  # type: ignore[arg-type]
+
+    def call(self, args: List[str]) -> Dict[str, Any]:
+        """Call the entry function once, returning the reply fields."""
+        with self._activity:
+            self._active += 1
+        start = time.perf_counter()
+        try:
+            if self.mode == "fork":
+                status, output = self._call_forked(args)
+            else:
+                status, output = self._call_inproc(args)
+        finally:
+            with self._activity:
+                self._active -= 1
+                self._last_call = time.monotonic()
+        return {"status": status, "output": output, "call_time": time.perf_counter() - start,
+                "worker_start_time": self.worker_start_time}
+
+    def _call_forked(self, args: List[str]) -> tuple[int, str]:
+        """Run the call in a child forked from the warm worker, capturing its file descriptors."""
+        with tempfile.TemporaryFile() as output:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", DeprecationWarning)  # fork() with server threads running
+                pid = os.fork()
+            if pid == 0:  # Child: never returns
+                status = 1
+                try:
+                    os.dup2(output.fileno(), 1)
+                    os.dup2(output.fileno(), 2)
+                    status = _call(self.entry, args)
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                finally:
+                    os._exit(status)
+            _, wait_status = os.waitpid(pid, 0)
+            output.seek(0)
+            return os.waitstatus_to_exitcode(wait_status), output.read().decode(errors="replace")
+
+    def _call_inproc(self, args: List[str]) -> tuple[int, str]:
+        """Run the call in the worker process (one at a time), capturing Python-level output."""
+        buffer = io.StringIO()
+        with self._call_lock, contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+            status = _call(self.entry, args)
+        return status, buffer.getvalue()
+
+    def _exit_when_idle(self) -> None:
+        """Stop serving once no call ran for idle_timeout seconds."""
+        while True:
+            time.sleep(min(1.0, self.idle_timeout))
+            with self._activity:
+                if self._active == 0 and time.monotonic() - self._last_call >= self.idle_timeout:
+                    break
+        self.shutdown()
+
+
+class _WarmRequestHandler(socketserver.StreamRequestHandler):
+    """Handles one request line (see WarmWorkerServer)."""
+
+    server: WarmWorkerServer
+
+    def handle(self) -> None:
+        """Read the request, run it, write the reply."""
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        if request.get("op") == "stop":
+            self._reply({"status": 0})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return
+        self._reply(self.server.call([str(arg) for arg in request.get("args", [])]))
+
+    def _reply(self, reply: Dict[str, Any]) -> None:
+        self.wfile.write(json.dumps(reply).encode() + b"\n")
+        self.wfile.flush()
+
+
+def serve(path: str, benchmark: str, mode: str, function: str | None, spawned_at: float,
+          idle_timeout: float) -> int:
+    """
+    Worker process main: import the benchmark, then serve calls on the socket.
+
+    Args:
+        path: Unix socket path
+        benchmark: Benchmark .py file
+        mode: "fork" or "inproc"
+        function: Entry function name (default: found via the Flask app)
+        spawned_at: time.time() when the client spawned this worker
+        idle_timeout: Seconds without calls after which the worker exits
+
+    Returns:
+        Exit code
+    """
+    sys.argv = [benchmark]
+    try:
+        entry = resolve_entry(load_benchmark(benchmark), function)
+    except BaseException as e:
+        print(f"cannot load {benchmark}: {e}", file=sys.stderr)
+        return 1
+    server = WarmWorkerServer(path, entry, mode, time.time() - spawned_at, idle_timeout)
+    server.serve()
+    return 0
+
+
+# =============================================================================
+# Client side
+# =============================================================================
+
+def socket_dir() -> Path:
+    """Directory holding worker sockets ($XDG_RUNTIME_DIR, else the temporary directory)."""
+    return Path(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir())
+
+
+def worker_key(benchmark: str, mode: str, function: str | None,
+               cwd: str | None = None, env: Dict[str, str] | None = None) -> str:
+    """
+    Identify the worker serving a benchmark: calls with the same key share a worker.
+
+    Args:
+        benchmark: Benchmark .py file
+        mode: "fork" or "inproc"
+        function: Entry function name, if given
+        cwd: Working directory (default: current)
+        env: Environment (default: current, without per-shell variables)
+
+    Returns:
+        Short hex digest
+    """
+    path = os.path.abspath(benchmark)
+    environ: Mapping[str, str] = os.environ if env is None else env
+    key = [path, os.stat(path).st_mtime_ns, sys.executable, mode, function or "", cwd or os.getcwd(),
+           sorted((k, v) for k, v in environ.items() if k not in _VOLATILE_ENV)]
+    return hashlib.sha256(json.dumps(key).encode()).hexdigest()[:16]
+
+
+def socket_path(key: str) -> Path:
+    """Socket of the worker with the given key."""
+    return socket_dir() / f"sharp-warm-{os.getuid()}-{key}.sock"
+
+
+def send_request(path: Path, request: Dict[str, Any], timeout: float | None = None) -> Dict[str, Any]:
+    """Send one request to a worker and return its reply."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(path))
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as reply:
+            line = reply.readline()
+    if not line:
+        raise ConnectionError(f"Warm worker {path} closed the connection")
+    result: Dict[str, Any] = json.loads(line)
+    return result
+
+
+def connectable(path: Path) -> bool:
+    """Whether a worker accepts connections on path."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+            return True
+        except OSError:
+            return False
+
+
+def start_worker(path: Path, benchmark: str, mode: str, function: str | None, idle_timeout: float,
+                 cwd: str | None = None) -> None:
+    """
+    Start a worker on a socket and wait until it serves (callers sharing workers hold a start lock).
+
+    The worker runs in cwd (default: the current directory), against which a
+    relative benchmark path is resolved.
+
+    Raises:
+        RuntimeError: If the worker exits (e.g. the import failed) or does not start in time
+    """
+    with contextlib.suppress(FileNotFoundError):
+        path.unlink()  # Stale socket of a worker that died
+    log = tempfile.TemporaryFile()
+    command = [sys.executable, os.path.abspath(__file__), "--serve", str(path), "--mode", mode,
+               "--idle-timeout", str(idle_timeout), "--spawned-at", repr(time.time())]
+    if function:
+        command += ["--function", function]
+    worker = subprocess.Popen(command + [os.path.abspath(os.path.join(cwd or "", benchmark))],
+                              stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+                              start_new_session=True, cwd=cwd)
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while not connectable(path):
+        if worker.poll() is not None or time.monotonic() > deadline:
+            if worker.poll() is None:
+                worker.kill()
+            log.seek(0)
+            raise RuntimeError(log.read().decode(errors="replace").strip() or "warm worker did not start")
+        time.sleep(0.01)
+
+
+def invoke(benchmark: str, args: List[str], mode: str = "fork", function: str | None = None,
+           idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> WarmResult:
+    """
+    Call a benchmark's entry function through its warm worker, starting the worker if needed.
+
+    Args:
+        benchmark: Benchmark .py file
+        args: Arguments for the entry function
+        mode: "fork" or "inproc"
+        function: Entry function name (default: found via the Flask app)
+        idle_timeout: Seconds a new worker waits for calls before exiting
+
+    Returns:
+        WarmResult of the call
+
+    Raises:
+        RuntimeError: If the worker cannot start
+    """
+    path = socket_path(worker_key(benchmark, mode, function))
+    cold = False
+    if not connectable(path):
+        # One client starts the worker; concurrent copies wait for it
+        with open(path.with_suffix(".lock"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            if not connectable(path):
+                start_worker(path, benchmark, mode, function, idle_timeout)
+                cold = True
+    reply = send_request(path, {"args": args})
+    return WarmResult(status=int(reply["status"]), output=reply["output"], call_time=float(reply["call_time"]),
+                      worker_start_time=float(reply["worker_start_time"]), cold=cold)
+
+
+def stop_all() -> int:
+    """
+    Stop all warm workers of this user (for cold starts).
+
+    Returns:
+        Number of workers stopped
+    """
+    stopped = 0
+    for path in socket_dir().glob(f"sharp-warm-{os.getuid()}-*.sock"):
+        try:
+            send_request(path, {"op": "stop"}, timeout=10)
+            stopped += 1
+        except (OSError, ValueError):
+            with contextlib.suppress(OSError):
+                path.unlink()  # Worker is gone
+        with contextlib.suppress(OSError):
+            path.with_suffix(".lock").unlink()
+    # Wait for the sockets to disappear, so the next call starts a new worker
+    deadline = time.monotonic() + 10
+    while any(socket_dir().glob(f"sharp-warm-{os.getuid()}-*.sock")) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return stopped
+
+
+def main(argv: List[str] | None = None) -> int:
+    """
+    Command-line entry point (the warm backend's run and reset commands).
+
+    Returns:
+        Exit status of the benchmark call (or of the worker, with --serve)
+    """
+    parser = argparse.ArgumentParser(description="Call a Python benchmark through a warm worker process")
+    parser.add_argument("--mode", choices=MODES, default="fork",
+                        help="Call in a child forked from the worker (default) or in the worker itself")
+    parser.add_argument("--function", help="Entry function (default: the Flask route '/' function)")
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help="Seconds an idle worker waits before exiting")
+    parser.add_argument("--stop-all", action="store_true", help="Stop all warm workers of this user")
+    parser.add_argument("--serve", metavar="SOCKET", help=argparse.SUPPRESS)
+    parser.add_argument("--spawned-at", type=float, help=argparse.SUPPRESS)
+    parser.add_argument("benchmark", nargs="?", help="Benchmark .py file")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Arguments for the entry function")
+    args = parser.parse_args(argv)
+
+    if args.stop_all:
+        stop_all()
+        return 0
+    if not args.benchmark:
+        parser.error("benchmark is required")
+    if args.serve:
+        return serve(args.serve, args.benchmark, args.mode, args.function,
+                     args.spawned_at or time.time(), args.idle_timeout)
+
+    try:
+        result = invoke(args.benchmark, args.args, args.mode, args.function, args.idle_timeout)
+    except (RuntimeError, OSError, ValueError) as e:
+        print(f"warm-worker: {e}", file=sys.stderr)
+        return 1
+    sys.stdout.write(result.output)
+    print(f"warm-worker output {int(result.cold)} {result.worker_start_time:.6f} "
+          f"{result.call_time:.6f} {args.mode}")
+    return result.status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+"""
+Concurrent execution of workflow tasks as a dependency graph.
+
+A workflow lists tasks with the tasks each one depends on. WorkflowScheduler
+starts every task whose dependencies succeeded, up to a worker limit, in
+workflow order. Tasks naming the same resource (for example "host:node7")
+never run at the same time. When a task fails, the tasks depending on it
+(directly or not) are skipped, while independent branches continue.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Sequence
+
+
+@dataclass
+class WorkflowJob:
+    """One workflow task to run, with its dependencies and exclusive resources."""
+    name: str
+    run: Callable[[], int]  # Returns exit code
+    depends_on: List[str] = field(default_factory=list)  # Names of jobs that must succeed first
+    resources: List[str] = field(default_factory=list)  # Held exclusively while running
+
+
+@dataclass
+class WorkflowProgress:
+    """Aggregate progress of a workflow, passed to the progress callback."""
+    total: int
+    completed: int
+    failed: int
+    skipped: int
+    running: int
+    elapsed: float
+    name: str = ""  # Job whose completion (or skipping) triggered this update
+    exit_code: int | None = 0  # None when the job was skipped
+
+
+def check_dependencies(names: Sequence[str], depends_on: Dict[str, List[str]]) -> None:
+    """
+    Validate a dependency graph.
+
+    Args:
+        names: Job names, in workflow order
+        depends_on: Dependencies of each job (jobs without an entry have none)
+
+    Raises:
+        ValueError: If names repeat, a dependency is unknown, or the graph has a cycle
+    """
+    known = set(names)
+    if len(known) != len(names):
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        raise ValueError(f"Duplicate task ids: {', '.join(duplicates)}")
+    for name in names:
+        for dependency in depends_on.get(name, []):
+            if dependency not in known:
+                raise ValueError(f"Task '{name}' depends on unknown task '{dependency}'")
+
+    # Kahn's algorithm: whatever cannot be ordered is on (or behind) a cycle
+    remaining = {name: len(set(depends_on.get(name, []))) for name in names}
+    dependents: Dict[str, List[str]] = {name: [] for name in names}
+    for name in names:
+        for dependency in set(depends_on.get(name, [])):
+            dependents[dependency].append(name)
+    ready = [name for name, count in remaining.items() if count == 0]
+    while ready:
+        for dependent in dependents[ready.pop()]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+    cyclic = [name for name in names if remaining[name] > 0]
+    if cyclic:
+        raise ValueError(f"Dependency cycle among tasks: {', '.join(cyclic)}")
+
+
+class WorkflowScheduler:
+    """
+    Runs workflow jobs concurrently, respecting dependencies and resources.
+
+    A job starts once all its dependencies succeeded, a worker is free and
+    none of its resources is held by a running job. Among the jobs that can
+    start, earlier ones in workflow order go first. A job whose dependency
+    failed (or was skipped) is skipped.
+
+    Args:
+        max_workers: Maximum jobs running at once
+        on_start: Called with a job's name just before it runs
+        on_progress: Called after each job completes or is skipped
+    """
+
+    def __init__(self, max_workers: int = 1,
+                 on_start: Callable[[str], None] | None = None,
+                 on_progress: Callable[[WorkflowProgress], None] | None = None) -> None:
+        """Initialize the scheduler (see class docstring)."""
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self.max_workers = max_workers
+        self.on_start = on_start
+        self.on_progress = on_progress
+
+        self._cond = threading.Condition()
+        self._held: set[str] = set()
+        self._running = 0
+
+    def run(self, jobs: Sequence[WorkflowJob]) -> Dict[str, int | None]:
+        """
+        Run all jobs and wait for them to finish.
+
+        Args:
+            jobs: Jobs in workflow order
+
+        Returns:
+            Exit code of each job by name, in workflow order (None for jobs
+            skipped because a dependency did not succeed; a job that raised is
+            reported with exit code 1)
+
+        Raises:
+            ValueError: If the dependency graph is invalid (see check_dependencies)
+        """
+        check_dependencies([job.name for job in jobs], {job.name: job.depends_on for job in jobs})
+        results: Dict[str, int | None] = {job.name: None for job in jobs}
+        done: Dict[str, bool] = {}  # name -> succeeded (for finished and skipped jobs)
+        pending = list(jobs)
+        progress = WorkflowProgress(total=len(jobs), completed=0, failed=0, skipped=0, running=0, elapsed=0.0)
+        start = time.monotonic()
+
+        def report(name: str, exit_code: int | None) -> None:
+            """Record a finished or skipped job (caller holds the condition)."""
+            results[name] = exit_code
+            done[name] = exit_code == 0
+            progress.completed += exit_code is not None
+            progress.failed += exit_code is not None and exit_code != 0
+            progress.skipped += exit_code is None
+            progress.running = self._running
+            progress.elapsed = time.monotonic() - start
+            progress.name = name
+            progress.exit_code = exit_code
+            if self.on_progress:
+                self.on_progress(WorkflowProgress(**vars(progress)))
+
+        def execute(job: WorkflowJob) -> None:
+            exit_code = 1
+            try:
+                exit_code = job.run()
+            except Exception as e:
+                warnings.warn(f"Workflow task {job.name} raised: {e}")
+            finally:
+                # Even on SystemExit, so the scheduler never waits for this job forever
+                with self._cond:
+                    self._running -= 1
+                    self._held.difference_update(job.resources)
+                    report(job.name, exit_code)
+                    self._cond.notify_all()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="sharp-workflow") as pool:
+            with self._cond:
+                while pending:
+                    # Skip jobs whose dependencies did not all succeed (repeat for their dependents)
+                    skipped = [j for j in pending if any(done.get(d) is False for d in j.depends_on)]
+                    if skipped:
+                        for job in skipped:
+                            pending.remove(job)
+                            report(job.name, None)
+                        continue
+                    ready = self._next_ready(pending, done)
+                    if ready is None:
+                        self._cond.wait()
+                        continue
+                    pending.remove(ready)
+                    self._running += 1
+                    self._held.update(ready.resources)
+                    if self.on_start:
+                        self.on_start(ready.name)
+                    pool.submit(execute, ready)
+        return results
+
+    def _next_ready(self, pending: List[WorkflowJob], done: Dict[str, bool]) -> WorkflowJob | None:
+        """First pending job that can start now (caller holds the condition)."""
+        if self._running >= self.max_workers:
+            return None
+        for job in pending:
+            if all(done.get(d) for d in job.depends_on) and not self._held.intersection(job.resources):
+                return job
+        return None
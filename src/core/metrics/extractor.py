@@ -3,6 +3,8 @@ Metrics extraction from benchmark outputs.
 
 Extracts numerical metrics from command outputs using regex patterns
 or shell commands defined in benchmark/backend configurations.
+Common grep/awk/sed pipelines are compiled and run in-process (see
+pipeline.py); other extraction commands are run through the shell.
 
 © Copyright 2025--2025 Hewlett Packard Enterprise Development LP
 """
@@ -11,6 +13,7 @@ import subprocess
 import warnings
 from typing import Any, Dict, List
 
+from src.core.metrics.pipeline import CompiledPipeline, compile_pipeline
 from src.core.rundata import RunData
 
 
@@ -19,7 +22,8 @@ class MetricExtractor:
     Extracts metrics from benchmark output files.
 
     Supports:
-    - Shell command-based extraction (e.g., grep | awk)
+    - Shell command-based extraction (e.g., grep | awk), compiled to
+      in-process stages when possible so each output file is read once
     - Regex-based extraction
     - Auto-metrics (format: "name value" per line)
     """
@@ -43,6 +47,8 @@ class MetricExtractor:
                 }
         """
         self.metric_specs = metric_specs
+        # Compiled extraction pipelines by command; None means "run through shell"
+        self._compiled: Dict[str, CompiledPipeline | None] = {}
 
     def extract(self, output_file: str, outer_metrics: Dict[str, List[str]] = {}) -> RunData:
         """
@@ -60,6 +66,7 @@ class MetricExtractor:
             ValueError if outer_time not present in extracted metrics
         """
         metrics: Dict[str, List[str]] = {}
+        lines: List[str] | None = None  # Output file contents, read on first use
 
         for name, spec in self.metric_specs.items():
             if not spec:
@@ -69,16 +76,24 @@ class MetricExtractor:
             if not cmd:
                 continue
 
-            # Run extraction command
+            # Run extraction command (in-process if compiled, else shell)
             try:
-                full_cmd = f"cat {output_file} | {cmd}"
-                result = subprocess.run(
-                    full_cmd,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
+                if cmd not in self._compiled:
+                    self._compiled[cmd] = compile_pipeline(cmd)
+                compiled = self._compiled[cmd]
+                if compiled is not None:
+                    if lines is None:
+                        lines = self._read_lines(output_file)
+                    result = self._run_compiled(compiled, lines)
+                else:
+                    full_cmd = f"cat {output_file} | {cmd}"
+                    result = subprocess.run(
+                        full_cmd,
+                        shell=True,
+                        capture_output=True,
+                        text=True,
+                        timeout=10
+                    )
 
                 if result.returncode != 0 or not result.stdout:
                     warnings.warn(
@@ -121,6 +136,23 @@ class MetricExtractor:
         # Return RunData (validates outer_time is present)
         return RunData(metrics | outer_metrics)
 
+    @staticmethod
+    def _read_lines(output_file: str) -> List[str]:
+        """Read an output file as a list of lines (without terminators)."""
+        with open(output_file, "r", encoding="utf-8", errors="replace", newline="") as f:
+            content = f.read()
+        lines = content.split("\n")
+        if lines and lines[-1] == "":
+            lines.pop()
+        return lines
+
+    @staticmethod
+    def _run_compiled(compiled: CompiledPipeline,
+                      lines: List[str]) -> subprocess.CompletedProcess[str]:
+        """Run a compiled pipeline, packaging output like subprocess.run."""
+        stdout = "".join(f"{line}\n" for line in compiled(lines))
+        return subprocess.CompletedProcess(compiled.source, 0, stdout, "")
+
     def _parse_auto_metrics(self, output: str) -> Dict[str, List[str]]:
         """
         Parse auto-metrics from output (format: "name value" per line).
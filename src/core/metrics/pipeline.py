@@ -0,0 +1,409 @@
+"""
+In-process compilation of metric extraction pipelines.
+
+Metric specs describe extraction as shell pipelines fed with the command
+output (e.g. "grep ' cache-misses' | awk '{ gsub(/,/, ""); print $1; }'").
+Running one shell per metric, per copy, per iteration dominates harness
+overhead for short benchmarks, so this module recognizes the common
+cat/grep/awk/sed idioms used in backends/*.yaml and compiles them to
+Python callables over a list of lines. Anything outside the supported
+subset compiles to None, and the caller falls back to the shell.
+
+Supported stages:
+- cat (no arguments)
+- grep [-E|-F] [-v] [-i] PATTERN
+- sed 's/RE/REPL/[g]' (REPL without '&' or backslashes)
+- awk '[/ERE/] { stmt; ... }' where stmt is gsub(/ERE/, "str"[, $N])
+  or print of comma-separated fields ($N, $NF, $(NF), $(N))
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+from __future__ import annotations
+
+import re
+import shlex
+from typing import Callable, List
+
+Stage = Callable[[List[str]], List[str]]
+
+# Characters that give a shell pipeline semantics we do not emulate
+_SHELL_METACHARS = set(";&<>()`$\\\n")
+# Awk default field separation: runs of blanks, leading/trailing ignored
+_AWK_FS = re.compile(r"[ \t]+")
+_AWK_FIELD = re.compile(r"^\$(?:(\d+)|NF|\(NF\)|\((\d+)\))$")
+_AWK_GSUB = re.compile(
+    r'^gsub\(\s*/((?:[^/\\]|\\.)*)/\s*,\s*"([^"\\&]*)"\s*(?:,\s*(\$\S+?)\s*)?\)$'
+)
+_AWK_PROGRAM = re.compile(r"^(?:/((?:[^/\\]|\\.)*)/)?\s*\{(.*)\}$", re.DOTALL)
+
+
+class CompiledPipeline:
+    """
+    A shell extraction pipeline compiled to in-process stages.
+
+    Calling the object with the lines of an output file returns the lines
+    the equivalent shell pipeline would have printed.
+    """
+
+    def __init__(self, source: str, stages: List[Stage]) -> None:
+        """
+        Initialize compiled pipeline.
+
+        Args:
+            source: Original shell pipeline (for diagnostics)
+            stages: Line-transforming stages, applied in order
+        """
+        self.source = source
+        self.stages = stages
+
+    def __call__(self, lines: List[str]) -> List[str]:
+        """Run all stages over the input lines."""
+        for stage in self.stages:
+            lines = stage(lines)
+            if not lines:
+                break
+        return lines
+
+    def __repr__(self) -> str:
+        return f"CompiledPipeline({self.source!r})"
+
+
+def compile_pipeline(cmd: str) -> CompiledPipeline | None:
+    """
+    Compile a shell extraction pipeline into in-process stages.
+
+    Args:
+        cmd: Shell pipeline that reads command output from stdin
+
+    Returns:
+        CompiledPipeline, or None if any stage uses unsupported features
+    """
+    segments = _split_pipeline(cmd)
+    if not segments:
+        return None
+
+    stages: List[Stage] = []
+    for segment in segments:
+        try:
+            argv = shlex.split(segment)
+        except ValueError:
+            return None
+        if not argv:
+            return None
+        stage = _compile_stage(argv)
+        if stage is None:
+            return None
+        stages.append(stage)
+    return CompiledPipeline(cmd, stages)
+
+
+def _split_pipeline(cmd: str) -> List[str] | None:
+    """
+    Split a command on unquoted '|' characters.
+
+    Returns None if the command uses shell features other than plain pipes
+    and quoting (redirections, substitutions, lists, escapes, '||').
+    """
+    segments: List[str] = []
+    current: List[str] = []
+    quote = ""
+    for ch in cmd:
+        if quote:
+            if ch == quote:
+                quote = ""
+            elif quote == '"' and ch in "$`\\":
+                return None
+            current.append(ch)
+        elif ch in "'\"":
+            quote = ch
+            current.append(ch)
+        elif ch == "|":
+            segments.append("".join(current))
+            current = []
+        elif ch in _SHELL_METACHARS or ch in "*?[~#{":
+            return None
+        else:
+            current.append(ch)
+    if quote:
+        return None
+    segments.append("".join(current))
+    if any(not s.strip() for s in segments):
+        return None
+    return segments
+
+
+def _compile_stage(argv: List[str]) -> Stage | None:
+    """Compile one pipeline stage from its argument vector."""
+    match argv[0]:
+        case "cat":
+            return (lambda lines: lines) if len(argv) == 1 else None
+        case "grep":
+            return _compile_grep(argv[1:])
+        case "sed":
+            return _compile_sed(argv[1:])
+        case "awk":
+            return _compile_awk(argv[1:])
+        case _:
+            return None
+
+
+# ========== grep ==========
+
+def _compile_grep(args: List[str]) -> Stage | None:
+    """Compile `grep [-E|-F] [-v] [-i] PATTERN`."""
+    extended = fixed = invert = ignore_case = False
+    while args and args[0].startswith("-") and len(args[0]) > 1:
+        for flag in args[0][1:]:
+            match flag:
+                case "E":
+                    extended = True
+                case "F":
+                    fixed = True
+                case "v":
+                    invert = True
+                case "i":
+                    ignore_case = True
+                case _:
+                    return None
+        args = args[1:]
+    if len(args) != 1 or (extended and fixed):
+        return None
+
+    if fixed:
+        source: str | None = re.escape(args[0])
+    elif extended:
+        source = _ere_to_python(args[0])
+    else:
+        source = _bre_to_python(args[0])
+    if source is None:
+        return None
+    try:
+        regex = re.compile(source, re.IGNORECASE if ignore_case else 0)
+    except re.error:
+        return None
+
+    def grep(lines: List[str]) -> List[str]:
+        return [line for line in lines if (regex.search(line) is None) == invert]
+    return grep
+
+
+# ========== sed ==========
+
+def _compile_sed(args: List[str]) -> Stage | None:
+    """Compile `sed 's/RE/REPL/[g]'` with a literal replacement."""
+    if len(args) != 1:
+        return None
+    match = re.fullmatch(r"s/((?:[^/\\]|\\.)*)/([^/\\&]*)/(g?)", args[0])
+    if match is None:
+        return None
+    source = _bre_to_python(match.group(1))
+    if source is None:
+        return None
+    try:
+        regex = re.compile(source)
+    except re.error:
+        return None
+    replacement = match.group(2)
+    count = 0 if match.group(3) else 1
+
+    def sed(lines: List[str]) -> List[str]:
+        return [regex.sub(lambda _: replacement, line, count=count) for line in lines]
+    return sed
+
+
+# ========== awk ==========
+
+def _compile_awk(args: List[str]) -> Stage | None:
+    """Compile `awk '[/ERE/] { gsub(...); print $N, ... }'`."""
+    if len(args) != 1:
+        return None
+    program = _AWK_PROGRAM.match(args[0].strip())
+    if program is None:
+        return None
+
+    selector = None
+    if program.group(1) is not None:
+        source = _ere_to_python(program.group(1))
+        if source is None:
+            return None
+        try:
+            selector = re.compile(source)
+        except re.error:
+            return None
+
+    actions: List[Callable[[List[str]], List[str] | None]] = []
+    for statement in (s.strip() for s in program.group(2).split(";")):
+        if not statement:
+            continue
+        action = _compile_awk_statement(statement)
+        if action is None:
+            return None
+        actions.append(action)
+
+    def awk(lines: List[str]) -> List[str]:
+        output: List[str] = []
+        for line in lines:
+            if selector is not None and selector.search(line) is None:
+                continue
+            # record[0] is $0, record[1:] are the fields
+            record = [line] + _awk_split(line)
+            for action in actions:
+                printed = action(record)
+                if printed is not None:
+                    output.extend(printed)
+        return output
+    return awk
+
+
+def _compile_awk_statement(statement: str) -> Callable[[List[str]], List[str] | None] | None:
+    """Compile a single awk statement (gsub or print)."""
+    gsub = _AWK_GSUB.match(statement)
+    if gsub is not None:
+        source = _ere_to_python(gsub.group(1))
+        if source is None:
+            return None
+        try:
+            regex = re.compile(source)
+        except re.error:
+            return None
+        replacement = gsub.group(2)
+        target = _awk_field_index(gsub.group(3)) if gsub.group(3) else 0
+        if target is None:
+            return None
+        return _awk_gsub(regex, replacement, target)
+
+    if statement == "print" or statement.startswith(("print ", "print\t")):
+        operands = statement[len("print"):].strip()
+        if not operands:
+            return lambda record: [record[0]]
+        fields = []
+        for operand in operands.split(","):
+            index = _awk_field_index(operand.strip())
+            if index is None:
+                return None
+            fields.append(index)
+        return _awk_print(fields)
+
+    return None
+
+
+def _awk_field_index(token: str) -> int | None:
+    """
+    Map an awk field reference to an index into the record list.
+
+    Returns a positive index for $N, -1 for $NF, None if unsupported.
+    """
+    match = _AWK_FIELD.match(token)
+    if match is None:
+        return None
+    number = match.group(1) or match.group(2)
+    return int(number) if number is not None else -1
+
+
+def _awk_field(record: List[str], index: int) -> str:
+    """Read field `index` of a record ($0 for 0, $NF for -1)."""
+    if index == -1:
+        index = len(record) - 1
+    return record[index] if index < len(record) else ""
+
+
+def _awk_gsub(regex: re.Pattern[str], replacement: str,
+              target: int) -> Callable[[List[str]], None]:
+    def gsub(record: List[str]) -> None:
+        index = len(record) - 1 if target == -1 else target
+        # Like awk, only a substitution assigns the target (rebuilding $0 or the fields)
+        if index == 0:
+            line, count = regex.subn(lambda _: replacement, record[0])
+            if count:
+                # Assigning $0 re-splits the fields
+                record[:] = [line]
+                record.extend(_awk_split(line))
+        elif index < len(record):
+            field, count = regex.subn(lambda _: replacement, record[index])
+            if count:
+                record[index] = field
+                record[0] = " ".join(record[1:])
+    return gsub
+
+
+def _awk_print(fields: List[int]) -> Callable[[List[str]], List[str]]:
+    def print_fields(record: List[str]) -> List[str]:
+        return [" ".join(_awk_field(record, i) for i in fields)]
+    return print_fields
+
+
+def _awk_split(line: str) -> List[str]:
+    """Split a record into fields using awk's default field separator."""
+    stripped = line.strip(" \t")
+    return _AWK_FS.split(stripped) if stripped else []
+
+
+# ========== regex dialects ==========
+
+_REGEX_ESCAPES = set(".[]^$*+?(){}|/\\")
+
+
+def _bre_to_python(pattern: str) -> str | None:
+    """
+    Translate a POSIX basic regular expression to Python syntax.
+
+    In BREs, + ? ( ) { } | are literals, '^' and '$' are anchors only at
+    the ends of the pattern, and a leading '*' is literal.
+    """
+    return _posix_to_python(pattern, basic=True)
+
+
+def _ere_to_python(pattern: str) -> str | None:
+    """Translate a POSIX extended regular expression to Python syntax."""
+    return _posix_to_python(pattern, basic=False)
+
+
+def _posix_to_python(pattern: str, basic: bool) -> str | None:
+    """
+    Translate the subset of POSIX regex syntax shared by the idioms we compile.
+
+    Backslash escapes other than of special characters, intervals, and
+    bracket expressions containing classes or escapes are rejected.
+    """
+    if "\n" in pattern:
+        return None
+    out: List[str] = []
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            if i + 1 >= len(pattern) or pattern[i + 1] not in _REGEX_ESCAPES:
+                return None
+            if basic and pattern[i + 1] in "+?(){}|":
+                # \( \{ \| etc. are operators in GNU BREs
+                return None
+            out.append("\\" + pattern[i + 1])
+            i += 2
+        elif ch == "[":
+            j = i + 1
+            if pattern[j:j + 1] == "^":
+                j += 1
+            if pattern[j:j + 1] == "]":
+                j += 1
+            end = pattern.find("]", j)
+            if end < 0:
+                return None
+            body = pattern[i + 1:end]
+            if "[" in body or "\\" in body:
+                return None
+            out.append("[" + body + "]")
+            i = end + 1
+        elif ch == "{" and not basic:
+            # Intervals are rare in extraction rules and differ subtly
+            return None
+        elif basic and (ch in "+?(){}|"
+                        or (ch == "^" and i > 0)
+                        or (ch == "$" and i < len(pattern) - 1)
+                        or (ch == "*" and pattern[:i] in ("", "^"))):
+            out.append("\\" + ch)
+            i += 1
+        else:
+            out.append(ch)
+            i += 1
+    return "".join(out)
@@ -6,8 +6,6 @@ Stops when block bootstrap confidence intervals stabilize.
 © Copyright 2025--2025 Hewlett Packard Enterprise Development LP
 """
 
-import copy
-import random
 from typing import Any, Dict, List
 
 import numpy
@@ -59,12 +57,30 @@ class BBRepeater(CountRepeater):
             "type": int,
             "help": "Minimum number of runs before checking",
         },
+        "seed": {
+            "default": None,
+            "type": int,
+            "help": "Seed for the bootstrap random generator (None for fresh entropy)",
+        },
+        "reuse_samples": {
+            "default": False,
+            "type": bool,
+            "help": "Reuse block draws across iterations instead of resampling from scratch",
+        },
     }
 
     def __init__(self, options: Dict[str, Any]):
         """Initialize BB parameters from options."""
         super().__init__(options)
-        self.__prev_means: List[float] = []
+        self.__prev_means: numpy.ndarray | None = None
+        # Bootstrap state kept across iterations when reuse_samples is set: block
+        # size, kept blocks per sample, per-sample sums of those blocks, and the
+        # no. of measurements and sample means of the last computation
+        self.__state_bsize: int = 0
+        self.__state_blocks: int = 0
+        self.__state_sums: numpy.ndarray | None = None
+        self.__state_n: int = 0
+        self.__state_means: numpy.ndarray = numpy.zeros(0)
 
         ropts: Dict[str, Any] = options.get("repeater_options", {})
         ropts = ropts.get("BB", ropts)
@@ -75,20 +91,13 @@ class BBRepeater(CountRepeater):
         self.__thresh: float = ropts.get("error_threshold", self._DEFAULT_VALUES["error_threshold"]["default"])
         self.__max_repeats: int = ropts.get("max", self._DEFAULT_VALUES["max"]["default"])
         self.__min_repeats: int = ropts.get("min", self._DEFAULT_VALUES["min"]["default"])
+        self.__reuse: bool = bool(ropts.get("reuse_samples", self._DEFAULT_VALUES["reuse_samples"]["default"]))
+        self.__rng = numpy.random.default_rng(ropts.get("seed", self._DEFAULT_VALUES["seed"]["default"]))
         assert self.__min_repeats > 1, "Must have at least two samples to start with"
 
     def _autocor(self) -> Any:
-        """
-        Compute auto-correlations at all possible lags.
-
-        Based on https://scicoding.com/4-ways-of-calculating-autocorrelation-in-python/
-        """
-        data = numpy.array(self._runtimes)
-        mean = numpy.mean(data)
-        var = numpy.var(data)
-        ndata = data - mean
-        acorr = numpy.correlate(ndata, ndata, "full")[len(ndata) - 1 :]
-        return acorr / var / len(ndata)
+        """Compute auto-correlations of the runtimes at all possible lags."""
+        return autocorrelation(self._runtimes)
 
     def _block_size(self, acf: List[float]) -> int | None:
         """
@@ -100,19 +109,61 @@ class BBRepeater(CountRepeater):
         """
         return next((i for i, v in enumerate(acf) if abs(v) < self.__epsilon), None)
 
-    def _sample(self, bsize: int) -> List[float]:
+    def _block_sums(self, prefix: numpy.ndarray, bsize: int, nblocks: int) -> numpy.ndarray:
         """
-        Obtain a randomized sample of measurements from a current data set of runtimes while sampling entire units of size bsize at a time.
+        Draw nblocks random blocks for each bootstrap sample and sum them.
+
+        Start indices are drawn as one (num_samples, nblocks) matrix, and block
+        sums come from the prefix sum of the data, so no resampled series is
+        ever materialized.
 
-        The sample size will be no less than the current no. of measurements.
+        Args:
+            prefix: Prefix sums of the runtimes, with a leading zero
+            bsize: Block size
+            nblocks: Number of blocks to draw per sample
+
+        Returns:
+            Array of num_samples sums of the drawn blocks
         """
-        data: List[float] = self._runtimes
-        samples: List[float] = []
-        while len(samples) < len(data):
-            idx = random.randint(0, len(data) - bsize)
-            samples += data[idx : idx + bsize]
+        positions = len(prefix) - bsize  # n - bsize + 1 valid start indices
+        starts = self.__rng.integers(0, positions, size=(self.__num_samples, nblocks))
+        sums: numpy.ndarray = (prefix[starts + bsize] - prefix[starts]).sum(axis=1)
+        return sums
 
-        return samples
+    def _bootstrap_means(self, bsize: int) -> numpy.ndarray:
+        """
+        Compute the mean of each block-bootstrap sample of the runtimes.
+
+        Each sample consists of ceil(n / bsize) blocks, so its size is no less
+        than the current no. of measurements. With reuse_samples, all blocks but
+        the last one drawn in earlier iterations are kept (they index data that
+        has not changed) and only the blocks needed for new measurements are
+        drawn; the trailing block is redrawn whenever n changes, so every sample
+        can include the newest measurements. This makes each check
+        O(num_samples) amortized instead of O(num_samples * n). The state is
+        discarded whenever the block size changes.
+        """
+        data = self._runtimes
+        prefix = numpy.concatenate(([0.0], numpy.cumsum(data)))
+        nblocks = -(-len(data) // bsize)
+
+        if not self.__reuse:
+            return self._block_sums(prefix, bsize, nblocks) / (nblocks * bsize)
+
+        if self.__state_sums is None or self.__state_bsize != bsize:
+            self.__state_bsize = bsize
+            self.__state_blocks = 0
+            self.__state_sums = numpy.zeros(self.__num_samples)
+            self.__state_n = 0
+        if len(data) != self.__state_n:
+            if nblocks - 1 > self.__state_blocks:
+                self.__state_sums = self.__state_sums + self._block_sums(
+                    prefix, bsize, nblocks - 1 - self.__state_blocks)
+                self.__state_blocks = nblocks - 1
+            trailing = self._block_sums(prefix, bsize, 1)
+            self.__state_means = (self.__state_sums + trailing) / (nblocks * bsize)
+            self.__state_n = len(data)
+        return self.__state_means
 
     def _means_are_close_enough(self, bsize: int) -> bool:
         """
@@ -122,15 +173,19 @@ class BBRepeater(CountRepeater):
         """
         assert bsize is not None
         n = self.__num_samples
-        means = [numpy.mean(self._sample(bsize)) for i in range(n)]
-        prev = copy.copy(self.__prev_means)
-        self.__prev_means = means   # type: ignore
+        means = self._bootstrap_means(bsize)
+        prev = self.__prev_means
+        self.__prev_means = means
 
-        if not prev:
+        if prev is None:
             return False  # Not enough samples to find a block with negligible correlations
+        if self.__reuse:
+            # A reused sample shares most of its blocks with its previous value,
+            # so compare it with another sample, drawn independently of it
+            prev = numpy.roll(prev, 1)
 
-        assert all(prev)  # No zeroes allowed, for division
-        diffs = sorted([(means[i] - prev[i]) / prev[i] for i in range(n)])
+        assert numpy.all(prev)  # No zeroes allowed, for division
+        diffs = numpy.sort((means - prev) / prev)
         low = diffs[int(n * (1.0 - self.__cl_limit) / 2)]
         hi = diffs[int((1 + self.__cl_limit) * n / 2)]
 
@@ -168,3 +223,27 @@ class BBRepeater(CountRepeater):
             return True
 
         return not self._means_are_close_enough(bsize)
+
+
+def autocorrelation(x: Any) -> numpy.ndarray:
+    """
+    Compute normalized auto-correlations of a series at all non-negative lags.
+
+    Equivalent to numpy.correlate(d, d, "full")[n - 1:] / var / n on the
+    demeaned series d, but computed in O(n log n) via a zero-padded FFT.
+    Based on https://scicoding.com/4-ways-of-calculating-autocorrelation-in-python/
+
+    Args:
+        x: Sequence of samples
+
+    Returns:
+        Array of n auto-correlation coefficients (lag 0 first)
+    """
+    data = numpy.asarray(x, dtype=numpy.float64)
+    n = len(data)
+    ndata = data - numpy.mean(data)
+    # Pad to a power of two >= 2n - 1 so the circular correlation is linear
+    nfft = 1 << max(0, 2 * n - 2).bit_length()
+    spectrum = numpy.fft.rfft(ndata, nfft)
+    acorr: numpy.ndarray = numpy.fft.irfft(spectrum * numpy.conj(spectrum), nfft)[:n] / numpy.var(data) / n
+    return acorr
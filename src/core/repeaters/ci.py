@@ -10,7 +10,6 @@ import math
 import warnings
 from typing import Any, Dict
 
-import numpy
 import scipy.stats as st
 
 from .base import RunData
@@ -77,13 +76,14 @@ class CIRepeater(CountRepeater):
             return False
 
         if self.get_count() > 1:
-            N: int = len(self._runtimes)
+            N: int = len(self._stats)
             t: float = st.t.ppf(q=self.__ci_limit, df=N - 1)
-            ci: float = t * st.tstd(self._runtimes) / math.sqrt(N)
-            rel_ci: float = ci / numpy.mean(self._runtimes)
+            # O(1): running mean/variance instead of rescanning all runtimes
+            ci: float = t * self._stats.std() / math.sqrt(N)
+            rel_ci: float = ci / self._stats.mean
             if self._verbose:
                 print(
-                    f"At repeat #{self.get_count()}, CI={ci}, rel_CI={rel_ci}, mean={numpy.mean(self._runtimes)}"
+                    f"At repeat #{self.get_count()}, CI={ci}, rel_CI={rel_ci}, mean={self._stats.mean}"
                 )
                 print(f"Previous runtimes={self._runtimes}")
                 print(
@@ -6,9 +6,12 @@ Stops after a predetermined number of runs.
 © Copyright 2025--2025 Hewlett Packard Enterprise Development LP
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict
+
+import numpy
 
 from .base import Repeater, RunData
+from .streaming import StreamingStats
 
 
 class CountRepeater(Repeater):
@@ -20,6 +23,9 @@ class CountRepeater(Repeater):
     Repeater is essentially the superclass of all others.
     """
 
+    # Whether subclasses need sorted samples (order statistics) from self._stats
+    _TRACK_ORDER = False
+
     _DEFAULT_VALUES = {
         "max": {
             "default": 1,
@@ -48,10 +54,15 @@ class CountRepeater(Repeater):
         max_default = self._DEFAULT_VALUES["max"]["default"]
         self._limit: int = int(ropts.get("max", max_default))
 
-        self._runtimes: List[float] = []
+        self._stats = StreamingStats(track_order=self._TRACK_ORDER)
+
+    @property
+    def _runtimes(self) -> numpy.ndarray:
+        """All recorded values of the tracked metric, in arrival order (read-only)."""
+        return self._stats.values
 
     def __call__(self, pdata: RunData) -> bool:
         """Stopping heuristic based on reaching maximum run count."""
         super().__call__(pdata)
-        self._runtimes += pdata.get_metric(self._metric)
+        self._stats.extend(pdata.get_metric(self._metric))
         return self._count < self._limit
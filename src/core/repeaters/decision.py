@@ -6,19 +6,18 @@ Uses multiple sub-repeaters to decide when to stop.
 © Copyright 2025--2025 Hewlett Packard Enterprise Development LP
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence
 
 import numpy
 import scipy.stats
-from sklearn.mixture import GaussianMixture
-from sklearn.model_selection import GridSearchCV
 
 from .base import RunData
-from .bb import BBRepeater
+from .bb import BBRepeater, autocorrelation
 from .ci import CIRepeater
 from .count import CountRepeater
 from .gmm import GaussianMixtureRepeater
 from .hdi import HDIRepeater
+from .mixture import MixtureSelector
 from .rse import RSERepeater
 
 
@@ -168,6 +167,9 @@ class DecisionRepeater(CountRepeater):
             "gaussian_covariances", self._DEFAULT_VALUES["gaussian_covariances"]["default"]
         )
 
+        # Warm-started model selection reused across multimodality tests
+        self.__mixture = MixtureSelector(self.__gaussian_covariances)
+
         self.__decision_verbose: bool = ropts.get("decision_verbose", self._DEFAULT_VALUES["decision_verbose"]["default"])
 
         self.__default_repeaters: Dict[str, Any] = {
@@ -278,7 +280,7 @@ class DecisionRepeater(CountRepeater):
             self.__log_decision(info_string + "| All tests failed, continue experiments")
             return True
 
-    def _is_constant(self, pdata: List[float]) -> bool:
+    def _is_constant(self, pdata: Sequence[float] | numpy.ndarray) -> bool:
         """
         Helper function to determine if an array of samples is constant.
 
@@ -298,7 +300,7 @@ class DecisionRepeater(CountRepeater):
             <= self.__mean_threshold * numpy.mean(pdata)
         )
 
-    def _is_monotonic(self, pdata: List[float]) -> bool:
+    def _is_monotonic(self, pdata: Sequence[float] | numpy.ndarray) -> bool:
         """
         Helper function used to determine if an array of samples is monotonic.
 
@@ -311,7 +313,7 @@ class DecisionRepeater(CountRepeater):
         samples: Any = numpy.array(pdata)
         return (all(samples[1:] >= samples[:-1])) or (all(samples[1:] <= samples[:-1]))
 
-    def _is_uniform(self, pdata: List[float]) -> bool:
+    def _is_uniform(self, pdata: Sequence[float] | numpy.ndarray) -> bool:
         """
         Helper function used to determine if an array of samples is uniform.
 
@@ -332,7 +334,7 @@ class DecisionRepeater(CountRepeater):
 
         return not (test_result.pvalue <= self.__uniform_threshold)
 
-    def _is_gaussian(self, pdata: List[float]) -> bool:
+    def _is_gaussian(self, pdata: Sequence[float] | numpy.ndarray) -> bool:
         """
         Helper function used to determine if an array of samples is gaussian.
 
@@ -357,7 +359,7 @@ class DecisionRepeater(CountRepeater):
         # In other words, the NULL hypothesis is that the data come from a normal distribution.
         return not (test_result.pvalue <= self.__gaussian_threshold)
 
-    def _is_lognormal(self, pdata: List[float]) -> bool:
+    def _is_lognormal(self, pdata: Sequence[float] | numpy.ndarray) -> bool:
         """
         Helper function used to determine if an array of samples is lognormal.
 
@@ -382,7 +384,7 @@ class DecisionRepeater(CountRepeater):
         # In other words, the NULL hypothesis is that the data come from a lognormal distribution.
         return not (test_result.pvalue <= self.__lognormal_threshold)
 
-    def _is_multimodal(self, pdata: List[float]) -> bool:
+    def _is_multimodal(self, pdata: Sequence[float] | numpy.ndarray) -> bool:
         """
         Helper function used to determine if an array of samples is multimodal.
 
@@ -409,26 +411,19 @@ class DecisionRepeater(CountRepeater):
         # Fit models with different numbers of components to check BIC trend
         max_components = min(self.__max_gaussian_components, max(2, n_samples // 50))
 
-        param_grid = {
-            "n_components": range(1, max_components + 1),
-            "covariance_type": self.__gaussian_covariances,
-        }
+        best_model = self.__mixture.select(X_data, range(1, max_components + 1))
+        best_params = self.__mixture.best_params
+        assert best_params is not None
 
-        grid_search = GridSearchCV(
-            GaussianMixture(), param_grid=param_grid, scoring=lambda est, X: -est.bic(X)
-        )
-        multi_model = grid_search.fit(X_data)
-
-        best_components = multi_model.best_params_["n_components"]
-        multi_bic = multi_model.best_estimator_.bic(X_data)
-        model_loglikelihood = numpy.abs(multi_model.best_estimator_.score(X_data))
+        best_components = best_params["n_components"]
+        multi_bic = best_model.bic(X_data)
+        model_loglikelihood = numpy.abs(best_model.score(X_data))
 
         # For true multimodal (especially bimodal), fit 3 components to check if BIC gets worse
         # Bimodal: BIC(3 components) >> BIC(2 components) - adding a 3rd mode hurts fit
         # Uniform: BIC(3 components) ≈ BIC(2 components) or better - can always add more
         if best_components >= 2:
-            model_3 = GaussianMixture(n_components=3, covariance_type=multi_model.best_params_["covariance_type"])
-            model_3.fit(X_data)
+            model_3 = self.__mixture.fit(X_data, 3, best_params["covariance_type"])
             bic_3 = model_3.bic(X_data)
             # For bimodal, BIC should increase significantly when forcing 3 components
             # For uniform, BIC should stay similar or decrease (can fit flat data with 3 as well as 2)
@@ -437,7 +432,7 @@ class DecisionRepeater(CountRepeater):
             bic_penalty_for_3 = 0.0
 
         # Get component means from best model
-        component_means = multi_model.best_estimator_.means_.flatten()
+        component_means = best_model.means_.flatten()
 
         # Calculate mean separation
         sorted_means = numpy.sort(component_means)
@@ -455,9 +450,7 @@ class DecisionRepeater(CountRepeater):
         min_samples_per_component = 10.0
 
         # BIC improvement threshold (single vs best multi)
-        single_model = GaussianMixture(n_components=1)
-        single_model.fit(X_data)
-        single_bic = single_model.bic(X_data)
+        single_bic = self.__mixture.fit(X_data, 1).bic(X_data)
         bic_improvement = single_bic - multi_bic
         bic_threshold = 15.0
 
@@ -485,7 +478,7 @@ class DecisionRepeater(CountRepeater):
             and bic_penalty_for_3 > 5.0  # Adding 3rd component should hurt (true multimodal)
         )
 
-    def _is_autocorrelated(self, pdata: List[float]) -> bool:
+    def _is_autocorrelated(self, pdata: Sequence[float] | numpy.ndarray) -> bool:
         """
         Determine if an array of samples is autocorrelated.
 
@@ -496,16 +489,9 @@ class DecisionRepeater(CountRepeater):
         Args:
             pdata: List of samples to be tested
         """
-        def __autocor(x: Any) -> Any:
-            data = numpy.array(x)
-            mean = numpy.mean(data)
-            var = numpy.var(data)
-            ndata = data - mean
-            acorr = numpy.correlate(ndata, ndata, "full")[len(ndata) - 1 :]
-            return acorr / var / len(ndata)
-
+        max_autocor = numpy.max(numpy.abs(autocorrelation(pdata)[1:]))
         self.__log_decision(
-            f"[autocorrelated_test] current autocorr: {numpy.max(numpy.abs(__autocor(pdata)[1:]))}, threshold: {self.__autocor_threshold}"
+            f"[autocorrelated_test] current autocorr: {max_autocor}, threshold: {self.__autocor_threshold}"
         )
 
-        return bool(numpy.max(numpy.abs(__autocor(pdata)[1:])) >= self.__autocor_threshold)
+        return bool(max_autocor >= self.__autocor_threshold)
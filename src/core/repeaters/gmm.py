@@ -9,11 +9,10 @@ Stops when goodness of fit of Gaussian Mixture model exceeds threshold.
 from typing import Any, Dict, List
 
 import numpy
-from sklearn.mixture import GaussianMixture
-from sklearn.model_selection import GridSearchCV
 
 from .base import RunData
 from .count import CountRepeater
+from .mixture import IncrementalMixtureSelector
 
 
 class GaussianMixtureRepeater(CountRepeater):
@@ -27,6 +26,13 @@ class GaussianMixtureRepeater(CountRepeater):
     The best fit is found by optimizing the BIC score:
     https://en.wikipedia.org/wiki/Bayesian_information_criterion
 
+    Model selection is incremental: estimators are warm-started from their
+    previous solution, and the search is only rerun every `refit_every` runs
+    or when the sample mean/std shifts by more than `refit_tolerance` standard
+    deviations. In between, the stopping rule scores the current data with the
+    last selected model. With `background_fit`, searches run in a separate
+    process and the repeater keeps going until the first one completes.
+
     This repeater uses the GaussianMixture model from sklearn:
     https://scikit-learn.org/stable/modules/generated/sklearn.mixture.GaussianMixture.html
 
@@ -34,6 +40,9 @@ class GaussianMixtureRepeater(CountRepeater):
         goodness_threshold:       Likelihood value that triggers stopping (default: 2)
         max_gaussian_components:  Maximum gaussian components used in the model (default: 8)
         gaussian_covariances:     List of strings with covariance modes to be tested (default: ["spherical", "tied", "diag", "full"])
+        refit_every:              Rerun model selection every N runs (default: 5)
+        refit_tolerance:          Relative mean/std shift that forces a refit (default: 0.1)
+        background_fit:           Run model selection in a background process (default: False)
     """
 
     _DEFAULT_VALUES = {
@@ -62,6 +71,21 @@ class GaussianMixtureRepeater(CountRepeater):
             "type": int,
             "help": "Minimum number of runs before checking threshold",
         },
+        "refit_every": {
+            "default": 5,
+            "type": int,
+            "help": "Rerun model selection every N runs (1 = every run)",
+        },
+        "refit_tolerance": {
+            "default": 0.1,
+            "type": float,
+            "help": "Refit early when mean or std shifts by this many stds (0 disables)",
+        },
+        "background_fit": {
+            "default": False,
+            "type": bool,
+            "help": "Run model selection in a background process",
+        },
     }
 
     def __init__(self, options: Dict[str, Any]):
@@ -80,47 +104,35 @@ class GaussianMixtureRepeater(CountRepeater):
         self.__gaussian_covariances: List[str] = ropts.get(
             "gaussian_covariances", self._DEFAULT_VALUES["gaussian_covariances"]["default"]
         )
+        self.__selector = IncrementalMixtureSelector(
+            self.__gaussian_covariances,
+            n_components=range(1, self.__max_gaussian_components),
+            refit_every=int(ropts.get("refit_every", self._DEFAULT_VALUES["refit_every"]["default"])),
+            refit_tolerance=float(ropts.get("refit_tolerance", self._DEFAULT_VALUES["refit_tolerance"]["default"])),
+            background=bool(ropts.get("background_fit", self._DEFAULT_VALUES["background_fit"]["default"])),
+        )
 
     def __call__(self, pdata: RunData) -> bool:
         """Stopping heuristic using Gaussian Mixture model."""
         super().__call__(pdata)
 
-        def gmm_bic_score(estimator: GaussianMixture, X_data: numpy.ndarray) -> Any:
-            """
-            Callable passed to GridSearchCV using the BIC score.
-
-            It's negative because GridSearchCV maximizes by default.
-            """
-            return -estimator.bic(X_data)
-
         if self.get_count() < self.__min_repeats or self.get_count() <= min(
             self.__max_repeats - 1,
             self.__max_gaussian_components * len(self.__gaussian_covariances),
         ):
             return True
 
-        else:
-            param_grid = {
-                "n_components": range(1, self.__max_gaussian_components),
-                "covariance_type": self.__gaussian_covariances,
-            }
-
-            grid_search = GridSearchCV(
-                GaussianMixture(), param_grid=param_grid, scoring=gmm_bic_score
-            )
-
-            model = grid_search.fit(numpy.array(self._runtimes).reshape(-1, 1))
-
-            if self.get_count() >= self.__max_repeats:
-                if self._verbose:
-                    print("GMM exhausted experimental budget, stop.")
-                return False
-
-            return bool(
-                numpy.abs(
-                    model.best_estimator_.score(
-                        numpy.array(self._runtimes).reshape(-1, 1)
-                    )
-                )
-                <= self.__goodness_threshold
-            )
+        if self.get_count() >= self.__max_repeats:
+            self.__selector.close()
+            if self._verbose:
+                print("GMM exhausted experimental budget, stop.")
+            return False
+
+        model = self.__selector.update(self._runtimes)
+        if model is None:
+            return True  # First background fit still running
+
+        repeat = bool(numpy.abs(model.score(self._runtimes.reshape(-1, 1))) <= self.__goodness_threshold)
+        if not repeat:
+            self.__selector.close()
+        return repeat
@@ -8,9 +8,6 @@ Stops when HDI width drops below threshold.
 
 from typing import Any, Dict
 
-import arviz
-import numpy
-
 from .base import RunData
 from .count import CountRepeater
 
@@ -25,6 +22,9 @@ class HDIRepeater(CountRepeater):
     method will never converge and will only stop when it reaches max_repeats.
     """
 
+    # Keep samples sorted incrementally so the HDI needs no re-sorting
+    _TRACK_ORDER = True
+
     _DEFAULT_VALUES = {
         "hdi_limit": {
             "default": 0.89,
@@ -68,7 +68,8 @@ class HDIRepeater(CountRepeater):
         Algorithm to determine whether enough repeats have run:
         1. If maximum repeats were reached or exceeded, return True
         2. Otherwise, add reported run times to record of all runtimes.
-        3. Compute length of HDI using the arviz library.
+        3. Compute length of HDI (same algorithm as the arviz library, over
+           incrementally sorted samples).
         4. If the HDI length falls below the threshold and a minimum number
         of repeats was performed, return True.
         For definitions and computations of HDI, see:
@@ -84,8 +85,8 @@ class HDIRepeater(CountRepeater):
             return False
 
         if self.get_count() > 1:
-            hdi = arviz.hdi(numpy.asarray(self._runtimes), hdi_prob=self.__hdi_limit)  # type: ignore
-            mean = numpy.mean(self._runtimes)
+            hdi = self._stats.hdi(self.__hdi_limit)
+            mean = self._stats.mean
             rel_hdi: float = 0 if mean == 0 else (hdi[1] - hdi[0]) / mean
             if self._verbose:
                 print(
@@ -75,7 +75,7 @@ class KSRepeater(CountRepeater):
             return False
 
         # Extract metric column from pdata
-        self._runtimes += pdata.get_metric(self._metric)
+        self._stats.extend(pdata.get_metric(self._metric))
         ks_statistic, ks_p_value = ks_2samp(
             self._runtimes[: int(self.get_count() / 2)],
             self._runtimes[int(self.get_count() / 2) :],
@@ -0,0 +1,246 @@
+"""
+Incremental Gaussian mixture model selection shared by repeaters.
+
+GMM-based stopping rules pick the mixture (number of components and
+covariance type) that minimizes the cross-validated BIC. Re-running a full
+grid search from random initializations on every iteration costs hundreds
+of EM fits per repeat, which easily exceeds the benchmark runtime. The
+selector here keeps one warm-started estimator per (candidate, fold), so
+each new search starts EM from the previous solution and converges in a
+few steps. It also collapses covariance types that are equivalent for
+one-dimensional data. IncrementalMixtureSelector adds a refit policy
+(every k samples or on material change) and optional fitting in a
+background process.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+from __future__ import annotations
+
+import warnings
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy
+from sklearn.mixture import GaussianMixture
+
+# In one dimension, spherical, diag and full covariances all reduce to one
+# variance per component (with the same number of free parameters), so
+# only "full" and "tied" need to be evaluated.
+_EQUIVALENT_1D_COVARIANCES = {"spherical": "full", "diag": "full", "full": "full", "tied": "tied"}
+
+Estimators = Dict[Tuple[int, str, int], GaussianMixture]
+
+_FULL_DATA = -1  # Fold key for estimators fit on all samples
+
+
+def effective_covariance_types(covariance_types: Sequence[str], ndim: int = 1) -> List[str]:
+    """
+    Drop covariance types that are redundant for data of the given dimension.
+
+    Args:
+        covariance_types: Requested covariance types, in preference order
+        ndim: Number of features in the data
+
+    Returns:
+        Covariance types to evaluate, preserving order of first appearance
+    """
+    if ndim != 1:
+        return list(dict.fromkeys(covariance_types))
+    return list(dict.fromkeys(_EQUIVALENT_1D_COVARIANCES.get(c, c) for c in covariance_types))
+
+
+def _fit(estimators: Estimators, key: Tuple[int, str, int], X: numpy.ndarray) -> GaussianMixture:
+    """Fit the estimator for `key` on X, warm-starting from its last solution."""
+    model = estimators.get(key)
+    if model is None:
+        model = GaussianMixture(n_components=key[0], covariance_type=key[1], warm_start=True)
+        estimators[key] = model
+    model.fit(X)
+    return model
+
+
+def _select(estimators: Estimators, data: numpy.ndarray, n_components: Sequence[int],
+            covariance_types: Sequence[str], folds: int) -> Tuple[Estimators, GaussianMixture, Dict[str, Any]]:
+    """
+    Pick the candidate with the best mean held-out BIC and refit it on all data.
+
+    Mirrors GridSearchCV(GaussianMixture(), scoring=-BIC) with its default
+    unshuffled K-fold splits: candidates are ranked by the mean over folds of
+    the negative BIC on the test fold, ties going to the first candidate in
+    (covariance_type, n_components) order. Candidates that fail to fit on
+    some fold are ranked last.
+
+    Returns:
+        (updated estimators, best model fit on all data, best parameters)
+    """
+    X = data.reshape(-1, 1)
+    n = len(X)
+    # Same fold sizes as sklearn's KFold: the first n % folds folds get one extra sample
+    sizes = numpy.full(max(1, folds), n // max(1, folds))
+    sizes[:n % max(1, folds)] += 1
+    bounds = numpy.concatenate(([0], numpy.cumsum(sizes)))
+    best_score = -numpy.inf
+    best_params: Dict[str, Any] | None = None
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # ConvergenceWarning on small folds
+        for covariance_type in covariance_types:
+            for k in n_components:
+                scores = []
+                for fold in range(len(bounds) - 1):
+                    lo, hi = bounds[fold], bounds[fold + 1]
+                    train = numpy.concatenate((X[:lo], X[hi:])) if folds > 1 else X
+                    test = X[lo:hi]
+                    try:
+                        model = _fit(estimators, (k, covariance_type, fold), train)
+                        scores.append(-model.bic(test))
+                    except ValueError:
+                        scores = []
+                        break
+                score = numpy.mean(scores) if scores else -numpy.inf
+                if best_params is None or score > best_score:
+                    best_score = score
+                    best_params = {"covariance_type": covariance_type, "n_components": k}
+
+        assert best_params is not None, "No mixture candidates to evaluate"
+        best = _fit(estimators, (best_params["n_components"], best_params["covariance_type"], _FULL_DATA), X)
+    return estimators, best, best_params
+
+
+class MixtureSelector:
+    """
+    Cross-validated BIC model selection with warm-started estimators.
+
+    Args:
+        covariance_types: Covariance types to consider (redundant 1-D types are dropped)
+        folds: Number of contiguous cross-validation folds (as GridSearchCV's default)
+    """
+
+    def __init__(self, covariance_types: Sequence[str], folds: int = 5) -> None:
+        """Initialize an empty selector."""
+        self.covariance_types = effective_covariance_types(covariance_types)
+        self.folds = folds
+        self.best_params: Dict[str, Any] | None = None
+        self._estimators: Estimators = {}
+
+    def select(self, data: Sequence[float] | numpy.ndarray, n_components: Sequence[int]) -> GaussianMixture:
+        """
+        Select the best mixture for the data among the candidate component counts.
+
+        Args:
+            data: One-dimensional samples
+            n_components: Candidate numbers of components
+
+        Returns:
+            Best model, fit on all samples (best_params is updated)
+        """
+        self._estimators, best, self.best_params = _select(
+            self._estimators, numpy.asarray(data, dtype=numpy.float64),
+            list(n_components), self.covariance_types, self.folds,
+        )
+        return best
+
+    def fit(self, data: Sequence[float] | numpy.ndarray, n_components: int, covariance_type: str = "full") -> GaussianMixture:
+        """Fit a single warm-started mixture on all samples."""
+        covariance_type = effective_covariance_types([covariance_type])[0]
+        X = numpy.asarray(data, dtype=numpy.float64).reshape(-1, 1)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return _fit(self._estimators, (n_components, covariance_type, _FULL_DATA), X)
+
+
+class IncrementalMixtureSelector(MixtureSelector):
+    """
+    MixtureSelector that only refits when the sample has grown or changed enough.
+
+    A new selection runs when `refit_every` samples were added since the last
+    one, or when the mean or standard deviation moved by more than
+    `refit_tolerance` times the standard deviation at the last fit. With
+    `background`, selections run in a worker process and update() returns the
+    previous model (or None before the first one completes) without waiting.
+
+    Args:
+        covariance_types: Covariance types to consider
+        n_components: Candidate numbers of components
+        refit_every: Refit after this many new samples (1 refits every time)
+        refit_tolerance: Relative mean/std change that forces a refit
+        background: Run selections in a background process
+        folds: Number of cross-validation folds
+    """
+
+    def __init__(self, covariance_types: Sequence[str], n_components: Sequence[int],
+                 refit_every: int = 1, refit_tolerance: float = 0.0,
+                 background: bool = False, folds: int = 5) -> None:
+        """Initialize selector and refit policy."""
+        super().__init__(covariance_types, folds)
+        self.n_components = list(n_components)
+        self.refit_every = max(1, refit_every)
+        self.refit_tolerance = refit_tolerance
+        self.background = background
+        self.model: GaussianMixture | None = None
+        self.fits = 0
+        self._fit_size = 0
+        self._fit_mean = 0.0
+        self._fit_std = 0.0
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending: Future[Tuple[Estimators, GaussianMixture, Dict[str, Any]]] | None = None
+
+    def update(self, data: Sequence[float] | numpy.ndarray) -> GaussianMixture | None:
+        """
+        Return the current best model, refitting first if the policy says so.
+
+        Args:
+            data: All samples so far
+
+        Returns:
+            Best model, or None while the first background fit is running
+        """
+        self._collect()
+        values = numpy.asarray(data, dtype=numpy.float64)
+        if self._pending is None and self._needs_refit(values):
+            self._fit_size = len(values)
+            self._fit_mean = float(numpy.mean(values))
+            self._fit_std = float(numpy.std(values))
+            self.fits += 1
+            if self.background:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=1)
+                self._pending = self._executor.submit(
+                    _select, self._estimators, values, self.n_components, self.covariance_types, self.folds)
+            else:
+                self.model = self.select(values, self.n_components)
+        return self.model
+
+    def wait(self) -> GaussianMixture | None:
+        """Block until a pending background selection completes and return the model."""
+        if self._pending is not None:
+            self._pending.result()
+            self._collect()
+        return self.model
+
+    def close(self) -> None:
+        """Stop the background worker, if any."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._pending = None
+
+    def _collect(self) -> None:
+        """Adopt the result of a finished background selection."""
+        if self._pending is not None and self._pending.done():
+            self._estimators, self.model, self.best_params = self._pending.result()
+            self._pending = None
+
+    def _needs_refit(self, values: numpy.ndarray) -> bool:
+        """Apply the refit policy to the current samples."""
+        if self.model is None and self.fits == 0:
+            return True
+        if len(values) - self._fit_size >= self.refit_every:
+            return True
+        if self.refit_tolerance > 0 and len(values) > self._fit_size:
+            scale = self._fit_std if self._fit_std > 0 else abs(self._fit_mean) or 1.0
+            moved = max(abs(float(numpy.mean(values)) - self._fit_mean),
+                        abs(float(numpy.std(values)) - self._fit_std))
+            return moved > self.refit_tolerance * scale
+        return False
@@ -10,9 +10,6 @@ import math
 import warnings
 from typing import Any, Dict
 
-import numpy
-import scipy.stats as st
-
 from .base import RunData
 from .count import CountRepeater
 
@@ -68,11 +65,12 @@ class RSERepeater(CountRepeater):
             return False
 
         if self.get_count() > 1:
-            N: int = len(self._runtimes)
+            N: int = len(self._stats)
             assert N > 0
-            se: float = st.tstd(self._runtimes) / math.sqrt(N)
-            mean = numpy.mean(self._runtimes)
-            rse: float = se if mean == 0 else se / numpy.mean(self._runtimes)
+            # O(1): running mean/variance instead of rescanning all runtimes
+            se: float = self._stats.std() / math.sqrt(N)
+            mean = self._stats.mean
+            rse: float = se if mean == 0 else se / mean
             if self._verbose:
                 print(
                     f"At repeat #{self.get_count()}, SE={se}, RSE={rse}, mean={mean}"
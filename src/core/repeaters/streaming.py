@@ -0,0 +1,127 @@
+"""
+Streaming statistics accumulator shared by repeaters.
+
+Repeaters evaluate their stopping rule after every iteration, so recomputing
+statistics over all samples makes each check O(n) and a whole run O(n^2).
+StreamingStats keeps samples in a growable NumPy buffer and maintains the
+running mean and variance (Welford's algorithm) in O(1) per sample.
+Optionally, it also keeps a sorted copy of the samples (binary search plus
+an in-place shift per insertion) so order statistics such as the HDI need
+no re-sorting.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+import math
+from typing import Iterable, Tuple
+
+import numpy
+
+
+class StreamingStats:
+    """
+    Incremental mean/variance and (optionally) order statistics of a sample.
+
+    Args:
+        track_order: Maintain a sorted copy of samples (needed for hdi())
+        capacity: Initial buffer capacity; buffers double when full
+    """
+
+    def __init__(self, track_order: bool = False, capacity: int = 64) -> None:
+        """Initialize an empty accumulator."""
+        self._buf = numpy.empty(max(1, capacity), dtype=numpy.float64)
+        self._sorted = numpy.empty_like(self._buf) if track_order else None
+        self._n: int = 0
+        self._mean: float = 0.0
+        self._m2: float = 0.0  # Sum of squared deviations from the mean
+
+    def __len__(self) -> int:
+        return self._n
+
+    def extend(self, values: Iterable[float]) -> None:
+        """
+        Add samples.
+
+        Args:
+            values: New sample values (converted to float)
+        """
+        for value in values:
+            self.append(float(value))
+
+    def append(self, value: float) -> None:
+        """Add one sample in O(1) (plus an O(n) memmove if tracking order)."""
+        if self._n == len(self._buf):
+            self._grow()
+        self._buf[self._n] = value
+
+        if self._sorted is not None:
+            pos = int(numpy.searchsorted(self._sorted[:self._n], value, side="right"))
+            self._sorted[pos + 1:self._n + 1] = self._sorted[pos:self._n]
+            self._sorted[pos] = value
+
+        self._n += 1
+        delta = value - self._mean
+        self._mean += delta / self._n
+        self._m2 += delta * (value - self._mean)
+
+    def _grow(self) -> None:
+        """Double buffer capacity."""
+        capacity = 2 * len(self._buf)
+        buf = numpy.empty(capacity, dtype=numpy.float64)
+        buf[:self._n] = self._buf[:self._n]
+        self._buf = buf
+        if self._sorted is not None:
+            ordered = numpy.empty(capacity, dtype=numpy.float64)
+            ordered[:self._n] = self._sorted[:self._n]
+            self._sorted = ordered
+
+    @property
+    def values(self) -> numpy.ndarray:
+        """Read-only view of samples in arrival order (valid until next append)."""
+        view = self._buf[:self._n]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def sorted_values(self) -> numpy.ndarray:
+        """Read-only view of samples in ascending order (valid until next append)."""
+        if self._sorted is None:
+            raise ValueError("StreamingStats was created without track_order")
+        view = self._sorted[:self._n]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def mean(self) -> float:
+        """Sample mean (nan if empty)."""
+        return self._mean if self._n else math.nan
+
+    def variance(self, ddof: int = 1) -> float:
+        """Sample variance with `ddof` delta degrees of freedom (nan if undefined)."""
+        if self._n - ddof <= 0:
+            return math.nan
+        return max(self._m2, 0.0) / (self._n - ddof)
+
+    def std(self, ddof: int = 1) -> float:
+        """Sample standard deviation (matches scipy.stats.tstd for ddof=1)."""
+        return math.sqrt(self.variance(ddof))
+
+    def hdi(self, prob: float) -> Tuple[float, float]:
+        """
+        Highest-density interval of the samples.
+
+        Same algorithm as arviz.hdi (narrowest window spanning floor(prob*n)
+        sorted samples), computed with one vectorized pass over the
+        maintained sorted samples.
+
+        Raises:
+            ValueError: If there are too few samples or order is not tracked
+        """
+        ordered = self.sorted_values
+        n = len(ordered)
+        inc = int(numpy.floor(prob * n))
+        widths = ordered[inc:] - ordered[:n - inc]
+        if len(widths) == 0:
+            raise ValueError("Too few elements for interval calculation.")
+        low = int(numpy.argmin(widths))
+        return float(ordered[low]), float(ordered[low + inc])
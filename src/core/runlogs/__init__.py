@@ -8,14 +8,21 @@ and writing results during execution.
 © Copyright 2025--2025 Hewlett Packard Enterprise Development LP
 """
 
-from .scanner import scan_runlogs, get_experiments, get_tasks_for_experiment
+from .scanner import scan_runlogs, query_runlogs, get_experiments, get_tasks_for_experiment
+from .index import RunlogIndex
+from .hostcache import HostCache, get_host_cache
 from .reader import load_csv, load_runlog
 from .parser import parse_markdown_runtime_options, extract_runtime_options_from_markdown, parse_markdown_metadata
 from .writer import RunLogger
+from .journal import RunJournal, config_hash
 from .sysinfo import collect_sysinfo
 
 __all__ = [
     "scan_runlogs",
+    "query_runlogs",
+    "RunlogIndex",
+    "HostCache",
+    "get_host_cache",
     "get_experiments",
     "get_tasks_for_experiment",
     "load_csv",
@@ -24,5 +31,7 @@ __all__ = [
     "extract_runtime_options_from_markdown",
     "parse_markdown_metadata",
     "RunLogger",
+    "RunJournal",
+    "config_hash",
     "collect_sysinfo",
 ]
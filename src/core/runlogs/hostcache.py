@@ -0,0 +1,194 @@
+"""
+Per-host cache of expensive system facts.
+
+Every experiment (and every configuration of a parameter sweep) records the
+same host facts: system specifications, the SHARP version and git hash,
+and a SHA-256 checksum of the benchmark executable, which for AppImages
+means hashing 100MB+. HostCache stores these facts in a small JSON file per
+host so they are computed once per boot instead of once per run.
+
+Entries are invalidated three ways:
+- The whole cache is discarded when the kernel boot id changes.
+- Entries derived from files carry a signature (device, inode, mtime, size)
+  and are ignored if the file changed.
+- Volatile entries (e.g. load average) are only reused within a TTL.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+from src.core.config.settings import Settings
+
+_BOOT_ID_PATH = "/proc/sys/kernel/random/boot_id"
+_CACHE_VERSION = 1
+
+_caches: Dict[str, HostCache] = {}
+
+
+def boot_id() -> str:
+    """
+    Identify the current boot of this host.
+
+    Returns:
+        Kernel boot id, or the boot time from /proc/stat, or "" if neither
+        is available
+    """
+    try:
+        with open(_BOOT_ID_PATH, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        pass
+    try:
+        with open("/proc/stat", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("btime "):
+                    return line.split()[1]
+    except OSError:
+        pass
+    return ""
+
+
+def file_signature(path: str | Path) -> List[int] | None:
+    """
+    Signature that changes whenever a file is replaced or modified.
+
+    Args:
+        path: File path
+
+    Returns:
+        [device, inode, mtime_ns, size], or None if path is not a regular file
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if not os.path.isfile(path):
+        return None
+    return [stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size]
+
+
+def get_host_cache() -> HostCache | None:
+    """
+    Return the host cache of this process, or None if caching is disabled.
+
+    The cache file lives in the directory named by the SHARP_HOST_CACHE_DIR
+    environment variable or settings host_cache.directory, and is named
+    after the host so a shared home directory serves several hosts.
+    """
+    if not Settings().get("host_cache.enabled", True):
+        return None
+    directory = os.environ.get("SHARP_HOST_CACHE_DIR") or Settings().get(
+        "host_cache.directory", "~/.cache/sharp")
+    path = Path(directory).expanduser() / f"host-{platform.node() or 'unknown'}.json"
+    key = str(path)
+    if key not in _caches:
+        _caches[key] = HostCache(path)
+    return _caches[key]
+
+
+class HostCache:
+    """
+    Key-value cache of host facts, scoped to the current boot.
+
+    Values must be JSON-serializable and not None. Changes are kept in
+    memory until save(). Safe to share between threads.
+
+    Args:
+        path: JSON file backing the cache (None keeps it in memory only)
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        """Load the cache file if it belongs to the current boot."""
+        self.path = Path(path) if path is not None else None
+        self.boot_id = boot_id()
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        self._dirty: set[str] = set()
+
+    def get(self, key: str, signature: Sequence[Any] | None = None,
+            ttl: float | None = None) -> Any | None:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key
+            signature: Required signature of the entry (e.g. file_signature())
+            ttl: Maximum age in seconds (None for no limit within the boot)
+
+        Returns:
+            Cached value, or None if missing, stale or of another signature
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if signature is not None and entry.get("signature") != list(signature):
+            return None
+        if ttl is not None and time.time() - entry.get("time", 0.0) > ttl:
+            return None
+        return entry.get("value")
+
+    def put(self, key: str, value: Any, signature: Sequence[Any] | None = None) -> None:
+        """
+        Store a value (stamped with the current time).
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            signature: Signature that get() must match to return the value
+        """
+        with self._lock:
+            self._entries[key] = {
+                "value": value,
+                "time": time.time(),
+                "signature": list(signature) if signature is not None else None,
+            }
+            self._dirty.add(key)
+
+    def save(self) -> None:
+        """
+        Write changed entries to the cache file (best effort).
+
+        Entries written concurrently by other processes are merged rather
+        than overwritten. Without a boot id, the cache is never persisted
+        because its validity could not be checked by the next process.
+        """
+        if self.path is None or not self._dirty or not self.boot_id:
+            return
+        with self._lock:
+            try:
+                entries = self._load()
+                entries.update({key: self._entries[key] for key in self._dirty})
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".host-", suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"version": _CACHE_VERSION, "boot_id": self.boot_id, "entries": entries}, f)
+                os.replace(tmp, self.path)
+                self._entries = entries
+                self._dirty.clear()
+            except OSError:
+                pass  # Caching is an optimization; never fail a run over it
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read entries from the cache file, if it is valid for this boot."""
+        if self.path is None or not self.boot_id:
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION \
+                or data.get("boot_id") != self.boot_id or not isinstance(data.get("entries"), dict):
+            return {}
+        entries: Dict[str, Dict[str, Any]] = data["entries"]
+        return entries
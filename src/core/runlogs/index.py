@@ -0,0 +1,302 @@
+"""
+Persistent index of runlog metadata.
+
+Parsing every Markdown file under the runlogs directory on each listing does
+not scale to shared directories with tens of thousands of experiments. The
+index caches the metadata extracted from each <experiment>/<task>.md file
+in an SQLite database at the top of the runlogs directory, keyed by relative
+path and validated by file mtime and size. A refresh only stats files and
+re-parses those that are new or changed; RunLogger.save_md updates the
+entry of the file it writes directly. The index also maps the configuration
+hash of every completed launch to its file, so identical configurations can
+be found across experiments (find_launches).
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+from .parser import parse_markdown_metadata
+
+INDEX_FILENAME = ".sharp_index.sqlite"
+
+# Bump when the schema or the extracted metadata changes; older indexes are rebuilt
+_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    md_path TEXT PRIMARY KEY,
+    experiment TEXT NOT NULL,
+    task TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    has_csv INTEGER NOT NULL,
+    sort_time REAL NOT NULL,
+    timestamp TEXT NOT NULL,
+    benchmark TEXT,
+    backends TEXT,
+    duration REAL,
+    rows INTEGER,
+    description TEXT,
+    launches TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_by_experiment ON runs (experiment, task);
+CREATE INDEX IF NOT EXISTS runs_by_time ON runs (sort_time DESC);
+"""
+
+_COLUMNS = ("md_path", "experiment", "task", "mtime_ns", "size", "has_csv", "sort_time",
+            "timestamp", "benchmark", "backends", "duration", "rows", "description", "launches")
+
+_INVARIANTS_RE = re.compile(r"## Invariant parameters.*?```json\s+(.*?)\s+```", re.DOTALL)
+
+
+class RunlogIndex:
+    """
+    SQLite-backed index of the runs under a runlogs directory.
+
+    Args:
+        runlogs_dir: Runlogs directory (the index file lives at its top level)
+
+    Raises:
+        sqlite3.Error: If the index database cannot be opened or created
+    """
+
+    def __init__(self, runlogs_dir: str | Path) -> None:
+        """Open (creating if needed) the index of a runlogs directory."""
+        self.root = Path(runlogs_dir)
+        self.path = self.root / INDEX_FILENAME
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            with self._conn:
+                self._conn.execute("DROP TABLE IF EXISTS runs")
+                self._conn.executescript(_SCHEMA)
+                self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> RunlogIndex:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # ========== Updates ==========
+
+    def refresh(self) -> None:
+        """
+        Bring the index in sync with the Markdown files on disk.
+
+        New or modified files (by mtime and size) are parsed and stored,
+        entries of deleted files are dropped, and CSV availability is updated
+        for all runs. Unchanged files are not read.
+        """
+        known = {row["md_path"]: (row["mtime_ns"], row["size"], row["has_csv"])
+                 for row in self._conn.execute("SELECT md_path, mtime_ns, size, has_csv FROM runs")}
+        seen = set()
+        upserts = []
+        csv_changes = []
+
+        for md_file, stat, has_csv in self._walk():
+            key = md_file.relative_to(self.root).as_posix()
+            seen.add(key)
+            old = known.get(key)
+            if old is None or old[0] != stat.st_mtime_ns or old[1] != stat.st_size:
+                entry = self._entry(md_file, stat, has_csv)
+                if entry is not None:
+                    upserts.append(entry)
+            elif bool(old[2]) != has_csv:
+                csv_changes.append((int(has_csv), key))
+
+        removed = [(key,) for key in known.keys() - seen]
+        if not (upserts or csv_changes or removed):
+            return
+        with self._conn:
+            self._conn.executemany(self._upsert_sql(), upserts)
+            self._conn.executemany("UPDATE runs SET has_csv = ? WHERE md_path = ?", csv_changes)
+            self._conn.executemany("DELETE FROM runs WHERE md_path = ?", removed)
+
+    def update(self, md_path: str | Path) -> None:
+        """
+        Index (or re-index) a single Markdown file.
+
+        Args:
+            md_path: Path of a <experiment>/<task>.md file under the runlogs directory
+        """
+        md_file = Path(md_path)
+        if not md_file.is_absolute() and not md_file.exists():
+            md_file = self.root / md_file
+        try:
+            relative = md_file.resolve().relative_to(self.root.resolve())
+        except ValueError:
+            return  # Not under this runlogs directory
+        if len(relative.parts) < 2:
+            return
+        md_file = self.root / relative
+        entry = self._entry(md_file, md_file.stat(), md_file.with_suffix(".csv").exists())
+        if entry is not None:
+            with self._conn:
+                self._conn.execute(self._upsert_sql(), entry)
+
+    # ========== Queries ==========
+
+    def runs(self, limit: int | None = None, experiment: str | None = None,
+             task: str | None = None, benchmark: str | None = None,
+             backend: str | None = None, since: datetime | None = None,
+             until: datetime | None = None, with_csv: bool = False) -> List[Dict[str, Any]]:
+        """
+        Query indexed runs, newest first.
+
+        Args:
+            limit: Maximum number of runs to return (None for all)
+            experiment: Only runs of this experiment
+            task: Only runs of this task
+            benchmark: Only runs of this benchmark
+            backend: Only runs that used this backend
+            since: Only runs with timestamp at or after this time
+            until: Only runs with timestamp before this time
+            with_csv: Only runs whose CSV file exists
+
+        Returns:
+            List of run metadata dicts in the format of scan_runlogs()
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        for column, value in (("experiment", experiment), ("task", task), ("benchmark", benchmark)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if backend is not None:
+            clauses.append("EXISTS (SELECT 1 FROM json_each(runs.backends) WHERE value = ?)")
+            params.append(backend)
+        if since is not None:
+            clauses.append("sort_time >= ?")
+            params.append(since.timestamp())
+        if until is not None:
+            clauses.append("sort_time < ?")
+            params.append(until.timestamp())
+        if with_csv:
+            clauses.append("has_csv = 1")
+
+        sql = "SELECT * FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY sort_time DESC, md_path"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self._run_dict(row) for row in self._conn.execute(sql, params)]
+
+    def find_launches(self, config_hash: str) -> List[Dict[str, Any]]:
+        """
+        Find completed launches of a configuration, newest first.
+
+        Args:
+            config_hash: Configuration hash (see journal.config_hash)
+
+        Returns:
+            List of dicts with md_path, csv_path and launch_id, for runs whose
+            CSV file exists
+        """
+        rows = self._conn.execute(
+            "SELECT runs.md_path, launch.key AS launch_id FROM runs, json_each(runs.launches) AS launch "
+            "WHERE launch.value = ? AND runs.has_csv = 1 ORDER BY runs.sort_time DESC, runs.md_path",
+            (config_hash,))
+        return [{"md_path": self.root / row["md_path"],
+                 "csv_path": (self.root / row["md_path"]).with_suffix(".csv"),
+                 "launch_id": row["launch_id"]} for row in rows]
+
+    def experiments(self) -> List[str]:
+        """Return the sorted names of all indexed experiments."""
+        rows = self._conn.execute("SELECT DISTINCT experiment FROM runs ORDER BY experiment")
+        return [row[0] for row in rows]
+
+    def count(self) -> int:
+        """Return the number of indexed runs."""
+        return int(self._conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0])
+
+    # ========== Helpers ==========
+
+    def _walk(self) -> Iterator[Tuple[Path, os.stat_result, bool]]:
+        """Yield (md file, stat, CSV exists) for every <experiment>/.../<task>.md."""
+        for dirpath, _, filenames in os.walk(self.root):
+            if dirpath == str(self.root):
+                continue  # Expected structure: runlogs/<experiment>/<task>.md
+            names = set(filenames)
+            for name in filenames:
+                if not name.endswith(".md"):
+                    continue
+                md_file = Path(dirpath) / name
+                try:
+                    stat = md_file.stat()
+                except OSError:
+                    continue
+                yield md_file, stat, f"{name[:-3]}.csv" in names
+
+    def _entry(self, md_file: Path, stat: os.stat_result, has_csv: bool) -> Tuple[Any, ...] | None:
+        """Parse one Markdown file into a row tuple (None if unparseable)."""
+        try:
+            metadata = parse_markdown_metadata(md_file)
+        except Exception:
+            return None  # Skip experiments with damaged/unparseable markdown
+
+        # If no timestamp from metadata, use file modification time
+        timestamp = metadata.get("timestamp")
+        if not isinstance(timestamp, datetime):
+            timestamp = datetime.fromtimestamp(stat.st_mtime)
+        backends = metadata.get("backends")
+        relative = md_file.relative_to(self.root)
+        return (
+            relative.as_posix(), relative.parts[0], md_file.stem,
+            stat.st_mtime_ns, stat.st_size, int(has_csv),
+            timestamp.timestamp(), timestamp.isoformat(),
+            metadata.get("benchmark"),
+            json.dumps(backends) if backends is not None else None,
+            metadata.get("duration"), metadata.get("rows"), metadata.get("description"),
+            self._launches(md_file),
+        )
+
+    @staticmethod
+    def _launches(md_file: Path) -> str | None:
+        """JSON map of launch_id -> config_hash from the file's invariants (None if none)."""
+        try:
+            match = _INVARIANTS_RE.search(md_file.read_text(encoding="utf-8"))
+            invariants = json.loads(match.group(1)) if match else {}
+        except (OSError, ValueError):
+            return None
+        if not isinstance(invariants, dict):
+            return None
+        launches = {launch_id: params["config_hash"] for launch_id, params in invariants.items()
+                    if isinstance(params, dict) and isinstance(params.get("config_hash"), str)}
+        return json.dumps(launches) if launches else None
+
+    @staticmethod
+    def _upsert_sql() -> str:
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        return f"INSERT OR REPLACE INTO runs ({', '.join(_COLUMNS)}) VALUES ({placeholders})"
+
+    def _run_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert an index row to the scan_runlogs() dict format."""
+        md_path = self.root / row["md_path"]
+        return {
+            "experiment": row["experiment"],
+            "task": row["task"],
+            "md_path": md_path,
+            "csv_path": md_path.with_suffix(".csv") if row["has_csv"] else None,
+            "timestamp": datetime.fromisoformat(row["timestamp"]),
+            "benchmark": row["benchmark"],
+            "backends": json.loads(row["backends"]) if row["backends"] is not None else None,
+            "duration": row["duration"],
+            "rows": row["rows"],
+            "description": row["description"],
+        }
@@ -0,0 +1,181 @@
+"""
+Configuration hashes and the per-task launch journal.
+
+Every launch is identified by a hash of everything that determines its
+results: the benchmark, its arguments and environment, the backend chain
+and options, the repeater, and the checksum of the executable. The journal
+(a hidden JSON-lines file next to each task's CSV) records when a launch
+with a given hash starts and completes, so an interrupted sweep or workflow
+can be rerun with --resume: complete launches are skipped and partially
+finished ones continue from the rows already in the CSV.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import os
+import re
+from itertools import groupby
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+from .writer import cached_executable_checksum
+
+# Options that determine a launch's results (all others, like the output
+# directory or verbosity, do not)
+HASHED_OPTIONS = (
+    "entry_point", "args", "environment", "backend_names", "backend_options",
+    "repeats", "repeater_options", "mpl", "start", "metrics", "pipeline",
+    "arrival_rate", "arrivals", "duration", "arrival_seed", "max_in_flight", "exec_mode",
+)
+
+# CSV columns that describe a row rather than hold a metric
+ROW_COLUMNS = ("launch_id", "completion_timestamp", "repeat", "rank", "speculative")
+
+
+def config_hash(options: Dict[str, Any]) -> str:
+    """
+    Hash the options that determine a launch's results.
+
+    Args:
+        options: Orchestrator options (see HASHED_OPTIONS)
+
+    Returns:
+        16-hex-digit content hash
+    """
+    content: Dict[str, Any] = {key: options.get(key) for key in HASHED_OPTIONS}
+    entry_point = options.get("entry_point", "")
+    content["checksum"] = list(cached_executable_checksum(entry_point)) if entry_point else None
+    encoded = json.dumps(content, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def read_launch_rows(csv_path: str | Path, launch_id: str) -> List[List[Dict[str, str]]]:
+    """
+    Read the rows a launch wrote to a CSV, grouped by iteration.
+
+    Speculative rows (pipelined mode) are left out.
+
+    Args:
+        csv_path: Task CSV file
+        launch_id: Launch whose rows to read
+
+    Returns:
+        One list of rows (column -> value) per iteration, in order; empty if
+        the file or launch does not exist
+    """
+    try:
+        with open(csv_path, "r", encoding="utf-8", newline="") as f:
+            rows = [row for row in csv.DictReader(f)
+                    if row.get("launch_id") == launch_id and row.get("speculative", "0") != "1"]
+    except OSError:
+        return []
+    return [list(group) for _, group in groupby(rows, key=lambda row: row.get("repeat"))]
+
+
+def iteration_metrics(rows: List[Dict[str, str]]) -> Dict[str, List[str]]:
+    """
+    Rebuild an iteration's metrics (one value per row, e.g. per rank) from its CSV rows.
+
+    Args:
+        rows: CSV rows of one iteration
+
+    Returns:
+        Dict mapping metric name to list of string values, as for RunData
+    """
+    metrics: Dict[str, List[str]] = {}
+    for row in rows:
+        for column, value in row.items():
+            # Empty cells belong to columns of other launches sharing the CSV
+            if column not in ROW_COLUMNS and column is not None and value:
+                metrics.setdefault(column, []).append(value)
+    return metrics
+
+
+class RunJournal:
+    """
+    Start/complete records of the launches written to one task's CSV.
+
+    Args:
+        base_path: Task output path without extension (RunLogger's base path)
+    """
+
+    def __init__(self, base_path: str | Path) -> None:
+        """Locate the journal of a task (the file is created on first record)."""
+        base = Path(base_path)
+        self.path = base.with_name(f".{base.name}.journal")
+        self.md_path = base.with_name(f"{base.name}.md")
+
+    def record(self, launch_id: str, config_hash: str, status: str) -> None:
+        """
+        Append a record (one short line, so concurrent appends do not interleave).
+
+        Args:
+            launch_id: Launch identifier
+            config_hash: Hash of the launch's configuration
+            status: "started" or "complete"
+        """
+        line = json.dumps({"launch_id": launch_id, "config_hash": config_hash, "status": status})
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+    def lookup(self, config_hash: str) -> Tuple[str | None, str | None]:
+        """
+        Find the latest launch of a configuration.
+
+        A complete launch takes precedence over later, unfinished attempts.
+        A started launch whose metadata is already in the task's Markdown file
+        (interrupted just before its completion record) counts as complete.
+
+        Args:
+            config_hash: Hash of the configuration
+
+        Returns:
+            (status, launch_id) with status "complete" or "started", or
+            (None, None) if the configuration was never launched
+        """
+        found: Tuple[str | None, str | None] = (None, None)
+        for record in self._records():
+            if record.get("config_hash") != config_hash:
+                continue
+            if record.get("status") == "complete":
+                return "complete", record.get("launch_id")
+            found = "started", record.get("launch_id")
+        if found[1] is not None and found[1] in self._saved_launches():
+            return "complete", found[1]
+        return found
+
+    def clear(self) -> None:
+        """Forget all launches (their results are being overwritten)."""
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _saved_launches(self) -> Dict[str, Any]:
+        """Invariants by launch ID from the task's Markdown file (empty if none)."""
+        try:
+            match = re.search(r"## Invariant parameters.*?```json\s+(.*?)\s+```",
+                              self.md_path.read_text(encoding="utf-8"), re.DOTALL)
+            invariants = json.loads(match.group(1)) if match else {}
+        except (OSError, ValueError):
+            return {}
+        return invariants if isinstance(invariants, dict) else {}
+
+    def _records(self) -> Iterator[Dict[str, Any]]:
+        """Yield all valid records (a torn last line is ignored)."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(record, dict):
+                        yield record
+        except OSError:
+            return
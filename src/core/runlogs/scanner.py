@@ -2,16 +2,20 @@
 Runlogs directory scanning and metadata extraction.
 
 Functions for scanning the runlogs directory to discover completed experiments
-and extract metadata from their markdown files.
+and extract metadata from their markdown files. Metadata is served from the
+persistent RunlogIndex, falling back to parsing every file when the index
+cannot be used (e.g. read-only runlogs directory).
 
 © Copyright 2025--2025 Hewlett Packard Enterprise Development LP
 """
 
+import sqlite3
 from pathlib import Path
 from datetime import datetime
 from typing import Any, cast
 
 from src.core.config.settings import Settings
+from .index import RunlogIndex
 from .parser import parse_markdown_metadata
 
 
@@ -21,6 +25,8 @@ def scan_runlogs(runlogs_dir: str | None = None, limit: int | None = None) -> li
 
     Scans markdown files only (much faster than CSV scanning).
     Markdown files contain all metadata: benchmark, backends, start/end times.
+    Only new or modified markdown files are parsed; the rest is served from
+    the runlogs index (see RunlogIndex).
 
     Args:
         runlogs_dir: Path to runlogs directory (defaults to settings.sharp.runlogs_dir)
@@ -42,14 +48,66 @@ def scan_runlogs(runlogs_dir: str | None = None, limit: int | None = None) -> li
             'description': str | None,  # Experiment description
         }
     """
-    if runlogs_dir is None:
-        runlogs_dir = Settings().get("sharp.runlogs_dir", "runlogs")
+    runlogs_path = _runlogs_path(runlogs_dir)
+    if not runlogs_path.exists():
+        return []
+
+    try:
+        with RunlogIndex(runlogs_path) as index:
+            index.refresh()
+            return index.runs(limit=limit)
+    except sqlite3.Error:
+        return _scan_markdown_files(runlogs_path, limit)
 
-    runlogs_path = Path(runlogs_dir)
 
+def query_runlogs(runlogs_dir: str | None = None, **filters: Any) -> list[dict[str, Any]]:
+    """
+    Query runs from the runlogs index with filters.
+
+    Args:
+        runlogs_dir: Path to runlogs directory (defaults to settings.sharp.runlogs_dir)
+        **filters: Filters accepted by RunlogIndex.runs(): limit, experiment,
+                   task, benchmark, backend, since, until, with_csv
+
+    Returns:
+        List of run metadata dicts (as in scan_runlogs), newest first
+    """
+    runlogs_path = _runlogs_path(runlogs_dir)
     if not runlogs_path.exists():
         return []
 
+    try:
+        with RunlogIndex(runlogs_path) as index:
+            index.refresh()
+            return index.runs(**filters)
+    except sqlite3.Error:
+        return [run for run in _scan_markdown_files(runlogs_path, None) if _matches(run, filters)][:filters.get("limit")]
+
+
+def _runlogs_path(runlogs_dir: str | None) -> Path:
+    if runlogs_dir is None:
+        runlogs_dir = Settings().get("sharp.runlogs_dir", "runlogs")
+    return Path(runlogs_dir)
+
+
+def _matches(run: dict[str, Any], filters: dict[str, Any]) -> bool:
+    """Apply RunlogIndex.runs() filters to a scanned run (fallback path)."""
+    for key in ("experiment", "task", "benchmark"):
+        if filters.get(key) is not None and run[key] != filters[key]:
+            return False
+    if filters.get("backend") is not None and filters["backend"] not in (run["backends"] or []):
+        return False
+    if filters.get("since") is not None and run["timestamp"].timestamp() < filters["since"].timestamp():
+        return False
+    if filters.get("until") is not None and run["timestamp"].timestamp() >= filters["until"].timestamp():
+        return False
+    if filters.get("with_csv") and run["csv_path"] is None:
+        return False
+    return True
+
+
+def _scan_markdown_files(runlogs_path: Path, limit: int | None) -> list[dict[str, Any]]:
+    """Parse every markdown file under runlogs_path (used when there is no index)."""
     runs = []
 
     # Scan for markdown files only (much faster than scanning CSVs)
@@ -117,8 +175,15 @@ def get_experiments() -> dict[str, str]:
     Returns:
         Dict mapping experiment name to itself (for Shiny select widget)
     """
-    runs = scan_runlogs(limit=None)
-    experiments = sorted(set(r["experiment"] for r in runs))
+    runlogs_path = _runlogs_path(None)
+    if not runlogs_path.exists():
+        return {}
+    try:
+        with RunlogIndex(runlogs_path) as index:
+            index.refresh()
+            experiments = index.experiments()
+    except sqlite3.Error:
+        experiments = sorted(set(r["experiment"] for r in _scan_markdown_files(runlogs_path, None)))
     return {exp: exp for exp in experiments}
 
 
@@ -135,11 +200,9 @@ def get_tasks_for_experiment(experiment: str) -> dict[str, str]:
     Returns:
         Dict mapping CSV path to task name
     """
-    runs = scan_runlogs(limit=None)
+    runs = query_runlogs(experiment=experiment, with_csv=True)
     tasks = {}
     for r in runs:
-        if r["experiment"] == experiment and r["csv_path"] is not None:
-            # Use CSV path as key, task name as value (Shiny returns key on selection)
-            tasks[str(r["csv_path"])] = r["task"]
+        # Use CSV path as key, task name as value (Shiny returns key on selection)
+        tasks[str(r["csv_path"])] = r["task"]
     return tasks
-
@@ -4,17 +4,77 @@ System specification collection.
 Executes shell commands to collect system information (CPU, memory, OS, etc.)
 for inclusion in experiment metadata and markdown output.
 
+Most default specs (src/core/config/sys_spec.yaml) only read a /proc or /sys
+file through cat, grep or awk, so forking a shell for each of them costs far
+more than the read itself. When a spec runs locally, native_probe()
+recognizes those idioms (and a few one-syscall commands such as nproc and
+uname) and evaluates them in-process with identical output. The remaining
+genuine shell probes run concurrently in a bounded thread pool under one
+total time budget for the whole collection.
+
+When the backend chain wraps specs (e.g. ssh, docker, kubectl exec), each
+wrapped invocation costs a connection or container round trip. In batched
+mode all such specs are joined into one script, separated by a random
+marker, which is shipped base64-encoded through the chain in a single
+invocation; its output is split back into the individual specs.
+
+Results are kept in the host cache (see hostcache.py). Specs matching
+host_cache.static_specs in settings.yaml (CPU model, kernel version, ...)
+are reused for the whole boot, or for host_cache.remote_static_ttl seconds
+when collected through a wrapping backend chain; all other specs are
+reused for at most host_cache.volatile_ttl seconds.
+
 © Copyright 2025--2025 Hewlett Packard Enterprise Development LP
 """
 
+import base64
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import signal
 import subprocess
-from typing import Any
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Tuple
+
+from src.core.config.settings import Settings
+
+from .hostcache import get_host_cache
+
+Probe = Callable[[], str | None]
+SpecKey = Tuple[str, str]
+
+_BATCH_KEY: SpecKey = ("", "*batch*")  # Output of the batched remote script
+
+# Only pseudo-filesystem paths are read natively; names are restricted to
+# characters with no shell meaning so the shell and native readings agree.
+_PATH = r"/(?:proc|sys)/[\w./:-]+"
+_NA_FALLBACK = r' 2>/dev/null \|\| echo "NA"'
+
+# cat /proc/x [2>/dev/null || echo "NA"]
+_CAT = re.compile(rf"^cat (?P<path>{_PATH})(?P<na>{_NA_FALLBACK})?$")
+# cat /proc/x | cut -d. -f1
+_CAT_CUT = re.compile(rf"^cat (?P<path>{_PATH}) \| cut -d(?P<delim>[:.,]) -f(?P<field>\d+)$")
+# awk "[/RE/ ]{print \$N}" /proc/x
+_AWK = re.compile(rf'^awk "(?:/(?P<regex>[\w^ ]+)/ )?\{{print \\\$(?P<field>\d+)\}}" (?P<path>{_PATH})$')
+# grep "literal" /proc/x | head -1 | cut -d: -f2 | xargs
+_GREP_FIELD = re.compile(
+    rf'^grep "(?P<literal>[\w ]+)" (?P<path>{_PATH}) \| head -1 \| '
+    r"cut -d(?P<delim>[:.,]) -f(?P<field>\d+) \| xargs$"
+)
 
 
 def collect_sysinfo(
     sys_spec_commands: dict[str, dict[str, str]],
     backend_options: dict[str, Any] | None = None,
-    backend_names: list[str] | None = None
+    backend_names: list[str] | None = None,
+    max_workers: int | None = None,
+    time_budget: float | None = None,
+    batch: bool | None = None,
+    cache: bool | None = None
 ) -> dict[str, dict[str, str]]:
     """
     Execute system specification commands and collect results.
@@ -27,6 +87,15 @@ def collect_sysinfo(
     the backend composition chain (e.g., through SSH to remote host). This ensures
     system specs reflect the actual execution environment.
 
+    Commands whose composition leaves them unchanged (local execution) and
+    that native_probe() recognizes are evaluated in-process. All other
+    commands run concurrently; any still running when the time budget is
+    spent are killed and return empty strings. With `batch`, commands that
+    the chain wraps are sent together in one invocation; if the batch
+    produces no recognizable output (e.g. base64 is missing on the target),
+    they are retried one invocation each. With `cache`, results still valid
+    in the host cache are reused without running their commands.
+
     Args:
         sys_spec_commands: Two-level dict mapping group name to
             {spec_name: shell_command}. Example:
@@ -38,6 +107,14 @@ def collect_sysinfo(
             If None, commands run locally without backend wrapping.
         backend_names: Optional list of backend names to compose.
             If None, commands run locally without backend wrapping.
+        max_workers: Maximum concurrent shell commands
+            (default: settings data.sys_spec_workers)
+        time_budget: Seconds allowed for all shell commands together
+            (default: settings data.sys_spec_time_budget)
+        batch: Send all wrapped commands through the backend chain at once
+            (default: settings data.sys_spec_batch)
+        cache: Reuse and store results in the host cache
+            (default: settings host_cache.enabled)
 
     Returns:
         Two-level dict with same structure as input, with commands
@@ -52,54 +129,93 @@ def collect_sysinfo(
     if not sys_spec_commands:
         return {}
 
-    # Import here to avoid circular dependency
-    from src.core.execution.command_composer import CommandComposer
+    if max_workers is None:
+        max_workers = int(Settings().get("data.sys_spec_workers", 8))
+    if time_budget is None:
+        time_budget = float(Settings().get("data.sys_spec_time_budget", 20.0))
+    if batch is None:
+        batch = bool(Settings().get("data.sys_spec_batch", True))
+    deadline = time.monotonic() + time_budget
+    host_cache = get_host_cache() if cache is not False else None
+    fresh: Dict[SpecKey, str] = {}  # Newly computed values, for the cache
+    cache_keys: Dict[SpecKey, str] = {}
 
     result: dict[str, dict[str, str]] = {}
+    shell_jobs: List[Tuple[SpecKey, str]] = []
+    wrapped: List[Tuple[SpecKey, str, str]] = []  # (key, raw command, composed command)
 
     for group, commands in sys_spec_commands.items():
         result[group] = {}
         for key, command in commands.items():
+            result[group][key] = ""
             try:
-                if backend_options and backend_names:
-                    # Treat sys spec command like a regular command
-                    # entry_point becomes the sys spec command, args is empty
-                    temp_spec = {"entry_point": command, "args": "", "task": ""}
-                    temp_composer = CommandComposer(backend_options, temp_spec)
-
-                    # Use compose() with template_key="run_sys_spec" to use run_sys_spec template
-                    composed = temp_composer.compose(backend_names, copies=1, template_key="run_sys_spec")
-                    if not composed:
-                        result[group][key] = ""
-                        continue
-                    full_cmd = composed[0]
-                else:
-                    # Run directly without backend wrapping
-                    full_cmd = command
-
-                # Execute command and capture output
-                output = subprocess.run(
-                    full_cmd,
-                    capture_output=True,
-                    text=True,
-                    shell=True,
-                    timeout=10  # Prevent hanging
-                ).stdout.strip()
-
-                # Decode unicode escapes if present
+                full_cmd = _compose(command, backend_options, backend_names)
+            except Exception:
+                continue
+            if not full_cmd:
+                continue
+
+            is_wrapped = full_cmd.strip() != command.strip()
+            if host_cache is not None:
+                cache_key = _spec_cache_key(group, key, command, backend_options,
+                                            backend_names if is_wrapped else None)
+                cached = host_cache.get(cache_key, ttl=_spec_ttl(group, key, is_wrapped))
+                if cached is not None:
+                    result[group][key] = cached
+                    continue
+                cache_keys[(group, key)] = cache_key
+
+            if is_wrapped:
+                wrapped.append(((group, key), command, full_cmd))
+                continue
+
+            # Local commands may not need a shell at all
+            probe = native_probe(command)
+            output = None
+            if probe is not None:
                 try:
-                    output = output.encode().decode('unicode_escape')
-                except (UnicodeDecodeError, UnicodeEncodeError):
-                    pass  # Keep original if decoding fails
+                    output = probe()
+                except Exception:
+                    output = None
+            if output is None:
+                shell_jobs.append(((group, key), full_cmd))
+            else:
+                result[group][key] = fresh[(group, key)] = _clean(output)
 
-                result[group][key] = output
+    marker = f"@@SHARP_SPEC_{uuid.uuid4().hex}@@"
+    batch_cmd = ""
+    if batch and len(wrapped) > 1:
+        try:
+            batch_cmd = _compose(batch_command([cmd for _, cmd, _ in wrapped], marker),
+                                 backend_options, backend_names)
+        except Exception:
+            batch_cmd = ""
+    if batch_cmd:
+        shell_jobs.append((_BATCH_KEY, batch_cmd))
+    else:
+        shell_jobs.extend((spec, full_cmd) for spec, _, full_cmd in wrapped)
 
-            except subprocess.TimeoutExpired:
-                # Command took too long
-                result[group][key] = ""
-            except Exception:
-                # Any other error (command not found, etc.)
-                result[group][key] = ""
+    outputs = _run_jobs(shell_jobs, deadline, max_workers)
+
+    if batch_cmd:
+        sections = split_batch_output(outputs.pop(_BATCH_KEY, ""), marker)
+        if sections is None:
+            # Batch could not run on the target: one invocation per spec
+            outputs.update(_run_jobs([(spec, full_cmd) for spec, _, full_cmd in wrapped],
+                                     deadline, max_workers))
+        else:
+            for index, (spec, _, _) in enumerate(wrapped):
+                if index in sections:
+                    outputs[spec] = sections[index]
+
+    for (group, key), output in outputs.items():
+        result[group][key] = fresh[(group, key)] = _clean(output)
+
+    if host_cache is not None and fresh:
+        for spec, value in fresh.items():
+            if spec in cache_keys:
+                host_cache.put(cache_keys[spec], value)
+        host_cache.save()
 
     # Post-process: Replace groups with all empty/"NA" values with empty dict
     for group in list(result.keys()):
@@ -108,3 +224,271 @@ def collect_sysinfo(
             result[group] = {}
 
     return result
+
+
+def native_probe(command: str) -> Probe | None:
+    """
+    Recognize a sys spec command that can be evaluated without a shell.
+
+    Supported forms (paths under /proc or /sys only):
+    - cat PATH [2>/dev/null || echo "NA"]
+    - cat PATH | cut -dD -fN
+    - awk "[/RE/ ]{print \\$N}" PATH
+    - grep "LITERAL" PATH | head -1 | cut -dD -fN | xargs
+    - nproc, uname -m, uname -r, hostname
+
+    Args:
+        command: Shell command from sys_spec_commands
+
+    Returns:
+        Callable returning the command's stdout (or None when the output
+        cannot be reproduced exactly, to fall back to the shell), or None
+        if the command is not recognized
+    """
+    command = command.strip()
+    if command in _SYSCALL_PROBES:
+        return _SYSCALL_PROBES[command]
+
+    match = _CAT.match(command)
+    if match:
+        path, fallback = match["path"], "NA\n" if match["na"] else ""
+        return lambda: _read(path, fallback)
+
+    match = _CAT_CUT.match(command)
+    if match:
+        path, delim, field = match["path"], match["delim"], int(match["field"])
+        return lambda: "".join(f"{_cut(line, delim, field)}\n" for line in _read_lines(path))
+
+    match = _AWK.match(command)
+    if match:
+        regex = re.compile(match["regex"]) if match["regex"] else None
+        path, field = match["path"], int(match["field"])
+        return lambda: "".join(f"{_awk_field(line, field)}\n" for line in _read_lines(path)
+                               if regex is None or regex.search(line))
+
+    match = _GREP_FIELD.match(command)
+    if match:
+        literal, path = match["literal"], match["path"]
+        delim, field = match["delim"], int(match["field"])
+        return lambda: _grep_field(path, literal, delim, field)
+
+    return None
+
+
+# ========== Native probe helpers ==========
+
+def _nproc() -> str | None:
+    """Processors available to this process, as nproc reports them."""
+    if "OMP_NUM_THREADS" in os.environ or "OMP_THREAD_LIMIT" in os.environ:
+        return None  # nproc honors these; leave it to the real command
+    if not hasattr(os, "sched_getaffinity"):
+        return None
+    return f"{len(os.sched_getaffinity(0))}\n"
+
+
+_SYSCALL_PROBES: Dict[str, Probe] = {
+    "nproc": _nproc,
+    "uname -m": lambda: f"{os.uname().machine}\n",
+    "uname -r": lambda: f"{os.uname().release}\n",
+    "hostname": lambda: f"{os.uname().nodename}\n",
+}
+
+
+def _read(path: str, fallback: str) -> str:
+    """Read a whole file, returning `fallback` if it cannot be read."""
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return f.read()
+    except OSError:
+        return fallback
+
+
+def _read_lines(path: str) -> List[str]:
+    """Lines of a file without terminators (empty if unreadable)."""
+    return _read(path, "").splitlines()
+
+
+def _cut(line: str, delim: str, field: int) -> str:
+    """cut -dD -fN of one line (lines without the delimiter pass through)."""
+    if delim not in line:
+        return line
+    fields = line.split(delim)
+    return fields[field - 1] if field <= len(fields) else ""
+
+
+def _awk_field(line: str, field: int) -> str:
+    """awk's $N with default field splitting."""
+    fields = line.split()
+    return fields[field - 1] if 0 < field <= len(fields) else ""
+
+
+def _grep_field(path: str, literal: str, delim: str, field: int) -> str | None:
+    """First line containing `literal`, cut to one field, whitespace-normalized by xargs."""
+    line = next((line for line in _read_lines(path) if literal in line), None)
+    if line is None:
+        return "\n"  # xargs runs echo once on empty input
+    value = _cut(line, delim, field)
+    if any(c in value for c in "'\"\\"):
+        return None  # xargs interprets quotes and backslashes
+    return " ".join(value.split()) + "\n"
+
+
+# ========== Caching ==========
+
+def _spec_cache_key(group: str, key: str, command: str, backend_options: dict[str, Any] | None,
+                    backend_names: list[str] | None) -> str:
+    """Host cache key of a spec: its name, command and (if wrapped) the backend chain."""
+    target = "local"
+    if backend_names:
+        chain = [[name, (backend_options or {}).get(name)] for name in backend_names]
+        target = hashlib.sha256(json.dumps(chain, sort_keys=True, default=str).encode()).hexdigest()[:16]
+    digest = hashlib.sha256(command.encode()).hexdigest()[:16]
+    return f"spec:{target}:{group}.{key}:{digest}"
+
+
+def _spec_ttl(group: str, key: str, wrapped: bool) -> float | None:
+    """Seconds a cached spec value stays valid (None for the whole boot)."""
+    settings = Settings()
+    static = settings.get("host_cache.static_specs", []) or []
+    if any(fnmatch.fnmatchcase(f"{group}.{key}", pattern) for pattern in static):
+        return float(settings.get("host_cache.remote_static_ttl", 3600)) if wrapped else None
+    return float(settings.get("host_cache.volatile_ttl", 5))
+
+
+# ========== Batched execution ==========
+
+def batch_command(commands: List[str], marker: str) -> str:
+    """
+    Combine sys spec commands into one shell command for a single invocation.
+
+    The script prints `marker` and the command index before each command's
+    output and `marker end` after the last one. Each command runs in a
+    subshell with stdin closed and stderr discarded. The script travels
+    base64-encoded, so the resulting command has no single quotes, dollar
+    signs or backslashes for backend templates to re-interpret; it works
+    both when a template passes it to a remote shell (ssh) and when it
+    becomes an argv (docker run, kubectl exec).
+
+    Args:
+        commands: Shell commands, in order
+        marker: Separator string that must not appear in command output
+
+    Returns:
+        Shell command that runs all commands and prints delimited output
+    """
+    lines = []
+    for index, command in enumerate(commands):
+        lines.append(f"printf '\\n%s %s\\n' '{marker}' {index}")
+        lines.append(f"(\n{command}\n) </dev/null 2>/dev/null")
+    lines.append(f"printf '\\n%s end\\n' '{marker}'")
+    script = "\n".join(lines) + "\n"
+    encoded = base64.b64encode(script.encode()).decode("ascii")
+    return f'sh -c "echo {encoded} | base64 -d | sh"'
+
+
+def split_batch_output(output: str, marker: str) -> Dict[int, str] | None:
+    """
+    Demultiplex the output of a batch_command() invocation.
+
+    Args:
+        output: Captured stdout (possibly truncated by the time budget)
+        marker: Marker passed to batch_command()
+
+    Returns:
+        Dict mapping command index to its output, for commands that
+        completed, or None if no marker was found (the batch did not run)
+    """
+    parts = re.split(rf"\n?{re.escape(marker)} (\d+|end)\n", output)
+    if len(parts) == 1:
+        return None
+    labels, texts = parts[1::2], parts[2::2]
+    sections: Dict[int, str] = {}
+    for position, (label, text) in enumerate(zip(labels, texts)):
+        # A section is complete once the next marker was printed
+        if label != "end" and position + 1 < len(labels):
+            sections[int(label)] = text
+    return sections
+
+
+# ========== Shell execution ==========
+
+def _run_jobs(jobs: List[Tuple[SpecKey, str]], deadline: float,
+              max_workers: int) -> Dict[SpecKey, str]:
+    """
+    Run shell commands concurrently until the deadline.
+
+    Returns:
+        Output of each command that finished; failed or unfinished
+        commands are missing
+    """
+    if not jobs:
+        return {}
+    outputs: Dict[SpecKey, str] = {}
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs))))
+    futures = {executor.submit(_run_shell, cmd, deadline, spec == _BATCH_KEY): spec
+               for spec, cmd in jobs}
+    # Commands are killed at the deadline; the margin covers reaping them
+    done, _ = wait(futures, timeout=max(0.0, deadline - time.monotonic()) + 1.0)
+    executor.shutdown(wait=False, cancel_futures=True)
+    for future in done:
+        try:
+            outputs[futures[future]] = future.result()
+        except Exception:
+            pass  # Any error (command not found, etc.) leaves an empty string
+    return outputs
+
+
+def _compose(command: str, backend_options: dict[str, Any] | None,
+             backend_names: list[str] | None) -> str:
+    """Wrap a sys spec command in the backend chain (empty if it cannot be composed)."""
+    if not (backend_options and backend_names):
+        # Run directly without backend wrapping
+        return command
+
+    # Import here to avoid circular dependency
+    from src.core.execution.command_composer import CommandComposer
+
+    # Treat sys spec command like a regular command
+    # entry_point becomes the sys spec command, args is empty
+    temp_spec = {"entry_point": command, "args": "", "task": ""}
+    temp_composer = CommandComposer(backend_options, temp_spec)
+
+    # Use compose() with template_key="run_sys_spec" to use run_sys_spec template
+    composed = temp_composer.compose(backend_names, copies=1, template_key="run_sys_spec")
+    return composed[0] if composed else ""
+
+
+def _run_shell(command: str, deadline: float, partial: bool = False) -> str:
+    """
+    Run one shell command, killing its whole process group at the deadline.
+
+    Commands run in their own session with stdin closed, so stray
+    grandchildren holding the output pipe are killed too and concurrent
+    probes cannot compete for the terminal. A killed command returns ""
+    or, with `partial`, whatever it printed before the deadline.
+    """
+    timeout = deadline - time.monotonic()
+    if timeout <= 0:
+        return ""
+    proc = subprocess.Popen(command, shell=True, text=True, start_new_session=True,
+                            stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL)
+    try:
+        output, _ = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except OSError:
+            pass
+        output, _ = proc.communicate()
+        return output if partial else ""
+    return output
+
+
+def _clean(output: str) -> str:
+    """Strip output and decode unicode escapes if present."""
+    output = output.strip()
+    try:
+        return output.encode().decode('unicode_escape')
+    except (UnicodeDecodeError, UnicodeEncodeError):
+        return output  # Keep original if decoding fails
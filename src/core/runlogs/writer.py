@@ -5,24 +5,38 @@ Records experiment metadata and run results to:
 - CSV file: columnar data (shared metadata + per-run metrics)
 - Markdown file: human-readable metadata, field descriptions, system specs
 
+Rows can either be buffered and written at the end (save_csv), or streamed
+to the CSV as they are produced (start_streaming/flush_rows), so a crashed
+or killed run still leaves a valid partial CSV behind.
+
+All writes hold an exclusive lock on a hidden per-task lock file, so several
+loggers (e.g. concurrent sweep configurations) can append to the same CSV
+and Markdown files without interleaving rows or losing invariants.
+
 © Copyright 2022--2025 Hewlett Packard Enterprise Development LP
 """
 
 import csv
+import fcntl
 import hashlib
 import json
 import os
 import platform
 import re
+import sqlite3
 import subprocess
 import time
 import tomllib
 import uuid
+import warnings
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, ContextManager, Dict, Iterator, List, Union
 from src.core.config.include_resolver import get_project_root
 from src.core.config.settings import Settings
+from .hostcache import file_signature, get_host_cache
+from .index import RunlogIndex
 
 
 def compute_executable_checksum(entry_point: str) -> tuple[str, str]:
@@ -80,6 +94,119 @@ def compute_executable_checksum(entry_point: str) -> tuple[str, str]:
     return ("unavailable", f"file not found: {entry_point}")
 
 
+def cached_executable_checksum(entry_point: str) -> tuple[str, str]:
+    """
+    compute_executable_checksum() with results kept in the host cache.
+
+    File checksums are reused for as long as the file's device, inode,
+    mtime and size are unchanged (within one boot). Docker digests and
+    failures are not cached.
+
+    Args:
+        entry_point: Path to executable, script, or container reference
+
+    Returns:
+        Tuple of (checksum_type, checksum_value), as compute_executable_checksum()
+    """
+    cache = get_host_cache()
+    signature = file_signature(entry_point) if cache is not None else None
+    if cache is None or signature is None:
+        return compute_executable_checksum(entry_point)
+
+    key = f"checksum:{Path(entry_point).resolve()}"
+    cached = cache.get(key, signature)
+    if cached is not None:
+        return (cached[0], cached[1])
+    checksum_type, checksum_value = compute_executable_checksum(entry_point)
+    if checksum_type == "sha256":
+        cache.put(key, [checksum_type, checksum_value], signature)
+        cache.save()
+    return (checksum_type, checksum_value)
+
+
+def _sharp_version() -> str:
+    """SHARP version from pyproject.toml (cached by file signature)."""
+    try:
+        # Find project root (assuming writer.py is in src/core/runlogs/)
+        pyproject_path = get_project_root() / "pyproject.toml"
+        signature = file_signature(pyproject_path)
+        if signature is None:
+            return "unknown"
+        cache = get_host_cache()
+        key = f"sharp_version:{pyproject_path}"
+        if cache is not None:
+            cached = cache.get(key, signature)
+            if cached is not None:
+                return str(cached)
+        with open(pyproject_path, "rb") as f:
+            pyproject_data = tomllib.load(f)
+            version = str(pyproject_data.get("project", {}).get("version", "unknown"))
+        if cache is not None:
+            cache.put(key, version, signature)
+            cache.save()
+        return version
+    except Exception:
+        return "unknown"  # Use "unknown" if can't read version
+
+
+def _git_signature(cwd: Path) -> List[Any] | None:
+    """
+    Signature of the git HEAD visible from cwd, changing on checkout and commit.
+
+    Returns None (do not cache) when no plain .git directory is found,
+    e.g. for worktrees and submodules where .git is a file.
+    """
+    for directory in (cwd, *cwd.parents):
+        git_dir = directory / ".git"
+        if not git_dir.exists():
+            continue
+        if not git_dir.is_dir():
+            return None
+        signature: List[Any] = [str(git_dir)]
+        try:
+            head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        signature.append(head)
+        refs = [git_dir / "packed-refs"]
+        if head.startswith("ref: "):
+            refs.append(git_dir / head[5:])
+        for ref in refs:
+            signature.append(file_signature(ref))
+        return signature
+    return None
+
+
+def _git_hash() -> str:
+    """Short git hash of the working directory's HEAD (cached by HEAD signature)."""
+    cache = get_host_cache()
+    cwd = Path.cwd()
+    signature = _git_signature(cwd) if cache is not None else None
+    key = f"git_hash:{cwd}"
+    if cache is not None and signature is not None:
+        cached = cache.get(key, signature)
+        if cached is not None:
+            return str(cached)
+
+    git_hash = ""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        if result.returncode == 0:
+            git_hash = result.stdout.strip()
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return ""  # git not available or timed out
+
+    if cache is not None and signature is not None:
+        cache.put(key, git_hash, signature)
+        cache.save()
+    return git_hash
+
+
 class RunLogger:
     """Records experiment data to CSV and Markdown files."""
 
@@ -99,10 +226,20 @@ class RunLogger:
             ValueError: If topdir does not exist or cannot create experiment directory
         """
         self.clear_rows()
+        # Streaming state (see start_streaming)
+        self._streaming: bool = False
+        self._stream: Any = None
+        self._stream_writer: csv.DictWriter[str] | None = None
+        self._stream_mode: str = "w"
+        self._fieldnames: List[str] = []
+        self._flushed_rows: int = 0
+        self._last_fsync: float = 0.0
+        self._fsync_interval: float = 1.0
         self._constants: Dict[str, Dict[str, Any]] = {}
         self._metadata: Dict[str, Dict[str, str]] = {}
         self._sweep_invariants: Dict[str, Any] = {}  # Sweep parameter invariants
         self._task: str = task
+        self._topdir: Path = Path(topdir)
         self._start_time: float = time.perf_counter()
         self._launch_id: str = launch_id if launch_id else uuid.uuid4().hex[:8]
 
@@ -111,7 +248,7 @@ class RunLogger:
         exp_dir.mkdir(parents=True, exist_ok=True)
 
         # Base filename (without extension)
-        self._base_path: str = str(exp_dir / task.split("/")[-1])
+        self._base_path: str = self.output_base(topdir, experiment, task)
 
         if options.get("verbose", False):
             print(f"Logging runs to: {self._base_path} starting at {self._start_time}")
@@ -121,6 +258,31 @@ class RunLogger:
         # Cache output precision from settings to avoid repeated lookups
         self._precision = Settings().get("sharp.output_precision", 4)
 
+    @staticmethod
+    def output_base(topdir: str, experiment: str, task: str) -> str:
+        """
+        Output path of a task's CSV/Markdown files, without extension.
+
+        Args:
+            topdir: Top-level directory for all logs
+            experiment: Experiment subdirectory name
+            task: Task name (only its last path component is used)
+
+        Returns:
+            Base path, e.g. 'runlogs/matmul_perf/matmul'
+        """
+        return str(Path(topdir) / experiment / task.split("/")[-1])
+
+    @property
+    def base_path(self) -> str:
+        """Output path of this logger's CSV/Markdown files, without extension."""
+        return self._base_path
+
+    @property
+    def launch_id(self) -> str:
+        """Launch identifier written to every row and keying the invariants."""
+        return self._launch_id
+
     def _truncate_values(self, row: dict[str, Any]) -> dict[str, Any]:
         """
         Truncate all float-like values in the row to output_precision decimal places.
@@ -155,37 +317,15 @@ class RunLogger:
         Returns:
             Preamble text for markdown file
         """
-        # Try to get SHARP version from pyproject.toml
-        version = "unknown"
-        try:
-            # Find project root (assuming writer.py is in src/core/runlogs/)
-            pyproject_path = get_project_root() / "pyproject.toml"
-            if pyproject_path.exists():
-                with open(pyproject_path, "rb") as f:
-                    pyproject_data = tomllib.load(f)
-                    version = pyproject_data.get("project", {}).get("version", "unknown")
-        except Exception:
-            pass  # Use "unknown" if can't read version
-
-        # Try to get git hash for reproducibility
-        git_hash = ""
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--short", "HEAD"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                git_hash = result.stdout.strip()
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass  # git not available or timed out
+        # SHARP version and git hash for reproducibility (cached per host)
+        version = _sharp_version()
+        git_hash = _git_hash()
 
         # Compute executable checksum for reproducibility
         entry_point = options.get("entry_point", "")
         checksum_type, checksum_value = "", ""
         if entry_point:
-            checksum_type, checksum_value = compute_executable_checksum(entry_point)
+            checksum_type, checksum_value = cached_executable_checksum(entry_point)
             checksum_value = checksum_value[1:10] + "..." if len(checksum_value) > 12 else checksum_value
 
         now = datetime.now(timezone.utc)
@@ -213,8 +353,9 @@ class RunLogger:
         # - sys_spec_commands: shown in System configuration section
         # - sweep_params: shown as invariants per launch_id
         # - launch_id: shown in CSV and invariants sections
+        # - cpu_set: shown as invariant per launch_id (assigned by parallel sweeps)
         options_filtered = {k: v for k, v in options.items()
-                           if k not in ("sys_spec_commands", "sweep_params", "launch_id")}
+                           if k not in ("sys_spec_commands", "sweep_params", "launch_id", "cpu_set")}
         preamble += json.dumps(options_filtered, indent=2)
         preamble += "\n```"
 
@@ -300,6 +441,10 @@ class RunLogger:
         if len(self._rows) > 1:
             assert field in self._rows[-2], \
                 f"Can't add new field '{field}' that isn't in previous row (inconsistent row structure)"
+        # Once rows have been streamed, the CSV header is the reference structure
+        elif self._fieldnames:
+            assert field in self._fieldnames, \
+                f"Can't add new field '{field}' that isn't in the CSV header (inconsistent row structure)"
 
         # Create new row if this field already exists in current row
         if len(self._rows) == 0 or field in self._rows[-1]:
@@ -307,10 +452,116 @@ class RunLogger:
 
         self._rows[-1][field] = value
 
+    @property
+    def row_count(self) -> int:
+        """Total number of rows logged, including rows already streamed to disk."""
+        return self._flushed_rows + len(self._rows)
+
+    def start_streaming(self, mode: str = "w", fsync_interval: float | None = None) -> None:
+        """
+        Stream rows to the CSV file as they are produced.
+
+        After this call, flush_rows() appends all buffered rows to the CSV and
+        releases them from memory; the file is opened (and truncated in "w"
+        mode) on the first flush. save_csv() then only writes what is left
+        and closes the file.
+
+        Args:
+            mode: File write mode - "w" (truncate) or "a" (append)
+            fsync_interval: Minimum seconds between fsync calls (default from
+                settings data.csv_fsync_interval; 0 syncs on every flush)
+        """
+        self._stream_mode = mode
+        if fsync_interval is None:
+            fsync_interval = Settings().get("data.csv_fsync_interval", 1.0)
+        self._fsync_interval = float(fsync_interval)
+        self._stream = None
+        self._stream_writer = None
+        self._streaming = True
+
+    @property
+    def streaming(self) -> bool:
+        """Whether rows are streamed to disk (see start_streaming)."""
+        return self._streaming
+
+    def flush_rows(self) -> None:
+        """
+        Append all buffered rows to the CSV and release them from memory.
+
+        Rows are flushed to the OS on every call, and fsync'ed at most once
+        per fsync interval. Does nothing unless streaming.
+
+        Raises:
+            AssertionError: If a row's fields don't match the CSV header
+            IOError: If cannot write to CSV file
+        """
+        if not self.streaming or not self._rows:
+            return
+
+        with self._output_lock():
+            if self._stream_writer is None:
+                self._open_stream()
+
+            assert self._stream_writer is not None
+            for r in self._rows:
+                assert list(r.keys()) == self._fieldnames[1:], \
+                    f"Row fields {list(r.keys())} don't match CSV header {self._fieldnames[1:]} (inconsistent row structure)"
+                self._stream_writer.writerow(self._truncate_values({"launch_id": self._launch_id, **r}))
+
+            self._flushed_rows += len(self._rows)
+            self._rows = []
+            self._stream.flush()
+
+        now = time.monotonic()
+        if now - self._last_fsync >= self._fsync_interval:
+            os.fsync(self._stream.fileno())
+            self._last_fsync = now
+
+    def close_stream(self) -> None:
+        """Flush pending rows, fsync, and close the streamed CSV file (if open)."""
+        if not self.streaming:
+            return
+        try:
+            self.flush_rows()
+        finally:
+            if self._stream is not None:
+                self._stream.flush()
+                os.fsync(self._stream.fileno())
+                self._stream.close()
+            self._stream = None
+            self._stream_writer = None
+            self._streaming = False
+
+    def _open_stream(self) -> None:
+        """Open the CSV for streaming, writing or validating its header."""
+        self._fieldnames = ["launch_id"] + list(self._rows[0].keys())
+        csv_path = self.get_csv_path()
+
+        if self._stream_mode == "a" and os.path.exists(csv_path) and os.path.getsize(csv_path) > 0:
+            with open(csv_path, "r", encoding="utf-8", newline="") as f:
+                existing = next(csv.reader(f), [])
+            if existing != self._fieldnames:
+                warnings.warn(
+                    f"Appending to {csv_path} with columns {self._fieldnames}, "
+                    f"but its header is {existing}"
+                )
+            write_header = False
+        else:
+            write_header = True
+
+        self._stream = open(csv_path, self._stream_mode, encoding="utf-8", newline="")
+        self._stream_writer = csv.DictWriter(self._stream, fieldnames=self._fieldnames)
+        if write_header:
+            self._stream_writer.writeheader()
+        self._last_fsync = time.monotonic()
+
     def save_csv(self, mode: str = "w") -> None:
         """
         Write all rows to CSV file.
 
+        When streaming, writes only the rows not yet flushed and closes the
+        file (mode was already given to start_streaming).
+
         Args:
             mode: File write mode - "w" (truncate) or "a" (append)
 
@@ -318,7 +569,11 @@ class RunLogger:
             AssertionError: If no rows to save
             IOError: If cannot write to CSV file
         """
-        assert len(self._rows) > 0, "No row data to save"
+        assert self.row_count > 0, "No row data to save"
+
+        if self.streaming:
+            self.close_stream()
+            return
 
         # Add launch_id to every row
         records = [{"launch_id": self._launch_id, **r} for r in self._rows]
@@ -329,7 +584,7 @@ class RunLogger:
 
         csv_path = f"{self._base_path}.csv"
 
-        with open(csv_path, mode, encoding="utf-8", newline="") as f:
+        with self._output_lock(), open(csv_path, mode, encoding="utf-8", newline="") as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
 
             # Write header if truncating or file is empty
@@ -352,20 +607,73 @@ class RunLogger:
         """
         md_path = Path(f"{self._base_path}.md")
 
-        invariants = {}
-        if mode == "a" and md_path.exists():
-            invariants = self._load_existing_invariants(md_path)
+        with self._output_lock():
+            invariants = {}
+            if mode == "a" and md_path.exists():
+                invariants = self._load_existing_invariants(md_path)
 
-        invariants = self._merge_invariants(invariants)
+            invariants = self._merge_invariants(invariants)
 
-        if mode == "a" and md_path.exists():
-            self._update_existing_markdown(md_path, invariants, sys_specs)
-            return
+            if mode == "a" and md_path.exists():
+                self._update_existing_markdown(md_path, invariants, sys_specs)
+            else:
+                now = datetime.now(timezone.utc)
+                elapsed = int(time.perf_counter() - self._start_time)
+                row_count = self.row_count
+                self._write_new_markdown(md_path, invariants, sys_specs, now, elapsed, row_count)
+        self._update_index(md_path)
+
+    @staticmethod
+    def save_md_section(base_path: str, title: str, body: str) -> None:
+        """
+        Add a section to the end of a task's Markdown file, replacing one with the same title.
 
-        now = datetime.now(timezone.utc)
-        elapsed = int(time.perf_counter() - self._start_time)
-        row_count = len(self._rows)
-        self._write_new_markdown(md_path, invariants, sys_specs, now, elapsed, row_count)
+        Later saves in append mode only replace the invariants block, so the
+        section survives further launches into the same file.
+
+        Args:
+            base_path: Output path of the task's files, without extension (see output_base)
+            title: Section heading (without the leading '## ')
+            body: Section content (Markdown)
+
+        Raises:
+            IOError: If the markdown file cannot be read or written
+        """
+        md_path = Path(f"{base_path}.md")
+        section = f"## {title}\n\n{body.strip()}\n"
+        with RunLogger._locked(base_path):
+            content = md_path.read_text(encoding="utf-8")
+            pattern = rf"^## {re.escape(title)}\n.*?(?=^## |\Z)"
+            if re.search(pattern, content, flags=re.DOTALL | re.MULTILINE):
+                content = re.sub(pattern, lambda _: section + "\n", content, flags=re.DOTALL | re.MULTILINE)
+                content = content.rstrip() + "\n"
+            else:
+                content = content.rstrip() + "\n\n" + section
+            md_path.write_text(content, encoding="utf-8")
+
+    @staticmethod
+    @contextmanager
+    def _locked(base_path: str) -> Iterator[None]:
+        """Hold an exclusive lock on a task's CSV and Markdown files."""
+        base = Path(base_path)
+        with open(base.with_name(f".{base.name}.lock"), "a", encoding="utf-8") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _output_lock(self) -> ContextManager[None]:
+        """Hold an exclusive lock on this task's CSV and Markdown files."""
+        return self._locked(self._base_path)
+
+    def _update_index(self, md_path: Path) -> None:
+        """Record the written markdown in the runlogs index (best effort)."""
+        try:
+            with RunlogIndex(self._topdir) as index:
+                index.update(md_path)
+        except (sqlite3.Error, OSError):
+            pass  # The index is a cache; the next scan picks the file up
 
     def _load_existing_invariants(self, md_path: Path) -> Dict[str, Any]:
         """Extract invariant parameters JSON block from existing markdown file."""
@@ -25,6 +25,7 @@ from .narrative import (
 )
 from .jenks_breaks import (
     jenks_breaks,
+    jenks_breaks_all,
     goodness_of_variance_fit,
     optimal_jenks_classes
 )
@@ -47,6 +48,7 @@ __all__ = [
     'report_test',
     # Clustering
     'jenks_breaks',
+    'jenks_breaks_all',
     'goodness_of_variance_fit',
     'optimal_jenks_classes',
 ]
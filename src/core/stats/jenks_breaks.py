@@ -8,7 +8,7 @@ for identifying natural groupings in performance data.
 """
 
 import numpy as np
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 
 def jenks_breaks(data: np.ndarray, n_classes: int) -> List[float]:
@@ -34,67 +34,153 @@ def jenks_breaks(data: np.ndarray, n_classes: int) -> List[float]:
         >>> breaks = jenks_breaks(data, 3)
         >>> # Returns breaks that separate [1,2,3], [10,11,12], [50,51,52]
     """
-    # Clean and sort data
-    data_clean = data[~np.isnan(data)]
-    data_sorted = np.sort(data_clean)
-    n = len(data_sorted)
-
     if n_classes < 2:
         raise ValueError("n_classes must be at least 2")
 
-    unique_vals = np.unique(data_sorted)
-    if len(unique_vals) < n_classes:
+    data_sorted = np.sort(data[~np.isnan(data)])
+    n_unique = len(np.unique(data_sorted))
+    if n_unique < n_classes:
         raise ValueError(
-            f"Cannot create {n_classes} classes with only {len(unique_vals)} unique values"
+            f"Cannot create {n_classes} classes with only {n_unique} unique values"
         )
+    return _breaks_for_classes(data_sorted, [n_classes])[n_classes]
+
+
+def jenks_breaks_all(data: np.ndarray, max_classes: int) -> Dict[int, List[float]]:
+    """
+    Calculate Jenks natural breaks for every number of classes up to max_classes.
+
+    The dynamic program for k classes computes the optimal partitions for all
+    smaller class counts along the way, so this is as cheap as a single
+    jenks_breaks(data, max_classes) call.
+
+    Args:
+        data: 1D array of numeric values
+        max_classes: Largest number of classes to compute
+
+    Returns:
+        Dict mapping each n_classes in 2..max_classes to its break points, as
+        jenks_breaks(data, n_classes) would return them. Class counts that
+        exceed the number of unique values are omitted.
+
+    Raises:
+        ValueError: If max_classes < 2
+    """
+    if max_classes < 2:
+        raise ValueError("max_classes must be at least 2")
+
+    data_sorted = np.sort(data[~np.isnan(data)])
+    n_unique = len(np.unique(data_sorted))
+    return _breaks_for_classes(data_sorted, list(range(2, min(max_classes, n_unique) + 1)))
+
+
+def _breaks_for_classes(data_sorted: np.ndarray, class_counts: List[int]) -> Dict[int, List[float]]:
+    """Compute break points for each requested class count on sorted data."""
+    n = len(data_sorted)
+    result: Dict[int, List[float]] = {}
 
     # For small datasets, use simple quantile-based approach
-    if n < n_classes * 2:
-        percentiles = [100 * (i + 1) / n_classes for i in range(n_classes - 1)]
-        result: List[float] = np.percentile(data_sorted, percentiles).tolist()
+    for n_classes in class_counts:
+        if n < n_classes * 2:
+            percentiles = [100 * (i + 1) / n_classes for i in range(n_classes - 1)]
+            result[n_classes] = np.percentile(data_sorted, percentiles).tolist()
+
+    remaining = [k for k in class_counts if k not in result]
+    if not remaining:
         return result
 
-    # Fisher-Jenks algorithm using dynamic programming
-    # Based on the algorithm described in:
-    # Fisher, W. D. (1958). On grouping for maximum homogeneity.
-
-    # Create matrices for sum of squared deviations (SSD) and class limits
-    # mat1[i][j] = minimum SSD for values 0..i classified into j classes
-    # mat2[i][j] = lower class limit for optimal classification
-
-    mat1 = np.full((n, n_classes), np.inf)
-    mat2 = np.zeros((n, n_classes), dtype=int)
-
-    # Initialize: one class for first i values
-    for i in range(n):
-        mat1[i, 0] = _ssd(data_sorted[:i + 1])
-        mat2[i, 0] = 0
-
-    # Fill matrices using dynamic programming
-    for j in range(1, n_classes):
-        for i in range(j, n):
-            for k in range(j - 1, i):
-                # SSD if we put values k+1..i in class j
-                ssd_k = _ssd(data_sorted[k + 1:i + 1])
-                cost = mat1[k, j - 1] + ssd_k
-
-                if cost < mat1[i, j]:
-                    mat1[i, j] = cost
-                    mat2[i, j] = k + 1
-
-    # Backtrack to find break points
-    breaks: List[float] = []
-    k = n
-    for j in range(n_classes - 1, 0, -1):
-        break_idx = mat2[k - 1, j]
-        # Break point is between data_sorted[break_idx-1] and data_sorted[break_idx]
-        if break_idx > 0 and break_idx < n:
-            # Use midpoint between adjacent values as the break
-            break_val = (data_sorted[break_idx - 1] + data_sorted[break_idx]) / 2
-            breaks.insert(0, break_val)
-        k = break_idx
-
-    return breaks
+    starts = _fisher_jenks(data_sorted, max(remaining))
+    for n_classes in remaining:
+        # Backtrack to find break points
+        breaks: List[float] = []
+        end = n
+        for j in range(n_classes, 1, -1):
+            break_idx = int(starts[j, end])
+            # Break point is between data_sorted[break_idx-1] and data_sorted[break_idx]
+            if 0 < break_idx < n:
+                # Use midpoint between adjacent values as the break
+                breaks.insert(0, float((data_sorted[break_idx - 1] + data_sorted[break_idx]) / 2))
+            end = break_idx
+        result[n_classes] = breaks
+    return result
+
+
+def _fisher_jenks(data_sorted: np.ndarray, max_classes: int) -> np.ndarray:
+    """
+    Solve the Fisher-Jenks dynamic program for 1..max_classes classes.
+
+    Based on the algorithm described in:
+    Fisher, W. D. (1958). On grouping for maximum homogeneity.
+
+    cost[j][m] is the minimum within-class sum of squared deviations (SSD) of
+    the first m values split into j classes, where the last class starts at
+    starts[j][m]:
+
+        cost[j][m] = min over s of cost[j-1][s] + SSD(values[s:m])
+
+    SSD of any range is O(1) from prefix sums. Because SSD satisfies the
+    quadrangle inequality, the smallest optimal start is non-decreasing in m,
+    so each layer is solved by divide and conquer in O(n log n). All
+    sub-problems of one recursion depth are evaluated together with NumPy.
+
+    Args:
+        data_sorted: Sorted values without NaNs
+        max_classes: Largest number of classes
+
+    Returns:
+        Integer array starts[j, m] (j = 1..max_classes, m = 0..n); ties are
+        resolved towards the smallest start, as in the textbook recurrence
+    """
+    n = len(data_sorted)
+    # Center values so prefix sums of squares keep their precision
+    centered = data_sorted - data_sorted.mean()
+    sum1 = np.concatenate(([0.0], np.cumsum(centered)))
+    sum2 = np.concatenate(([0.0], np.cumsum(centered * centered)))
+
+    def range_ssd(lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        """SSD of values[lo:hi] for arrays of ranges (hi > lo)."""
+        total = sum1[hi] - sum1[lo]
+        ssd: np.ndarray = (sum2[hi] - sum2[lo]) - total * total / (hi - lo)
+        return ssd
+
+    ends = np.arange(1, n + 1)
+    cost = np.full(n + 1, np.inf)
+    cost[1:] = range_ssd(np.zeros(n, dtype=np.intp), ends)
+    starts = np.zeros((max_classes + 1, n + 1), dtype=np.intp)
+
+    for j in range(2, max_classes + 1):
+        new_cost = np.full(n + 1, np.inf)
+        # Sub-problems: end range [m_lo, m_hi] with candidate starts [s_lo, s_hi]
+        m_lo, m_hi = np.array([j]), np.array([n])
+        s_lo, s_hi = np.array([j - 1]), np.array([n - 1])
+        while len(m_lo):
+            mid = (m_lo + m_hi) // 2
+            cand_hi = np.minimum(s_hi, mid - 1)
+            counts = cand_hi - s_lo + 1
+            offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            rows = np.repeat(np.arange(len(mid)), counts)
+            cand = s_lo[rows] + (np.arange(len(rows)) - offsets[rows])
+            values = cost[cand] + range_ssd(cand, mid[rows])
+
+            # First (smallest) argmin within each sub-problem
+            best_values = np.minimum.reduceat(values, offsets)
+            hits = np.flatnonzero(values <= best_values[rows])
+            best = cand[hits[np.searchsorted(hits, offsets)]]
+
+            new_cost[mid] = best_values
+            starts[j, mid] = best
+
+            left = mid > m_lo
+            right = mid < m_hi
+            m_lo, m_hi, s_lo, s_hi = (
+                np.concatenate((m_lo[left], mid[right] + 1)),
+                np.concatenate((mid[left] - 1, m_hi[right])),
+                np.concatenate((s_lo[left], best[right])),
+                np.concatenate((best[left], s_hi[right])),
+            )
+        cost = new_cost
+
+    return starts
 
 
 def _ssd(data: np.ndarray) -> float:
@@ -177,24 +263,26 @@ def optimal_jenks_classes(data: np.ndarray, min_classes: int = 2,
     best_n = min_classes
     prev_gvf = 0.0
 
+    # One dynamic-programming pass yields the breaks for every class count
+    all_breaks = jenks_breaks_all(data_clean, max_classes) if max_classes >= 2 else {}
+
     for n in range(min_classes, max_classes + 1):
-        try:
-            breaks = jenks_breaks(data_clean, n)
-            gvf = goodness_of_variance_fit(data_clean, breaks)
-
-            # Check if we've reached the quality threshold
-            if gvf >= gvf_threshold:
-                return n, breaks
-
-            # Check if improvement justifies added complexity
-            if n > min_classes and (gvf - prev_gvf) < min_gvf_improvement:
-                # Diminishing returns - stick with previous n
-                return best_n, best_breaks
-
-            best_breaks = breaks
-            best_n = n
-            prev_gvf = gvf
-        except ValueError:
+        if n not in all_breaks:
             break
+        breaks = all_breaks[n]
+        gvf = goodness_of_variance_fit(data_clean, breaks)
+
+        # Check if we've reached the quality threshold
+        if gvf >= gvf_threshold:
+            return n, breaks
+
+        # Check if improvement justifies added complexity
+        if n > min_classes and (gvf - prev_gvf) < min_gvf_improvement:
+            # Diminishing returns - stick with previous n
+            return best_n, best_breaks
+
+        best_breaks = breaks
+        best_n = n
+        prev_gvf = gvf
 
     return best_n, best_breaks
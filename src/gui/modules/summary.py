@@ -129,9 +129,8 @@ def summary_server(input: Inputs, output: Outputs, session: Session, refresh_tri
             all_runs = scan_runlogs(limit=None)
             all_runs_data.set(all_runs)
 
-            # Also get limited runs for table display
-            recent_runs = scan_runlogs(limit=recent_runs_limit)
-            recent_runs_data.set(recent_runs)
+            # Runs are sorted newest first, so the table shows a prefix
+            recent_runs_data.set(all_runs[:recent_runs_limit])
 
         load_data()
 
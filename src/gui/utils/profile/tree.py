@@ -431,7 +431,7 @@ def search_optimal_manual_cutoffs(
     Returns:
         List of optimal cutoff values, or None if no valid configuration found
     """
-    from src.core.stats.jenks_breaks import jenks_breaks
+    from src.core.stats.jenks_breaks import jenks_breaks_all
     from src.core.profile.labeler import ManualLabeler
 
     trainer = DecisionTreeTrainer()
@@ -443,16 +443,19 @@ def search_optimal_manual_cutoffs(
     best_aic = float('inf')
     best_cutoffs = None
 
+    # Jenks cutoff locations for every number of classes, from one DP pass
+    # (jenks_breaks returns n_classes-1 cutoffs for n_classes classes)
+    max_tried = min(max_cutoffs, 9)
+    all_cutoffs = jenks_breaks_all(values, max_tried + 1) if max_tried >= 1 else {}
+
     # Try different numbers of cutoffs (1 to max_cutoffs)
-    for num_cutoffs in range(1, min(max_cutoffs + 1, 10)):
+    for num_cutoffs in range(1, max_tried + 1):
         if progress_callback:
             progress = num_cutoffs / max_cutoffs
             progress_callback(progress, f"Trying {num_cutoffs} cutoffs...")
 
         try:
-            # Use Jenks to find optimal cutoff locations for this number of classes
-            # jenks_breaks returns n_classes-1 cutoffs for n_classes classes
-            cutoffs = jenks_breaks(values, n_classes=num_cutoffs + 1)
+            cutoffs = all_cutoffs.get(num_cutoffs + 1)
 
             if not cutoffs or len(cutoffs) != num_cutoffs:
                 continue
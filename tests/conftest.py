@@ -18,6 +18,12 @@ from typing import Tuple
 from src.core.config.include_resolver import get_project_root
 
 
+@pytest.fixture(autouse=True)
+def _isolated_host_cache(tmp_path_factory, monkeypatch):
+    """Give each test an empty host fact cache outside the user's cache directory."""
+    monkeypatch.setenv("SHARP_HOST_CACHE_DIR", str(tmp_path_factory.mktemp("host_cache")))
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test outputs."""
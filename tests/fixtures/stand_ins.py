@@ -0,0 +1,113 @@
+"""
+Shared stand-ins for scheduler and FaaS unit tests.
+
+Provides a job factory that records how many jobs run at the same time, and a
+local HTTP server that plays the part of a deployed function.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# One lock for all tracked jobs, so concurrent updates of a shared count never race
+_tracking_lock = threading.Lock()
+
+
+def tracking_job(job_type: Callable[..., Any], name: str, active: Dict[str, int], peak: Dict[str, int],
+                 log: Optional[List[str]] = None, exit_code: int = 0,
+                 seen_cpus: Optional[Dict[str, Any]] = None, **job_options: Any) -> Any:
+    """
+    Create a scheduler job that records how many jobs (and cores) run at the same time.
+
+    Args:
+        job_type: Job class to build (SweepJob or WorkflowJob)
+        name: Job name (launch ID or workflow task)
+        active: Running counts, updated while the job runs ("jobs", and "cores" if present)
+        peak: Highest running counts seen
+        log: Optional list receiving "start <name>" and "end <name>" entries
+        exit_code: Value returned by the job
+        seen_cpus: Optional dict receiving the CPUs the job was given, by name
+        **job_options: Passed to job_type (e.g. cores, memory_mb, depends_on)
+
+    Returns:
+        A job_type instance
+    """
+    cores = job_options.get("cores", 1)
+
+    def run(cpus: Any = None) -> int:
+        with _tracking_lock:
+            if log is not None:
+                log.append(f"start {name}")
+            active["jobs"] += 1
+            peak["jobs"] = max(peak["jobs"], active["jobs"])
+            if "cores" in active:
+                active["cores"] += cores
+                peak["cores"] = max(peak["cores"], active["cores"])
+        if seen_cpus is not None:
+            seen_cpus[name] = cpus
+        time.sleep(0.05)
+        with _tracking_lock:
+            active["jobs"] -= 1
+            if "cores" in active:
+                active["cores"] -= cores
+            if log is not None:
+                log.append(f"end {name}")
+        return exit_code
+
+    return job_type(name, run, **job_options)
+
+
+class FunctionHandler(BaseHTTPRequestHandler):
+    """Local stand-in for a deployed function: replies with a prefix and the request body after a delay."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        server: Any = self.server
+        with server.lock:
+            server.connections.add(self.client_address)
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+        time.sleep(server.delay)
+        with server.lock:
+            server.active -= 1
+        reply = server.reply_prefix + body
+        self.send_response(200)
+        if server.chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for part in (reply[:3], reply[3:]):
+                self.wfile.write(f"{len(part):x}\r\n".encode() + part + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(reply)))
+            self.end_headers()
+            self.wfile.write(reply)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+def start_function_server(delay: float = 0.0, chunked: bool = False, protocol: str = "HTTP/1.1",
+                          reply_prefix: bytes = b"echo ") -> Tuple[Any, str]:
+    """
+    Start a FunctionHandler server on a free local port, in a daemon thread.
+
+    The server records its peak no. of in-flight requests (server.peak) and the
+    client connections it saw (server.connections). Callers shut it down.
+
+    Returns:
+        Tuple of (server, function URL)
+    """
+    handler = type("Handler", (FunctionHandler,), {"protocol_version": protocol})
+    server: Any = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    server.lock, server.connections = threading.Lock(), set()
+    server.active = server.peak = 0
+    server.delay, server.chunked, server.reply_prefix = delay, chunked, reply_prefix
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/"
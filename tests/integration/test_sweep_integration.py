@@ -18,6 +18,8 @@ from pathlib import Path
 import yaml
 import json
 import subprocess
+
+from src.core.execution.runner import COPY_METRICS
 import re
 import glob
 
@@ -139,7 +141,7 @@ def test_sweep_csv_has_all_runs(temp_sweep_workspace):
     assert header[0] == "launch_id"
     if len(header) > 1 and header[1] == "completion_timestamp":
         header.pop(1)
-    assert header == ["launch_id", "repeat", "rank", "outer_time", "size", "threads", "time"]
+    assert header == ["launch_id", "repeat", "rank", "outer_time", "size", "threads", "time", *COPY_METRICS]
 
     # Verify all 4 combinations present
     launch_ids = [line.split(',')[0] for line in lines[1:]]
@@ -315,3 +317,31 @@ def test_sweep_no_state_mutation(temp_sweep_workspace):
         assert csv_file is not None, f"Run {i+1}: CSV file not found"
         lines = csv_file.read_text().strip().split('\n')
         assert len(lines) == 5, f"Run {i+1}: Expected 5 lines, got {len(lines)}"
+
+
+def test_parallel_sweep_matches_sequential(temp_sweep_workspace):
+    """Test that --parallel-configs writes every configuration once, truncating old results."""
+    workspace = temp_sweep_workspace
+    experiment_yaml = workspace / "experiment.yaml"
+
+    # Run twice: the second run must replace, not extend, the first one's output
+    for i in range(2):
+        result = subprocess.run(
+            ["uv", "run", "src/cli/launch.py", "-f", str(experiment_yaml), "-b", str(workspace / "local.yaml"),
+             "--parallel-configs", "3"],
+            cwd=Path.cwd(),
+            capture_output=True,
+            text=True
+        )
+        assert result.returncode == 0, f"Parallel sweep run {i+1} failed: {result.stderr}"
+
+    csv_file = find_output_file(workspace, "test_sweep.csv")
+    assert csv_file is not None, "CSV file not found"
+    lines = csv_file.read_text().strip().split('\n')
+    assert len(lines) == 5, f"Expected 5 lines (header + 4 data rows), got {len(lines)}"
+    assert len({line.split(',')[0] for line in lines[1:]}) == 4
+
+    md_file = find_output_file(workspace, "test_sweep.md")
+    content = md_file.read_text()
+    invariants = json.loads(re.search(r"## Invariant parameters.*?```json\s+(.*?)\s+```", content, re.DOTALL).group(1))
+    assert len(invariants) == 4
@@ -0,0 +1,111 @@
+"""
+Unit tests for the remote execution agent and its relay - one persistent channel per host.
+
+A local `sh -c` transport stands in for ssh.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from src.core.execution import agent_relay
+
+TRANSPORT = "sh -c"
+
+
+@pytest.fixture(autouse=True)
+def sockets(tmp_path, monkeypatch):
+    """Relay sockets in a private directory (relays stopped afterwards)."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    yield tmp_path
+    agent_relay.stop_all()
+
+
+def run(host: str, command: str, **kwargs):
+    return agent_relay.run(host, command, TRANSPORT, sys.executable, **kwargs)
+
+
+def test_bootstrapped_agent_runs_requests_concurrently() -> None:
+    """The agent source travels inside the command and answers requests as they finish."""
+    command = agent_relay.agent_command("node1", TRANSPORT, sys.executable)
+    agent = subprocess.Popen(command, shell=True, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    requests = [{"id": 1, "command": "sleep 0.3; echo slow"}, {"id": 2, "command": "echo fast; exit 3"},
+                {"id": 3, "op": "ping"}]
+    agent.stdin.write(b"".join(json.dumps(r).encode() + b"\n" for r in requests))
+    agent.stdin.flush()
+    replies = [json.loads(agent.stdout.readline()) for _ in requests]
+    agent.stdin.close()
+
+    assert agent.wait(timeout=10) == 0
+    by_id = {reply["id"]: reply for reply in replies}
+    assert replies[-1]["id"] == 1  # The slow command did not hold up the others
+    assert by_id[1]["output"] == "slow\n" and by_id[1]["status"] == 0
+    assert by_id[1]["elapsed"] >= 0.3 and by_id[1]["start"] > 0
+    assert by_id[2]["output"] == "fast\n" and by_id[2]["status"] == 3
+    assert by_id[3]["python"] == ".".join(map(str, sys.version_info[:3]))
+
+
+def test_first_command_starts_the_agent_and_later_ones_reuse_it() -> None:
+    """One relay and agent per host: later commands run in the same agent."""
+    first = run("node1", "echo $PPID")
+    second = run("node1", "echo $PPID; exit 4")
+    other = run("node2", "true")
+
+    assert first.started and not second.started and other.started
+    assert first.status == 0 and second.status == 4
+    # Commands are children of the same agent process
+    assert first.output.split()[0] == second.output.split()[0]
+    assert 0 < second.elapsed < 5 and second.user_time >= 0
+    assert len(agent_relay.relay_sockets()) == 2
+
+
+def test_timeout_kills_the_command_on_the_host() -> None:
+    """A command past its timeout is killed; its status is 128 + SIGKILL, as from a shell."""
+    result = run("node1", "echo started; sleep 30", timeout=0.3)
+
+    assert result.status == 137
+    assert result.output == "started\n"
+    assert result.elapsed < 5
+
+
+def test_run_all_reaches_every_connected_host(capsys) -> None:
+    """run --all runs a command (e.g. a reset) through every open relay."""
+    assert agent_relay.run_all("echo reset") == 0  # No relays: nothing to do
+    run("node1", "true")
+    run("node2", "true")
+
+    assert agent_relay.run_all("echo reset; exit 2") == 2
+    assert capsys.readouterr().out == "reset\nreset\n"
+
+
+def test_stop_closes_channels_and_next_command_reconnects() -> None:
+    """After stop, the next command starts a new relay and agent."""
+    run("node1", "true")
+    assert agent_relay.stop_all() == 1
+    assert agent_relay.relay_sockets() == []
+
+    assert run("node1", "true").started
+
+
+def test_failing_transport_is_reported() -> None:
+    """A transport that cannot start the agent raises with its error output."""
+    with pytest.raises(RuntimeError, match="Agent did not answer"):
+        agent_relay.run("node1", "true", "false", sys.executable)
+
+
+def test_cli_prints_output_and_metrics_line(capsys) -> None:
+    """The backend command prints the output, then the metrics line unless --quiet."""
+    base = ["run", "--transport", TRANSPORT, "--python", sys.executable]
+    assert agent_relay.main(base + ["node1", "echo", "hello"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert agent_relay.main(base + ["--quiet", "node1", "uname"]) == 0
+    quiet = capsys.readouterr().out.splitlines()
+
+    assert lines[0] == "hello"
+    assert lines[1].startswith("remote-agent output 1 ")
+    assert len(lines[1].split()) == 6
+    assert len(quiet) == 1 and not quiet[0].startswith("remote-agent")
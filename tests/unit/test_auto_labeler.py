@@ -10,7 +10,7 @@ import pytest
 from typing import List, Dict, Any
 
 from src.core.profile.labeler import AutoLabeler
-from src.core.stats.jenks_breaks import jenks_breaks, goodness_of_variance_fit, optimal_jenks_classes
+from src.core.stats.jenks_breaks import jenks_breaks, jenks_breaks_all, goodness_of_variance_fit, optimal_jenks_classes
 from tests.fixtures.distributions import distributions
 
 
@@ -125,6 +125,52 @@ class TestJenksBreaks:
             expected_position = (i + 1) * expected_spacing
             assert abs(brk - expected_position) < 0.2 * expected_spacing
 
+    def test_jenks_matches_exhaustive_search(self):
+        """Jenks should find the minimum within-class SSD over all partitions."""
+        from itertools import combinations
+
+        rng = np.random.default_rng(7)
+        data = np.sort(np.concatenate((rng.normal(0, 1, 6), rng.normal(6, 1, 5), rng.normal(9, 0.5, 4))))
+
+        def within_ssd(cuts):
+            bounds = (0,) + cuts + (len(data),)
+            return sum(((data[a:b] - data[a:b].mean()) ** 2).sum() for a, b in zip(bounds, bounds[1:]))
+
+        for n_classes in (2, 3, 4):
+            best = min(within_ssd(c) for c in combinations(range(1, len(data)), n_classes - 1))
+            breaks = jenks_breaks(data, n_classes)
+            cuts = tuple(int(np.searchsorted(data, b)) for b in breaks)
+            assert within_ssd(cuts) == pytest.approx(best)
+
+    def test_jenks_breaks_all_matches_single_calls(self):
+        """All class counts from one pass should equal individual calls."""
+        rng = np.random.default_rng(3)
+        data = np.concatenate((rng.normal(10, 1, 200), rng.normal(30, 2, 100), [np.nan]))
+
+        all_breaks = jenks_breaks_all(data, 8)
+
+        assert sorted(all_breaks) == list(range(2, 9))
+        for n_classes, breaks in all_breaks.items():
+            assert breaks == jenks_breaks(data, n_classes)
+
+    def test_jenks_breaks_all_skips_impossible_classes(self):
+        """Class counts above the number of unique values are omitted."""
+        assert sorted(jenks_breaks_all(np.array([1, 1, 2, 2, 3, 3, 3, 3]), 6)) == [2, 3]
+
+    def test_jenks_scales_to_large_inputs(self):
+        """Fifty thousand samples should be clustered quickly."""
+        import time
+
+        rng = np.random.default_rng(11)
+        data = np.concatenate((rng.normal(1.0, 0.01, 25000), rng.normal(1.5, 0.01, 25000)))
+
+        start = time.perf_counter()
+        all_breaks = jenks_breaks_all(data, 10)
+        elapsed = time.perf_counter() - start
+
+        assert 1.04 < all_breaks[2][0] < 1.46
+        assert elapsed < 5.0
+
 
 class TestGoodnessOfVarianceFit:
     """Tests for GVF calculation."""
@@ -0,0 +1,190 @@
+"""
+Unit tests for the local FaaS emulator - benchmark functions served by pools of warm instances.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+import asyncio
+import os
+import textwrap
+import threading
+
+import pytest
+
+from src.core.execution import faas_local
+from src.core.execution.faas_local import FaasGateway, FunctionSpec
+from src.core.execution.http_invoker import invoke_concurrently
+
+BENCHMARK = textwrap.dedent("""
+    import os
+    import time
+    from flask import Flask, request
+
+    _app = Flask(__name__)
+
+    @_app.route("/", methods=["POST"])
+    def square(n, delay="0"):
+        time.sleep(float(delay))
+        if n == "fail":
+            raise RuntimeError("broken function")
+        return f"square {int(n) ** 2} pid {os.getpid()}"
+""")
+
+
+@pytest.fixture
+def benchmark(tmp_path, monkeypatch):
+    """Benchmark file, with sockets and gateway state in a private directory."""
+    sockets = tmp_path / "run"
+    sockets.mkdir()
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(sockets))
+    path = tmp_path / "bench.py"
+    path.write_text(BENCHMARK)
+    return str(path)
+
+
+@pytest.fixture
+def gateway(benchmark):
+    """In-process gateway serving the benchmark as function 'bench' (instances stopped afterwards)."""
+    server = FaasGateway()
+    thread = threading.Thread(target=server.serve)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+
+
+def deploy(gateway, benchmark, **limits) -> None:
+    faas_local.deploy(gateway.url, FunctionSpec(name="bench", path=benchmark,
+                                                mtime_ns=os.stat(benchmark).st_mtime_ns, **limits))
+
+
+def call(gateway, body: str, concurrency: int = 1, name: str = "bench"):
+    return asyncio.run(invoke_concurrently(f"{gateway.url}/{name}", body.encode(), concurrency, timeout=60))
+
+
+def test_first_request_is_cold_and_later_ones_reuse_the_instance(gateway, benchmark) -> None:
+    """A new function starts an instance on its first request; idle instances serve warm."""
+    deploy(gateway, benchmark)
+    first, = call(gateway, "3")
+    second, = call(gateway, "4")
+
+    assert first.status == second.status == 200
+    assert first.body.startswith(b"square 9") and second.body.startswith(b"square 16")
+    assert first.headers["x-faas-cold"] == "1" and second.headers["x-faas-cold"] == "0"
+    assert first.body.split(b"pid")[1] == second.body.split(b"pid")[1]
+    assert float(first.headers["x-faas-startup-time"]) > 0
+    assert float(second.headers["x-faas-call-time"]) < second.latency
+
+
+def test_scale_to_zero_makes_next_request_cold(gateway, benchmark) -> None:
+    """Scaling to zero stops idle instances, as the backend's reset command does."""
+    deploy(gateway, benchmark)
+    call(gateway, "2")
+
+    assert faas_local.scale(gateway.url, 0) == {"bench": 0}
+    result, = call(gateway, "2")
+    assert result.headers["x-faas-cold"] == "1"
+
+
+def test_prewarmed_replicas_serve_concurrent_requests_warm(gateway, benchmark) -> None:
+    """Instances started by scaling up serve concurrent requests without cold starts."""
+    deploy(gateway, benchmark)
+    assert faas_local.scale(gateway.url, 3, "bench") == {"bench": 3}
+
+    results = call(gateway, "5 0.3", concurrency=3)
+    assert [r.headers["x-faas-cold"] for r in results] == ["0"] * 3
+    assert len({r.body.split(b"pid")[1] for r in results}) == 3
+    assert gateway.pools["bench"].state()["cold_starts"] == 0  # Instances started ahead of the requests
+
+
+def test_max_replicas_queues_requests(gateway, benchmark) -> None:
+    """With one replica allowed, concurrent requests wait for the single instance."""
+    deploy(gateway, benchmark, max_replicas=1)
+    results = call(gateway, "5 0.2", concurrency=3)
+
+    assert [r.status for r in results] == [200] * 3
+    assert sorted(r.headers["x-faas-cold"] for r in results) == ["0", "0", "1"]
+    assert max(r.latency for r in results) >= 0.6
+
+
+def test_idle_instances_scale_down_to_min_replicas(gateway, benchmark) -> None:
+    """The reaper stops instances idle beyond idle_timeout, keeping min_replicas."""
+    deploy(gateway, benchmark, min_replicas=1, idle_timeout=0.1)
+    call(gateway, "1 0.2", concurrency=2)
+    assert gateway.pools["bench"].state()["instances"] == 2
+
+    for _ in range(50):
+        if gateway.pools["bench"].state()["instances"] == 1:
+            break
+        threading.Event().wait(0.1)
+    assert gateway.pools["bench"].state()["instances"] == 1
+
+
+def test_failures_and_unknown_functions(gateway, benchmark) -> None:
+    """A raising function answers 500 with its traceback; unknown functions 404."""
+    deploy(gateway, benchmark)
+    failed, = call(gateway, "fail")
+    missing, = call(gateway, "1", name="other")
+
+    assert failed.status == 500 and b"broken function" in failed.body
+    assert missing.status == 404
+    assert call(gateway, "6")[0].headers["x-faas-cold"] == "0"  # The instance survived the failure
+
+
+def test_instances_run_in_the_deploying_directory(gateway, tmp_path) -> None:
+    """Instances start in the spec's working directory; the gateway's own directory is unchanged."""
+    work = tmp_path / "work"
+    work.mkdir()
+    (work / "where.py").write_text(textwrap.dedent("""
+        import os
+        from flask import Flask
+
+        _app = Flask(__name__)
+
+        @_app.route("/", methods=["POST"])
+        def where():
+            return os.getcwd()
+    """))
+    cwd = os.getcwd()
+    faas_local.deploy(gateway.url, FunctionSpec(name="where", path="where.py", cwd=str(work),
+                                                mtime_ns=os.stat(work / "where.py").st_mtime_ns))
+    result, = call(gateway, "", name="where")
+
+    assert result.status == 200 and result.body.decode().strip() == str(work)
+    assert os.getcwd() == cwd
+
+
+def test_cli_invoke_reports_cold_and_warm_latency(benchmark, capsys) -> None:
+    """The backend command starts a gateway on demand and splits latency by start kind."""
+    try:
+        assert faas_local.main(["invoke", "--concurrency", "2", benchmark, "7"]) == 0
+        cold = capsys.readouterr().out.splitlines()
+        assert faas_local.main(["invoke", benchmark, "7"]) == 0
+        warm = capsys.readouterr().out.splitlines()
+        assert faas_local.main(["scale", "bench", "--replicas", "0"]) == 0
+    finally:
+        faas_local.main(["stop"])
+
+    assert cold[0].startswith("square 49") and warm[0].startswith("square 49")
+    rows = [line.split() for line in cold + warm if line.startswith("faaslocal output")]
+    assert [row[2:4] for row in rows] == [["0", "200"], ["1", "200"], ["0", "200"]]
+    assert [row[5] for row in rows] == ["1", "1", "0"]
+    # Cold requests report cold_latency, warm ones warm_latency
+    assert rows[0][6] == "NA" and rows[0][7] == rows[0][4]
+    assert rows[2][6] == rows[2][4] and rows[2][7] == "NA"
+
+
+def test_min_replicas_keeps_warm_instances_across_invocations(benchmark, capsys) -> None:
+    """Pre-warming to min_replicas only scales up, so later iterations stay warm."""
+    try:
+        colds = []
+        for _ in range(3):
+            assert faas_local.main(["invoke", "--concurrency", "3", "--min-replicas", "1", benchmark, "2", "0.2"]) == 0
+            rows = [line.split() for line in capsys.readouterr().out.splitlines()
+                    if line.startswith("faaslocal output")]
+            colds.append(sorted(row[5] for row in rows))
+    finally:
+        faas_local.main(["stop"])
+
+    assert colds[0] == ["0", "1", "1"]  # One pre-warmed instance, two started by the requests
+    assert colds[1:] == [["0", "0", "0"]] * 2
@@ -0,0 +1,111 @@
+"""
+Tests for the per-host cache of system specs, checksums and version info.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+import os
+import time
+
+from src.core.runlogs import collect_sysinfo, hostcache, writer
+from src.core.runlogs.hostcache import HostCache, file_signature, get_host_cache
+from src.core.runlogs.writer import RunLogger, cached_executable_checksum
+
+
+def test_cache_persists_within_boot_only(tmp_path, monkeypatch) -> None:
+    """Entries survive a reload, but not a reboot."""
+    path = tmp_path / "host.json"
+    monkeypatch.setattr(hostcache, "boot_id", lambda: "boot-1")
+    cache = HostCache(path)
+    cache.put("answer", 42)
+    cache.save()
+
+    assert HostCache(path).get("answer") == 42
+
+    monkeypatch.setattr(hostcache, "boot_id", lambda: "boot-2")
+    assert HostCache(path).get("answer") is None
+
+
+def test_signature_and_ttl_validation(tmp_path) -> None:
+    """Entries are rejected if their signature differs or they are too old."""
+    cache = HostCache(None)
+    cache.put("file", "digest", [1, 2, 3])
+    cache.put("load", "0.5")
+
+    assert cache.get("file", [1, 2, 3]) == "digest"
+    assert cache.get("file", [1, 2, 4]) is None
+    assert cache.get("load", ttl=60) == "0.5"
+    cache._entries["load"]["time"] -= 120
+    assert cache.get("load", ttl=60) is None
+    assert cache.get("load") == "0.5"
+
+
+def test_concurrent_saves_are_merged(tmp_path) -> None:
+    """Two processes saving different keys do not drop each other's entries."""
+    path = tmp_path / "host.json"
+    first, second = HostCache(path), HostCache(path)
+    first.put("a", 1)
+    second.put("b", 2)
+    first.save()
+    second.save()
+
+    merged = HostCache(path)
+    assert (merged.get("a"), merged.get("b")) == (1, 2)
+
+
+def test_executable_checksum_is_computed_once(tmp_path, monkeypatch) -> None:
+    """Checksums are reused until the file changes."""
+    exe = tmp_path / "bench.sh"
+    exe.write_text("#!/bin/sh\necho hi\n")
+    hashed = []
+    original = writer.compute_executable_checksum
+    monkeypatch.setattr(writer, "compute_executable_checksum",
+                        lambda path: hashed.append(path) or original(path))
+
+    first = cached_executable_checksum(str(exe))
+    assert cached_executable_checksum(str(exe)) == first
+    assert len(hashed) == 1
+
+    exe.write_text("#!/bin/sh\necho changed\n")
+    os.utime(exe, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+    changed = cached_executable_checksum(str(exe))
+    assert len(hashed) == 2
+    assert changed != first and changed == original(str(exe))
+    assert file_signature(tmp_path) is None
+
+
+def test_preamble_facts_are_cached(tmp_path, monkeypatch) -> None:
+    """A second logger does not fork git again."""
+    RunLogger(str(tmp_path), "exp", "first", {})
+    calls = []
+    original = writer.subprocess.run
+    monkeypatch.setattr(writer.subprocess, "run", lambda *a, **kw: calls.append(a) or original(*a, **kw))
+
+    logger = RunLogger(str(tmp_path), "exp", "second", {})
+
+    assert calls == []
+    assert "SHARP version:" in logger._preamble
+
+
+def test_static_specs_reused_and_volatile_refreshed(tmp_path, monkeypatch) -> None:
+    """Static specs run once per boot; other specs rerun once their TTL expires."""
+    counter = tmp_path / "runs"
+    counter.write_text("")
+    commands = {
+        "kernel": {"version": f"echo k >> {counter}; echo 6.1"},
+        "load_average": {"one_minute": f"echo l >> {counter}; echo 0.5"},
+    }
+
+    first = collect_sysinfo(commands)
+    second = collect_sysinfo(commands)
+    assert first == second == {"kernel": {"version": "6.1"}, "load_average": {"one_minute": "0.5"}}
+    assert sorted(counter.read_text().split()) == ["k", "l"]
+
+    cache = get_host_cache()
+    for entry in cache._entries.values():
+        entry["time"] -= 3600
+    collect_sysinfo(commands)
+    assert sorted(counter.read_text().split()) == ["k", "l", "l"]
+
+    collect_sysinfo(commands, cache=False)
+    assert sorted(counter.read_text().split()) == ["k", "k", "l", "l", "l"]
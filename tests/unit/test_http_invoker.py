@@ -0,0 +1,130 @@
+"""
+Unit tests for the HTTP invoker - FaaS invocations over pooled keep-alive connections.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.core.execution import http_invoker
+from src.core.execution.http_invoker import HttpPool, invoke_concurrently, resolve_url
+from tests.fixtures.stand_ins import start_function_server
+
+
+@pytest.fixture
+def function_server():
+    """Start a local function server; yields a factory taking handler settings."""
+    servers = []
+
+    def start(**settings):
+        server, url = start_function_server(**settings)
+        servers.append(server)
+        return server, url
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_concurrent_requests_are_in_flight_at_once(function_server) -> None:
+    """With concurrency N, N requests overlap on N connections."""
+    server, url = function_server(delay=0.2)
+
+    start = time.monotonic()
+    results = asyncio.run(invoke_concurrently(url, b"42", concurrency=4))
+    elapsed = time.monotonic() - start
+
+    assert [r.status for r in results] == [200] * 4
+    assert all(r.body == b"echo 42" for r in results)
+    assert server.peak == 4 and len(server.connections) == 4
+    assert elapsed < 0.6
+    assert all(0.2 <= r.latency < 0.6 for r in results)
+
+
+def test_requests_reuse_keep_alive_connections(function_server) -> None:
+    """Back-to-back requests share one connection, whose setup is timed once."""
+    server, url = function_server()
+
+    results = asyncio.run(invoke_concurrently(url, b"x", concurrency=1, requests=5))
+
+    assert [r.status for r in results] == [200] * 5
+    assert len(server.connections) == 1
+    assert len({r.connect_time for r in results}) == 1
+
+
+def test_chunked_responses_are_read_whole(function_server) -> None:
+    """Chunked transfer encoding is decoded, and the connection stays reusable."""
+    server, url = function_server(chunked=True)
+
+    results = asyncio.run(invoke_concurrently(url, b"abc", requests=2))
+
+    assert [r.body for r in results] == [b"echo abc"] * 2
+    assert len(server.connections) == 1
+
+
+def test_closed_idle_connection_is_retried(function_server) -> None:
+    """A server that closes connections after each response costs a reconnect, not a failure."""
+    server, url = function_server(protocol="HTTP/1.0")
+
+    results = asyncio.run(invoke_concurrently(url, b"x", requests=3))
+
+    assert [r.status for r in results] == [200] * 3
+    assert len(server.connections) == 3
+
+
+def test_pool_never_exceeds_its_size(function_server) -> None:
+    """More concurrent requests than pool connections wait for a free connection."""
+    server, url = function_server(delay=0.05)
+
+    async def run():
+        pool = HttpPool(url, size=2)
+        try:
+            return await asyncio.gather(*(pool.request(b"x") for _ in range(6)))
+        finally:
+            await pool.close()
+
+    responses = asyncio.run(run())
+
+    assert [r.status for r, _ in responses] == [200] * 6
+    assert server.peak <= 2 and len(server.connections) == 2
+
+
+def test_unreachable_function_reports_failed_requests() -> None:
+    """Requests that cannot connect report status 0 and an error."""
+    results = asyncio.run(invoke_concurrently("http://127.0.0.1:9/", concurrency=2, timeout=5))
+
+    assert [r.status for r in results] == [0, 0]
+    assert all(r.error for r in results)
+
+
+def test_resolved_url_is_cached(tmp_path, monkeypatch) -> None:
+    """The resolve command runs once per TTL, unless the URL is refreshed."""
+    monkeypatch.setattr(http_invoker.tempfile, "gettempdir", lambda: str(tmp_path))
+    counter = tmp_path / "calls"
+    command = f"echo x >> {counter}; echo http://127.0.0.1:8080/fn"
+
+    assert resolve_url(command) == "http://127.0.0.1:8080/fn"
+    assert resolve_url(command) == "http://127.0.0.1:8080/fn"
+    assert counter.read_text().count("x") == 1
+    resolve_url(command, refresh=True)
+    assert counter.read_text().count("x") == 2
+    with pytest.raises(RuntimeError, match="Cannot resolve"):
+        resolve_url("false")
+
+
+def test_main_prints_bodies_and_one_line_per_request(function_server, capsys) -> None:
+    """The command line prints each response body and a metrics line per request."""
+    _, url = function_server()
+
+    assert http_invoker.main(["--url", url, "--concurrency", "3", "100"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines.count("echo 100") == 3
+    metrics = [line.split() for line in lines if line.startswith("http-invoke output ")]
+    assert [m[2] for m in metrics] == ["0", "1", "2"]
+    assert all(m[3] == "200" and float(m[4]) > 0 and m[6] == "8" for m in metrics)
+    assert http_invoker.main(["--url", "http://127.0.0.1:9/"]) == 1
@@ -0,0 +1,181 @@
+"""
+Tests for metric extraction and in-process pipeline compilation.
+
+Compiled pipelines are checked against the real shell on representative
+backend outputs, so any divergence from grep/awk/sed semantics shows up here.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+import yaml
+
+from src.core.metrics.extractor import MetricExtractor
+from src.core.metrics.pipeline import compile_pipeline
+
+
+PERF_OUTPUT = """\
+ Performance counter stats for 'sleep 0.1':
+
+             1,234      cache-misses
+                 2      context-switches
+     <not supported>      branch-misses
+                 0      cpu-migrations
+                61      page-faults
+              0.52 msec cpu-clock                        #    0.005 CPUs utilized
+         1,503,210      cycles
+
+       0.101234567 seconds time elapsed
+"""
+
+BINTIME_OUTPUT = "some output\nbin-time output 0.10 0.00 0 75 1928 1% 1 2\n"
+
+MISC_OUTPUT = """\
+@@@ Time 12.5
+Hostname: node01
+Linux node01 6.1.0 #1 SMP x86_64 GNU/Linux
+pid 42's current affinity list: 0-3
+Compute 1 2.75 ms
+time kernel = 0.25s
+time = 1.5s
+   0.004 s
+Time total: a b c d 3.3
+"""
+
+
+def _shell(cmd: str, text: str, tmp_path: Path) -> str:
+    """Run an extraction pipeline through the shell, as the fallback does."""
+    path = tmp_path / "output.txt"
+    path.write_text(text)
+    return subprocess.run(f"cat {path} | {cmd}", shell=True,
+                          capture_output=True, text=True).stdout
+
+
+def _compiled(cmd: str, text: str) -> str:
+    compiled = compile_pipeline(cmd)
+    assert compiled is not None, f"expected {cmd!r} to compile"
+    lines = text.split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return "".join(f"{line}\n" for line in compiled(lines))
+
+
+def _repo_extract_commands() -> list[str]:
+    """Collect every metric extract command shipped in backends/*.yaml."""
+    root = Path(__file__).resolve().parents[2]
+    commands = set()
+    for path in sorted((root / "backends").glob("*.yaml")):
+        config = yaml.safe_load(path.read_text()) or {}
+        for spec in (config.get("metrics") or {}).values():
+            if isinstance(spec, dict) and isinstance(spec.get("extract"), str):
+                commands.add(spec["extract"])
+    return sorted(commands)
+
+
+@pytest.mark.parametrize("cmd", _repo_extract_commands())
+def test_compiled_matches_shell_for_backend_rules(cmd, tmp_path) -> None:
+    """Every compilable backend rule must produce the shell's exact output."""
+    if compile_pipeline(cmd) is None:
+        pytest.skip("rule is not compilable; extractor falls back to shell")
+    for text in (PERF_OUTPUT, BINTIME_OUTPUT, MISC_OUTPUT, ""):
+        assert _compiled(cmd, text) == _shell(cmd, text, tmp_path)
+
+
+@pytest.mark.parametrize("cmd", [
+    "cat",
+    "grep '@@@ Time' | awk '{ print $(NF); }'",
+    "grep 'Hostname:' | awk '{print $2;}'",
+    "grep ^Linux | awk '{ print $3 }'",
+    "grep ' current affinity list:' | sed 's/.*current affinity list: //'",
+    "awk ' /^Compute/ { print $3; } '",
+    "grep 'time kernel' | awk '{ print $4; }' | sed 's/s//'",
+    "grep '^time = ' | awk '{ print $3; }' | sed 's/s//'",
+    "grep -E '[0-9]+([.][0-9]+)? s$' | awk '{ print $1; }'",
+    "grep 'Time total' | awk '{ print $6; }'",
+    "grep -v Time | awk '{print $1, $2}'",
+    "awk '{gsub(/[0-9]+/, \"N\", $2); print}'",
+    "awk '{ gsub(/s$/, \"\", $0); print; }'",
+])
+def test_compiled_matches_shell_for_benchmark_rules(cmd, tmp_path) -> None:
+    """Idioms used by benchmark YAMLs compile and match the shell."""
+    assert _compiled(cmd, MISC_OUTPUT) == _shell(cmd, MISC_OUTPUT, tmp_path)
+
+
+@pytest.mark.parametrize("cmd", [
+    "grep 'Time consumed' | awk '{ print $3/1000; }'",
+    "awk '/a/ {x=$1} END {print x}'",
+    "grep foo output.txt",
+    "grep foo > /tmp/out",
+    "grep foo || echo '1.0'",
+    "grep \"$HOME\"",
+    "grep '\\(a\\)'",
+    "grep '[[:digit:]]'",
+    "sed 's/a/&&/'",
+    "sort | uniq",
+    "",
+])
+def test_unsupported_pipelines_do_not_compile(cmd) -> None:
+    """Anything outside the supported subset is left to the shell."""
+    assert compile_pipeline(cmd) is None
+
+
+def test_bre_operators_are_literal_in_grep(tmp_path) -> None:
+    """In basic regexes, + and ? match themselves."""
+    text = "a+b 1\nab 2\n"
+    assert _compiled("grep 'a+b'", text) == _shell("grep 'a+b'", text, tmp_path) == "a+b 1\n"
+
+
+def test_extractor_reads_file_once_for_compiled_rules(tmp_path, monkeypatch) -> None:
+    """Compiled rules share one read of the output file and never fork."""
+    output = tmp_path / "out.txt"
+    output.write_text(PERF_OUTPUT)
+    extractor = MetricExtractor({
+        "perf_time": {"extract": "grep ' seconds time elapsed' | awk '{ print $1; }'"},
+        "cache_misses": {"extract": "grep ' cache-misses' | awk '{ gsub(/,/, \"\"); print $1; }' | sed 's/<not/NA/'"},
+        "branch_misses": {"extract": "grep ' branch-misses' | awk '{ gsub(/,/, \"\"); print $1; }' | sed 's/<not/NA/'"},
+    })
+
+    def no_shell(*args, **kwargs):
+        raise AssertionError("compiled rules must not spawn a shell")
+    monkeypatch.setattr(subprocess, "run", no_shell)
+
+    reads = []
+    original = MetricExtractor._read_lines
+    monkeypatch.setattr(MetricExtractor, "_read_lines",
+                        staticmethod(lambda path: reads.append(path) or original(path)))
+
+    rundata = extractor.extract(str(output), {"outer_time": ["0.2"]})
+
+    assert len(reads) == 1
+    assert rundata.get_metric("perf_time") == [0.101234567]
+    assert rundata.get_metric("cache_misses") == [1234.0]
+    assert rundata.get_metric("branch_misses") == []  # NA is dropped
+
+
+def test_extractor_falls_back_to_shell(tmp_path) -> None:
+    """Rules that do not compile still run through the shell."""
+    output = tmp_path / "out.txt"
+    output.write_text("Time consumed 2500 ms\n")
+    extractor = MetricExtractor({
+        "t": {"extract": "grep 'Time consumed' | awk '{ print $3/1000; }'"},
+    })
+
+    rundata = extractor.extract(str(output), {"outer_time": ["1.0"]})
+
+    assert rundata.get_metric("t") == [2.5]
+
+
+def test_extractor_compiled_auto_metrics(tmp_path) -> None:
+    """Auto metrics work with compiled rules."""
+    output = tmp_path / "out.txt"
+    output.write_text("# header\nalpha 1\nbeta 2.5\n")
+    extractor = MetricExtractor({"auto": {"extract": "grep -v '^#'", "type": "auto"}})
+
+    rundata = extractor.extract(str(output), {"outer_time": ["1.0"]})
+
+    assert rundata.get_metric("alpha") == [1.0]
+    assert rundata.get_metric("beta") == [2.5]
+    assert "auto" not in rundata.perf
@@ -0,0 +1,187 @@
+"""
+Unit tests for open-loop execution - requests issued on an arrival process.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+import csv
+import os
+import random
+import resource
+import sys
+import warnings
+
+import pytest
+import yaml
+
+from src.core.execution.open_loop import OpenLoopRunner, arrival_times, percentile
+from src.core.execution.orchestrator import ExecutionOrchestrator
+from tests.fixtures.stand_ins import start_function_server
+
+
+def _close(files) -> None:
+    for f in files:
+        f.close()
+
+
+def test_constant_arrivals_are_evenly_spaced() -> None:
+    """A constant process issues rate * duration arrivals, 1/rate apart."""
+    times = arrival_times("constant", 10, 1.0)
+
+    assert times == pytest.approx([i / 10 for i in range(10)])
+
+
+def test_poisson_arrivals_are_seeded_and_average_the_rate() -> None:
+    """Poisson arrivals are reproducible with a seed and average rate * duration."""
+    first = arrival_times("poisson", 1000, 10, random.Random(7))
+
+    assert first == arrival_times("poisson", 1000, 10, random.Random(7))
+    assert 9500 < len(first) < 10500
+    assert all(0 <= a < b < 10 for a, b in zip(first, first[1:]))
+    with pytest.raises(ValueError, match="Unknown arrival process"):
+        arrival_times("bursty", 1, 1)
+    with pytest.raises(ValueError, match="positive"):
+        arrival_times("constant", 0, 1)
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    """Percentiles pick an observed value (nearest rank)."""
+    values = [float(v) for v in range(1, 101)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 99.9) == 100.0
+    assert percentile([], 50) is None
+
+
+def test_requests_are_sent_on_schedule_without_waiting_for_earlier_ones() -> None:
+    """Requests overlap: each is sent at its arrival even while earlier ones still run."""
+    runner = OpenLoopRunner(rate=20, duration=0.5, arrivals="constant")
+
+    success, files, elapsed = runner.run_commands(["sleep 0.2"])
+    metrics = runner.copy_metrics()
+    _close(files)
+
+    assert success and len(files) == 10
+    assert elapsed < 0.5 + 0.2 + 0.3  # Closed loop would take 10 * 0.2 s
+    lags = [float(sent) - float(scheduled)
+            for sent, scheduled in zip(metrics["request_sent"], metrics["request_scheduled"])]
+    assert all(0 <= lag < 0.05 for lag in lags)
+    assert all(0.2 <= float(t) < 0.5 for t in metrics["outer_time"])
+    assert float(metrics["latency_p50"][0]) >= 0.2
+    assert metrics["error_rate"] == ["0.0"] * 10
+    assert metrics["offered_rate"] == ["20.0"] * 10
+
+
+def test_requests_beyond_max_in_flight_are_dropped() -> None:
+    """Arrivals while max_in_flight requests run are dropped and counted as errors."""
+    runner = OpenLoopRunner(rate=20, duration=0.3, arrivals="constant", max_in_flight=2)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        _, files, _ = runner.run_commands(["sleep 0.5"])
+    metrics = runner.copy_metrics()
+    _close(files)
+
+    assert len(files) == 2 and runner.dropped == 4
+    assert float(metrics["error_rate"][0]) == pytest.approx(4 / 6)
+
+
+def test_failed_requests_count_as_errors() -> None:
+    """Non-zero exits are recorded per request and excluded from the latency percentiles."""
+    runner = OpenLoopRunner(rate=10, duration=0.3, arrivals="constant")
+
+    with pytest.warns(UserWarning, match="3 of 3 open-loop request"):
+        _, files, _ = runner.run_commands(["exit 3"])
+    metrics = runner.copy_metrics()
+    _close(files)
+
+    assert metrics["request_status"] == ["3"] * 3
+    assert metrics["error_rate"] == ["1.0"] * 3
+    assert metrics["throughput"] == ["0.0"] * 3
+    assert metrics["latency_p99"] == ["NA"] * 3
+
+
+def test_more_requests_than_file_descriptors() -> None:
+    """Reaped requests release their descriptors; launches out of descriptors are dropped."""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    headroom = 30
+    runner = OpenLoopRunner(rate=200, duration=1.0, arrivals="constant")
+
+    resource.setrlimit(resource.RLIMIT_NOFILE, (len(os.listdir("/proc/self/fd")) + headroom, hard))
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            _, files, _ = runner.run_commands(["sleep 0.2"])
+    finally:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+    assert len(files) + runner.dropped == 200
+    assert len(files) > headroom and runner.dropped > 0
+    assert all(f.closed for f in files)
+    assert runner.returncodes == [0] * len(files)
+
+
+def _open_loop_options(tmp_path, **extra):
+    options = {
+        "entry_point": "echo",
+        "args": ["hi"],
+        "task": "open_loop_test",
+        "backend_names": ["local"],
+        "backend_options": {"local": {"run": "$CMD $ARGS"}},
+        "metrics": {},
+        "repeats": "COUNT",
+        "repeater_options": {"CR": {"max": 2}},
+        "arrival_rate": 20,
+        "arrivals": "constant",
+        "duration": 0.25,
+        "skip_sys_specs": True,
+        "directory": str(tmp_path / "runlogs"),
+    }
+    return options | extra
+
+
+def test_orchestrator_logs_one_row_per_request(tmp_path) -> None:
+    """Each iteration is a load phase, logged with one row per request."""
+    result = ExecutionOrchestrator(_open_loop_options(tmp_path), experiment_name="ol").run()
+
+    assert result.success
+    with open(result.output_paths["csv"], newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["repeat"] for row in rows] == ["1"] * 5 + ["2"] * 5
+    assert [row["rank"] for row in rows[:5]] == ["0", "1", "2", "3", "4"]
+    assert all(float(row["outer_time"]) < 0.25 for row in rows)
+    assert {row["throughput"] for row in rows[:5]} == {rows[0]["throughput"]}
+    with open(result.output_paths["markdown"]) as f:
+        markdown = f.read()
+    assert "arrival_rate" in markdown and "request_latency" in markdown
+
+
+def test_orchestrator_rejects_open_loop_copies(tmp_path) -> None:
+    """Open-loop requests are single commands, so mpl must be 1."""
+    with pytest.raises(ValueError, match="mpl must be 1"):
+        ExecutionOrchestrator(_open_loop_options(tmp_path, mpl=2), experiment_name="ol")
+
+
+def test_open_loop_drives_http_backend(tmp_path) -> None:
+    """The http backend works as an open-loop request against a local function."""
+    server, url = start_function_server(reply_prefix=b"@@@ Time 0.001 ")
+    with open("backends/http.yaml") as f:
+        backend = yaml.safe_load(f)
+    options = _open_loop_options(
+        tmp_path, backend_names=["http"], entry_point="fn", args=["7"], repeater_options={"CR": {"max": 1}},
+        arrival_rate=4, duration=0.5, metrics=backend["metrics"],
+        backend_options={"http": {"run": f"{sys.executable} -m src.core.execution.http_invoker "
+                                          f"--concurrency $MPL --url {url} $ARGS"}})
+    try:
+        result = ExecutionOrchestrator(options, experiment_name="ol").run()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert result.success
+    with open(result.output_paths["csv"], newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 2
+    assert all(float(row["http_status"]) == 200 for row in rows)
+    assert all(0 < float(row["http_latency"]) <= float(row["request_latency"]) and float(row["error_rate"]) == 0 for row in rows)
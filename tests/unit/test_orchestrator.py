@@ -8,6 +8,7 @@ with metrics extraction, callback triggering, and convergence detection.
 """
 
 import pytest
+import csv
 import os
 import tempfile
 import warnings
@@ -668,4 +669,322 @@ def test_orchestrator_mpl_generates_multiple_commands(orchestrator_flow_setup) -
     first_iteration_commands = mock_runner.commands_run[0]
 
     # Should have 2 commands because mpl=2
-    assert len(first_iteration_commands) == 2
\ No newline at end of file
+    assert len(first_iteration_commands) == 2
+
+def test_per_copy_metrics_logged_per_row(tmp_path) -> None:
+    """Ensure each copy's runner timing and rusage land in its own CSV row."""
+    options = {
+        "entry_point": "echo",
+        "args": ["hi"],
+        "task": "copy_test",
+        "backend_names": ["local"],
+        "backend_options": {"local": {"run": "$CMD $ARGS"}},
+        "metrics": {},
+        "repeats": "COUNT",
+        "repeater_options": {"CR": {"max": 1}},
+        "mpl": 3,
+        "skip_sys_specs": True,
+        "directory": str(tmp_path / "runlogs"),
+    }
+
+    orchestrator = ExecutionOrchestrator(options, experiment_name="copy_test")
+    result = orchestrator.run()
+
+    assert result.success
+    with open(result.output_paths["csv"], newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 3
+    for row in rows:
+        assert float(row["copy_time"]) > 0
+        assert "copy_max_rss" in row
+        assert "straggler_ratio" in row
+    assert float(rows[0]["copy_start"]) == 0.0
+    assert len({row["launch_skew"] for row in rows}) == 1
+
+
+@pytest.mark.parametrize("run_template, exec_mode, expected", [
+    ("$CMD $ARGS", None, "direct"),
+    ("$CMD $ARGS", "shell", "shell"),
+    ("$CMD $ARGS | cat", None, "shell"),
+])
+def test_exec_mode_recorded_in_metadata(tmp_path, run_template, exec_mode, expected) -> None:
+    """Ensure the way commands were launched is recorded as an invariant."""
+    options = {
+        "entry_point": "echo",
+        "args": ["hi"],
+        "task": "exec_test",
+        "backend_names": ["local"],
+        "backend_options": {"local": {"run": run_template}},
+        "metrics": {},
+        "repeats": "COUNT",
+        "repeater_options": {"CR": {"max": 1}},
+        "skip_sys_specs": True,
+        "directory": str(tmp_path / "runlogs"),
+    }
+    if exec_mode:
+        options["exec_mode"] = exec_mode
+
+    orchestrator = ExecutionOrchestrator(options, experiment_name="exec_test")
+    result = orchestrator.run()
+
+    assert result.success
+    with open(result.output_paths["markdown"]) as f:
+        invariants = f.read().split("## Invariant parameters")[1]
+    assert f'"exec_mode": "{expected}"' in invariants
+
+
+def test_rows_streamed_before_failure_survive(tmp_path) -> None:
+    """Ensure rows of completed iterations are on disk if a later one fails."""
+    options = {
+        "entry_point": "echo",
+        "args": [],
+        "task": "crash_test",
+        "backend_names": ["local"],
+        "backend_options": {"local": {"run": "$CMD $ARGS"}},
+        "metrics": {},
+        "repeats": "COUNT",
+        "repeater_options": {"CR": {"max": 5}},
+        "skip_sys_specs": True,
+        "directory": str(tmp_path / "runlogs"),
+    }
+    orchestrator = ExecutionOrchestrator(options, experiment_name="crash_test")
+    runner = MockRunner()
+    calls = []
+
+    def crash_on_third(commands, env=None):
+        calls.append(commands)
+        if len(calls) == 3:
+            raise RuntimeError("simulated crash")
+        return MockRunner.run_commands(runner, commands, env)
+    orchestrator.runner.run_commands = crash_on_third
+
+    result = orchestrator.run()
+
+    assert not result.success
+    with open(orchestrator.logger.get_csv_path(), newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["repeat"] for row in rows] == ["1", "2"]
+
+
+def _pipeline_options(tmp_path, max_repeats: int) -> Dict:
+    return {
+        "entry_point": "echo",
+        "args": [],
+        "task": "pipeline_test",
+        "backend_names": ["local"],
+        "backend_options": {"local": {"run": "$CMD $ARGS"}},
+        "metrics": {},
+        "repeats": "COUNT",
+        "repeater_options": {"CR": {"max": max_repeats}},
+        "pipeline": True,
+        "skip_sys_specs": True,
+        "directory": str(tmp_path / "runlogs"),
+    }
+
+
+def test_pipelined_run_flags_one_speculative_iteration(tmp_path) -> None:
+    """Pipelined mode runs at most one extra iteration, logged as speculative."""
+    orchestrator = ExecutionOrchestrator(_pipeline_options(tmp_path, 3), experiment_name="pipeline_test")
+    orchestrator.runner = MockRunner()
+    repeater = TrackingRepeater(max_iterations=3)
+    orchestrator.repeater = repeater
+
+    result = orchestrator.run()
+
+    assert result.success
+    assert orchestrator.runner.run_count == 4
+    assert len(repeater.received_rundata) == 3
+    assert result.convergence_info["speculative_iterations"] == 1
+    with open(result.output_paths["csv"], newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["repeat"] for row in rows] == ["1", "2", "3", "4"]
+    assert [row["speculative"] for row in rows] == ["0", "0", "0", "1"]
+
+
+def test_pipelined_callbacks_number_iterations_in_order(tmp_path) -> None:
+    """Iteration start and completion callbacks both count 1..n in pipelined mode."""
+    orchestrator = ExecutionOrchestrator(_pipeline_options(tmp_path, 4), experiment_name="pipeline_test")
+    orchestrator.runner = MockRunner()
+    orchestrator.repeater = TrackingRepeater(max_iterations=4)
+    starts: List[int] = []
+    completions: List[int] = []
+    callbacks = ProgressCallbacks(on_iteration_start=starts.append,
+                                  on_iteration_complete=lambda iteration, _: completions.append(iteration))
+
+    result = orchestrator.run(callbacks)
+
+    assert result.success
+    assert starts == completions == [1, 2, 3, 4, 5]  # The fifth is speculative
+
+
+def test_pipelined_analysis_overlaps_next_iteration(tmp_path) -> None:
+    """The repeater decides on iteration i while iteration i+1 is running."""
+    import threading
+
+    orchestrator = ExecutionOrchestrator(_pipeline_options(tmp_path, 2), experiment_name="pipeline_test")
+    runner = MockRunner()
+    second_run_started = threading.Event()
+
+    def run_commands(commands, env=None):
+        if runner.run_count == 1:
+            second_run_started.set()
+        return MockRunner.run_commands(runner, commands, env)
+    orchestrator.runner.run_commands = run_commands
+
+    overlapped = []
+
+    class WaitingRepeater(TrackingRepeater):
+        def __call__(self, rundata: RunData) -> bool:
+            if not self.received_rundata:
+                overlapped.append(second_run_started.wait(timeout=5))
+            return super().__call__(rundata)
+    orchestrator.repeater = WaitingRepeater(max_iterations=2)
+
+    result = orchestrator.run()
+
+    assert result.success
+    assert overlapped == [True]
+
+
+def test_pipelined_run_respects_max_iterations(tmp_path) -> None:
+    """The speculative iteration never exceeds max_iterations."""
+    orchestrator = ExecutionOrchestrator(_pipeline_options(tmp_path, 10), experiment_name="pipeline_test")
+    orchestrator.runner = MockRunner()
+
+    result = orchestrator.run(max_iterations=2)
+
+    assert result.success
+    assert orchestrator.runner.run_count == 2
+    assert result.convergence_info["speculative_iterations"] == 0
+    assert not result.convergence_info["stopped_early"]
+
+
+def test_pipelined_failure_keeps_analyzed_rows(tmp_path) -> None:
+    """A failed launch still records the iteration analyzed meanwhile."""
+    orchestrator = ExecutionOrchestrator(_pipeline_options(tmp_path, 5), experiment_name="pipeline_test")
+    runner = MockRunner()
+
+    def crash_on_third(commands, env=None):
+        if runner.run_count == 2:
+            raise RuntimeError("simulated crash")
+        return MockRunner.run_commands(runner, commands, env)
+    orchestrator.runner.run_commands = crash_on_third
+
+    result = orchestrator.run()
+
+    assert not result.success
+    with open(orchestrator.logger.get_csv_path(), newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["repeat"] for row in rows] == ["1", "2"]
+
+
+def _resume_options(tmp_path, experiment: str = "resume_test", **extra) -> Dict:
+    return {
+        "entry_point": "echo",
+        "args": [],
+        "task": "resume_test",
+        "backend_names": ["local"],
+        "backend_options": {"local": {"run": "$CMD $ARGS"}},
+        "metrics": {},
+        "repeats": "COUNT",
+        "repeater_options": {"CR": {"max": 4}},
+        "skip_sys_specs": True,
+        "directory": str(tmp_path / "runlogs"),
+        **extra,
+    }
+
+
+def test_resume_continues_interrupted_launch(tmp_path) -> None:
+    """Resuming replays the rows already written and runs only the missing iterations."""
+    interrupted = ExecutionOrchestrator(_resume_options(tmp_path), experiment_name="resume_test")
+    runner = MockRunner()
+
+    def crash_on_third(commands, env=None):
+        if runner.run_count == 2:
+            raise RuntimeError("simulated crash")
+        return MockRunner.run_commands(runner, commands, env)
+    interrupted.runner.run_commands = crash_on_third
+    assert not interrupted.run().success
+
+    resumed = ExecutionOrchestrator(_resume_options(tmp_path, resume=True), experiment_name="resume_test")
+    resumed.runner = MockRunner()
+    result = resumed.run()
+
+    assert result.success
+    assert resumed.runner.run_count == 2
+    assert result.iteration_count == 4
+    assert result.convergence_info["replayed_iterations"] == 2
+    with open(result.output_paths["csv"], newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["repeat"] for row in rows] == ["1", "2", "3", "4"]
+    assert {row["launch_id"] for row in rows} == {interrupted.logger.launch_id}
+
+    # Complete results are skipped entirely
+    again = ExecutionOrchestrator(_resume_options(tmp_path, resume=True), experiment_name="resume_test")
+    again.runner = MockRunner()
+    skipped = again.run()
+    assert skipped.success
+    assert skipped.convergence_info["skipped"]
+    assert again.runner.run_count == 0
+
+
+def test_resume_reruns_changed_configuration(tmp_path) -> None:
+    """A configuration with a different hash is launched afresh."""
+    first = ExecutionOrchestrator(_resume_options(tmp_path), experiment_name="resume_test")
+    first.runner = MockRunner()
+    assert first.run().success
+
+    changed = ExecutionOrchestrator(_resume_options(tmp_path, args=["-n"], resume=True),
+                                    experiment_name="resume_test")
+    changed.runner = MockRunner()
+    result = changed.run()
+
+    assert result.success
+    assert changed.runner.run_count == 4
+    assert changed.config_hash != first.config_hash
+    with open(result.output_paths["csv"], newline="") as f:
+        assert len(list(csv.DictReader(f))) == 8
+
+
+def test_reuse_results_replays_identical_configuration(tmp_path) -> None:
+    """Results of an identical configuration in another runlog are logged without rerunning."""
+    original = ExecutionOrchestrator(_resume_options(tmp_path), experiment_name="first")
+    original.runner = MockRunner()
+    assert original.run().success
+
+    reusing = ExecutionOrchestrator(_resume_options(tmp_path, reuse_results=True), experiment_name="second")
+    reusing.runner = MockRunner()
+    result = reusing.run()
+
+    assert result.success
+    assert reusing.runner.run_count == 0
+    assert result.convergence_info["replayed_iterations"] == 4
+    with open(result.output_paths["csv"], newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["outer_time"] for row in rows] == ["1.5"] * 4
+    assert {row["launch_id"] for row in rows} == {reusing.logger.launch_id}
+    md = Path(result.output_paths["markdown"]).read_text()
+    assert f"first/resume_test:{original.logger.launch_id}" in md
+
+
+def test_resume_launch_interrupted_after_last_iteration(tmp_path) -> None:
+    """A launch with all its rows but no completion record only writes its metadata."""
+    first = ExecutionOrchestrator(_resume_options(tmp_path), experiment_name="resume_test")
+    first.runner = MockRunner()
+    assert first.run().success
+    # Interrupted after the last row, before the metadata and completion record
+    journal = first.journal.path
+    journal.write_text("".join(line for line in journal.read_text().splitlines(keepends=True)
+                               if '"complete"' not in line))
+    Path(first.logger.get_markdown_path()).unlink()
+
+    resumed = ExecutionOrchestrator(_resume_options(tmp_path, resume=True), experiment_name="resume_test")
+    resumed.runner = MockRunner()
+    result = resumed.run()
+
+    assert result.success
+    assert resumed.runner.run_count == 0
+    assert result.iteration_count == 4
+    assert resumed.journal.lookup(resumed.config_hash) == ("complete", first.logger.launch_id)
+    with open(result.output_paths["csv"], newline="") as f:
+        assert len(list(csv.DictReader(f))) == 4
@@ -31,10 +31,16 @@ from src.core.repeaters.count import CountRepeater
 from src.core.repeaters.rse import RSERepeater
 from src.core.repeaters.ci import CIRepeater
 from src.core.repeaters.hdi import HDIRepeater
-from src.core.repeaters.bb import BBRepeater
+from src.core.repeaters.bb import BBRepeater, autocorrelation
 from src.core.repeaters.gmm import GaussianMixtureRepeater
 from src.core.repeaters.ks import KSRepeater
+from src.core.repeaters.mixture import (
+    IncrementalMixtureSelector,
+    MixtureSelector,
+    effective_covariance_types,
+)
 from src.core.repeaters.decision import DecisionRepeater
+from src.core.repeaters.streaming import StreamingStats
 from tests.fixtures.distributions import distributions, helpers
 from tests.fixtures.repeater_fixtures import (
     MockRunData,
@@ -1309,3 +1315,203 @@ def test_hdi_repeater_with_constant_data_tight_threshold():
         "Should respect starting_sample minimum"
     assert stopped_at_count < 30, \
         "Constant data should converge quickly (no variance)"
+
+
+# ============================================================================
+# STREAMING STATISTICS TESTS
+# Tests for the incremental accumulator backing all CountRepeater subclasses.
+# ============================================================================
+
+
+def test_streaming_stats_match_batch_statistics():
+    """Running mean/std must match numpy/scipy over the same samples."""
+    rng = numpy.random.default_rng(7)
+    data = rng.lognormal(0.0, 0.5, size=1000)
+    stats = StreamingStats(capacity=4)  # Forces several buffer growths
+
+    stats.extend(data)
+
+    assert len(stats) == 1000
+    numpy.testing.assert_array_equal(stats.values, data)
+    assert stats.mean == pytest.approx(numpy.mean(data), rel=1e-12)
+    assert stats.std() == pytest.approx(scipy.stats.tstd(data), rel=1e-10)
+
+
+def test_streaming_stats_hdi_matches_arviz():
+    """Incremental HDI must equal arviz.hdi at every prefix length."""
+    import arviz
+
+    rng = numpy.random.default_rng(11)
+    data = rng.gamma(2.0, 1.0, size=300)
+    stats = StreamingStats(track_order=True)
+
+    for i, value in enumerate(data):
+        stats.append(value)
+        if i >= 1:
+            expected = arviz.hdi(data[:i + 1], hdi_prob=0.89)
+            assert stats.hdi(0.89) == (expected[0], expected[1])
+    numpy.testing.assert_array_equal(stats.sorted_values, numpy.sort(data))
+
+
+def test_streaming_stats_values_are_read_only():
+    """Views exposed to repeaters cannot corrupt the accumulator."""
+    stats = StreamingStats()
+    stats.extend([1.0, 2.0])
+
+    with pytest.raises(ValueError):
+        stats.values[0] = 5.0
+
+
+def test_streaming_stats_undefined_variance():
+    """Variance with fewer samples than ddof+1 is nan, like scipy."""
+    stats = StreamingStats()
+    assert numpy.isnan(stats.mean)
+    stats.append(3.0)
+    assert numpy.isnan(stats.std())
+
+
+def test_autocorrelation_matches_direct_correlation():
+    """FFT autocorrelation should equal the O(n^2) numpy.correlate formula."""
+    data = numpy.random.default_rng(3).normal(size=257).cumsum()
+    ndata = data - data.mean()
+    expected = numpy.correlate(ndata, ndata, "full")[len(ndata) - 1:] / data.var() / len(data)
+    numpy.testing.assert_allclose(autocorrelation(data), expected, atol=1e-10)
+
+
+def test_bb_bootstrap_means_match_explicit_resampling():
+    """Prefix-sum bootstrap means should equal means of the concatenated blocks."""
+    repeater = BBRepeater({"repeater_options": {"BB": {"seed": 7, "num_samples": 50}}})
+    data = list(numpy.random.default_rng(0).normal(10, 1, 37))
+    for value in data:
+        repeater._stats.append(value)
+
+    bsize = 4
+    starts = numpy.random.default_rng(7).integers(0, len(data) - bsize + 1, size=(50, 10))
+    expected = [numpy.mean(numpy.concatenate([data[s:s + bsize] for s in row])) for row in starts]
+
+    numpy.testing.assert_allclose(repeater._bootstrap_means(bsize), expected)
+
+
+def _bb_stop_count(data, **opts):
+    """Count at which a BB repeater with the given options stops on data."""
+    repeater = BBRepeater({"repeater_options": {"BB": {"max": len(data), "min": 20, **opts}}})
+    pdata = MockRunData({"outer_time": []})
+    for value in data:
+        pdata.set_metric("outer_time", [value])
+        if not repeater(pdata):
+            break
+    return repeater.get_count()
+
+
+def test_bb_seed_makes_decisions_reproducible():
+    """Seeded BB repeaters should stop at the same iteration."""
+    data = list(numpy.random.default_rng(1).normal(10, 0.5, 200))
+
+    assert _bb_stop_count(data, seed=11) == _bb_stop_count(data, seed=11)
+    assert _bb_stop_count(data, seed=11, reuse_samples=True) == _bb_stop_count(data, seed=11, reuse_samples=True)
+
+
+def test_bb_reuse_samples_stops_like_resampling():
+    """Reusing block draws should stop at counts comparable to resampling from scratch."""
+    data = list(numpy.random.default_rng(3).normal(10, 2, 400))
+
+    fresh = [_bb_stop_count(data, seed=seed) for seed in range(4)]
+    reused = [_bb_stop_count(data, seed=seed, reuse_samples=True) for seed in range(4)]
+
+    assert min(fresh) > 100  # Slow to converge: a premature stop would show
+    assert numpy.median(reused) == pytest.approx(numpy.median(fresh), rel=0.2)
+
+
+def test_bb_reuse_samples_redraws_trailing_block():
+    """Reused means change with every new measurement, even within the last block."""
+    repeater = BBRepeater({"repeater_options": {"BB": {"seed": 5, "num_samples": 20,
+                                                       "reuse_samples": True}}})
+    for value in range(1, 22):
+        repeater._stats.append(float(value))
+    first = repeater._bootstrap_means(4).copy()
+
+    assert numpy.array_equal(repeater._bootstrap_means(4), first)  # No new data, same means
+    repeater._stats.append(22.0)  # Still six blocks of four
+    assert not numpy.array_equal(repeater._bootstrap_means(4), first)
+
+
+# --- Mixture model selection Tests ---
+
+
+def test_effective_covariance_types_drop_1d_duplicates():
+    """Spherical, diag and full are the same model in one dimension."""
+    assert effective_covariance_types(["spherical", "tied", "diag", "full"]) == ["full", "tied"]
+    assert effective_covariance_types(["diag", "spherical"], ndim=2) == ["diag", "spherical"]
+
+
+def test_mixture_selector_matches_grid_search():
+    """Warm-started selection should pick the same component count as GridSearchCV."""
+    from sklearn.mixture import GaussianMixture
+    from sklearn.model_selection import GridSearchCV
+
+    rng = numpy.random.default_rng(4)
+    data = numpy.concatenate((rng.normal(10, 0.5, 60), rng.normal(20, 0.5, 60)))
+    rng.shuffle(data)
+    X = data.reshape(-1, 1)
+
+    grid = GridSearchCV(GaussianMixture(), scoring=lambda est, X: -est.bic(X),
+                        param_grid={"n_components": range(1, 5), "covariance_type": ["full", "tied"]}).fit(X)
+    selector = MixtureSelector(["spherical", "tied", "diag", "full"])
+    best = selector.select(data, range(1, 5))
+
+    assert selector.best_params["n_components"] == grid.best_params_["n_components"] == 2
+    assert sorted(best.means_.flatten()) == pytest.approx([10, 20], abs=0.3)
+    # A second selection reuses (warm-starts) the same estimators
+    estimators = dict(selector._estimators)
+    selector.select(numpy.append(data, 10.1), range(1, 5))
+    assert all(selector._estimators[key] is model for key, model in estimators.items())
+
+
+def test_incremental_selector_refit_policy():
+    """Selection reruns every refit_every samples or on a material shift."""
+    rng = numpy.random.default_rng(5)
+    data = list(rng.normal(10, 1, 40))
+    selector = IncrementalMixtureSelector(["full"], range(1, 3), refit_every=5, refit_tolerance=0.5)
+
+    first = selector.update(data)
+    assert first is not None and selector.fits == 1
+    for _ in range(4):
+        data.append(10.0)
+        assert selector.update(data) is first
+    assert selector.fits == 1
+    data.append(10.0)
+    selector.update(data)
+    assert selector.fits == 2
+
+    data.extend([30.0, 30.0])  # Shifts the mean by more than half a std
+    selector.update(data)
+    assert selector.fits == 3
+
+
+def test_incremental_selector_background_fit():
+    """Background selection returns immediately and is adopted when done."""
+    data = list(numpy.random.default_rng(6).normal(10, 1, 40))
+    selector = IncrementalMixtureSelector(["full"], range(1, 3), background=True)
+    try:
+        assert selector.update(data) is None
+        model = selector.wait()
+        assert model is not None and selector.best_params is not None
+        assert selector.update(data) is model  # Nothing new, no refit
+    finally:
+        selector.close()
+
+
+def test_gmm_repeater_refits_periodically():
+    """GaussianMixtureRepeater only reruns model selection every refit_every runs."""
+    repeater = GaussianMixtureRepeater({"repeater_options": {"GMM": {
+        "max": 100, "starting_sample": 10, "max_gaussian_components": 3,
+        "goodness_threshold": 100.0, "refit_every": 10, "refit_tolerance": 0.0,
+    }}})
+    pdata = MockRunData({"outer_time": []})
+    for value in numpy.random.default_rng(7).normal(10, 1, 60):
+        pdata.set_metric("outer_time", [float(value)])
+        assert repeater(pdata)
+
+    selector = repeater._GaussianMixtureRepeater__selector
+    # Checks start after 3 * 4 = 12 runs; runs 13..60 refit at 13, 23, 33, 43, 53
+    assert selector.fits == 5
@@ -0,0 +1,153 @@
+"""
+Tests for the persistent runlogs index and the scanner functions built on it.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+from src.core.runlogs import index as index_module
+from src.core.runlogs.index import INDEX_FILENAME, RunlogIndex
+from src.core.runlogs.scanner import (
+    _scan_markdown_files,
+    get_experiments,
+    get_tasks_for_experiment,
+    query_runlogs,
+    scan_runlogs,
+)
+from src.core.runlogs.writer import RunLogger
+
+
+def _write_run(root: Path, experiment: str, task: str, backends: list[str],
+               mtime: float, csv: bool = True) -> Path:
+    """Write a minimal <experiment>/<task>.md (and CSV) runlog."""
+    exp_dir = root / experiment
+    exp_dir.mkdir(parents=True, exist_ok=True)
+    options = {"entry_point": f"/bin/{task}", "backend_names": backends, "description": f"{task} run"}
+    md_path = exp_dir / f"{task}.md"
+    md_path.write_text(
+        "Experiment completed at 2025-01-01 (total experiment time: 7s, total rows: 3).\n\n"
+        f"## Initial runtime options\n\n```json\n{json.dumps(options)}\n```\n"
+    )
+    os.utime(md_path, (mtime, mtime))
+    if csv:
+        md_path.with_suffix(".csv").write_text("repeat,outer_time\n1,1.0\n")
+    return md_path
+
+
+def _populate(root: Path) -> None:
+    _write_run(root, "exp_a", "alpha", ["local"], 1_700_000_000)
+    _write_run(root, "exp_a", "beta", ["perf", "local"], 1_700_000_100)
+    _write_run(root, "exp_b", "gamma", ["ssh"], 1_700_000_200, csv=False)
+
+
+def test_scan_uses_index_and_matches_direct_scan(tmp_path) -> None:
+    """Indexed results are identical to parsing every file."""
+    _populate(tmp_path)
+
+    runs = scan_runlogs(str(tmp_path))
+
+    assert (tmp_path / INDEX_FILENAME).exists()
+    assert runs == _scan_markdown_files(tmp_path, None)
+    assert [r["task"] for r in runs] == ["gamma", "beta", "alpha"]
+    assert runs[1]["backends"] == ["perf", "local"]
+    assert runs[1]["duration"] == 7
+    assert runs[1]["rows"] == 3
+    assert runs[0]["csv_path"] is None
+    assert [r["task"] for r in scan_runlogs(str(tmp_path), limit=2)] == ["gamma", "beta"]
+
+
+def test_refresh_only_parses_changed_files(tmp_path, monkeypatch) -> None:
+    """Unchanged files are served from the index; changes and deletions are picked up."""
+    _populate(tmp_path)
+    scan_runlogs(str(tmp_path))
+
+    parsed = []
+    original = index_module.parse_markdown_metadata
+    monkeypatch.setattr(index_module, "parse_markdown_metadata",
+                        lambda path: parsed.append(path.name) or original(path))
+
+    scan_runlogs(str(tmp_path))
+    assert parsed == []
+
+    _write_run(tmp_path, "exp_a", "alpha", ["docker"], 1_700_000_300)
+    (tmp_path / "exp_b" / "gamma.md").unlink()
+    (tmp_path / "exp_a" / "beta.csv").unlink()
+    runs = scan_runlogs(str(tmp_path))
+
+    assert parsed == ["alpha.md"]
+    assert [(r["task"], r["backends"]) for r in runs] == [("alpha", ["docker"]), ("beta", ["perf", "local"])]
+    assert runs[1]["csv_path"] is None
+
+
+def test_query_filters(tmp_path) -> None:
+    """Runs can be filtered by experiment, backend, benchmark, time and CSV."""
+    _populate(tmp_path)
+
+    def tasks(**filters):
+        return [r["task"] for r in query_runlogs(str(tmp_path), **filters)]
+
+    assert tasks(experiment="exp_a") == ["beta", "alpha"]
+    assert tasks(backend="local") == ["beta", "alpha"]
+    assert tasks(benchmark="gamma") == ["gamma"]
+    assert tasks(since=datetime.fromtimestamp(1_700_000_050)) == ["gamma", "beta"]
+    assert tasks(until=datetime.fromtimestamp(1_700_000_100)) == ["alpha"]
+    assert tasks(with_csv=True, limit=1) == ["beta"]
+
+
+def test_experiment_and_task_listing(tmp_path, monkeypatch) -> None:
+    """GUI listing helpers are answered from the index."""
+    _populate(tmp_path)
+    monkeypatch.setattr("src.core.runlogs.scanner._runlogs_path", lambda _: tmp_path)
+
+    assert get_experiments() == {"exp_a": "exp_a", "exp_b": "exp_b"}
+    assert get_tasks_for_experiment("exp_a") == {
+        str(tmp_path / "exp_a" / "beta.csv"): "beta",
+        str(tmp_path / "exp_a" / "alpha.csv"): "alpha",
+    }
+    assert get_tasks_for_experiment("exp_b") == {}
+
+
+def test_run_logger_updates_index(tmp_path) -> None:
+    """save_md records the new run in the index without a rescan."""
+    logger = RunLogger(str(tmp_path), "exp_c", "delta", {"entry_point": "/bin/delta"})
+    logger.add_row_data("outer_time", "1.0", "float", "time")
+    logger.save_csv()
+    logger.save_md()
+
+    with RunlogIndex(tmp_path) as index:
+        runs = index.runs()
+    assert [(r["experiment"], r["task"], r["benchmark"]) for r in runs] == [("exp_c", "delta", "delta")]
+    assert runs[0]["csv_path"] == tmp_path / "exp_c" / "delta.csv"
+
+
+def test_scan_falls_back_without_writable_index(tmp_path, monkeypatch) -> None:
+    """If the index cannot be opened, markdown files are parsed directly."""
+    _populate(tmp_path)
+    monkeypatch.setattr(index_module, "INDEX_FILENAME", "missing_dir/index.sqlite")
+
+    runs = scan_runlogs(str(tmp_path))
+
+    assert [r["task"] for r in runs] == ["gamma", "beta", "alpha"]
+    assert [r["task"] for r in query_runlogs(str(tmp_path), experiment="exp_b")] == ["gamma"]
+
+
+def test_find_launches_by_config_hash(tmp_path) -> None:
+    """Launches are found by the config_hash invariant, newest run first."""
+    for experiment, mtime, launches in (("old", 1_700_000_000, {"l1": "abc", "l2": "def"}),
+                                        ("new", 1_700_000_100, {"l3": "abc"})):
+        md_path = _write_run(tmp_path, experiment, "task", ["local"], mtime)
+        invariants = {launch: {"config_hash": digest} for launch, digest in launches.items()}
+        md_path.write_text(md_path.read_text() + f"\n## Invariant parameters\n\n```json\n{json.dumps(invariants)}\n```\n")
+        os.utime(md_path, (mtime, mtime))
+
+    with RunlogIndex(tmp_path) as index:
+        index.refresh()
+        matches = index.find_launches("abc")
+        assert index.find_launches("missing") == []
+
+    assert [(m["md_path"].parent.name, m["launch_id"]) for m in matches] == [("new", "l3"), ("old", "l1")]
+    assert matches[0]["csv_path"] == tmp_path / "new" / "task.csv"
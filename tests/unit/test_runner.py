@@ -10,8 +10,14 @@ Uses controlled shell commands (echo, sleep, false) to test actual behavior.
 import pytest
 import tempfile
 import os
+import resource
+import signal
+import subprocess
+import sys
+import time
 import warnings
 
+from src.core.execution.command_composer import CommandComposer
 from src.core.execution.runner import Runner
 
 
@@ -284,3 +290,212 @@ def test_environment_variables_available() -> None:
 
     os.unlink(output_files[0].name)
 
+
+
+# ========== Test event-driven waiting ==========
+
+def test_exit_times_recorded_per_command() -> None:
+    """Test that each child's exit time is recorded when it exits."""
+    runner = Runner(timeout=5)
+    commands = ['sleep 0.3', 'true']
+
+    success, output_files, elapsed_time = runner.run_commands(commands)
+
+    assert success
+    assert len(runner.exit_times) == 2
+    assert all(t is not None for t in runner.exit_times)
+    # The fast command must be recorded as exiting well before the slow one
+    assert runner.exit_times[1] < runner.exit_times[0] - 0.1
+    assert elapsed_time >= 0.3
+
+    for f in output_files:
+        os.unlink(f.name)
+
+
+def test_wait_does_not_busy_poll() -> None:
+    """Test that waiting for a child consumes almost no launcher CPU."""
+    runner = Runner(timeout=5)
+    cpu_before = time.process_time()
+
+    success, output_files, elapsed_time = runner.run_commands(['sleep 0.5'])
+
+    assert success
+    assert time.process_time() - cpu_before < 0.1
+
+    for f in output_files:
+        os.unlink(f.name)
+
+
+def test_timeout_marks_unfinished_exit_times() -> None:
+    """Test that commands killed at timeout have no exit time."""
+    runner = Runner(timeout=0.5)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        warnings.simplefilter("ignore", ResourceWarning)
+        success, output_files, elapsed_time = runner.run_commands(['true', 'sleep 10'])
+
+    assert not success
+    assert runner.exit_times[0] is not None
+    assert runner.exit_times[1] is None
+
+    for f in output_files:
+        if os.path.exists(f.name):
+            os.unlink(f.name)
+
+
+def test_error_message_names_failing_command() -> None:
+    """Test that errors report the command that failed, not completion order."""
+    runner = Runner(timeout=5)
+    commands = ['sleep 0.2', '/nonexistent/command/xyz']
+
+    with pytest.raises(RuntimeError, match="/nonexistent/command/xyz"):
+        runner.run_commands(commands)
+
+
+# ========== Test per-copy metrics ==========
+
+def test_copy_metrics_report_each_copy() -> None:
+    """Test that per-copy timing and rusage are reported for every copy."""
+    runner = Runner(timeout=5)
+    commands = ['sleep 0.3', 'true', 'true']
+
+    success, output_files, elapsed_time = runner.run_commands(commands)
+    metrics = runner.copy_metrics()
+
+    assert success
+    for name in ("copy_start", "copy_time", "copy_user_time", "copy_sys_time",
+                 "copy_max_rss", "copy_vol_ctx_switches", "copy_invol_ctx_switches",
+                 "launch_skew", "straggler_ratio"):
+        assert len(metrics[name]) == 3, name
+    assert float(metrics["copy_start"][0]) == 0.0
+    assert float(metrics["copy_time"][0]) >= 0.3
+    assert float(metrics["copy_time"][1]) < float(metrics["copy_time"][0])
+    assert metrics["copy_max_rss"][0] == "NA"  # No larger than the launcher's own peak
+    # One slow copy among fast ones is a straggler
+    assert float(metrics["straggler_ratio"][0]) > 2
+    assert metrics["launch_skew"][0] == metrics["launch_skew"][2]
+
+    for f in output_files:
+        os.unlink(f.name)
+
+
+@pytest.mark.parametrize("exec_mode", ["shell", "direct", "spawn"])
+def test_copy_max_rss_is_the_copy_own_peak(exec_mode) -> None:
+    """Test that copy_max_rss reports a copy's peak above the launcher's, whatever the exec mode."""
+    launcher_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    size_kb = launcher_kb + 100 * 1024
+    runner = Runner(timeout=30, exec_mode=exec_mode)
+    _, output_files, _ = runner.run_commands([f"{sys.executable} -c 'b = b\"x\" * ({size_kb} * 1024)'"])
+
+    assert float(runner.copy_metrics()["copy_max_rss"][0]) >= size_kb
+    for f in output_files:
+        os.unlink(f.name)
+
+
+def test_copy_time_includes_launch_cost(monkeypatch) -> None:
+    """Test that copy times start before the launch, like outer_time."""
+    runner = Runner(timeout=5)
+    launch = runner._launch
+
+    def slow_launch(*args, **kwargs):
+        time.sleep(0.2)
+        return launch(*args, **kwargs)
+
+    monkeypatch.setattr(runner, "_launch", slow_launch)
+    _, output_files, elapsed_time = runner.run_commands(['true'])
+
+    assert float(runner.copy_metrics()["copy_time"][0]) >= 0.2
+    for f in output_files:
+        os.unlink(f.name)
+
+
+def test_copy_metrics_empty_before_run() -> None:
+    """Test that no per-copy metrics are reported before any run."""
+    assert Runner(timeout=5).copy_metrics() == {}
+
+
+# ========== Test CPU pinning ==========
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="CPU affinity not supported")
+def test_cpu_set_pins_commands() -> None:
+    """Test that commands run with the runner's CPU set as their affinity."""
+    cpu = sorted(os.sched_getaffinity(0))[-1]
+    runner = Runner(timeout=5, cpu_set=[cpu])
+
+    success, output_files, _ = runner.run_commands(["grep Cpus_allowed_list /proc/self/status"])
+
+    assert success
+    with open(output_files[0].name) as f:
+        assert f.read().split()[-1] == str(cpu)
+    os.unlink(output_files[0].name)
+
+
+# ========== Test exec modes ==========
+
+@pytest.mark.parametrize("command, argv", [
+    ("./benchmark 100", ["./benchmark", "100"]),
+    ("ssh node1 './benchmark 100'\n", ["ssh", "node1", "./benchmark 100"]),
+    ('perf stat -e cycles -- ./benchmark "a b"', ["perf", "stat", "-e", "cycles", "--", "./benchmark", "a b"]),
+    ("echo $HOME", None),
+    ("cat out.txt | wc -l", None),
+    ("./benchmark > out.txt", None),
+    ("OMP_NUM_THREADS=4 ./benchmark", None),
+    ("cd /tmp && ./benchmark", None),
+    ("exit 3", None),
+    ("ls *.csv", None),
+    ("echo 'unbalanced", None),
+])
+def test_argv_only_for_commands_without_shell_features(command, argv) -> None:
+    """Test that only single simple commands get an argv form."""
+    assert CommandComposer.argv(command) == argv
+
+
+def test_direct_mode_skips_shell_for_simple_commands() -> None:
+    """Test that direct mode executes simple commands itself and keeps the shell for the rest."""
+    runner = Runner(timeout=5, exec_mode="direct")
+    commands = ['echo "a  b"', 'echo $((6 * 7))', '/nonexistent/command/xyz --help']
+
+    with pytest.raises(RuntimeError, match="/nonexistent/command/xyz"):
+        runner.run_commands(commands[2:])  # Missing commands fail as with the shell (exit code 127)
+    success, output_files, _ = runner.run_commands(commands[:2])
+
+    assert success
+    assert runner.exec_modes == ["direct", "shell"]
+    assert [open(f.name).read() for f in output_files] == ["a  b\n", "42\n"]
+    for f in output_files:
+        os.unlink(f.name)
+
+
+@pytest.mark.skipif(not getattr(subprocess, "_USE_POSIX_SPAWN", False), reason="posix_spawn not used by subprocess")
+def test_spawn_mode_uses_posix_spawn(monkeypatch) -> None:
+    """Test that spawn mode launches simple commands through os.posix_spawn."""
+    spawned = []
+    posix_spawn = os.posix_spawn
+
+    def spy(path, *args, **kwargs):
+        spawned.append(path)
+        return posix_spawn(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "posix_spawn", spy)
+    runner = Runner(timeout=5, exec_mode="spawn")
+    success, output_files, _ = runner.run_commands(["echo spawned"])
+
+    assert success
+    assert runner.exec_modes == ["spawn"]
+    assert spawned and spawned[0].endswith("/echo")
+    assert open(output_files[0].name).read() == "spawned\n"
+    assert runner.copy_metrics()["copy_user_time"][0] != "NA"  # Still reaped with wait4
+    os.unlink(output_files[0].name)
+
+    # Signals Python ignores (SIGPIPE) are restored to their defaults in the child
+    _, output_files, _ = runner.run_commands(["cat /proc/self/status"])
+    ignored = next(line for line in open(output_files[0].name) if line.startswith("SigIgn:"))
+    assert not int(ignored.split()[1], 16) & (1 << (signal.SIGPIPE - 1))
+    os.unlink(output_files[0].name)
+
+
+def test_unknown_exec_mode_rejected() -> None:
+    """Test that an unknown exec mode is an error."""
+    with pytest.raises(ValueError, match="Unknown exec mode"):
+        Runner(exec_mode="fast")
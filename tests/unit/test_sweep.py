@@ -7,13 +7,16 @@ Tests CartesianSweepStrategy functionality including:
 - Args, env, and options section handling
 - Error handling for invalid sweep data
 
+And the sampling strategies (random, Latin hypercube, Bayesian) that run a
+budget of configurations, and the knee search over mpl levels.
+
 © Copyright 2022--2025 Hewlett Packard Enterprise Development LP
 """
 
 import pytest
 from pydantic import ValidationError
 from src.core.config.schema import ExperimentConfig, SweepConfig
-from src.core.execution.parameter_space import CartesianSweepStrategy
+from src.core.execution.parameter_space import CartesianSweepStrategy, create_parameter_space_strategy
 
 
 @pytest.fixture
@@ -386,3 +389,211 @@ def test_large_cartesian_product(temp_sweep_dir, base_config):
         for c in configs
     ]
     assert len(set(env_tuples)) == 24
+
+
+def test_lazy_expansion_and_random_access(temp_sweep_dir, base_config):
+    """Test that points can be indexed directly and match iteration order."""
+    sweep_dict = {
+        "args": [["--size", "100"], ["--size", "200"]],
+        "env": {"A": ["1", "2", "3"]},
+        "options": {"mpl": [1, 2]}
+    }
+
+    strategy = create_strategy(sweep_dict, base_config)
+    configs = strategy.generate_configurations()
+
+    iterated = list(configs)
+    assert len(configs) == len(iterated) == 12
+    for index, (launch_id, config, parameters) in enumerate(iterated):
+        indexed_id, indexed_config, indexed_parameters = configs[index]
+        assert indexed_id == launch_id
+        assert indexed_parameters == parameters
+        assert indexed_config.model_dump() == config.model_dump()
+    assert configs[-1][0] == iterated[-1][0]
+    assert [c[0] for c in configs[1::5]] == [iterated[1][0], iterated[6][0], iterated[11][0]]
+    with pytest.raises(IndexError):
+        configs[12]
+
+
+def test_huge_sweep_is_not_materialized(temp_sweep_dir, base_config):
+    """Test that a 10^6-point sweep has a length and any point without expanding the rest."""
+    sweep_dict = {"env": {f"V{d}": [str(v) for v in range(10)] for d in range(6)}}
+
+    strategy = create_strategy(sweep_dict, base_config)
+    configs = strategy.generate_configurations()
+
+    assert len(configs) == 10 ** 6
+    launch_id, config, parameters = configs[123456]
+    assert launch_id.startswith("sweep_123457_")
+    assert [config.environment[f"V{d}"] for d in range(6)] == ["1", "2", "3", "4", "5", "6"]
+    assert parameters["env.V5"] == "6"
+    assert strategy.get_parameter_ranges()["env.V0"] == [str(v) for v in range(10)]
+
+
+def test_points_do_not_share_overrides(temp_sweep_dir, base_config):
+    """Test that overlays leave the base config and other points untouched."""
+    base_config.environment["KEEP"] = "base"
+    strategy = create_strategy({"env": {"VAR": ["a", "b"]}}, base_config)
+    configs = strategy.generate_configurations()
+
+    first, second = configs[0][1], configs[1][1]
+    assert (first.environment["VAR"], second.environment["VAR"]) == ("a", "b")
+    assert first.environment["KEEP"] == second.environment["KEEP"] == "base"
+    assert "VAR" not in base_config.environment
+
+
+def test_swept_options_apply_as_runtime_options(temp_sweep_dir, base_config):
+    """Test that swept options are also set at the top level, where launch reads mpl and the like."""
+    configs = create_strategy({"options": {"mpl": [1, 3]}}, base_config).generate_configurations()
+
+    assert [c.model_dump()["mpl"] for _, c, _ in configs] == [1, 3]
+    assert [c.options["mpl"] for _, c, _ in configs] == [1, 3]
+
+
+def _sample(sweep_dict: dict, base_config: ExperimentConfig):
+    """Create a sampling strategy from a sweep dict with a strategy key."""
+    sweep_config = SweepConfig(**sweep_dict)
+    return create_parameter_space_strategy(base_config, sweep_config, sweep_config.strategy)
+
+
+def test_random_strategy_runs_budget_of_distinct_points(base_config):
+    """Test that random sampling picks budget distinct points, reproducibly with a seed."""
+    sweep_dict = {"env": {"A": [str(v) for v in range(10)], "B": [str(v) for v in range(10)]},
+                  "strategy": "random", "budget": 20, "seed": 7}
+
+    configs = _sample(sweep_dict, base_config).generate_configurations()
+    points = [(c.environment["A"], c.environment["B"]) for _, c, _ in configs]
+    again = [(c.environment["A"], c.environment["B"]) for _, c, _ in _sample(sweep_dict, base_config).generate_configurations()]
+
+    assert len(configs) == 20
+    assert len(set(points)) == 20
+    assert points == again
+
+
+def test_budget_larger_than_space_runs_every_point_once(base_config):
+    """Test that the budget is capped at the number of combinations."""
+    configs = _sample({"env": {"A": ["1", "2", "3"]}, "strategy": "random", "budget": 10}, base_config) \
+        .generate_configurations()
+
+    launched = list(configs)
+    assert len(configs) == 3
+    assert sorted(c.environment["A"] for _, c, _ in launched) == ["1", "2", "3"]
+    assert [launch_id.split("_")[1] for launch_id, _, _ in launched] == ["0001", "0002", "0003"]
+
+
+def test_latin_hypercube_covers_every_value(base_config):
+    """Test that with budget equal to the dimension sizes, each value is used exactly once."""
+    sweep_dict = {"env": {"A": [str(v) for v in range(6)], "B": [str(v) for v in range(6)]},
+                  "options": {"mpl": [1, 2, 3, 4, 5, 6]}, "strategy": "lhs", "budget": 6, "seed": 3}
+
+    launched = list(_sample(sweep_dict, base_config).generate_configurations())
+
+    assert len(launched) == 6
+    assert sorted(c.environment["A"] for _, c, _ in launched) == [str(v) for v in range(6)]
+    assert sorted(c.environment["B"] for _, c, _ in launched) == [str(v) for v in range(6)]
+    assert sorted(c.options["mpl"] for _, c, _ in launched) == [1, 2, 3, 4, 5, 6]
+
+
+def test_bayesian_strategy_finds_optimum_with_few_runs(base_config):
+    """Test that the surrogate model steers a small budget to the minimum of a smooth metric."""
+    sweep_dict = {"args": [[str(x)] for x in range(50)],
+                  "env": {"THREADS": ["1", "2", "4", "8", "16", "32", "64"]},
+                  "strategy": "bayesian", "budget": 20, "metric": "time", "seed": 1}
+    strategy = _sample(sweep_dict, base_config)
+
+    for launch_id, config, _ in strategy.generate_configurations():
+        x, threads = int(config.options["args"][0]), int(config.environment["THREADS"])
+        strategy.tell(launch_id, (x - 37) ** 2 / 100 + (threads.bit_length() - 4) ** 2)
+
+    (_, config, parameters), value = strategy.best()
+    assert len(strategy.results) == 20
+    assert value < 0.1
+    assert abs(int(parameters["args"][0]) - 37) <= 3
+    assert parameters["env.THREADS"] == "8"
+
+
+def test_sampling_maximize_and_failed_runs(base_config):
+    """Test that best() honors the goal and ignores failed configurations."""
+    sweep_dict = {"options": {"mpl": [1, 2, 3, 4]}, "strategy": "random", "goal": "maximize", "metric": "rate"}
+    strategy = _sample(sweep_dict, base_config)
+
+    for launch_id, config, _ in strategy.generate_configurations():
+        mpl = config.options["mpl"]
+        strategy.tell(launch_id, None if mpl == 4 else float(mpl * 10))
+
+    (launch_id, config, _), value = strategy.best()
+    assert config.options["mpl"] == 3
+    assert value == 30.0
+    assert launch_id.startswith("sweep_")
+
+
+def test_unknown_strategy_rejected(base_config):
+    """Test that only known strategies validate."""
+    with pytest.raises(ValidationError):
+        SweepConfig(env={"A": ["1"]}, strategy="genetic")
+    with pytest.raises(ValueError, match="Unknown parameter space strategy"):
+        create_parameter_space_strategy(base_config, SweepConfig(env={"A": ["1"]}), "genetic")
+
+
+def _run_levels(strategy, measure):
+    """Drive a knee search, reporting rows built from measure(mpl) -> (copy_time, outer_time) or None."""
+    levels = []
+    for launch_id, config, parameters in strategy.generate_configurations():
+        mpl = config.model_dump()["mpl"]
+        assert parameters == {"mpl": mpl} and config.options["mpl"] == mpl
+        levels.append(mpl)
+        timing = measure(mpl)
+        rows = None if timing is None else [[{"outer_time": str(timing[1]), "copy_time": str(timing[0])}
+                                             for _ in range(mpl)] for _ in range(3)]
+        strategy.report(launch_id, rows)
+    return levels
+
+
+def test_knee_search_locates_knee_and_slo_limit(base_config):
+    """Test exponential then bisection search on a system that saturates at 12 copies."""
+    strategy = _sample({"strategy": "knee", "max_mpl": 64, "knee_efficiency": 0.6, "slo_factor": 2.0},
+                       base_config)
+
+    # One copy takes 1s alone; beyond 12 copies they share 12 cores
+    levels = _run_levels(strategy, lambda mpl: (max(1.0, mpl / 12), max(1.0, mpl / 12)))
+
+    assert levels[:6] == [1, 2, 4, 8, 16, 32]
+    assert strategy.knee() == 12
+    assert strategy.slo_limit() == 24
+    assert len(levels) <= len(strategy.generate_configurations())
+    assert len(levels) == len(set(levels))
+    title, body = strategy.markdown_section()
+    assert title == "Scalability curve"
+    assert "| 12 | sweep_" in body and "Scalability knee: mpl 12" in body
+
+
+def test_knee_search_stops_at_failed_level(base_config):
+    """Test that a failing level bounds the search and a scaling system reports no knee below it."""
+    strategy = _sample({"strategy": "knee", "max_mpl": 16, "env": {"A": "1"}}, base_config)
+
+    levels = _run_levels(strategy, lambda mpl: None if mpl > 8 else (1.0, 1.0))
+
+    assert levels == [1, 2, 4, 8, 16, 12, 10, 9]
+    assert strategy.knee() == 8
+    assert strategy.summary() == ["Scalability knee: mpl 8"]
+
+
+def test_knee_search_without_knee_or_slo_violation(base_config):
+    """Test a perfectly scaling system: only the doubling phase runs."""
+    strategy = _sample({"strategy": "knee", "max_mpl": 8, "slo": 5.0}, base_config)
+
+    levels = _run_levels(strategy, lambda mpl: (1.0, 1.0))
+
+    assert levels == [1, 2, 4, 8]
+    assert strategy.knee() is None and strategy.slo_limit() == 8
+    assert strategy.summary()[0] == "Scalability knee: not reached up to mpl 8"
+
+
+def test_knee_search_rejects_swept_configurations(base_config):
+    """Test that the knee strategy needs one configuration and owns mpl."""
+    with pytest.raises(ValueError, match="single configuration"):
+        _sample({"strategy": "knee", "env": {"A": ["1", "2"]}}, base_config)
+    with pytest.raises(ValueError, match="chooses mpl"):
+        _sample({"strategy": "knee", "options": {"mpl": [1, 2]}}, base_config)
+    with pytest.raises(ValidationError):
+        SweepConfig(strategy="random")
@@ -0,0 +1,85 @@
+"""
+Unit tests for SweepScheduler - concurrent sweep configurations under a resource budget.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+import os
+
+import pytest
+
+from src.core.execution.sweep_scheduler import SweepJob, SweepScheduler
+from tests.fixtures.stand_ins import tracking_job
+
+
+def test_runs_up_to_max_parallel() -> None:
+    """Jobs overlap, but never more than max_parallel at once."""
+    active, peak = {"jobs": 0, "cores": 0}, {"jobs": 0, "cores": 0}
+    jobs = [tracking_job(SweepJob, f"sweep_{i}", active, peak) for i in range(8)]
+
+    results = SweepScheduler(3, core_budget=64).run(jobs)
+
+    assert list(results) == [f"sweep_{i}" for i in range(8)]
+    assert all(code == 0 for code in results.values())
+    assert peak["jobs"] == 3
+
+
+def test_core_and_memory_budgets() -> None:
+    """Running jobs never exceed the core or memory budget."""
+    active, peak = {"jobs": 0, "cores": 0}, {"jobs": 0, "cores": 0}
+    jobs = [tracking_job(SweepJob, f"sweep_{i}", active, peak, cores=3) for i in range(6)]
+    SweepScheduler(8, core_budget=7).run(jobs)
+    assert peak["cores"] == 6
+
+    peak.update(jobs=0, cores=0)
+    jobs = [tracking_job(SweepJob, f"sweep_{i}", active, peak, memory_mb=400) for i in range(6)]
+    SweepScheduler(8, core_budget=64, memory_budget_mb=1000).run(jobs)
+    assert peak["jobs"] == 2
+
+
+def test_oversized_job_runs_alone() -> None:
+    """A job larger than the budget still runs, with a warning."""
+    active, peak = {"jobs": 0, "cores": 0}, {"jobs": 0, "cores": 0}
+    jobs = [tracking_job(SweepJob, "big", active, peak, cores=16), tracking_job(SweepJob, "small", active, peak)]
+
+    with pytest.warns(UserWarning, match="running it alone"):
+        results = SweepScheduler(4, core_budget=4).run(jobs)
+
+    assert results == {"big": 0, "small": 0}
+    assert peak["jobs"] == 1
+
+
+def test_failures_and_progress() -> None:
+    """Failed and raising jobs are reported without stopping the others."""
+    active, peak = {"jobs": 0, "cores": 0}, {"jobs": 0, "cores": 0}
+
+    def boom(cpus):
+        raise RuntimeError("boom")
+
+    jobs = [
+        tracking_job(SweepJob, "ok", active, peak),
+        tracking_job(SweepJob, "failed", active, peak, exit_code=1),
+        SweepJob("raised", boom),
+    ]
+    updates = []
+
+    with pytest.warns(UserWarning, match="boom"):
+        results = SweepScheduler(2, core_budget=4, on_progress=updates.append).run(jobs)
+
+    assert results == {"ok": 0, "failed": 1, "raised": 1}
+    assert [u.completed for u in updates] == [1, 2, 3]
+    assert updates[-1].failed == 2 and updates[-1].total == 3
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity") or len(os.sched_getaffinity(0)) < 2,
+                    reason="needs CPU affinity and at least 2 CPUs")
+def test_pinned_jobs_get_disjoint_cpus() -> None:
+    """Concurrent pinned jobs receive disjoint CPU sets of the requested size."""
+    active, peak = {"jobs": 0, "cores": 0}, {"jobs": 0, "cores": 0}
+    seen = {}
+    jobs = [tracking_job(SweepJob, f"sweep_{i}", active, peak, seen_cpus=seen) for i in range(2)]
+
+    SweepScheduler(2, pin_cpus=True).run(jobs)
+
+    assert all(len(cpus) == 1 for cpus in seen.values())
+    assert seen["sweep_0"] != seen["sweep_1"]
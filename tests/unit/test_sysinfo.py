@@ -7,7 +7,11 @@ Uses actual shell commands to catch real bugs in subprocess handling.
 © Copyright 2025--2025 Hewlett Packard Enterprise Development LP
 """
 
+import subprocess
+import time
+
 from src.core.runlogs import collect_sysinfo
+from src.core.runlogs.sysinfo import native_probe, split_batch_output
 
 
 def test_real_commands_execute_and_strip_whitespace():
@@ -77,3 +81,129 @@ def test_preserves_multiline_output():
     assert lines[0] == 'line1'
     assert lines[1] == 'line2'
     assert lines[2] == 'line3'
+
+
+def test_native_probes_match_shell(tmp_path, monkeypatch):
+    """Recognized /proc and /sys idioms produce the same output as the shell."""
+    commands = [
+        'nproc',
+        'uname -m',
+        'uname -r',
+        'hostname',
+        'grep "model name" /proc/cpuinfo | head -1 | cut -d: -f2 | xargs',
+        'awk "/MemTotal/ {print \\$2}" /proc/meminfo',
+        'awk "/^Cached/ {print \\$2}" /proc/meminfo',
+        'awk "{print \\$3}" /proc/loadavg',
+        'cat /proc/sys/kernel/pid_max 2>/dev/null || echo "NA"',
+        'cat /sys/nonexistent/file 2>/dev/null || echo "NA"',
+        'cat /proc/sys/fs/file-max',
+    ]
+    monkeypatch.delenv("OMP_NUM_THREADS", raising=False)
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+    for command in commands:
+        probe = native_probe(command)
+        assert probe is not None, command
+        shell = subprocess.run(command, shell=True, capture_output=True, text=True).stdout
+        assert probe() == shell, command
+
+
+def test_unrecognized_commands_use_shell():
+    """Pipelines outside the supported idioms are not evaluated natively."""
+    assert native_probe('ps aux | wc -l') is None
+    assert native_probe('cat /etc/hostname') is None  # Not a pseudo-filesystem
+    assert native_probe('cat /proc/$PID/status') is None
+    assert native_probe('df -BG / | awk "NR==2 {print \\$4}" | sed "s/G//"') is None
+
+
+def test_native_probes_do_not_spawn_processes(monkeypatch):
+    """Locally run /proc specs never start a shell."""
+    def no_shell(*args, **kwargs):
+        raise AssertionError("native probes must not spawn a process")
+    monkeypatch.setattr(subprocess, "Popen", no_shell)
+
+    result = collect_sysinfo({
+        'memory': {'total': 'awk "/MemTotal/ {print \\$2}" /proc/meminfo'},
+        'kernel': {'pid_max': 'cat /proc/sys/kernel/pid_max 2>/dev/null || echo "NA"'},
+    })
+
+    assert result['memory']['total'].isdigit()
+    assert result['kernel']['pid_max'].isdigit()
+
+
+def test_shell_probes_run_concurrently_within_budget():
+    """Slow probes overlap, and the total budget kills stragglers."""
+    commands = {'slow': {f'sleep{i}': 'sleep 0.5; echo done' for i in range(4)}}
+    commands['slow']['hang'] = 'sleep 30; echo late'
+
+    start = time.monotonic()
+    result = collect_sysinfo(commands, max_workers=8, time_budget=1.5)
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 3.0, "Budget must bound the whole collection"
+    assert [result['slow'][f'sleep{i}'] for i in range(4)] == ['done'] * 4
+    assert result['slow']['hang'] == ''
+
+
+def _counting_backend(tmp_path, wrapper="sh -c '$SPEC_COMMAND'"):
+    """Backend options whose run_sys_spec template logs each invocation."""
+    calls = tmp_path / "calls"
+    calls.write_text("")
+    options = {"remote": {"run": "$CMD", "run_sys_spec": f"echo call >> {calls}; {wrapper}"}}
+    return options, calls
+
+
+def test_wrapped_commands_are_batched(tmp_path):
+    """Commands wrapped by the backend chain run in a single invocation."""
+    options, calls = _counting_backend(tmp_path)
+    commands = {
+        'cpu': {'count': 'nproc', 'model': 'grep "model name" /proc/cpuinfo | head -1 | cut -d: -f2 | xargs'},
+        'mixed': {
+            'quotes': 'echo "a b" \'c\'',
+            'no_newline': 'printf partial',
+            'fails': '/nonexistent/command/xyz',
+            'reads_stdin': 'cat',
+            'na': 'cat /sys/nonexistent 2>/dev/null || echo "NA"',
+        },
+    }
+
+    batched = collect_sysinfo(commands, options, ["remote"], batch=True, cache=False)
+    assert calls.read_text().count("call") == 1
+
+    calls.write_text("")
+    separate = collect_sysinfo(commands, options, ["remote"], batch=False, cache=False)
+    assert calls.read_text().count("call") == 7
+
+    assert batched == separate
+    assert batched['mixed'] == {'quotes': 'a b c', 'no_newline': 'partial', 'fails': '',
+                                'reads_stdin': '', 'na': 'NA'}
+
+
+def test_batch_survives_argv_style_templates(tmp_path):
+    """The batch command also works when the template re-splits it into words."""
+    options, calls = _counting_backend(tmp_path, wrapper="env $SPEC_COMMAND")
+
+    result = collect_sysinfo({'t': {'a': 'echo one', 'b': 'echo two | tr a-z A-Z'}},
+                             options, ["remote"], batch=True)
+
+    assert calls.read_text().count("call") == 1
+    assert result == {'t': {'a': 'one', 'b': 'TWO'}}
+
+
+def test_batch_falls_back_when_it_does_not_run(tmp_path):
+    """If the batch prints no markers, commands are retried one by one."""
+    options, calls = _counting_backend(tmp_path, wrapper="case '$SPEC_COMMAND' in *base64*) ;; *) sh -c '$SPEC_COMMAND';; esac")
+
+    result = collect_sysinfo({'t': {'a': 'echo one', 'b': 'echo two'}}, options, ["remote"], batch=True)
+
+    assert calls.read_text().count("call") == 3
+    assert result == {'t': {'a': 'one', 'b': 'two'}}
+
+
+def test_split_batch_output_keeps_completed_sections():
+    """Output truncated by the time budget keeps only completed commands."""
+    marker = "@@M@@"
+    output = f"\n{marker} 0\nfirst\n\n{marker} 1\nsecond\n{marker} 2\npart"
+
+    assert split_batch_output(output, marker) == {0: "first\n", 1: "second"}
+    assert split_batch_output(f"{output}ial\n{marker} end\n", marker)[2] == "partial"
+    assert split_batch_output("sh: base64: not found", marker) is None
@@ -0,0 +1,112 @@
+"""
+Unit tests for the warm worker - Python benchmarks imported once and called per iteration.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+import textwrap
+
+import pytest
+
+from src.core.execution import warm_worker
+from src.core.execution.warm_worker import invoke, load_benchmark, resolve_entry, stop_all
+
+BENCHMARK = textwrap.dedent("""
+    import os
+    from flask import Flask, request
+
+    _app = Flask(__name__)
+    calls = []
+
+    @_app.route("/", methods=["POST"])
+    def square(n):
+        calls.append(n)
+        return f"square {int(n) ** 2} pid {os.getpid()} calls {len(calls)}"
+
+    def fail():
+        raise RuntimeError("broken benchmark")
+
+    if __name__ == "__main__":
+        raise SystemExit("must not run when imported")
+""")
+
+
+@pytest.fixture
+def benchmark(tmp_path, monkeypatch):
+    """Benchmark file, with worker sockets in a private directory (workers stopped afterwards)."""
+    sockets = tmp_path / "run"
+    sockets.mkdir()
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(sockets))
+    path = tmp_path / "bench.py"
+    path.write_text(BENCHMARK)
+    yield str(path)
+    stop_all()
+
+
+def test_resolve_entry_uses_flask_root_route(benchmark) -> None:
+    """The entry function is the one served at '/', unless named explicitly."""
+    module = load_benchmark(benchmark)
+
+    assert resolve_entry(module).__name__ == "square"
+    assert resolve_entry(module, "fail").__name__ == "fail"
+    with pytest.raises(ValueError, match="no function 'missing'"):
+        resolve_entry(module, "missing")
+
+
+@pytest.mark.parametrize("mode", ["fork", "inproc"])
+def test_first_call_starts_worker_and_later_calls_reuse_it(benchmark, mode) -> None:
+    """Only the first call is cold; the worker keeps the imported module across calls."""
+    first = invoke(benchmark, ["3"], mode=mode)
+    second = invoke(benchmark, ["4"], mode=mode)
+
+    assert first.status == second.status == 0
+    assert first.cold and not second.cold
+    assert "square 9" in first.output and "square 16" in second.output
+    assert first.worker_start_time == second.worker_start_time > 0
+    assert 0 < second.call_time
+    if mode == "fork":
+        # Each call runs in a fresh child of the warm worker
+        assert "calls 1" in second.output
+        assert first.output.split("pid")[1] != second.output.split("pid")[1]
+    else:
+        assert "calls 2" in second.output
+        assert first.output.split("pid")[1].split()[0] == second.output.split("pid")[1].split()[0]
+
+
+def test_failing_call_reports_status_and_traceback(benchmark) -> None:
+    """An exception in the entry function fails the call without killing the worker."""
+    result = invoke(benchmark, [], function="fail")
+
+    assert result.status == 1
+    assert "broken benchmark" in result.output
+    assert invoke(benchmark, [], function="fail").cold is False
+
+
+def test_stop_all_forces_a_cold_start(benchmark) -> None:
+    """After stop_all, the next call starts a new worker."""
+    invoke(benchmark, ["2"])
+
+    assert stop_all() == 1
+    assert invoke(benchmark, ["2"]).cold
+
+
+def test_import_failure_is_reported(tmp_path, monkeypatch) -> None:
+    """A benchmark that cannot be imported fails the client with the worker's error."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    path = tmp_path / "broken.py"
+    path.write_text("raise ImportError('no such dependency')\n")
+
+    with pytest.raises(RuntimeError, match="no such dependency"):
+        invoke(str(path), [])
+
+
+def test_main_prints_output_and_timing_line(benchmark, capsys) -> None:
+    """The command line prints the benchmark output, then the metrics line."""
+    assert warm_worker.main([benchmark, "5"]) == 0
+    assert warm_worker.main([benchmark, "5"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    timings = [line.split() for line in lines if line.startswith("warm-worker output ")]
+    assert [t[2] for t in timings] == ["1", "0"]
+    assert all(t[5] == "fork" for t in timings)
+    assert sum("square 25" in line for line in lines) == 2
@@ -370,6 +370,64 @@ workflow:
         assert result == 0
         assert mock_launch_main.call_count == 2
 
+    @patch('src.cli.launch.main')
+    def test_run_workflow_continues_independent_branches(self, mock_launch_main, tmp_path):
+        """A failed task skips its dependents; independent tasks still run."""
+        workflow_file = tmp_path / "workflow.yaml"
+        workflow_file.write_text("""
+version: 1.0.0
+max_workers: 2
+workflow:
+  - {id: build, task: build}
+  - {id: test, task: test, depends_on: [build]}
+  - {id: lint, task: lint, depends_on: []}
+  - {task: docs}
+""")
+        mock_launch_main.side_effect = lambda argv: 1 if argv[0] == "build" else 0
+
+        result = workflow.run_workflow(str(workflow_file), verbose=False)
+
+        assert result == 1
+        ran = sorted(call[0][0][0] for call in mock_launch_main.call_args_list)
+        assert ran == ["build", "docs", "lint"]  # docs follows lint, the previous task
+
+    @patch('src.cli.launch.main')
+    def test_run_workflow_runs_independent_tasks_concurrently(self, mock_launch_main, tmp_path):
+        """Independent tasks overlap up to the worker limit."""
+        import threading
+        import time
+
+        lock, state = threading.Lock(), {"active": 0, "peak": 0}
+
+        def launch(argv):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.05)
+            with lock:
+                state["active"] -= 1
+            return 0
+
+        mock_launch_main.side_effect = launch
+        config = {"version": "1.0.0", "max_workers": 3,
+                  "workflow": [{"task": f"t{i}", "depends_on": []} for i in range(6)]}
+
+        assert workflow.run_workflow(config, verbose=False) == 0
+        assert state["peak"] == 3
+        state["peak"] = 0
+        assert workflow.run_workflow(config, verbose=False, max_workers=1) == 0
+        assert state["peak"] == 1 and mock_launch_main.call_count == 12
+
+    def test_run_workflow_rejects_dependency_cycle(self, capsys):
+        """Cycles and unknown dependencies are reported before any task runs."""
+        config = {"version": "1.0.0", "workflow": [
+            {"id": "a", "task": "a", "depends_on": ["b"]},
+            {"id": "b", "task": "b", "depends_on": ["a"]},
+        ]}
+
+        assert workflow.run_workflow(config, verbose=False) == 1
+        assert "Dependency cycle among tasks: a, b" in capsys.readouterr().err
+
     def test_run_workflow_invalid_file(self):
         """Workflow returns error for invalid workflow file."""
         result = workflow.run_workflow("nonexistent.yaml", verbose=False)
@@ -419,7 +477,7 @@ workflow:
         result = workflow.main([str(workflow_file)])
 
         assert result == 0
-        mock_run_workflow.assert_called_once_with(str(workflow_file), False)
+        mock_run_workflow.assert_called_once_with(str(workflow_file), False, resume=False, max_workers=None)
 
     @patch('src.cli.workflow.run_workflow')
     def test_main_verbose(self, mock_run_workflow, tmp_path):
@@ -436,7 +494,7 @@ workflow:
         result = workflow.main([str(workflow_file), '--verbose'])
 
         assert result == 0
-        mock_run_workflow.assert_called_once_with(str(workflow_file), True)
+        mock_run_workflow.assert_called_once_with(str(workflow_file), True, resume=False, max_workers=None)
 
     @patch('src.cli.workflow.run_workflow')
     def test_main_verbose_short_flag(self, mock_run_workflow, tmp_path):
@@ -453,4 +511,21 @@ workflow:
         result = workflow.main([str(workflow_file), '-v'])
 
         assert result == 0
-        mock_run_workflow.assert_called_once_with(str(workflow_file), True)
+        mock_run_workflow.assert_called_once_with(str(workflow_file), True, resume=False, max_workers=None)
+
+    @patch('src.cli.workflow.run_workflow')
+    def test_main_resume(self, mock_run_workflow, tmp_path):
+        """Test CLI with --resume flag."""
+        workflow_file = tmp_path / "workflow.yaml"
+        workflow_file.write_text("""
+version: 1.0.0
+workflow:
+  - task1.yaml
+""")
+
+        mock_run_workflow.return_value = 0
+
+        result = workflow.main([str(workflow_file), '--resume'])
+
+        assert result == 0
+        mock_run_workflow.assert_called_once_with(str(workflow_file), False, resume=True, max_workers=None)
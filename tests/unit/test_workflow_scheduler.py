@@ -0,0 +1,94 @@
+"""
+Unit tests for WorkflowScheduler - workflow tasks as a dependency graph.
+
+© Copyright 2025--2025 Hewlett Packard Enterprise Development LP
+"""
+
+import pytest
+
+from src.core.execution.workflow_scheduler import WorkflowJob, WorkflowScheduler, check_dependencies
+from tests.fixtures.stand_ins import tracking_job
+
+
+def test_independent_jobs_run_up_to_max_workers() -> None:
+    """Jobs without dependencies overlap, but never more than max_workers at once."""
+    log, active, peak = [], {"jobs": 0}, {"jobs": 0}
+    jobs = [tracking_job(WorkflowJob, f"t{i}", active, peak, log=log) for i in range(6)]
+
+    results = WorkflowScheduler(max_workers=3).run(jobs)
+
+    assert results == {f"t{i}": 0 for i in range(6)}
+    assert peak["jobs"] == 3
+
+
+def test_dependencies_run_first() -> None:
+    """A job starts only after all its dependencies ended."""
+    log, active, peak = [], {"jobs": 0}, {"jobs": 0}
+    jobs = [
+        tracking_job(WorkflowJob, "build", active, peak, log=log),
+        tracking_job(WorkflowJob, "a", active, peak, log=log, depends_on=["build"]),
+        tracking_job(WorkflowJob, "b", active, peak, log=log, depends_on=["build"]),
+        tracking_job(WorkflowJob, "report", active, peak, log=log, depends_on=["a", "b"]),
+    ]
+
+    WorkflowScheduler(max_workers=4).run(jobs)
+
+    assert log.index("end build") < min(log.index("start a"), log.index("start b"))
+    assert log.index("start report") > max(log.index("end a"), log.index("end b"))
+    assert peak["jobs"] == 2  # a and b together
+
+
+def test_shared_resource_is_exclusive() -> None:
+    """Jobs naming the same resource never overlap; others still run alongside."""
+    log, active, peak = [], {"jobs": 0}, {"jobs": 0}
+    host_log, host_active, host_peak = [], {"jobs": 0}, {"jobs": 0}
+    jobs = [tracking_job(WorkflowJob, f"h{i}", host_active, host_peak, log=host_log, resources=["host:node7"]) for i in range(3)]
+    jobs.append(tracking_job(WorkflowJob, "other", active, peak, log=log))
+
+    results = WorkflowScheduler(max_workers=4).run(jobs)
+
+    assert all(code == 0 for code in results.values())
+    assert host_peak["jobs"] == 1
+    assert log == ["start other", "end other"]
+
+
+def test_failure_skips_dependents_only() -> None:
+    """Dependents of a failed job (transitively) are skipped; independent branches continue."""
+    log, active, peak = [], {"jobs": 0}, {"jobs": 0}
+    jobs = [
+        tracking_job(WorkflowJob, "a", active, peak, log=log, exit_code=2),
+        tracking_job(WorkflowJob, "b", active, peak, log=log, depends_on=["a"]),
+        tracking_job(WorkflowJob, "c", active, peak, log=log, depends_on=["b"]),
+        tracking_job(WorkflowJob, "d", active, peak, log=log),
+        tracking_job(WorkflowJob, "e", active, peak, log=log, depends_on=["d"]),
+    ]
+    progress = []
+
+    results = WorkflowScheduler(max_workers=2, on_progress=progress.append).run(jobs)
+
+    assert results == {"a": 2, "b": None, "c": None, "d": 0, "e": 0}
+    assert "start b" not in log and "start c" not in log
+    assert (progress[-1].completed, progress[-1].failed, progress[-1].skipped) == (3, 1, 2)
+
+
+def test_raising_job_counts_as_failed() -> None:
+    """A job that raises (even SystemExit) fails without stalling the workflow."""
+    def boom():
+        raise SystemExit(2)
+
+    jobs = [WorkflowJob("boom", boom), WorkflowJob("after", lambda: 0, depends_on=["boom"]),
+            WorkflowJob("other", lambda: 0)]
+
+    assert WorkflowScheduler().run(jobs) == {"boom": 1, "after": None, "other": 0}
+
+
+def test_invalid_graphs_rejected() -> None:
+    """Unknown dependencies, duplicate names and cycles are reported."""
+    with pytest.raises(ValueError, match="unknown task 'x'"):
+        check_dependencies(["a"], {"a": ["x"]})
+    with pytest.raises(ValueError, match="Duplicate task ids: a"):
+        check_dependencies(["a", "a"], {})
+    with pytest.raises(ValueError, match="cycle among tasks: b, c"):
+        check_dependencies(["a", "b", "c"], {"b": ["c"], "c": ["b"]})
+    with pytest.raises(ValueError, match="at least 1"):
+        WorkflowScheduler(max_workers=0)
@@ -455,3 +455,167 @@ def test_compute_executable_checksum_docker_reference() -> None:
     assert checksum_type in ("unavailable", "docker-digest")
     assert isinstance(checksum_value, str)
 
+
+
+# ========== Test streaming rows ==========
+
+def test_streaming_flushes_rows_to_disk(tmp_path) -> None:
+    """Test that streamed rows are on disk (and out of memory) after each flush."""
+    logger = RunLogger(str(tmp_path), "test_exp", "test_task", {})
+    logger.start_streaming(mode="w", fsync_interval=0)
+
+    logger.add_row_data("iteration", 1, "int", "Iteration")
+    logger.add_row_data("latency", 10.5, "float", "Latency")
+    logger.flush_rows()
+
+    assert logger._rows == []
+    assert logger.row_count == 1
+    with open(logger.get_csv_path(), newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["iteration"] == "1"
+
+    logger.add_row_data("iteration", 2, "int", "Iteration")
+    logger.add_row_data("latency", 11.2, "float", "Latency")
+    logger.save_csv(mode="w")
+
+    with open(logger.get_csv_path(), newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["iteration"] for r in rows] == ["1", "2"]
+    assert logger.row_count == 2
+
+
+def test_streaming_validates_fields_against_header(tmp_path) -> None:
+    """Test that rows added after a flush must match the CSV header."""
+    logger = RunLogger(str(tmp_path), "test_exp", "test_task", {})
+    logger.start_streaming(mode="w")
+    logger.add_row_data("iteration", 1, "int", "Iteration")
+    logger.flush_rows()
+
+    with pytest.raises(AssertionError, match="CSV header"):
+        logger.add_row_data("latency", 10.5, "float", "Latency")
+
+
+def test_streaming_append_keeps_existing_rows(tmp_path) -> None:
+    """Test that streaming in append mode adds rows without a second header."""
+    first = RunLogger(str(tmp_path), "test_exp", "test_task", {}, launch_id="aaaa")
+    first.add_row_data("iteration", 1, "int", "Iteration")
+    first.save_csv(mode="w")
+
+    second = RunLogger(str(tmp_path), "test_exp", "test_task", {}, launch_id="bbbb")
+    second.start_streaming(mode="a")
+    second.add_row_data("iteration", 1, "int", "Iteration")
+    second.save_csv(mode="a")
+
+    with open(second.get_csv_path(), newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["launch_id"] for r in rows] == ["aaaa", "bbbb"]
+
+
+# ========== Test concurrent loggers ==========
+
+def test_concurrent_loggers_share_output_files(tmp_path) -> None:
+    """Test that loggers appending to the same task concurrently keep every row and invariant."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    def log(index: int) -> None:
+        logger = RunLogger(str(tmp_path), "exp", "task", {}, launch_id=f"run_{index}")
+        logger.add_invariant("index", index, "int", "Logger index")
+        logger.start_streaming(mode="a", fsync_interval=0)
+        for repeat in range(20):
+            logger.add_row_data("repeat", repeat, "int", "Repeat")
+            logger.add_row_data("value", index, "int", "Value")
+            logger.flush_rows()
+        logger.save_csv(mode="a")
+        logger.save_md(mode="a")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(log, range(8)))
+
+    with open(tmp_path / "exp" / "task.csv", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 8 * 20
+    assert all(row["launch_id"] == f"run_{row['value']}" for row in rows)
+    invariants = _extract_invariants(tmp_path / "exp" / "task.md")
+    assert sorted(invariants) == sorted(f"run_{i}" for i in range(8))
+
+
+# ========== Test launch journal ==========
+
+def test_journal_lookup_prefers_complete_launch(tmp_path) -> None:
+    """A complete launch wins over later attempts; a torn last line is ignored."""
+    from src.core.runlogs import RunJournal
+
+    journal = RunJournal(tmp_path / "task")
+    assert journal.lookup("h1") == (None, None)
+    journal.record("a", "h1", "started")
+    journal.record("b", "h2", "started")
+    assert journal.lookup("h1") == ("started", "a")
+    journal.record("a", "h1", "complete")
+    journal.record("c", "h1", "started")
+    with open(journal.path, "a") as f:
+        f.write('{"launch_id": "d", "config_')
+
+    assert journal.path.name == ".task.journal"
+    assert journal.lookup("h1") == ("complete", "a")
+    assert journal.lookup("h2") == ("started", "b")
+    journal.clear()
+    assert journal.lookup("h1") == (None, None)
+
+
+def test_config_hash_ignores_output_options() -> None:
+    """Only options that determine results change the configuration hash."""
+    from src.core.runlogs import config_hash
+
+    options = {"entry_point": "echo", "args": ["1"], "backend_names": ["local"], "directory": "a"}
+    assert config_hash(options) == config_hash({**options, "directory": "b", "verbose": True})
+    assert config_hash(options) != config_hash({**options, "args": ["2"]})
+
+
+def test_config_hash_includes_open_loop_options() -> None:
+    """Configurations differing only in their arrival process hash differently."""
+    from src.core.runlogs import config_hash
+
+    options = {"entry_point": "echo", "args": ["1"], "backend_names": ["local"], "duration": 5}
+    assert config_hash({**options, "arrival_rate": 10}) != config_hash({**options, "arrival_rate": 500})
+    assert config_hash(options) != config_hash({**options, "arrival_rate": 10})
+
+
+def test_config_hash_includes_exec_mode() -> None:
+    """Shell and direct launches time differently, so they hash differently."""
+    from src.core.runlogs import config_hash
+
+    options = {"entry_point": "echo", "args": ["1"], "backend_names": ["local"]}
+    assert config_hash({**options, "exec_mode": "shell"}) != config_hash({**options, "exec_mode": "direct"})
+
+
+def test_journal_started_launch_with_metadata_is_complete(tmp_path) -> None:
+    """A launch interrupted between its metadata and completion record is complete."""
+    from src.core.runlogs import RunJournal
+
+    journal = RunJournal(tmp_path / "task")
+    journal.record("a", "h1", "started")
+    (tmp_path / "task.md").write_text('## Invariant parameters\n\n```json\n{"a": {"config_hash": "h1"}}\n```\n')
+
+    assert journal.lookup("h1") == ("complete", "a")
+
+
+def test_md_section_survives_appended_launches(tmp_path) -> None:
+    """A section added to the Markdown file is replaced by title and kept by later launches."""
+    from src.core.runlogs import RunLogger
+
+    logger = RunLogger(str(tmp_path), "exp", "task", {})
+    logger.add_row_data("outer_time", 1.0, "float", "Time")
+    logger.save_csv()
+    logger.save_md()
+    RunLogger.save_md_section(logger.base_path, "Scalability curve", "| mpl |\n|-----|\n| 1 |")
+    RunLogger.save_md_section(logger.base_path, "Scalability curve", "| mpl |\n|-----|\n| 2 |")
+
+    other = RunLogger(str(tmp_path), "exp", "task", {})
+    other.add_row_data("outer_time", 2.0, "float", "Time")
+    other.save_csv("a")
+    other.save_md("a")
+
+    content = (tmp_path / "exp" / "task.md").read_text()
+    assert content.count("## Scalability curve") == 1
+    assert "| 2 |" in content and "| 1 |" not in content
+    assert f'"{other.launch_id}"' in content